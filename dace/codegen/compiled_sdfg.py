@@ -165,6 +165,49 @@ def _array_interface_ptr(array: Any, storage: dtypes.StorageType) -> int:
     return array.__array_interface__['data'][0]
 
 
+def _argument_signature(arg: Any) -> Any:
+    """
+    Returns a hashable signature of a call argument, used to select a cached argument marshalling plan in
+    ``CompiledSDFG.fast_call``. Two arguments with the same signature pass (or fail) type checking equally.
+    """
+    if isinstance(arg, np.ndarray):
+        return (type(arg), arg.dtype, arg.base is None)
+    return type(arg)
+
+
+class _ArgumentPlan(object):
+    """
+    A precompiled argument marshalling plan for one distinct tuple of argument types. Stores, for each argument in
+    the exported C function order, a converter from the Python object to its ctypes counterpart.
+    """
+
+    def __init__(self, converters: List[Callable[[Any], Any]], init_indices: Tuple[int],
+                 range_checks: List[Tuple[int, int, int]]):
+        """
+        :param converters: A list of functions converting each argument to its ctypes value.
+        :param init_indices: Indices of the arguments that are also passed to the initialization function.
+        :param range_checks: A list of (argument index, minimum, maximum) tuples for Python integers that are
+                             narrowed to a smaller C integer type.
+        """
+        self.converters = converters
+        self.init_indices = init_indices
+        self.range_checks = range_checks
+
+    def marshal(self, arglist: List[Any]) -> Optional[Tuple[Tuple[Any], Tuple[Any]]]:
+        """
+        Converts the given arguments to ctypes values according to the plan.
+
+        :param arglist: The arguments, in the order of the SDFG signature.
+        :return: A 2-tuple of the call and initialization argument tuples, or None if one of the argument values
+                 is out of the range that the plan was validated for.
+        """
+        for i, minval, maxval in self.range_checks:
+            if not minval <= arglist[i] <= maxval:
+                return None
+        argtuple = tuple(conv(arg) for conv, arg in zip(self.converters, arglist))
+        return argtuple, tuple(argtuple[i] for i in self.init_indices)
+
+
 class CompiledSDFG(object):
     """ A compiled SDFG object that can be called through Python. """
 
@@ -198,6 +241,10 @@ class CompiledSDFG(object):
         self._free_symbols = self._sdfg.free_symbols
         self.argnames = argnames
 
+        # Cache argument marshalling plans for the fast call path (see ``fast_call``)
+        self._fast_call: bool = Config.get_bool('compiler', 'fast_call')
+        self._argument_plans: Dict[Tuple[Any, ...], Optional[_ArgumentPlan]] = {}
+
         self.has_gpu_code = False
         self.external_memory_types = set()
         for _, _, aval in self._sdfg.arrays_recursive():
@@ -365,38 +412,71 @@ class CompiledSDFG(object):
             return result
 
     def __call__(self, *args, **kwargs):
+        if self._fast_call:
+            return self.fast_call(*args, **kwargs)
+
         # Update arguments from ordered list
         if len(args) > 0 and self.argnames is not None:
             kwargs.update({aname: arg for aname, arg in zip(self.argnames, args)})
 
         try:
             argtuple, initargtuple = self._construct_args(kwargs)
+            return self._invoke(argtuple, initargtuple)
+        except (RuntimeError, TypeError, UnboundLocalError, KeyError, cgx.DuplicateDLLError, ReferenceError):
+            self._lib.unload()
+            raise
+
+    def fast_call(self, *args, **kwargs):
+        """
+        Calls the compiled SDFG with reduced Python overhead. On the first call with a distinct tuple of argument
+        types, the arguments are fully type-checked and an argument marshalling plan (argument order, ctypes
+        converters, arrays vs. scalars) is created. Subsequent calls with the same argument types reuse the plan
+        and skip type checking. Arguments that cannot be marshalled by a plan (e.g., callbacks, lists, or symbolic
+        values) fall back to the regular call path.
+
+        This call path can be made the default for ``__call__`` via the ``compiler.fast_call`` configuration entry.
+
+        :param args: Arguments to call SDFG with.
+        :param kwargs: Keyword arguments to call SDFG with.
+        :return: The return value(s) of the SDFG, as in ``__call__``.
+        """
+        # Update arguments from ordered list
+        if len(args) > 0 and self.argnames is not None:
+            kwargs.update(zip(self.argnames, args))
+
+        try:
+            argtuple, initargtuple = self._construct_args_fast(kwargs)
+            return self._invoke(argtuple, initargtuple)
+        except (RuntimeError, TypeError, UnboundLocalError, KeyError, cgx.DuplicateDLLError, ReferenceError):
+            self._lib.unload()
+            raise
 
-            # Call initializer function if necessary, then SDFG
-            if self._initialized is False:
-                self._lib.load()
-                self._initialize(initargtuple)
+    def _invoke(self, argtuple: Tuple[Any], initargtuple: Tuple[Any]):
+        """ Calls the initializer function if necessary, then the SDFG with the given constructed arguments. """
+        if self._initialized is False:
+            self._lib.load()
+            self._initialize(initargtuple)
 
+        if hooks._COMPILED_SDFG_CALL_HOOKS:
             with hooks.invoke_compiled_sdfg_call_hooks(self, argtuple):
                 if self.do_not_execute is False:
                     self._cfunc(self._libhandle, *argtuple)
+        elif self.do_not_execute is False:
+            self._cfunc(self._libhandle, *argtuple)
 
-            if self.has_gpu_code:
-                # Optionally get errors from call
-                try:
-                    lasterror = common.get_gpu_runtime().get_last_error_string()
-                except RuntimeError as ex:
-                    warnings.warn(f'Could not get last error from GPU runtime: {ex}')
-                    lasterror = None
+        if self.has_gpu_code:
+            # Optionally get errors from call
+            try:
+                lasterror = common.get_gpu_runtime().get_last_error_string()
+            except RuntimeError as ex:
+                warnings.warn(f'Could not get last error from GPU runtime: {ex}')
+                lasterror = None
 
-                if lasterror is not None:
-                    raise RuntimeError(
-                        f'An error was detected when calling "{self._sdfg.name}": {self._get_error_text(lasterror)}')
+            if lasterror is not None:
+                raise RuntimeError(
+                    f'An error was detected when calling "{self._sdfg.name}": {self._get_error_text(lasterror)}')
 
-            return self._convert_return_values()
-        except (RuntimeError, TypeError, UnboundLocalError, KeyError, cgx.DuplicateDLLError, ReferenceError):
-            self._lib.unload()
-            raise
+        return self._convert_return_values()
 
     def __del__(self):
         if self._initialized is True:
@@ -417,6 +497,85 @@ class CompiledSDFG(object):
         for desc, arr in zip(self._retarray_shapes, self._return_arrays):
             kwargs[desc[0]] = arr
 
+        return self._marshal_args(kwargs)
+
+    def _construct_args_fast(self, kwargs) -> Tuple[Tuple[Any], Tuple[Any]]:
+        """ Constructs arguments for calling the C prototype of the SDFG using a cached argument marshalling plan,
+            which is created (and the arguments type-checked) once per distinct tuple of argument types.
+        """
+        # Return value initialization (for values that have not been given)
+        self._initialize_return_values(kwargs)
+        for desc, arr in zip(self._retarray_shapes, self._return_arrays):
+            kwargs[desc[0]] = arr
+
+        try:
+            arglist = [kwargs[a] for a in self._sig]
+        except KeyError as ex:
+            raise KeyError("Missing program argument \"{}\"".format(ex.args[0]))
+
+        key = tuple(_argument_signature(arg) for arg in arglist)
+        try:
+            plan = self._argument_plans[key]
+        except KeyError:
+            # First call with these argument types: perform full type checking and create a plan
+            result = self._marshal_args(kwargs)
+            self._argument_plans[key] = self._create_argument_plan(arglist)
+            return result
+
+        if plan is not None:
+            result = plan.marshal(arglist)
+            if result is not None:
+                self._lastargs = result
+                return result
+
+        # Arguments cannot be marshalled through a plan, use the full call path
+        return self._marshal_args(kwargs)
+
+    def _create_argument_plan(self, arglist: List[Any]) -> Optional[_ArgumentPlan]:
+        """
+        Creates an argument marshalling plan from a list of arguments that have passed type checking.
+
+        :param arglist: The (type-checked) arguments, in the order of the SDFG signature.
+        :return: The argument plan, or None if the arguments cannot be marshalled through a plan.
+        """
+        converters = []
+        range_checks = []
+        for i, (aname, arg) in enumerate(zip(self._sig, arglist)):
+            atype = self._typedict[aname]
+            if isinstance(atype, dt.Structure) or isinstance(atype.dtype, dtypes.callback):
+                return None
+            if isinstance(arg, (list, sp.Basic, symbolic.SymExpr)):
+                return None
+
+            actype = atype.dtype.as_ctypes()
+            if dtypes.is_array(arg):
+                converters.append(
+                    lambda arg, storage=atype.storage: ctypes.c_void_p(_array_interface_ptr(arg, storage)))
+            elif isinstance(atype, dt.Array):  # Optional array passed as None
+                converters.append(lambda _: ctypes.c_void_p(0))
+            elif atype.dtype == dtypes.string:
+                converters.append(lambda arg: ctypes.c_char_p(None if arg is None else arg.encode('utf-8')))
+            elif isinstance(arg, ctypes._SimpleCData):
+                converters.append(lambda arg: arg)
+            else:
+                nptype = atype.dtype.type
+                if isinstance(arg, int) and nptype in (np.int32, np.uint32):
+                    # Values outside the range of the C type are cast (with a warning) by the full call path
+                    info = np.iinfo(nptype)
+                    range_checks.append((i, -int(info.max) if nptype == np.int32 else 0, int(info.max)))
+                    converters.append(actype)
+                elif (isinstance(arg, nptype) or (isinstance(arg, int) and nptype == np.int64)
+                      or (isinstance(arg, float) and nptype == np.float64)):
+                    converters.append(actype)
+                else:  # Scalar is cast by NumPy first
+                    converters.append(lambda arg, actype=actype, nptype=nptype: actype(nptype(arg)))
+
+        init_indices = tuple(i for i, aname in enumerate(self._sig) if aname in self._free_symbols)
+        return _ArgumentPlan(converters, init_indices, range_checks)
+
+    def _marshal_args(self, kwargs) -> Tuple[Tuple[Any], Tuple[Any]]:
+        """ Type-checks and converts the given arguments (including return values) to the C prototype of the SDFG.
+        """
         # Argument construction
         sig = self._sig
         typedict = self._typedict
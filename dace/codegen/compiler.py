@@ -6,13 +6,18 @@
 from __future__ import print_function
 
 import collections
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import os
 import six
 import shutil
 import shlex
 import subprocess
+import sys
 import re
-from typing import Any, Callable, Dict, List, Set, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
+import uuid
 
 import dace
 from dace.config import Config
@@ -24,6 +29,14 @@ from dace.codegen.targets.target import make_absolute
 
 T = TypeVar('T')
 
+# Compiler flags that CMake adds for each build configuration (GCC/Clang)
+_BUILD_TYPE_FLAGS = {
+    'Debug': ['-g'],
+    'Release': ['-O3', '-DNDEBUG'],
+    'RelWithDebInfo': ['-O2', '-g', '-DNDEBUG'],
+    'MinSizeRel': ['-Os', '-DNDEBUG'],
+}
+
 
 def generate_program_folder(sdfg, code_objects: List[CodeObject], out_path: str, config=None):
     """ Writes all files required to configure and compile the DaCe program
@@ -165,6 +178,12 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
 
     environments = dace.library.get_environments_and_dependencies(environments)
 
+    # Try to build the program directly, without CMake
+    if Config.get('compiler', 'build_backend') == 'direct':
+        shared_library_path = _direct_build(program_folder, program_name, files, targets, environments)
+        if shared_library_path is not None:
+            return shared_library_path
+
     environment_flags, cmake_link_flags = get_environment_flags(environments)
     cmake_command += sorted(environment_flags)
 
@@ -229,7 +248,8 @@ def configure_and_compile(program_folder, program_name=None, output_stream=None)
 
     # Compile and link
     try:
-        _run_liveoutput("cmake --build . --config %s" % (Config.get('compiler', 'build_type')),
+        _run_liveoutput("cmake --build . --config %s --parallel %d" %
+                        (Config.get('compiler', 'build_type'), _get_build_jobs()),
                         shell=True,
                         cwd=build_folder,
                         output_stream=output_stream)
@@ -256,14 +276,14 @@ def _get_or_eval(value_or_function: Union[T, Callable[[], T]]) -> T:
     return value_or_function
 
 
-def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
+def _get_environment_settings(environments) -> Dict[str, Any]:
     """
-    Returns the CMake environment and linkage flags associated with the
-    given input environments/libraries.
-    
+    Collects the CMake settings (minimum version, variables, packages, includes, libraries, flags, and files)
+    of the given input environments/libraries.
+
     :param environments: A list of ``@dace.library.environment``-decorated
                          classes.
-    :return: A 2-tuple of (environment CMake flags, linkage CMake flags)
+    :return: A dictionary mapping each setting to its combined value.
     """
     cmake_minimum_version = [0]
     cmake_variables = collections.OrderedDict()
@@ -273,7 +293,6 @@ def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
     cmake_compile_flags = set()
     cmake_link_flags = set()
     cmake_files = set()
-    cmake_module_paths = set()
     for env in environments:
         if (env.cmake_minimum_version is not None and len(env.cmake_minimum_version) > 0):
             version_list = list(map(int, env.cmake_minimum_version.split(".")))
@@ -319,22 +338,332 @@ def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
                     cmake_includes.add(env_dir)
                     break
 
+    return dict(minimum_version=cmake_minimum_version,
+                variables=cmake_variables,
+                packages=cmake_packages,
+                includes=cmake_includes,
+                libraries=cmake_libraries,
+                compile_flags=cmake_compile_flags,
+                link_flags=cmake_link_flags,
+                files=cmake_files)
+
+
+def get_environment_flags(environments) -> Tuple[List[str], Set[str]]:
+    """
+    Returns the CMake environment and linkage flags associated with the
+    given input environments/libraries.
+    
+    :param environments: A list of ``@dace.library.environment``-decorated
+                         classes.
+    :return: A 2-tuple of (environment CMake flags, linkage CMake flags)
+    """
+    settings = _get_environment_settings(environments)
+
     environment_flags = [
-        "-DDACE_ENV_MINIMUM_VERSION={}".format(".".join(map(str, cmake_minimum_version))),
+        "-DDACE_ENV_MINIMUM_VERSION={}".format(".".join(map(str, settings['minimum_version']))),
         # Make CMake list of key-value pairs
-        "-DDACE_ENV_VAR_KEYS=\"{}\"".format(";".join(cmake_variables.keys())),
-        "-DDACE_ENV_VAR_VALUES=\"{}\"".format(";".join(cmake_variables.values())),
-        "-DDACE_ENV_PACKAGES=\"{}\"".format(" ".join(sorted(cmake_packages))),
-        "-DDACE_ENV_INCLUDES=\"{}\"".format(" ".join(sorted(cmake_includes))),
-        "-DDACE_ENV_LIBRARIES=\"{}\"".format(" ".join(sorted(cmake_libraries))),
-        "-DDACE_ENV_COMPILE_FLAGS=\"{}\"".format(" ".join(cmake_compile_flags)),
+        "-DDACE_ENV_VAR_KEYS=\"{}\"".format(";".join(settings['variables'].keys())),
+        "-DDACE_ENV_VAR_VALUES=\"{}\"".format(";".join(settings['variables'].values())),
+        "-DDACE_ENV_PACKAGES=\"{}\"".format(" ".join(sorted(settings['packages']))),
+        "-DDACE_ENV_INCLUDES=\"{}\"".format(" ".join(sorted(settings['includes']))),
+        "-DDACE_ENV_LIBRARIES=\"{}\"".format(" ".join(sorted(settings['libraries']))),
+        "-DDACE_ENV_COMPILE_FLAGS=\"{}\"".format(" ".join(settings['compile_flags'])),
         # "-DDACE_ENV_LINK_FLAGS=\"{}\"".format(" ".join(cmake_link_flags)),
-        "-DDACE_ENV_CMAKE_FILES=\"{}\"".format(";".join(sorted(cmake_files))),
+        "-DDACE_ENV_CMAKE_FILES=\"{}\"".format(";".join(sorted(settings['files']))),
     ]
     # Escape variable expansions to defer their evaluation
     environment_flags = [cmd.replace("$", "_DACE_CMAKE_EXPAND") for cmd in sorted(environment_flags)]
 
-    return environment_flags, cmake_link_flags
+    return environment_flags, settings['link_flags']
+
+
+def _get_build_jobs() -> int:
+    """ Returns the number of parallel compilation jobs to use. """
+    jobs = Config.get('compiler', 'build_jobs')
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return jobs
+
+
+def _direct_build_commands(files: List[str], targets: Dict[str, Any],
+                           environments) -> Optional[Tuple[List[str], List[str], List[str]]]:
+    """
+    Creates the compiler and linker command lines for building a program directly (without CMake), mirroring the
+    commands that the CMake build would use.
+
+    :param files: Source files of the program, relative to the source folder.
+    :param targets: Targets that generated the source files.
+    :param environments: Environments (libraries) used by the program.
+    :return: A 3-tuple of (compile command, link command, libraries to link), or None if the program cannot be
+             built without CMake (e.g., because it uses non-CPU targets or environments that require CMake packages).
+    """
+    # Only CPU programs on Linux (with GCC/Clang-style compilers) are supported
+    if not sys.platform.startswith('linux'):
+        return None
+    if set(targets.keys()) != {'cpu'} or any(not f.endswith('.cpp') for f in files):
+        return None
+    if Config.get('compiler', 'linker', 'executable') or Config.get('compiler', 'extra_cmake_args'):
+        return None
+    build_type = Config.get('compiler', 'build_type')
+    if build_type not in _BUILD_TYPE_FLAGS:
+        return None
+
+    settings = _get_environment_settings(environments)
+    if settings['packages'] or settings['variables'] or settings['files']:
+        return None
+    # Flags that depend on CMake variables
+    env_flags = (settings['includes'] | settings['libraries'] | settings['compile_flags'] | settings['link_flags'])
+    if any('$' in flag for flag in env_flags):
+        return None
+
+    compiler = Config.get('compiler', 'cpu', 'executable')
+    compiler = make_absolute(compiler) if compiler else os.environ.get('CXX', 'c++')
+
+    dace_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    includes = [os.path.join(dace_path, 'runtime', 'include')] + sorted(settings['includes'])
+
+    compile_command = ([compiler] + shlex.split(Config.get('compiler', 'cpu', 'args')) + ['-fopenmp'] +
+                       [flag for flags in sorted(settings['compile_flags']) for flag in shlex.split(flags)] +
+                       _BUILD_TYPE_FLAGS[build_type] + ['-fPIC'])
+    link_command = (compile_command + shlex.split(Config.get('compiler', 'linker', 'args') or '') +
+                    [flag for flags in sorted(settings['link_flags']) for flag in shlex.split(flags)] + ['-shared'])
+    compile_command += ['-I' + include for include in includes]
+
+    libraries = []
+    for lib in sorted(unique_flags(Config.get('compiler', 'cpu', 'libs'))) + sorted(settings['libraries']):
+        if lib.startswith('-') or os.path.sep in lib:
+            libraries.append(lib)
+        else:
+            libraries.append('-l' + lib)
+    libraries.append('-pthread')
+
+    return compile_command, link_command, libraries
+
+
+def _run_build_command(command: List[str], error_type: type, error_message: str) -> str:
+    """ Runs a compiler command, raising the given exception type with the compiler output on failure. """
+    if Config.get('debugprint') == 'verbose':
+        print('Running: ' + ' '.join(command))
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        output = result.stdout.decode('utf-8', errors='replace') + result.stderr.decode('utf-8', errors='replace')
+        if Config.get_bool('debugprint'):
+            print(output, flush=True)
+        raise error_type(error_message + ':\n' + output)
+    return result.stdout.decode('utf-8', errors='replace')
+
+
+def _read_dependency_file(path: str) -> List[str]:
+    """ Returns the absolute paths of the dependencies listed in a Makefile dependency file (see ``-MD``). """
+    with open(path, 'r') as fp:
+        contents = fp.read().replace('\\\n', ' ')
+    # Skip the target name and split on whitespace that is not escaped
+    _, _, dependencies = contents.partition(': ')
+    return [os.path.abspath(dep.replace('\\ ', ' ')) for dep in re.findall(r'(?:\\.|[^\s\\])+', dependencies)]
+
+
+def _file_signature(path: str) -> Optional[List[int]]:
+    """ Returns the modification time and size of a file, or None if it does not exist. """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _compile_cached_object(compile_command: List[str], source: str, object_path: str, cache_folder: str) -> str:
+    """
+    Compiles a source file into an object file, reusing a previously compiled object file from the object cache if
+    the preprocessed source and compiler flags are identical.
+
+    Preprocessing is skipped if the source file and compiler flags are identical to a previous compilation and none
+    of the headers it included have changed since. This is determined by a manifest in the cache, which stores the
+    included headers (with their modification times and sizes) and the resulting object hash.
+
+    :param compile_command: Compiler executable and flags.
+    :param source: Path to the source file.
+    :param object_path: Path of the output object file.
+    :param cache_folder: Folder of the content-addressed object cache.
+    :return: The content hash of the object.
+    """
+    source = os.path.abspath(source)
+    with open(source, 'rb') as fp:
+        source_contents = fp.read()
+    hasher = hashlib.sha256()
+    hasher.update('\0'.join(compile_command + [source]).encode('utf-8'))
+    hasher.update(b'\0')
+    hasher.update(source_contents)
+    manifest_digest = hasher.hexdigest()
+    manifest_path = os.path.join(cache_folder, 'manifests', manifest_digest[:2], manifest_digest + '.json')
+
+    digest = None
+    try:
+        with open(manifest_path, 'r') as fp:
+            manifest = json.load(fp)
+        if all(_file_signature(dep) == signature for dep, signature in manifest['dependencies'].items()):
+            digest = manifest['digest']
+            os.utime(manifest_path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if digest is None:
+        # Hash preprocessed source (without line markers, so that identical code in different folders matches) and
+        # record the included headers in the manifest
+        dependency_path = os.path.join(os.path.dirname(object_path), uuid.uuid4().hex + '.d')
+        try:
+            preprocessed = _run_build_command(compile_command + ['-E', '-P', '-MD', '-MF', dependency_path, source],
+                                              cgx.CompilationError, 'Compiler failure')
+            dependencies = [dep for dep in _read_dependency_file(dependency_path) if dep != source]
+        finally:
+            if os.path.exists(dependency_path):
+                os.remove(dependency_path)
+        hasher = hashlib.sha256()
+        hasher.update('\0'.join(compile_command).encode('utf-8'))
+        hasher.update(b'\0')
+        hasher.update(preprocessed.encode('utf-8'))
+        digest = hasher.hexdigest()
+
+        manifest = {'dependencies': {dep: _file_signature(dep) for dep in dependencies}, 'digest': digest}
+        os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+        tmp_path = manifest_path + '.' + uuid.uuid4().hex
+        with open(tmp_path, 'w') as fp:
+            json.dump(manifest, fp)
+        os.replace(tmp_path, manifest_path)
+
+    cached_path = os.path.join(cache_folder, digest[:2], digest + '.o')
+    try:
+        shutil.copyfile(cached_path, object_path)
+        # Mark object as recently used
+        os.utime(cached_path)
+        if Config.get_bool('debugprint'):
+            print(f'Reusing cached object file for {os.path.basename(source)}')
+        return digest
+    except FileNotFoundError:  # Not compiled yet, or evicted
+        pass
+
+    os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+    # Compile into a temporary file first, then move it into the cache atomically
+    tmp_path = cached_path + '.' + uuid.uuid4().hex
+    try:
+        _run_build_command(compile_command + ['-c', source, '-o', tmp_path], cgx.CompilationError, 'Compiler failure')
+        shutil.copyfile(tmp_path, object_path)
+        os.replace(tmp_path, cached_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return digest
+
+
+def _evict_cached_objects(cache_folder: str, max_size: int) -> int:
+    """
+    Removes the least recently used object files and manifests from the object cache until its total size is within
+    the given limit. Files that are being written or were removed concurrently are skipped.
+
+    :param cache_folder: Folder of the content-addressed object cache.
+    :param max_size: Maximal total size of the cache in bytes.
+    :return: The number of removed files.
+    """
+    entries = []
+    total_size = 0
+    for root, _, files in os.walk(cache_folder):
+        for file in files:
+            if not file.endswith(('.o', '.json')):
+                continue
+            path = os.path.join(root, file)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_size += stat.st_size
+    if total_size <= max_size:
+        return 0
+
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+        evicted += 1
+    return evicted
+
+
+def _link_if_changed(link_command: List[str], objects: List[Tuple[str, str]], libraries: List[str],
+                     output_path: str) -> None:
+    """
+    Links object files into a shared library, unless the library already exists and was linked from the same
+    objects with the same command.
+
+    :param objects: A list of 2-tuples of (object file path, object content hash).
+    """
+    command = link_command + ['-o', output_path] + [path for path, _ in objects] + libraries
+    stamp_path = output_path + '.stamp'
+    stamp = '\n'.join([' '.join(command)] + [digest for _, digest in objects])
+    if os.path.isfile(output_path) and identical_file_exists(stamp_path, stamp):
+        return
+
+    _run_build_command(command, cgx.CompilationError, 'Linker failure')
+    with open(stamp_path, 'w') as fp:
+        fp.write(stamp)
+
+
+def _direct_build(program_folder: str, program_name: str, files: List[str], targets: Dict[str, Any],
+                  environments) -> Optional[str]:
+    """
+    Builds a program without CMake by invoking the compiler directly. Source files are compiled in parallel (see
+    the ``compiler.build_jobs`` configuration entry) and object files are stored in a content-addressed cache, so
+    that unchanged generated files are never recompiled, even across different programs.
+
+    :param program_folder: Folder containing all files necessary to build.
+    :param program_name: Name of the program.
+    :param files: Source files of the program, relative to the source folder.
+    :param targets: Targets that generated the source files.
+    :param environments: Environments (libraries) used by the program.
+    :return: Path to the compiled shared library file, or None if the program cannot be built without CMake.
+    """
+    commands = _direct_build_commands(files, targets, environments)
+    if commands is None:
+        return None
+    compile_command, link_command, libraries = commands
+
+    src_folder = os.path.join(program_folder, 'src')
+    build_folder = os.path.join(program_folder, 'build')
+    object_folder = os.path.join(build_folder, 'objects')
+    os.makedirs(object_folder, exist_ok=True)
+    cache_folder = Config.get('compiler', 'object_cache_folder')
+    if not cache_folder:
+        cache_folder = os.path.join(Config.get('default_build_folder'), 'objects')
+    cache_folder = os.path.abspath(cache_folder)
+
+    dace_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    stub_source = os.path.join(dace_path, 'codegen', 'tools', 'dacestub.cpp')
+    sources = [os.path.join(src_folder, f) for f in files] + [stub_source]
+    object_paths = [
+        os.path.join(object_folder, f.replace(os.path.sep, '_')[:-len('.cpp')] + '.o') for f in files
+    ] + [os.path.join(object_folder, 'dacestub.o')]
+
+    # Compile all translation units in parallel
+    with ThreadPoolExecutor(max_workers=_get_build_jobs()) as pool:
+        digests = list(
+            pool.map(lambda args: _compile_cached_object(compile_command, *args, cache_folder),
+                     zip(sources, object_paths)))
+    objects = list(zip(object_paths, digests))
+    max_size = Config.get('compiler', 'object_cache_size')
+    if max_size > 0:
+        _evict_cached_objects(cache_folder, max_size * 1024 * 1024)
+
+    # Link program and loader stub
+    extension = Config.get('compiler', 'library_extension')
+    shared_library_path = os.path.join(build_folder, f'lib{program_name}.{extension}')
+    stub_library_path = os.path.join(build_folder, f'libdacestub_{program_name}.{extension}')
+    _link_if_changed(link_command, objects[:-1], libraries, shared_library_path)
+    _link_if_changed(link_command, objects[-1:], ['-pthread'], stub_library_path)
+
+    return shared_library_path
 
 
 def unique_flags(flags):
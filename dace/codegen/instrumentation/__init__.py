@@ -1,10 +1,10 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 from .provider import InstrumentationProvider
-from .report import InstrumentationReport
+from .report import InstrumentationReport, ColumnarInstrumentationReport
 
 from .papi import PAPIInstrumentation
 from .likwid import LIKWIDInstrumentationCPU, LIKWIDInstrumentationGPU
-from .timer import TimerProvider
+from .timer import TimerProvider, SampledTimerProvider
 from .gpu_events import GPUEventProvider
 from .fpga import FPGAInstrumentationProvider
 
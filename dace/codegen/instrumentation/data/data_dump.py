@@ -19,6 +19,17 @@ if TYPE_CHECKING:
 
 class DataInstrumentationProviderMixin:
 
+    def _serializer_arguments(self, codegen: 'DaCeCodeGenerator') -> str:
+        """ Returns the format arguments of the data serializer from the configuration, and links zlib if needed. """
+        data_format = config.Config.get('instrumentation', 'data_format')
+        if data_format not in ('files', 'chunked'):
+            raise ValueError(f'Unknown data instrumentation format "{data_format}". Expected "files" or "chunked"')
+        compression = int(config.Config.get('instrumentation', 'data_compression'))
+        if compression > 0:
+            from dace.libraries.standard.environments import ZLib  # Avoid import loop
+            codegen.dispatcher.used_environments.add(ZLib.full_class_path())
+        return f'{"true" if data_format == "chunked" else "false"}, {compression}'
+
     def _setup_gpu_runtime(self, sdfg: SDFG, global_stream: CodeIOStream):
         if self.gpu_runtime_init:
             return
@@ -94,7 +105,8 @@ class SaveProvider(InstrumentationProvider, DataInstrumentationProviderMixin):
             self.codegen = codegen
             path = os.path.abspath(os.path.join(sdfg.build_folder, 'data')).replace('\\', '/')
             codegen.statestruct.append('dace::DataSerializer *serializer;')
-            sdfg.append_init_code(f'__state->serializer = new dace::DataSerializer("{path}");\n')
+            args = self._serializer_arguments(codegen)
+            sdfg.append_init_code(f'__state->serializer = new dace::DataSerializer("{path}", {args});\n')
 
     def on_sdfg_end(self, sdfg: SDFG, local_stream: CodeIOStream, global_stream: CodeIOStream):
         # Teardown serializer versioning object
@@ -206,7 +218,8 @@ class RestoreProvider(InstrumentationProvider, DataInstrumentationProviderMixin)
         if sdfg.parent is None:
             self.codegen = codegen
             codegen.statestruct.append('dace::DataSerializer *serializer;')
-            sdfg.append_init_code(f'__state->serializer = new dace::DataSerializer("");\n')
+            args = self._serializer_arguments(codegen)
+            sdfg.append_init_code(f'__state->serializer = new dace::DataSerializer("", {args});\n')
 
             # Add method that controls serializer input
             global_stream.write(self._generate_report_setter(sdfg))
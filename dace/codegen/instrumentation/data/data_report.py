@@ -1,8 +1,10 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 from dataclasses import dataclass
+import json
 import struct
 from typing import Any, Dict, List, Set, Tuple, Union
 import os
+import zlib
 
 from dace import dtypes, SDFG
 from dace.data import ArrayLike, Number  # Type hint
@@ -10,6 +12,39 @@ from dace.data import ArrayLike, Number  # Type hint
 import numpy as np
 
 
+@dataclass
+class DataChunk:
+    """
+    An entry in the index of a chunked instrumented data report, pointing to one saved version of an array or symbol.
+    """
+    name: str  #: Array or symbol name
+    uuid: str  #: Identifier of the access node (or state for symbols) from which the data was saved
+    version: int  #: Running number of the saved data for the given identifier
+    kind: str  #: Either ``array`` or ``symbol``
+    offset: int  #: Offset of the chunk in the data file (in bytes)
+    size: int  #: Size of the (uncompressed) data (in bytes)
+    stored_size: int  #: Size of the chunk in the data file (in bytes)
+    compression: str  #: Either ``none`` or ``zlib``
+    shape: Tuple[int, ...]  #: Shape of the array
+    strides: Tuple[int, ...]  #: Strides of the array (in elements)
+
+    @property
+    def sort_key(self) -> Tuple[int, ...]:
+        return (*(int(s) for s in self.uuid.split('_')), self.version)
+
+    def save(self) -> Dict[str, Any]:
+        return dict(name=self.name,
+                    uuid=self.uuid,
+                    version=self.version,
+                    kind=self.kind,
+                    offset=self.offset,
+                    size=self.size,
+                    stored_size=self.stored_size,
+                    compression=self.compression,
+                    shape=list(self.shape),
+                    strides=list(self.strides))
+
+
 @dataclass
 class InstrumentedDataReport:
     """
@@ -26,6 +61,13 @@ class InstrumentedDataReport:
     
     The files themselves are direct binary representations of the whole data (with padding and strides), for complete
     reproducibility. When accessed from the report, a numpy wrapper shows the user-accessible view of that array.
+
+    Alternatively, if the ``instrumentation.data_format`` configuration entry is set to ``chunked``, the report folder
+    contains a single append-only data file (``data.bin``) with all saved versions, and an index (``index.jsonl``)
+    with one JSON object per line that describes each chunk (see ``DataChunk``). Later entries of the same version
+    replace earlier ones. Uncompressed arrays in chunked reports are memory-mapped upon access, and are thus only read
+    from disk as needed. Chunks compressed with zlib (see the ``instrumentation.data_compression`` configuration entry)
+    are decompressed upon access.
     Example of reading a file::
 
         dreport = sdfg.get_instrumented_data()  # returns a report
@@ -45,8 +87,12 @@ class InstrumentedDataReport:
     sdfg: SDFG
     folder: str
     files: Dict[str, List[str]]
+    chunks: Dict[str, List[DataChunk]]
     loaded_values: Dict[Tuple[str, int], Union[ArrayLike, Number]]
 
+    DATA_FILE = 'data.bin'
+    INDEX_FILE = 'index.jsonl'
+
     def __init__(self, sdfg: SDFG, folder: str) -> None:
         """
         Loads a data instrumentation report of an SDFG from the specified folder.
@@ -57,8 +103,13 @@ class InstrumentedDataReport:
         self.sdfg = sdfg
         self.folder = folder
         self.files = {}
+        self.chunks = {}
         self.loaded_values = {}
 
+        if os.path.isfile(os.path.join(folder, self.INDEX_FILE)):
+            self._read_index()
+            return
+
         # Prepare file mapping
         array_names = os.listdir(folder)
         for aname in array_names:
@@ -72,10 +123,104 @@ class InstrumentedDataReport:
 
             self.files[aname] = files
 
+    def _read_index(self):
+        """ Reads the index of a chunked report. """
+        entries: Dict[Tuple[str, str, int], DataChunk] = {}
+        with open(os.path.join(self.folder, self.INDEX_FILE), 'r') as fp:
+            for line in fp:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                chunk = DataChunk(entry['name'], entry['uuid'], entry['version'], entry['kind'], entry['offset'],
+                                  entry['size'], entry['stored_size'], entry['compression'], tuple(entry['shape']),
+                                  tuple(entry['strides']))
+                entries[chunk.name, chunk.uuid, chunk.version] = chunk
+
+        for chunk in entries.values():
+            self.chunks.setdefault(chunk.name, []).append(chunk)
+        for chunks in self.chunks.values():
+            chunks.sort(key=lambda c: c.sort_key)
+
     def keys(self) -> Set[str]:
         """ Returns the array names available in this data report. """
+        if self.chunks:
+            return self.chunks.keys()
         return self.files.keys()
 
+    def _read_chunk(self, chunk: DataChunk) -> bytes:
+        """ Reads and decompresses the contents of a chunk. """
+        with open(os.path.join(self.folder, self.DATA_FILE), 'rb') as fp:
+            fp.seek(chunk.offset)
+            data = fp.read(chunk.stored_size)
+        if chunk.compression == 'zlib':
+            return zlib.decompress(data)
+        elif chunk.compression != 'none':
+            raise ValueError(f'Unsupported chunk compression "{chunk.compression}"')
+        return data
+
+    def _read_array_chunk(self, chunk: DataChunk, npdtype: np.dtype) -> Tuple[ArrayLike, ArrayLike]:
+        """
+        Reads an array from a chunked report. Uncompressed chunks are memory-mapped (copy-on-write).
+
+        :return: A 2-tuple of (original buffer, array view)
+        """
+        if chunk.compression == 'none' and chunk.size > 0:
+            nparr = np.memmap(os.path.join(self.folder, self.DATA_FILE),
+                              dtype=npdtype,
+                              mode='c',
+                              offset=chunk.offset,
+                              shape=(chunk.size // npdtype.itemsize, ))
+        else:
+            nparr = np.frombuffer(bytearray(self._read_chunk(chunk)), dtype=npdtype)
+        strides = tuple(s * npdtype.itemsize for s in chunk.strides)
+        view = np.ndarray(chunk.shape, npdtype, buffer=nparr, strides=strides)
+        return nparr, view
+
+    def _read_symbol_chunk(self, chunk: DataChunk, npdtype: np.dtype) -> Number:
+        npclass = getattr(np, str(npdtype))
+        return npclass(self._read_chunk(chunk).decode('utf-8'))
+
+    def _read(self, item: str, index: int) -> Union[ArrayLike, Number]:
+        """ Reads one version of an array or symbol from the report. """
+        if item in self.sdfg.arrays:
+            npdtype = self.sdfg.arrays[item].dtype.as_numpy_dtype()
+            if self.chunks:
+                nparr, view = self._read_array_chunk(self.chunks[item][index], npdtype)
+            else:
+                nparr, view = self._read_array_file(self.files[item][index], npdtype)
+            self.loaded_values[item, index] = nparr
+            return view
+        elif item in self.sdfg.symbols:
+            npdtype = self.sdfg.symbols[item].as_numpy_dtype()
+            if self.chunks:
+                val = self._read_symbol_chunk(self.chunks[item][index], npdtype)
+            else:
+                val = self._read_symbol_file(self.files[item][index], npdtype)
+            self.loaded_values[item, index] = val
+            return val
+        else:
+            raise KeyError(f'Item {item} not found in report')
+
+    def num_versions(self, item: str) -> int:
+        """
+        Returns the number of saved versions of an array or symbol in the report.
+
+        :param item: Name of the array or symbol.
+        """
+        if self.chunks:
+            return len(self.chunks[item])
+        return len(self.files[item])
+
+    def get_version(self, item: str, version: int) -> Union[ArrayLike, Number]:
+        """
+        Returns one version of the instrumented (saved) data from the report, without loading the other versions.
+
+        :param item: Name of the array or symbol to read.
+        :param version: Index of the version, in the order of the list returned by ``__getitem__``.
+        :return: The array or symbol value from the report.
+        """
+        return self._read(item, version)
+
     def _read_array_file(self, filename: str, npdtype: np.dtype) -> Tuple[ArrayLike, ArrayLike]:
         """
         Reads a formatted instrumented data file. 
@@ -110,26 +255,9 @@ class InstrumentedDataReport:
         :return: An array (if a single entry in the report is given) or symbol, or a list of versions of the array
                  or symbol across the report.
         """
-        filenames = self.files[item]
-        results = []
-        if item in self.sdfg.arrays:
-            desc = self.sdfg.arrays[item]
-            dtype: dtypes.typeclass = desc.dtype
-            npdtype = dtype.as_numpy_dtype()
-            for i, file in enumerate(filenames):
-                nparr, view = self._read_array_file(file, npdtype)
-                self.loaded_values[item, i] = nparr
-                results.append(view)
-        elif item in self.sdfg.symbols:
-            dtype: dtypes.typeclass = self.sdfg.symbols[item]
-            npdtype = dtype.as_numpy_dtype()
-            for i, file in enumerate(filenames):
-                val = self._read_symbol_file(file, npdtype)
-                self.loaded_values[item, i] = val
-                results.append(val)
-        else:
+        if item not in self.sdfg.arrays and item not in self.sdfg.symbols:
             raise KeyError(f'Item {item} not found in report')
-
+        results = [self._read(item, i) for i in range(self.num_versions(item))]
         if len(results) == 1:
             return results[0]
         return results
@@ -142,23 +270,9 @@ class InstrumentedDataReport:
         :param item: Name of the array or symbol to read.
         :return: The array or symbol value from the report.
         """
-        filenames = self.files[item]
-        if item in self.sdfg.arrays:
-            desc = self.sdfg.arrays[item]
-            dtype: dtypes.typeclass = desc.dtype
-            npdtype = dtype.as_numpy_dtype()
-
-            file = next(iter(filenames))
-            nparr, view = self._read_array_file(file, npdtype)
-            self.loaded_values[item, 0] = nparr
-            return view
-        elif item in self.sdfg.symbols:
-            file = next(iter(filenames))
-            dtype: dtypes.typeclass = self.sdfg.symbols[item]
-            val = self._read_symbol_file(file, dtype.as_numpy_dtype())
-            self.loaded_values[item, 0] = val
-        else:
+        if item not in self.sdfg.arrays and item not in self.sdfg.symbols:
             raise KeyError(f'Item not found in report: {item}')
+        return self._read(item, 0)
 
     def update_report(self):
         """
@@ -167,6 +281,10 @@ class InstrumentedDataReport:
         
         :see: dace.dtypes.DataInstrumentationType.Restore
         """
+        if self.chunks:
+            self._update_chunks()
+            return
+
         for (k, i), loaded in self.loaded_values.items():
             if isinstance(loaded, np.ndarray):
                 dtype_bytes = loaded.dtype.itemsize
@@ -175,3 +293,32 @@ class InstrumentedDataReport:
                     fp.write(struct.pack('i' * loaded.ndim, *loaded.shape))
                     fp.write(struct.pack('i' * loaded.ndim, *(s // dtype_bytes for s in loaded.strides)))
                     loaded.tofile(fp)
+
+    def _update_chunks(self):
+        """
+        Stores the retrieved arrays back to a chunked report. Uncompressed chunks are overwritten in-place, whereas
+        compressed chunks are appended to the data file and replace the previous entries in the index.
+        """
+        with open(os.path.join(self.folder, self.DATA_FILE), 'r+b') as fp, open(os.path.join(
+                self.folder, self.INDEX_FILE), 'a') as index:
+            for (k, i), loaded in self.loaded_values.items():
+                if not isinstance(loaded, np.ndarray):
+                    continue
+                chunk = self.chunks[k][i]
+                data = loaded.tobytes()
+                if chunk.compression == 'none':
+                    fp.seek(chunk.offset)
+                    fp.write(data)
+                    continue
+
+                # Append recompressed chunk (aligned to 64 bytes) and its new index entry
+                compressed = zlib.compress(data)
+                fp.seek(0, os.SEEK_END)
+                offset = fp.tell()
+                padding = (64 - offset % 64) % 64
+                fp.write(b'\0' * padding)
+                fp.write(compressed)
+                fp.flush()
+                chunk.offset = offset + padding
+                chunk.stored_size = len(compressed)
+                index.write(json.dumps(chunk.save()) + '\n')
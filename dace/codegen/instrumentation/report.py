@@ -1,11 +1,12 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 """ Implementation of the performance instrumentation report. """
 
+import array
 from dataclasses import dataclass
 import json
 import numpy as np
 import re
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from io import StringIO
 
 from collections import defaultdict
@@ -70,6 +71,86 @@ class CounterEvent:
         return dict(name=self.name, cat=self.category, ph='C', ts=self.timestamp, pid=self.pid, tid=self.tid, args=args)
 
 
+@dataclass
+class DurationHistogram:
+    """
+    Histogram of the sampled durations of an element, aggregated at runtime by sampled timer instrumentation
+    (see ``InstrumentationType.Sampled_Timer``). Bucket 0 counts zero durations, and bucket ``i > 0`` counts
+    durations in ``[2^(i-1), 2^i)`` nanoseconds.
+    """
+    name: str  #: Element name
+    category: str  #: Category
+    uuid: UUIDType  #: Unique locator for SDFG/state/node/edge
+    invocations: int  #: Number of invocations of the element, including those that were not sampled
+    count: int  #: Number of sampled invocations
+    total: int  #: Sum of sampled durations (in nanoseconds)
+    minimum: int  #: Minimal sampled duration (in nanoseconds)
+    maximum: int  #: Maximal sampled duration (in nanoseconds)
+    buckets: List[int]  #: Number of samples in each bucket
+
+    @staticmethod
+    def from_json(histogram: Dict[str, Any]) -> 'DurationHistogram':
+        uuid, _ = InstrumentationReport.get_event_uuid_and_other_info(histogram)
+        return DurationHistogram(histogram['name'], histogram['cat'], uuid, histogram['invocations'],
+                                 histogram['count'], histogram['sum'], histogram['min'], histogram['max'],
+                                 list(histogram['buckets']))
+
+    def save(self) -> Dict[str, Any]:
+        return dict(name=self.name,
+                    cat=self.category,
+                    invocations=self.invocations,
+                    count=self.count,
+                    sum=self.total,
+                    min=self.minimum,
+                    max=self.maximum,
+                    buckets=self.buckets,
+                    args=_uuid_to_dict(self.uuid))
+
+    @property
+    def mean(self) -> float:
+        """ Mean sampled duration (in nanoseconds). """
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a quantile of the sampled durations, assuming samples are uniformly distributed within each bucket.
+
+        :param q: The quantile, between 0 and 1 (e.g., 0.5 for the median).
+        :return: The estimated duration (in nanoseconds).
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            if bucket == 0:
+                continue
+            if seen + bucket >= rank:
+                low, high = (0, 1) if i == 0 else (2**(i - 1), 2**i)
+                value = low + (high - low) * (rank - seen) / bucket
+                return float(min(max(value, self.minimum), self.maximum))
+            seen += bucket
+        return float(self.maximum)
+
+
+def _get_histograms_string(histograms: List[DurationHistogram], colw: int) -> str:
+    """ Returns a table of the sampled invocations and estimated runtimes (in milliseconds) of each histogram. """
+    row_format = ('{:<{width}}' * 6) + '\n'
+    separator = ('-' * (colw * 6)) + '\n'
+    string = separator
+    string += row_format.format('Element', 'Samples', 'Min (ms)', 'Mean (ms)', 'Median (ms)', 'Max (ms)',
+                                width=colw)
+    string += separator
+    for hist in sorted(histograms, key=lambda h: (h.uuid, h.name)):
+        string += f'{hist.name} ({", ".join(str(i) for i in hist.uuid if i >= 0)})\n'
+        string += row_format.format('', f'{hist.count}/{hist.invocations}', '%.3f' % (hist.minimum * 1e-6),
+                                    '%.3f' % (hist.mean * 1e-6), '%.3f' % (hist.quantile(0.5) * 1e-6),
+                                    '%.3f' % (hist.maximum * 1e-6),
+                                    width=colw)
+    string += separator
+    return string
+
+
 class InstrumentationReport(object):
     """
     An object that represents a DaCe program instrumentation report.
@@ -107,6 +188,9 @@ class InstrumentationReport(object):
         # UUID -> Name -> Counter -> Thread ID -> Values
         self.counters: Dict[UUIDType, Dict[str, Dict[str, Dict[int, List[float]]]]] = defaultdict(dict)
 
+        # Duration histograms of sampled timers
+        self.histograms: List[DurationHistogram] = []
+
         self._sortcat = None
         self._sortdesc = False
         self.sdfg_hash: str = ''
@@ -140,6 +224,7 @@ class InstrumentationReport(object):
                     self.events.append(
                         CounterEvent(event['name'], event['cat'], uuid, event['ts'], other_info, event['pid'],
                                      event['tid']))
+            self.histograms = [DurationHistogram.from_json(h) for h in report.get('histograms', [])]
 
         # Summarize events for printouts
         self.process_events()
@@ -388,6 +473,9 @@ class InstrumentationReport(object):
 
                 string += ('-' * (COLW * 5)) + '\n'
 
+        if len(self.histograms) > 0:
+            string += _get_histograms_string(self.histograms, COLW)
+
         return string
 
     def as_csv(self) -> Tuple[str, str]:
@@ -440,5 +528,431 @@ class InstrumentationReport(object):
         report_json = {}
         report_json['sdfgHash'] = self.sdfg_hash
         report_json['traceEvents'] = [ev.save() for ev in self.events]
+        if self.histograms:
+            report_json['histograms'] = [h.save() for h in self.histograms]
         with open(filename, 'w') as fp:
             json.dump(report_json, fp)
+
+
+class _TraceEventReader:
+    """
+    Incrementally reads the events of a Chrome Tracing JSON file, without loading the entire file into memory.
+    After iterating over all events, ``metadata`` contains the remaining top-level entries of the file (e.g.,
+    ``sdfgHash``).
+    """
+    _SEPARATORS = re.compile(r'[\s,]*')
+    _TRACE_EVENTS = re.compile(r'"traceEvents"\s*:\s*\[')
+
+    def __init__(self, filename: str, chunk_size: int = 1 << 20):
+        self.filename = filename
+        self.chunk_size = chunk_size
+        self.metadata: Dict[str, Any] = {}
+
+    def __iter__(self):
+        decoder = json.JSONDecoder()
+        with open(self.filename, 'r') as fp:
+            # Find beginning of events array
+            buffer = ''
+            while True:
+                chunk = fp.read(self.chunk_size)
+                buffer += chunk
+                match = self._TRACE_EVENTS.search(buffer)
+                if match is not None:
+                    break
+                if not chunk:
+                    raise ValueError(f'{self.filename} is not a valid instrumentation report')
+            prefix = buffer[:match.end()]
+            buffer = buffer[match.end():]
+
+            # Decode one event at a time
+            pos = 0
+            eof = False
+            while True:
+                pos = self._SEPARATORS.match(buffer, pos).end()
+                if pos < len(buffer) and buffer[pos] == ']':
+                    break
+
+                # Fast path: decode all complete events in the buffer at once
+                events, end = self._decode_events(buffer, pos)
+                if events:
+                    yield from events
+                    pos = end
+                    continue
+
+                try:
+                    if pos == len(buffer):
+                        raise json.JSONDecodeError('Incomplete event', buffer, pos)
+                    event, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    # Event was cut off, read more
+                    chunk = fp.read(self.chunk_size)
+                    eof = not chunk
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+                    continue
+                yield event
+
+            # Parse other entries
+            self.metadata = json.loads(prefix + buffer[pos:] + fp.read())
+            del self.metadata['traceEvents']
+
+    @staticmethod
+    def _decode_events(buffer: str, pos: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Tries to decode all complete events in the buffer starting at the given position as one JSON list. Since
+        a list that ends within a string or an event is never valid JSON, the last few closing braces are tried as
+        the end of the last complete event.
+
+        :return: A 2-tuple of the decoded events (or an empty list on failure) and the position after the last event.
+        """
+        end = len(buffer)
+        for _ in range(3):
+            end = buffer.rfind('}', pos, end)
+            if end < 0:
+                break
+            try:
+                return json.loads('[' + buffer[pos:end + 1] + ']'), end + 1
+            except json.JSONDecodeError:
+                pass
+        return [], pos
+
+
+class ElementStatistics:
+    """
+    Incrementally computed statistics of a series of values (e.g., durations of an instrumented element). The median
+    is estimated using the P-square algorithm (Jain and Chlamtac, 1985), which uses constant memory. It is exact for
+    up to five values.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.sum = 0.0
+
+        # P-square marker heights and positions
+        self._heights: List[float] = []
+        self._positions = [0, 1, 2, 3, 4]
+
+        # Exact median, if known
+        self._median: Optional[float] = None
+
+    @staticmethod
+    def from_summary(count: int, minimum: float, maximum: float, total: float, median: float) -> 'ElementStatistics':
+        """ Creates statistics from precomputed values, e.g., computed over all values at once. """
+        result = ElementStatistics()
+        result.count = count
+        result.min = minimum
+        result.max = maximum
+        result.sum = total
+        result._median = median
+        return result
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count
+
+    @property
+    def median(self) -> float:
+        if self._median is not None:
+            return self._median
+        if self.count <= 5:
+            return float(np.median(self._heights))
+        return self._heights[2]
+
+    def add(self, value: float):
+        """ Adds a value to the statistics. """
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        q = self._heights
+        if self.count <= 5:
+            q.append(value)
+            q.sort()
+            return
+
+        # Find cell of the value, update extreme markers and marker positions
+        n = self._positions
+        if value < q[0]:
+            q[0] = value
+            k = 1
+        elif value >= q[4]:
+            q[4] = value
+            k = 4
+        else:
+            k = 1
+            while value >= q[k]:
+                k += 1
+        for i in range(k, 5):
+            n[i] += 1
+
+        # Adjust heights of middle markers towards their desired positions (quartiles and median)
+        last = self.count - 1
+        for i, desired in ((1, last * 0.25), (2, last * 0.5), (3, last * 0.75)):
+            d = desired - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                # Piecewise-parabolic prediction
+                height = q[i] + d / (n[i + 1] - n[i - 1]) * ((n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) /
+                                                             (n[i + 1] - n[i]) + (n[i + 1] - n[i] - d) *
+                                                             (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < height < q[i + 1]:
+                    # Linear prediction
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+
+class ColumnarInstrumentationReport(object):
+    """
+    A memory-efficient representation of a DaCe program instrumentation report, intended for large reports.
+
+    As opposed to ``InstrumentationReport``, the report file is read incrementally, and events are stored in
+    NumPy arrays (one per field) rather than as Python objects. Storing the events is optional: if they are not
+    stored, the statistics of every instrumented element are computed while reading, with an estimated median
+    (see ``ElementStatistics``).
+
+    Duration events are stored in ``durations``, a dictionary of equal-length arrays with the fields ``sdfg_id``,
+    ``state_id``, ``node_id``, ``name`` (an index into ``names``), ``tid`` (an unsigned 64-bit thread hash, or
+    ``NO_THREAD`` if not applicable), ``timestamp`` (microseconds), and ``duration`` (microseconds). Counter events
+    are stored in ``counters`` with the same fields, except that ``duration`` is replaced by ``counter`` (an index
+    into ``counter_names``) and ``value``, and contain one row per counter value.
+    """
+
+    DURATION_FIELDS = (('sdfg_id', 'i'), ('state_id', 'i'), ('node_id', 'i'), ('name', 'i'), ('tid', 'Q'),
+                       ('timestamp', 'd'), ('duration', 'd'))
+    COUNTER_FIELDS = (('sdfg_id', 'i'), ('state_id', 'i'), ('node_id', 'i'), ('name', 'i'), ('tid', 'Q'),
+                      ('timestamp', 'd'), ('counter', 'i'), ('value', 'd'))
+
+    #: Value of the ``tid`` column for events without a thread ID (-1 in the report file)
+    NO_THREAD = (1 << 64) - 1
+
+    def __init__(self,
+                 filename: str,
+                 elements: Optional[List[Tuple[int, ...]]] = None,
+                 keep_events: bool = True,
+                 chunk_size: int = 1 << 20):
+        """
+        Loads an instrumentation report.
+
+        :param filename: Path to the report file (in the Chrome Tracing JSON format).
+        :param elements: If given, only loads events of the given elements. Each element is given as a tuple of
+                         ``(sdfg_id,)`` for an SDFG and everything within it, ``(sdfg_id, state_id)`` for a state and
+                         everything within it, or ``(sdfg_id, state_id, node_id)`` for a node.
+        :param keep_events: If False, only keeps the statistics of every element (with an estimated median), and not
+                            the events.
+        :param chunk_size: Number of characters to read from the file at once.
+        """
+        match = re.match(r'.*report-(\d+)\.json', filename)
+        self.name = match.groups()[0] if match is not None else 'N/A'
+        self.filepath = filename
+
+        self.names: List[str] = []
+        self.counter_names: List[str] = []
+
+        # (UUID, name, thread ID) -> statistics of durations (in milliseconds)
+        self.duration_statistics: Dict[Tuple[UUIDType, str, int], ElementStatistics] = {}
+        # (UUID, name, counter, thread ID) -> statistics of counter values
+        self.counter_statistics: Dict[Tuple[UUIDType, str, str, int], ElementStatistics] = {}
+
+        durations = {field: array.array(typecode) for field, typecode in self.DURATION_FIELDS}
+        counters = {field: array.array(typecode) for field, typecode in self.COUNTER_FIELDS}
+        duration_columns = list(durations.values())
+        counter_columns = list(counters.values())
+        name_ids: Dict[str, int] = {}
+        counter_ids: Dict[str, int] = {}
+        included: Dict[UUIDType, bool] = {}
+        elements = [tuple(e) for e in elements] if elements is not None else None
+
+        reader = _TraceEventReader(filename, chunk_size)
+        for event in reader:
+            phase = event.get('ph')
+            if phase not in ('X', 'C'):
+                continue
+            uuid, other_info = InstrumentationReport.get_event_uuid_and_other_info(event)
+
+            # Filter elements
+            if elements is not None:
+                if uuid not in included:
+                    included[uuid] = any(uuid[:len(e)] == e for e in elements)
+                if not included[uuid]:
+                    continue
+
+            name = event['name']
+            tid = event.get('tid', -1)
+            stored_tid = tid if tid >= 0 else self.NO_THREAD
+            if name not in name_ids:
+                name_ids[name] = len(self.names)
+                self.names.append(name)
+
+            if phase == 'X':  # Duration event
+                if keep_events:
+                    for column, value in zip(duration_columns, (*uuid, name_ids[name], stored_tid, event['ts'],
+                                                                  event['dur'])):
+                        column.append(value)
+                else:
+                    key = (uuid, name, tid)
+                    stats = self.duration_statistics.get(key)
+                    if stats is None:
+                        stats = self.duration_statistics[key] = ElementStatistics()
+                    stats.add(event['dur'] / 1000)
+            else:  # Counter event
+                for counter, value in other_info.items():
+                    if counter not in counter_ids:
+                        counter_ids[counter] = len(self.counter_names)
+                        self.counter_names.append(counter)
+                    if keep_events:
+                        for column, val in zip(counter_columns,
+                                               (*uuid, name_ids[name], stored_tid, event['ts'], counter_ids[counter],
+                                                value)):
+                            column.append(val)
+                    else:
+                        key = (uuid, name, counter, tid)
+                        if key not in self.counter_statistics:
+                            self.counter_statistics[key] = ElementStatistics()
+                        self.counter_statistics[key].add(value)
+
+        if 'sdfgHash' not in reader.metadata:
+            raise ValueError(f'{filename} is not a valid SDFG instrumentation report')
+        self.sdfg_hash: str = reader.metadata['sdfgHash']
+        self.histograms: List[DurationHistogram] = [
+            DurationHistogram.from_json(h) for h in reader.metadata.get('histograms', [])
+            if elements is None or any(InstrumentationReport.get_event_uuid_and_other_info(h)[0][:len(e)] == e
+                                       for e in elements)
+        ]
+
+        # Convert columns to NumPy arrays without copying
+        self.durations: Dict[str, np.ndarray] = {k: np.frombuffer(v, dtype=v.typecode) for k, v in durations.items()}
+        self.counters: Dict[str, np.ndarray] = {k: np.frombuffer(v, dtype=v.typecode) for k, v in counters.items()}
+
+        # If all events are available, compute exact statistics at once
+        if keep_events:
+            for key, stats in self._statistics(self.durations, ('name', 'tid'), 'duration', 1e-3):
+                uuid, (name, tid) = key[:3], key[3:]
+                self.duration_statistics[(uuid, self.names[name], tid)] = stats
+            for key, stats in self._statistics(self.counters, ('name', 'counter', 'tid'), 'value'):
+                uuid, (name, counter, tid) = key[:3], key[3:]
+                self.counter_statistics[(uuid, self.names[name], self.counter_names[counter], tid)] = stats
+
+    @staticmethod
+    def _statistics(columns: Dict[str, np.ndarray],
+                    key_fields: Tuple[str, ...],
+                    value_field: str,
+                    scale: float = 1) -> Iterator[Tuple[Tuple[int, ...], ElementStatistics]]:
+        """
+        Computes statistics of the values of every element in the given columns.
+
+        :return: A generator of 2-tuples of (element UUID and key fields, statistics).
+        """
+        values = columns[value_field] * scale
+        if len(values) == 0:
+            return
+        # Key columns are not stacked into one array, as that would convert 64-bit thread IDs to floating point
+        fields = ('sdfg_id', 'state_id', 'node_id') + key_fields
+
+        # Sort by element, then by value
+        order = np.lexsort((values, ) + tuple(columns[f] for f in reversed(fields)))
+        keys = [columns[f][order] for f in fields]
+        values = values[order]
+        boundaries = np.zeros(len(values), dtype=bool)
+        boundaries[0] = True
+        for key in keys:
+            boundaries[1:] |= key[1:] != key[:-1]
+        starts = np.flatnonzero(boundaries)
+        ends = np.append(starts[1:], len(values))
+        sums = np.add.reduceat(values, starts)
+        medians = (values[(starts + ends - 1) // 2] + values[(starts + ends) // 2]) / 2
+
+        for i, (start, end) in enumerate(zip(starts, ends)):
+            key = tuple(int(k[start]) for k in keys)
+            key = tuple(-1 if f == 'tid' and k == ColumnarInstrumentationReport.NO_THREAD else k
+                        for f, k in zip(fields, key))
+            yield key, ElementStatistics.from_summary(int(end - start), values[start], values[end - 1], sums[i],
+                                                      medians[i])
+
+    def __repr__(self):
+        return 'ColumnarInstrumentationReport(name=%s)' % self.name
+
+    def __str__(self):
+        COLW = 15
+        row_format = ('{:<{width}}' * 6) + '\n'
+        separator = ('-' * (COLW * 6)) + '\n'
+
+        string = 'Instrumentation report\n'
+        string += 'SDFG Hash: ' + self.sdfg_hash + '\n'
+
+        if len(self.duration_statistics) > 0:
+            string += separator
+            string += row_format.format('Element', 'Count', 'Min (ms)', 'Mean (ms)', 'Median (ms)', 'Max (ms)',
+                                        width=COLW)
+            string += separator
+            for (uuid, name, tid), stats in sorted(self.duration_statistics.items()):
+                label = f'{name} ({", ".join(str(i) for i in uuid if i >= 0)})'
+                if tid >= 0:
+                    label += f' [Thread {tid}]'
+                string += label + '\n'
+                string += row_format.format('', stats.count, '%.3f' % stats.min, '%.3f' % stats.mean,
+                                            '%.3f' % stats.median, '%.3f' % stats.max, width=COLW)
+            string += separator
+
+        if len(self.counter_statistics) > 0:
+            string += separator
+            string += row_format.format('Element', 'Count', 'Min', 'Mean', 'Median', 'Max', width=COLW)
+            string += separator
+            for (uuid, name, counter, tid), stats in sorted(self.counter_statistics.items()):
+                label = f'{name} ({", ".join(str(i) for i in uuid if i >= 0)}): {counter}'
+                if tid >= 0:
+                    label += f' [Thread {tid}]'
+                string += label + '\n'
+                string += row_format.format('', stats.count, stats.min, '%.2f' % stats.mean, '%.2f' % stats.median,
+                                            stats.max, width=COLW)
+            string += separator
+
+        if len(self.histograms) > 0:
+            string += _get_histograms_string(self.histograms, COLW)
+
+        return string
+
+    def as_csv(self) -> Tuple[str, str]:
+        """
+        Generates a CSV version of the report, in the same format as ``InstrumentationReport.as_csv``.
+
+        :return: A tuple of two strings: (durations CSV, counters CSV).
+        """
+        durations_csv, counters_csv = StringIO(), StringIO()
+
+        if len(self.duration_statistics) > 0:
+            durations_csv.write('Name,SDFG,State,Node,Thread,Count,MinMS,MeanMS,MedianMS,MaxMS\n')
+            durations_csv.writelines(
+                f'{name},{sdfg},{state},{node},{tid},{s.count},{s.min},{s.mean},{s.median},{s.max}\n'
+                for ((sdfg, state, node), name, tid), s in self.duration_statistics.items())
+
+        if len(self.counter_statistics) > 0:
+            counters_csv.write('Counter,Name,SDFG,State,Node,Thread,Count,Min,Mean,Median,Max\n')
+            counters_csv.writelines(
+                f'{ctr},{name},{sdfg},{state},{node},{tid},{s.count},{s.min},{s.mean},{s.median},{s.max}\n'
+                for ((sdfg, state, node), name, ctr, tid), s in self.counter_statistics.items())
+
+        return durations_csv.getvalue(), counters_csv.getvalue()
+
+    def save_columns(self, filename: str) -> None:
+        """
+        Stores the events of the report in a compressed NumPy archive (``.npz``), with one array per field. Duration
+        fields are prefixed with ``durations/`` and counter fields with ``counters/``. The names of events and
+        counters are stored in the ``names`` and ``counter_names`` arrays.
+
+        :param filename: The file name to store.
+        """
+        arrays = {f'durations/{k}': v for k, v in self.durations.items()}
+        arrays.update({f'counters/{k}': v for k, v in self.counters.items()})
+        np.savez_compressed(filename,
+                            names=np.array(self.names, dtype=str),
+                            counter_names=np.array(self.counter_names, dtype=str),
+                            sdfg_hash=np.array(self.sdfg_hash),
+                            **arrays)
@@ -1,5 +1,5 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
-from dace import dtypes, registry
+from dace import config, dtypes, registry
 from dace.sdfg.nodes import CodeNode
 from dace.codegen.instrumentation.provider import InstrumentationProvider
 from dace.codegen.prettycode import CodeIOStream
@@ -9,17 +9,20 @@ from dace.codegen.prettycode import CodeIOStream
 class TimerProvider(InstrumentationProvider):
     """ Timing instrumentation that reports wall-clock time directly after
         timed execution is complete. """
+
+    instrumentation_type = dtypes.InstrumentationType.Timer
+
     def on_sdfg_begin(self, sdfg, local_stream, global_stream, codegen):
         global_stream.write('#include <chrono>')
 
         # For other file headers
         sdfg.append_global_code('\n#include <chrono>', None)
 
-        if sdfg.instrument == dtypes.InstrumentationType.Timer:
+        if sdfg.instrument == self.instrumentation_type:
             self.on_tbegin(local_stream, sdfg)
 
     def on_sdfg_end(self, sdfg, local_stream, global_stream):
-        if sdfg.instrument == dtypes.InstrumentationType.Timer:
+        if sdfg.instrument == self.instrumentation_type:
             self.on_tend('SDFG %s' % sdfg.name, local_stream, sdfg)
 
     def on_tbegin(self, stream: CodeIOStream, sdfg=None, state=None, node=None):
@@ -45,11 +48,11 @@ __state->report.add_completion("{timer_name}", "Timer", __dace_ts_start_{id}, __
 
     # Code generation hooks
     def on_state_begin(self, sdfg, state, local_stream, global_stream):
-        if state.instrument == dtypes.InstrumentationType.Timer:
+        if state.instrument == self.instrumentation_type:
             self.on_tbegin(local_stream, sdfg, state)
 
     def on_state_end(self, sdfg, state, local_stream, global_stream):
-        if state.instrument == dtypes.InstrumentationType.Timer:
+        if state.instrument == self.instrumentation_type:
             self.on_tend('State %s' % state.label, local_stream, sdfg, state)
 
     def _get_sobj(self, node):
@@ -61,24 +64,69 @@ __state->report.add_completion("{timer_name}", "Timer", __dace_ts_start_{id}, __
 
     def on_scope_entry(self, sdfg, state, node, outer_stream, inner_stream, global_stream):
         s = self._get_sobj(node)
-        if s.instrument == dtypes.InstrumentationType.Timer:
+        if s.instrument == self.instrumentation_type:
             self.on_tbegin(outer_stream, sdfg, state, node)
 
     def on_scope_exit(self, sdfg, state, node, outer_stream, inner_stream, global_stream):
         entry_node = state.entry_node(node)
         s = self._get_sobj(node)
-        if s.instrument == dtypes.InstrumentationType.Timer:
+        if s.instrument == self.instrumentation_type:
             self.on_tend('%s %s' % (type(s).__name__, s.label), outer_stream, sdfg, state, entry_node)
 
     def on_node_begin(self, sdfg, state, node, outer_stream, inner_stream, global_stream):
         if not isinstance(node, CodeNode):
             return
-        if node.instrument == dtypes.InstrumentationType.Timer:
+        if node.instrument == self.instrumentation_type:
             self.on_tbegin(outer_stream, sdfg, state, node)
 
     def on_node_end(self, sdfg, state, node, outer_stream, inner_stream, global_stream):
         if not isinstance(node, CodeNode):
             return
-        if node.instrument == dtypes.InstrumentationType.Timer:
+        if node.instrument == self.instrumentation_type:
             idstr = self._idstr(sdfg, state, node)
             self.on_tend('%s %s' % (type(node).__name__, idstr), outer_stream, sdfg, state, node)
+
+
+@registry.autoregister_params(type=dtypes.InstrumentationType.Sampled_Timer)
+class SampledTimerProvider(TimerProvider):
+    """ Low-overhead timing instrumentation that only times a sample of the
+        invocations of each element (every N-th invocation, or one invocation
+        per time period, per thread). The most recent samples of each thread
+        are kept in a fixed-size ring buffer, and all samples are aggregated
+        into a histogram of durations at runtime (see the
+        ``instrumentation.sampled_timer`` configuration entries). """
+
+    instrumentation_type = dtypes.InstrumentationType.Sampled_Timer
+
+    def __init__(self):
+        self._timers = set()
+
+    def on_sdfg_begin(self, sdfg, local_stream, global_stream, codegen):
+        self.codegen = codegen
+        super().on_sdfg_begin(sdfg, local_stream, global_stream, codegen)
+
+    def on_tbegin(self, stream: CodeIOStream, sdfg=None, state=None, node=None):
+        idstr = self._idstr(sdfg, state, node)
+
+        stream.write('unsigned long long __dace_tsample_%s = __state->__dace_stimer_%s.begin();' % (idstr, idstr))
+
+    def on_tend(self, timer_name: str, stream: CodeIOStream, sdfg=None, state=None, node=None):
+        idstr = self._idstr(sdfg, state, node)
+
+        # Declare timer in state struct
+        if idstr not in self._timers:
+            self._timers.add(idstr)
+            state_id = -1
+            node_id = -1
+            if state is not None:
+                state_id = sdfg.node_id(state)
+                if node is not None:
+                    node_id = state.node_id(node)
+            interval = config.Config.get('instrumentation', 'sampled_timer', 'sampling_interval')
+            period = config.Config.get('instrumentation', 'sampled_timer', 'sampling_period')
+            buffer_size = config.Config.get('instrumentation', 'sampled_timer', 'buffer_size')
+            self.codegen.statestruct.append(
+                f'dace::perf::SampledTimer __dace_stimer_{idstr}{{report, "{timer_name}", {sdfg.sdfg_id}, {state_id}, '
+                f'{node_id}, {interval}, {period}, {buffer_size}}};')
+
+        stream.write('__state->__dace_stimer_%s.end(__dace_tsample_%s);' % (idstr, idstr))
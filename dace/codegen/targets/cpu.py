@@ -418,9 +418,15 @@ class CPUCodeGen(TargetCodeGenerator):
 
             if not declared:
                 declaration_stream.write(f'{nodedesc.dtype.ctype} *{name};\n', sdfg, state_id, node)
-            allocation_stream.write(
-                "%s = new %s DACE_ALIGN(64)[%s];\n" % (alloc_name, nodedesc.dtype.ctype, cpp.sym2cpp(arrsize)), sdfg,
-                state_id, node)
+            arena_pointer = self._frame.arena_pointer(sdfg, node.data)
+            if arena_pointer is not None:
+                # Memory is planned in an arena allocated upon initialization
+                allocation_stream.write(f'{alloc_name} = reinterpret_cast<{ctypedef}>{arena_pointer};\n', sdfg,
+                                        state_id, node)
+            else:
+                allocation_stream.write(
+                    "%s = new %s DACE_ALIGN(64)[%s];\n" % (alloc_name, nodedesc.dtype.ctype, cpp.sym2cpp(arrsize)),
+                    sdfg, state_id, node)
             define_var(name, DefinedType.Pointer, ctypedef)
 
             if node.setzero:
@@ -504,6 +510,8 @@ class CPUCodeGen(TargetCodeGenerator):
             return
         elif (nodedesc.storage == dtypes.StorageType.CPU_Heap
               or (nodedesc.storage == dtypes.StorageType.Register and symbolic.issymbolic(arrsize, sdfg.constants))):
+            if self._frame.arena_pointer(sdfg, node.data) is not None:
+                return
             callsite_stream.write("delete[] %s;\n" % alloc_name, sdfg, state_id, node)
         elif nodedesc.storage is dtypes.StorageType.CPU_ThreadLocal:
             # Deallocate in each OpenMP thread
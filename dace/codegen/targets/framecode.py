@@ -45,6 +45,7 @@ class DaCeCodeGenerator(object):
         self.to_allocate: DefaultDict[Union[SDFG, SDFGState, nodes.EntryNode],
                                       List[Tuple[int, int, nodes.AccessNode]]] = collections.defaultdict(list)
         self.where_allocated: Dict[Tuple[SDFG, str], SDFG] = {}
+        self.memory_plan: Optional['MemoryPlan'] = None
         self.fsyms: Dict[int, Set[str]] = {}
         self._symbols_and_constants: Dict[int, Set[str]] = {}
         fsyms = self.free_symbols(sdfg)
@@ -210,7 +211,8 @@ struct {sdfg.name}_t {{
 
         # Instrumentation preamble
         if len(self._dispatcher.instrumentation) > 2:
-            self.statestruct.append('dace::perf::Report report;')
+            # The report is declared first, since fields added by instrumentation providers may refer to it
+            self.statestruct.insert(0, 'dace::perf::Report report;')
             # Reset report if written every invocation
             if config.Config.get_bool('instrumentation', 'report_each_invocation'):
                 callsite_stream.write('__state->report.reset();', sdfg)
@@ -524,6 +526,53 @@ DACE_EXPORTED void __dace_set_external_memory_{storage.name}({sdfg.name}_t *__st
 
         return False
 
+    def plan_memory_arenas(self, top_sdfg: SDFG):
+        """
+        Plans transients of the SDFG and all nested SDFGs into memory arenas, which are allocated once upon
+        initialization.
+
+        :param top_sdfg: The top-level SDFG to plan.
+        :see: dace.transformation.passes.memory_planner.MemoryPlanner
+        """
+        from dace.transformation.passes.memory_planner import MemoryPlanner  # Avoid import loop
+
+        planner = MemoryPlanner({dtypes.StorageType.CPU_Heap},
+                                alignment=config.Config.get('compiler', 'memory_arena_alignment'))
+        self.memory_plan = planner.apply_pass(top_sdfg, {})
+        if self.memory_plan is None:
+            return
+        if config.Config.get_bool('debugprint'):
+            print(self.memory_plan)
+
+        for storage, size in self.memory_plan.arena_sizes.items():
+            alignment = self.memory_plan.arena_alignments[storage]
+            arena = f'__dace_arena_{storage.name}'
+            self.statestruct.append(f'char *{arena}_buffer;')
+            self.statestruct.append(f'char *{arena};')
+            buffer = f'reinterpret_cast<uintptr_t>(__state->{arena}_buffer)'
+            aligned = f'({buffer} + {alignment - 1}) / {alignment} * {alignment}'
+            self._initcode.write(f'''
+__state->{arena}_buffer = new char[{size + alignment}];
+__state->{arena} = reinterpret_cast<char *>({aligned});
+''')
+            self._exitcode.write(f'delete[] __state->{arena}_buffer;\n')
+
+    def arena_pointer(self, sdfg: SDFG, name: str) -> Optional[str]:
+        """
+        Returns an expression of the memory of a transient in its memory arena, or None if the transient is not
+        planned into an arena.
+
+        :param sdfg: The SDFG that contains the transient.
+        :param name: The name of the transient.
+        """
+        if self.memory_plan is None:
+            return None
+        entry = self.memory_plan.offsets.get((sdfg.sdfg_id, name))
+        if entry is None:
+            return None
+        storage, offset = entry
+        return f'(__state->__dace_arena_{storage.name} + {offset})'
+
     def determine_allocation_lifetime(self, top_sdfg: SDFG):
         """
         Determines where (at which scope/state/SDFG) each data descriptor
@@ -840,6 +889,8 @@ DACE_EXPORTED void __dace_set_external_memory_{storage.name}({sdfg.name}_t *__st
         # Analyze allocation lifetime of SDFG and all nested SDFGs
         if is_top_level:
             self.determine_allocation_lifetime(sdfg)
+            if config.Config.get_bool('compiler', 'memory_arenas'):
+                self.plan_memory_arenas(sdfg)
 
         # Generate code
         ###########################
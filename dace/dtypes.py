@@ -161,6 +161,7 @@ class InstrumentationType(aenum.AutoNumberEnum):
     LIKWID_GPU = ()
     GPU_Events = ()
     FPGA = ()
+    Sampled_Timer = ()
 
 
 @undefined_safe_enum
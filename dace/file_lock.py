@@ -0,0 +1,33 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Inter-process locking of files, used to synchronize on-disk caches and databases that are shared across processes.
+"""
+from contextlib import contextmanager
+import os
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Context manager that holds an exclusive inter-process lock on the given file while active. The file is created
+    if it does not exist.
+
+    :param path: Path to the lock file.
+    """
+    with open(path, 'a+') as fp:
+        if os.name == 'nt':
+            import msvcrt
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
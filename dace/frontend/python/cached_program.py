@@ -3,11 +3,19 @@
 
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Set, Tuple
+import hashlib
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import uuid
+
+import numpy as np
 
 import dace
 from dace import config
 from dace import data as dt, hooks
+from dace.file_lock import file_lock
 from dace.sdfg.sdfg import SDFG
 
 # Type hints
@@ -50,6 +58,14 @@ def _make_sortable(obj):
         return repr(obj)
 
 
+def _make_stable_repr(obj) -> str:
+    """ Returns a string representation of a closure constant that is stable across processes. """
+    if isinstance(obj, np.ndarray):
+        # Array representations are truncated, use their contents instead
+        return f'ndarray({obj.dtype}, {obj.shape}, {hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()})'
+    return repr(obj)
+
+
 @dataclass
 class ProgramCacheKey:
     """ A key object representing a single instance of a DaCe program. """
@@ -70,7 +86,7 @@ class ProgramCacheKey:
             tuple((k, str(v.to_json())) for k, v in sorted(closure_types.items())),
             tuple((k, _make_hashable(v)) for k, v in sorted(closure_constants.items())),
             tuple(sorted(_make_sortable(a) for a in specified_args)),
-            tuple(id(hook) for hook in hooks._SDFG_CALL_HOOKS),
+            tuple(id(hook) for hook in hooks._SDFG_CALL_HOOKS if hook is not None),
         )
 
     def __hash__(self) -> int:
@@ -79,6 +95,18 @@ class ProgramCacheKey:
     def __eq__(self, o: 'ProgramCacheKey') -> bool:
         return self._tuple == o._tuple
 
+    def serialize(self) -> str:
+        """
+        Returns a string representation of the key that is stable across processes (i.e., does not depend on
+        object identities), used to address entries in the persistent program cache.
+        """
+        return json.dumps([
+            [[k, str(v.to_json())] for k, v in sorted(self.arg_types.items())],
+            [[k, str(v.to_json())] for k, v in sorted(self.closure_types.items())],
+            [[k, _make_stable_repr(v)] for k, v in sorted(self.closure_constants.items())],
+            sorted(repr(a) for a in self.specified_args),
+        ])
+
 
 @dataclass
 class ProgramCacheEntry:
@@ -149,3 +177,191 @@ class DaceProgramCache:
     def pop(self) -> None:
         """ Remove the first entry from the cache. """
         self.cache.popitem(last=False)
+
+
+class PersistentProgramCache:
+    """
+    A persistent, content-addressed on-disk cache of compiled DaCe programs that is shared across processes.
+    Each entry maps a serialized program cache key (see ``ProgramCacheKey.serialize``) and the program source code
+    to the resulting SDFG and its compiled shared library. The cache is bounded in the number of entries and evicts
+    the least recently used entries first. Concurrent accesses from multiple processes are synchronized through a
+    lock file in the cache folder.
+    """
+
+    STATISTICS = ('hits', 'misses', 'stores', 'evictions')
+
+    #: Configuration entries that affect parsing, transformation, code generation, or compilation of programs
+    CONFIG_ENTRIES = ('compiler', 'frontend', 'optimizer', 'instrumentation', 'library', 'profiling')
+
+    #: Entries of ``CONFIG_ENTRIES`` that configure on-disk caches, which do not affect the compiled programs
+    IGNORED_CONFIG_ENTRIES = (
+        ('frontend', 'persistent_cache'),
+        ('frontend', 'persistent_cache_folder'),
+        ('frontend', 'persistent_cache_size'),
+        ('optimizer', 'transformation_cache'),
+        ('optimizer', 'transformation_cache_folder'),
+        ('optimizer', 'transformation_cache_size'),
+        ('compiler', 'object_cache_folder'),
+        ('compiler', 'object_cache_size'),
+    )
+
+    def __init__(self, folder: Optional[str] = None, size: Optional[int] = None) -> None:
+        """
+        Initializes a persistent program cache.
+
+        :param folder: The folder in which the cache is stored (if not given, uses the value from the configuration,
+                       or a ``programs`` subfolder of the default build folder).
+        :param size: The maximal number of entries in the cache (if not given, uses the value from the
+                     configuration).
+        """
+        folder = folder or config.Config.get('frontend', 'persistent_cache_folder')
+        if not folder:
+            folder = os.path.join(config.Config.get('default_build_folder'), 'programs')
+        self.folder = os.path.abspath(folder)
+        self.size = size or config.Config.get('frontend', 'persistent_cache_size')
+        os.makedirs(os.path.join(self.folder, 'entries'), exist_ok=True)
+        self._lockfile = os.path.join(self.folder, '.lock')
+        self._statsfile = os.path.join(self.folder, 'statistics.json')
+
+    @staticmethod
+    def digest(program_name: str, key: ProgramCacheKey, sources: List[str]) -> str:
+        """
+        Computes the address of a program in the persistent cache. Besides the given arguments, the address depends
+        on the DaCe version, the configuration entries in ``CONFIG_ENTRIES`` (e.g., compiler executables, flags and
+        build type) except for ``IGNORED_CONFIG_ENTRIES``, and the compiler environment variables.
+
+        :param program_name: The name of the program.
+        :param key: The program cache key (argument types, closure types, and constants).
+        :param sources: The source code of the program and the programs it calls.
+        :return: A hexadecimal digest string.
+        """
+        configuration = {entry: config.Config.get(entry) for entry in PersistentProgramCache.CONFIG_ENTRIES}
+        for section, entry in PersistentProgramCache.IGNORED_CONFIG_ENTRIES:
+            configuration[section] = {k: v for k, v in configuration[section].items() if k != entry}
+        environment = {var: os.environ.get(var) for var in ('CC', 'CXX', 'CFLAGS', 'CXXFLAGS', 'LDFLAGS')}
+        settings = json.dumps([configuration, environment], sort_keys=True, default=str)
+        hasher = hashlib.sha256()
+        for part in [dace.__version__, settings, program_name, key.serialize()] + sources:
+            hasher.update(part.encode('utf-8'))
+            hasher.update(b'\0')
+        return hasher.hexdigest()
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.folder, 'entries', digest)
+
+    def _update_statistics(self, **increments: int) -> None:
+        """ Increments the persistent cache statistics. Must be called while holding the cache lock. """
+        stats = self._read_statistics()
+        for k, v in increments.items():
+            stats[k] += v
+        with open(self._statsfile, 'w') as fp:
+            json.dump(stats, fp)
+
+    def _read_statistics(self) -> Dict[str, int]:
+        stats = {k: 0 for k in self.STATISTICS}
+        try:
+            with open(self._statsfile, 'r') as fp:
+                stats.update(json.load(fp))
+        except (FileNotFoundError, ValueError):
+            pass
+        return stats
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the persistent cache, accumulated over all processes that used it.
+
+        :return: A dictionary with the number of cache hits, misses, stores, evictions, and current entries.
+        """
+        with file_lock(self._lockfile):
+            stats = self._read_statistics()
+        stats['entries'] = len(os.listdir(os.path.join(self.folder, 'entries')))
+        return stats
+
+    def load(self, digest: str) -> Optional['dace.codegen.compiled_sdfg.CompiledSDFG']:
+        """
+        Loads a compiled program from the persistent cache.
+
+        :param digest: The address of the program (see ``digest``).
+        :return: The compiled SDFG object, or None if the program is not in the cache.
+        """
+        from dace.codegen import compiled_sdfg as csd  # Avoid import loops
+
+        path = self._entry_path(digest)
+        with file_lock(self._lockfile):
+            try:
+                with open(os.path.join(path, 'entry.json'), 'r') as fp:
+                    libname = json.load(fp)['name']
+                sdfg = SDFG.from_file(os.path.join(path, 'program.sdfg'))
+                # Mark entry as recently used
+                os.utime(path)
+            except (FileNotFoundError, KeyError, ValueError):
+                self._update_statistics(misses=1)
+                return None
+            self._update_statistics(hits=1)
+
+        suffix = config.Config.get('compiler', 'library_extension')
+        return csd.CompiledSDFG(sdfg, csd.ReloadableDLL(os.path.join(path, 'build', f'lib{libname}.{suffix}'),
+                                                        libname))
+
+    def store(self, digest: str, compiled_sdfg: 'dace.codegen.compiled_sdfg.CompiledSDFG') -> None:
+        """
+        Stores a compiled program in the persistent cache, evicting the least recently used entries if the cache
+        exceeds its size.
+
+        :param digest: The address of the program (see ``digest``).
+        :param compiled_sdfg: The compiled SDFG object to store.
+        """
+        sdfg = compiled_sdfg.sdfg
+        libpath = compiled_sdfg.filename
+        stubpath = compiled_sdfg._lib._stub_filename
+
+        # Write entry into a temporary folder first, then move it into place atomically
+        tmppath = os.path.join(self.folder, f'.tmp-{uuid.uuid4().hex}')
+        os.makedirs(os.path.join(tmppath, 'build'))
+        sdfg.save(os.path.join(tmppath, 'program.sdfg'), hash=False)
+        suffix = config.Config.get('compiler', 'library_extension')
+        shutil.copyfile(libpath, os.path.join(tmppath, 'build', f'lib{sdfg.name}.{suffix}'))
+        shutil.copyfile(stubpath, os.path.join(tmppath, 'build', os.path.basename(stubpath)))
+        with open(os.path.join(tmppath, 'entry.json'), 'w') as fp:
+            json.dump({'name': sdfg.name, 'version': dace.__version__}, fp)
+
+        with file_lock(self._lockfile):
+            try:
+                os.rename(tmppath, self._entry_path(digest))
+            except OSError:  # Entry was stored concurrently by another process
+                shutil.rmtree(tmppath, ignore_errors=True)
+                return
+            self._update_statistics(stores=1, evictions=self._evict())
+
+    def _evict(self) -> int:
+        """
+        Removes the least recently used entries until the cache is within its size. Must be called while holding
+        the cache lock.
+
+        :return: The number of evicted entries.
+        """
+        entries_folder = os.path.join(self.folder, 'entries')
+        entries = [os.path.join(entries_folder, e) for e in os.listdir(entries_folder)]
+        if len(entries) <= self.size:
+            return 0
+        entries.sort(key=os.path.getmtime)
+        evicted = 0
+        for path in entries[:len(entries) - self.size]:
+            # Move entry out of the cache before deleting it, so that it is never partially visible
+            trashpath = os.path.join(self.folder, f'.trash-{uuid.uuid4().hex}')
+            try:
+                os.rename(path, trashpath)
+            except OSError:  # Entry is in use (e.g., a loaded library on Windows)
+                continue
+            shutil.rmtree(trashpath, ignore_errors=True)
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        """ Removes all entries and statistics from the persistent cache. """
+        with file_lock(self._lockfile):
+            entries_folder = os.path.join(self.folder, 'entries')
+            for entry in os.listdir(entries_folder):
+                shutil.rmtree(os.path.join(entries_folder, entry), ignore_errors=True)
+            if os.path.exists(self._statsfile):
+                os.remove(self._statsfile)
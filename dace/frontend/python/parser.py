@@ -60,6 +60,37 @@ def _get_locals_and_globals(f):
     return result
 
 
+def _closure_sources(program: 'DaceProgram', closure: pycommon.SDFGClosure) -> Optional[List[str]]:
+    """
+    Returns the source code of a DaCe program and of all the programs and SDFGs it (transitively) calls, in order
+    to detect changes in a program across processes.
+
+    :param program: The DaCe program.
+    :param closure: The resolved closure of the program.
+    :return: A list of source code strings, or None if the source code of an object could not be obtained.
+    """
+    try:
+        sources = [inspect.getsource(program.f)]
+    except (OSError, TypeError):
+        return None
+
+    closures = [closure]
+    while closures:
+        current = closures.pop()
+        for _, obj in current.closure_sdfgs.values():
+            if isinstance(obj, SDFG):
+                sources.append(obj.hash_sdfg())
+            elif isinstance(obj, DaceProgram):
+                try:
+                    sources.append(inspect.getsource(obj.f))
+                except (OSError, TypeError):
+                    return None
+            else:
+                return None
+        closures.extend(child for _, child in current.nested_closures)
+    return sources
+
+
 def infer_symbols_from_datadescriptor(sdfg: SDFG,
                                       args: Dict[str, Any],
                                       exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
@@ -426,6 +457,17 @@ class DaceProgram(pycommon.SDFGConvertible):
         # Clear cache to enforce deletion and closure of compiled program
         # self._cache.pop()
 
+        # Try to load an already compiled program from the persistent (on-disk) cache
+        digest = self._persistent_cache_digest(args, kwargs)
+        if digest is not None:
+            binaryobj = cached_program.PersistentProgramCache().load(digest)
+            if binaryobj is not None:
+                cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys,
+                                                self.closure_constant_keys, constant_args)
+                self._cache.add(cachekey, binaryobj.sdfg, binaryobj)
+                kwargs.update(arg_mapping)
+                return binaryobj(**self._create_sdfg_args(binaryobj.sdfg, args, kwargs))
+
         # Parse SDFG
         sdfg = self._parse(args, kwargs)
 
@@ -448,12 +490,39 @@ class DaceProgram(pycommon.SDFGConvertible):
             cachekey = self._cache.make_key(argtypes, specified, self.closure_array_keys, self.closure_constant_keys,
                                             constant_args)
             self._cache.add(cachekey, sdfg, binaryobj)
+            if digest is not None:
+                cached_program.PersistentProgramCache().store(digest, binaryobj)
 
             # Call SDFG
             result = binaryobj(**sdfg_args)
 
         return result
 
+    def _persistent_cache_digest(self, args, kwargs) -> Optional[str]:
+        """
+        Computes the address of this program instance in the persistent program cache. Resolves the closure of the
+        program (without parsing it) to obtain the full program cache key.
+
+        :return: The digest string, or None if the persistent cache is disabled or cannot be used for this program.
+        """
+        if not Config.get_bool('frontend', 'persistent_cache'):
+            return None
+        # Programs that are loaded from the build folder, specialized to symbol values, or modified by hooks
+        # cannot be addressed by their key and source code alone
+        if not self.recreate_sdfg or not self.regenerate_code or not self.recompile:
+            return None
+        if self.autoopt or Config.get_bool('optimizer', 'autooptimize'):
+            return None
+        # Unregistered hooks leave an empty (None) slot in the hook lists
+        if any(h is not None for h in hooks._SDFG_CALL_HOOKS + hooks._COMPILED_SDFG_CALL_HOOKS):
+            return None
+
+        _, cachekey = self._load_sdfg(None, *args, **kwargs)
+        sources = _closure_sources(self, self.resolver)
+        if sources is None:
+            return None
+        return cached_program.PersistentProgramCache.digest(self.name, cachekey, sources)
+
     def _parse(self, args, kwargs, simplify=None, save=False, validate=False) -> SDFG:
         """ 
         Try to parse a DaceProgram object and return the `dace.SDFG` object
@@ -83,6 +83,77 @@ class ExpandBatchedMatMulPure(ExpandTransformation):
         return ExpandBatchedMatMulPure.make_sdfg(node, state, sdfg)
 
 
+@dace.library.expansion
+class ExpandBatchedMatMulPureTiled(ExpandTransformation):
+    """
+    Expands a batched matrix multiplication into a parallel map over the batch, which contains a GEMM library node
+    with the cache-blocked "pure_tiled" implementation.
+    """
+
+    environments = []
+
+    @staticmethod
+    def make_sdfg(node, parent_state, parent_sdfg):
+        from dace.libraries.blas.nodes.gemm import Gemm  # Avoid import loop
+
+        ((edge_a, outer_array_a, shape_a, strides_a), (edge_b, outer_array_b, shape_b, strides_b),
+         cdata) = _get_matmul_operands(node, parent_state, parent_sdfg)
+        outedge = parent_state.out_edges(node)[0]
+        cdesc = parent_sdfg.arrays[outedge.data.data]
+        bopt = _get_batchmm_opts(shape_a, strides_a, shape_b, strides_b, cdesc.shape, cdesc.strides)
+
+        res = equal(shape_a[-1], shape_b[-2])
+        if res is None:
+            warnings.warn(f"First matrix columns {shape_a[-1]} may not match second matrix rows {shape_b[-2]}",
+                          UserWarning)
+        elif not res:
+            raise SyntaxError("Matrix sizes must match")
+        shape_c = (bopt['b'], shape_a[-2], shape_b[-1])
+
+        if outer_array_a.storage != outer_array_b.storage:
+            raise ValueError("Input matrices must have same storage")
+        storage = outer_array_a.storage
+
+        sdfg = dace.SDFG(node.label + "_sdfg")
+        _, array_a = sdfg.add_array("_a", shape_a, outer_array_a.dtype, strides=strides_a, storage=storage)
+        _, array_b = sdfg.add_array("_b", shape_b, outer_array_b.dtype, strides=strides_b, storage=storage)
+        _, array_c = sdfg.add_array("_c", shape_c, cdesc.dtype, strides=cdata[-1], storage=storage)
+        state = sdfg.add_state(node.label + "_state")
+
+        gemm = Gemm(node.label + "_gemm")
+        gemm.implementation = "pure_tiled"
+        gemm.accumulator_type = node.accumulator_type
+
+        def matrix(name: str, shape) -> str:
+            ranges = ', '.join(f'0:{symstr(s)}' for s in shape[-2:])
+            return f'{name}[__i0, {ranges}]' if len(shape) == 3 else f'{name}[{ranges}]'
+
+        map_entry, map_exit = state.add_map('batched_gemm', {'__i0': f'0:{symstr(bopt["b"])}'},
+                                            schedule=dtypes.ScheduleType.CPU_Multicore)
+        state.add_memlet_path(state.add_read('_a'),
+                              map_entry,
+                              gemm,
+                              dst_conn='_a',
+                              memlet=dace.Memlet(matrix('_a', array_a.shape)))
+        state.add_memlet_path(state.add_read('_b'),
+                              map_entry,
+                              gemm,
+                              dst_conn='_b',
+                              memlet=dace.Memlet(matrix('_b', array_b.shape)))
+        state.add_memlet_path(gemm,
+                              map_exit,
+                              state.add_write('_c'),
+                              src_conn='_c',
+                              memlet=dace.Memlet(matrix('_c', array_c.shape)))
+
+        return sdfg
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        node.validate(sdfg, state)
+        return ExpandBatchedMatMulPureTiled.make_sdfg(node, state, sdfg)
+
+
 @dace.library.expansion
 class ExpandBatchedMatMulMKL(ExpandTransformation):
 
@@ -384,6 +455,7 @@ class BatchedMatMul(dace.sdfg.nodes.LibraryNode):
     # Global properties
     implementations = {
         "pure": ExpandBatchedMatMulPure,
+        "pure_tiled": ExpandBatchedMatMulPureTiled,
         "MKL": ExpandBatchedMatMulMKL,
         "OpenBLAS": ExpandBatchedMatMulOpenBLAS,
         "cuBLAS": ExpandBatchedMatMulCuBLAS
@@ -38,99 +38,113 @@ def _cast_to_dtype_str(value, dtype: dace.dtypes.typeclass) -> str:
         return "dace.{}({})".format(dace.DTYPE_TO_TYPECLASS[dtype].to_string(), value)
 
 
-@dace.library.expansion
-class ExpandGemmPure(ExpandTransformation):
+def _make_gemm_sdfg(node, parent_state, parent_sdfg):
+    """
+    Creates the SDFG of a pure GEMM expansion with its arrays and the initialization of the output (scaling by beta).
 
-    environments = []
+    :return: A tuple of the SDFG, the state in which the multiplication should be added, the matrix sizes
+             (M, N, K) of ``op(A) @ op(B)``, and the data types of A and C.
+    """
+    sdfg = dace.SDFG(node.label + "_sdfg")
 
-    @staticmethod
-    def make_sdfg(node, parent_state, parent_sdfg):
-        sdfg = dace.SDFG(node.label + "_sdfg")
+    ((edge_a, outer_array_a, shape_a, strides_a), (edge_b, outer_array_b, shape_b, strides_b),
+     cdata) = _get_matmul_operands(node, parent_state, parent_sdfg)
 
-        ((edge_a, outer_array_a, shape_a, strides_a), (edge_b, outer_array_b, shape_b, strides_b),
-         cdata) = _get_matmul_operands(node, parent_state, parent_sdfg)
+    dtype_a = outer_array_a.dtype.type
+    dtype_b = outer_array_b.dtype.type
+    dtype_c = dace.DTYPE_TO_TYPECLASS[np.result_type(dtype_a, dtype_b).type]
 
-        dtype_a = outer_array_a.dtype.type
-        dtype_b = outer_array_b.dtype.type
-        dtype_c = dace.DTYPE_TO_TYPECLASS[np.result_type(dtype_a, dtype_b).type]
+    if node.transA:
+        trans_shape_a = list(reversed(shape_a))
+    else:
+        trans_shape_a = shape_a
 
-        if node.transA:
-            trans_shape_a = list(reversed(shape_a))
+    if node.transB:
+        trans_shape_b = list(reversed(shape_b))
+    else:
+        trans_shape_b = shape_b
+
+    if len(trans_shape_a) != 2 or len(trans_shape_b) != 2:
+        raise SyntaxError("Matrix sizes must match")
+    res = equal(trans_shape_a[1], trans_shape_b[0])
+    if res is None:
+        warnings.warn(f"First matrix columns {trans_shape_a[1]} may not match "
+                      f"second matrix rows {trans_shape_b[0]}", UserWarning)
+    elif not res:
+        raise SyntaxError("Matrix sizes must match")
+    M, K, N = trans_shape_a[0], trans_shape_a[1], trans_shape_b[1]
+    shape_c = (M, N)
+
+    storage = outer_array_a.storage
+
+    _, array_a = sdfg.add_array("_a", shape_a, dtype_a, strides=strides_a, storage=outer_array_a.storage)
+    _, array_b = sdfg.add_array("_b", shape_b, dtype_b, strides=strides_b, storage=outer_array_b.storage)
+    _, array_c = sdfg.add_array("_c", shape_c, dtype_c, strides=cdata[-1], storage=cdata[1].storage)
+
+    if node.beta == 1:
+        state = sdfg.add_state(node.label + "_state")
+    else:
+        init_state = sdfg.add_state(node.label + "_initstate")
+        state = sdfg.add_state_after(init_state, node.label + "_state")
+
+    if '_cin' in node.in_connectors:
+        sdfg.add_array("_cin", shape_c, dtype_c, strides=cdata[-1], storage=cdata[1].storage)
+
+    mul_out = "_c"
+
+    # Initialization / beta map
+    if node.beta == 0:
+        init_state.add_mapped_tasklet(
+            'gemm_init', {'_o%d' % i: '0:%s' % symstr(d)
+                          for i, d in enumerate(shape_c)}, {},
+            'out = 0', {'out': dace.Memlet.simple(mul_out, ','.join(['_o%d' % i for i in range(len(shape_c))]))},
+            external_edges=True)
+    elif node.beta == 1:
+        # Do nothing for initialization, only update the values
+        pass
+    else:
+        # Beta map
+        add_program = "__y = ({} * __c)".format(_cast_to_dtype_str(node.beta, dtype_a))
+
+        # manually broadcasting C to [M, N]
+        if list(shape_c) == [M, N]:
+            memlet_idx = '__i0, __i1'
+        elif list(shape_c) == [1, N]:
+            memlet_idx = '0, __i1'
+        elif list(shape_c) == [M, 1]:
+            memlet_idx = '__i0, 0'
+        elif list(shape_c) == [N]:
+            memlet_idx = '__i1'
         else:
-            trans_shape_a = shape_a
+            raise ValueError("Could not broadcast input _c to ({}, {})".format(M, N))
 
-        if node.transB:
-            trans_shape_b = list(reversed(shape_b))
-        else:
-            trans_shape_b = shape_b
+        init_state.add_mapped_tasklet("gemm_init", {"__i%d" % i: "0:%s" % s
+                                                    for i, s in enumerate([M, N])}, {
+                                                        "__c": dace.Memlet.simple("_cin", memlet_idx),
+                                                    },
+                                      add_program, {"__y": dace.Memlet.simple("_c", "__i0, __i1")},
+                                      external_edges=True)
 
-        if len(trans_shape_a) != 2 or len(trans_shape_b) != 2:
-            raise SyntaxError("Matrix sizes must match")
-        res = equal(trans_shape_a[1], trans_shape_b[0])
-        if res is None:
-            warnings.warn(f"First matrix columns {trans_shape_a[1]} may not match "
-                          f"second matrix rows {trans_shape_b[0]}", UserWarning)
-        elif not res:
-            raise SyntaxError("Matrix sizes must match")
-        M, K, N = trans_shape_a[0], trans_shape_a[1], trans_shape_b[1]
-        shape_c = (M, N)
+    return sdfg, state, (M, N, K), dtype_a, dtype_c
 
-        storage = outer_array_a.storage
 
-        _, array_a = sdfg.add_array("_a", shape_a, dtype_a, strides=strides_a, storage=outer_array_a.storage)
-        _, array_b = sdfg.add_array("_b", shape_b, dtype_b, strides=strides_b, storage=outer_array_b.storage)
-        _, array_c = sdfg.add_array("_c", shape_c, dtype_c, strides=cdata[-1], storage=cdata[1].storage)
+@dace.library.expansion
+class ExpandGemmPure(ExpandTransformation):
+
+    environments = []
+
+    @staticmethod
+    def make_sdfg(node, parent_state, parent_sdfg):
+        sdfg, state, (M, N, K), dtype_a, _ = _make_gemm_sdfg(node, parent_state, parent_sdfg)
 
         if node.alpha == 1.0:
             mul_program = "__out = __a * __b"
         else:
             mul_program = "__out = {} * __a * __b".format(_cast_to_dtype_str(node.alpha, dtype_a))
 
-        if node.beta == 1:
-            state = sdfg.add_state(node.label + "_state")
-        else:
-            init_state = sdfg.add_state(node.label + "_initstate")
-            state = sdfg.add_state_after(init_state, node.label + "_state")
-
-        if '_cin' in node.in_connectors:
-            sdfg.add_array("_cin", shape_c, dtype_c, strides=cdata[-1], storage=cdata[1].storage)
-
-        mul_out, mul_out_array = "_c", array_c
+        mul_out = "_c"
         output_nodes = None
 
-        # Initialization / beta map
-        if node.beta == 0:
-            init_state.add_mapped_tasklet(
-                'gemm_init', {'_o%d' % i: '0:%s' % symstr(d)
-                              for i, d in enumerate(shape_c)}, {},
-                'out = 0', {'out': dace.Memlet.simple(mul_out, ','.join(['_o%d' % i for i in range(len(shape_c))]))},
-                external_edges=True)
-        elif node.beta == 1:
-            # Do nothing for initialization, only update the values
-            pass
-        else:
-            # Beta map
-            add_program = "__y = ({} * __c)".format(_cast_to_dtype_str(node.beta, dtype_a))
-
-            # manually broadcasting C to [M, N]
-            if list(shape_c) == [M, N]:
-                memlet_idx = '__i0, __i1'
-            elif list(shape_c) == [1, N]:
-                memlet_idx = '0, __i1'
-            elif list(shape_c) == [M, 1]:
-                memlet_idx = '__i0, 0'
-            elif list(shape_c) == [N]:
-                memlet_idx = '__i1'
-            else:
-                raise ValueError("Could not broadcast input _c to ({}, {})".format(M, N))
-
-            init_state.add_mapped_tasklet("gemm_init", {"__i%d" % i: "0:%s" % s
-                                                        for i, s in enumerate([M, N])}, {
-                                                            "__c": dace.Memlet.simple("_cin", memlet_idx),
-                                                        },
-                                          add_program, {"__y": dace.Memlet.simple("_c", "__i0, __i1")},
-                                          external_edges=True)
-
         # Multiplication map
         state.add_mapped_tasklet("gemm", {"__i%d" % i: "0:%s" % s
                                           for i, s in enumerate([M, N, K])},
@@ -151,6 +165,185 @@ class ExpandGemmPure(ExpandTransformation):
         return ExpandGemmPure.make_sdfg(node, state, sdfg)
 
 
+def _tile_size(tile: int, size, multiple: int = 1) -> int:
+    """ Rounds a tile size up to a multiple, and clamps it to the (rounded up) size of the dimension if known. """
+    try:
+        tile = min(tile, int(size))
+    except TypeError:
+        pass
+    return max(multiple, -(-tile // multiple) * multiple)
+
+
+@dace.library.expansion
+class ExpandGemmPureTiled(ExpandTransformation):
+    """
+    Cache-blocked GEMM for CPUs that do not link a BLAS library. The multiplication follows the loop structure of
+    BLIS/GotoBLAS:
+
+        * A sequential map over panels of NC columns of C and blocks of KC of the inner dimension. The KC x NC panel
+          of ``op(B)`` is packed into a contiguous buffer (L3 cache) in micro-panels of NR columns.
+        * A parallel map over blocks of MC rows of C. The MC x KC block of ``op(A)`` is packed into a thread-local
+          buffer (L2 cache) in micro-panels of MR rows.
+        * A map over the MR x NR tiles of C, each computed by a micro-kernel that accumulates in registers. The
+          micro-kernel loops have constant bounds, so that they are unrolled and vectorized by the compiler.
+
+    Packing zero-pads partial micro-panels, such that the micro-kernel always computes full tiles. Tile sizes are
+    taken from the ``library.blas.tiled_gemm`` configuration entries unless given to the expansion, and are clamped
+    to the matrix sizes if known. If ``accumulator_type`` is set, the packed buffers and the accumulation use that
+    type.
+    """
+
+    environments = []
+
+    @staticmethod
+    def make_sdfg(node, parent_state, parent_sdfg, mc=None, nc=None, kc=None, mr=None, nr=None):
+        sdfg, state, (M, N, K), _, dtype_c = _make_gemm_sdfg(node, parent_state, parent_sdfg)
+        array_a, array_b, array_c = sdfg.arrays['_a'], sdfg.arrays['_b'], sdfg.arrays['_c']
+        check_access(dtypes.ScheduleType.CPU_Multicore, array_a, array_b, array_c)
+
+        config = dace.config.Config
+        mr = mr or config.get('library', 'blas', 'tiled_gemm', 'mr')
+        nr = nr or config.get('library', 'blas', 'tiled_gemm', 'nr')
+        MC = _tile_size(mc or config.get('library', 'blas', 'tiled_gemm', 'mc'), M, mr)
+        NC = _tile_size(nc or config.get('library', 'blas', 'tiled_gemm', 'nc'), N, nr)
+        KC = _tile_size(kc or config.get('library', 'blas', 'tiled_gemm', 'kc'), K)
+        MR, NR = min(mr, MC), min(nr, NC)
+        M, N, K = symstr(M), symstr(N), symstr(K)
+
+        compute_type = node.accumulator_type or dtype_c
+        ctype = compute_type.ctype
+        if node.alpha == 1:
+            alpha = ''
+        elif isinstance(node.alpha, complex):
+            alpha = f'{ctype}({node.alpha.real}, {node.alpha.imag}) * '
+        else:
+            alpha = f'{ctype}({node.alpha}) * '
+        store = '__acc[__i][__j]' if compute_type == dtype_c else f'{dtype_c.ctype}(__acc[__i][__j])'
+
+        # Element (row, column) of op(A), op(B), and C as offsets from the beginning of the accessed subset
+        sa, sb, sc = ([f'({symstr(s)})' for s in arr.strides] for arr in (array_a, array_b, array_c))
+        if node.transA:
+            sa = list(reversed(sa))
+        if node.transB:
+            sb = list(reversed(sb))
+
+        def op_subset(transposed: bool, rows: str, cols: str) -> str:
+            return f'{cols}, {rows}' if transposed else f'{rows}, {cols}'
+
+        sdfg.add_transient('_apack', [MC * KC], compute_type)
+        sdfg.add_transient('_bpack', [NC * KC], compute_type)
+
+        panel_entry, panel_exit = state.add_map('gemm_panels', {
+            '__jc': f'0:{N}:{NC}',
+            '__pc': f'0:{K}:{KC}'
+        },
+                                                schedule=dtypes.ScheduleType.Sequential)
+        block_entry, block_exit = state.add_map('gemm_blocks', {'__ic': f'0:{M}:{MC}'},
+                                                schedule=dtypes.ScheduleType.CPU_Multicore)
+        tile_entry, tile_exit = state.add_map('gemm_tiles', {
+            '__jr': f'0:min({NC}, {N} - __jc):{NR}',
+            '__ir': f'0:min({MC}, {M} - __ic):{MR}'
+        },
+                                              schedule=dtypes.ScheduleType.Sequential)
+
+        pack_b = state.add_tasklet(
+            'gemm_pack_b', {'__b'}, {'__bpack'}, f'''
+const int __kc = min({KC}, {K} - __pc);
+const int __nc = min({NC}, {N} - __jc);
+for (int __j0 = 0; __j0 < __nc; __j0 += {NR}) {{
+    for (int __p = 0; __p < __kc; ++__p) {{
+        for (int __j = 0; __j < {NR}; ++__j) {{
+            __bpack[__j0 * {KC} + __p * {NR} + __j] = (__j0 + __j < __nc) ?
+                {ctype}(__b[__p * {sb[0]} + (__j0 + __j) * {sb[1]}]) : {ctype}(0);
+        }}
+    }}
+}}''', dtypes.Language.CPP)
+        pack_a = state.add_tasklet(
+            'gemm_pack_a', {'__a'}, {'__apack'}, f'''
+const int __kc = min({KC}, {K} - __pc);
+const int __mc = min({MC}, {M} - __ic);
+for (int __i0 = 0; __i0 < __mc; __i0 += {MR}) {{
+    for (int __p = 0; __p < __kc; ++__p) {{
+        for (int __i = 0; __i < {MR}; ++__i) {{
+            __apack[__i0 * {KC} + __p * {MR} + __i] = (__i0 + __i < __mc) ?
+                {ctype}(__a[(__i0 + __i) * {sa[0]} + __p * {sa[1]}]) : {ctype}(0);
+        }}
+    }}
+}}''', dtypes.Language.CPP)
+        kernel = state.add_tasklet(
+            'gemm_micro_kernel', {'__ap', '__bp'}, {'__c'}, f'''
+const int __kc = min({KC}, {K} - __pc);
+const int __mr = min({MR}, {M} - __ic - __ir);
+const int __nr = min({NR}, {N} - __jc - __jr);
+{ctype} __acc[{MR}][{NR}] = {{}};
+for (int __p = 0; __p < __kc; ++__p) {{
+    for (int __i = 0; __i < {MR}; ++__i) {{
+        const {ctype} __av = __ap[__p * {MR} + __i];
+        for (int __j = 0; __j < {NR}; ++__j) {{
+            __acc[__i][__j] += __av * __bp[__p * {NR} + __j];
+        }}
+    }}
+}}
+for (int __i = 0; __i < __mr; ++__i) {{
+    for (int __j = 0; __j < __nr; ++__j) {{
+        __c[__i * {sc[0]} + __j * {sc[1]}] += {alpha}{store};
+    }}
+}}''', dtypes.Language.CPP)
+
+        kc_range = f'__pc:min({K}, __pc + {KC})'
+        nc_range = f'__jc:min({N}, __jc + {NC})'
+        mc_range = f'__ic:min({M}, __ic + {MC})'
+        tile_subset = f'__ic + __ir:min({M}, __ic + __ir + {MR}), __jc + __jr:min({N}, __jc + __jr + {NR})'
+
+        # Pack a panel of op(B)
+        bpack = state.add_access('_bpack')
+        state.add_memlet_path(state.add_read('_b'),
+                              panel_entry,
+                              pack_b,
+                              dst_conn='__b',
+                              memlet=dace.Memlet(f'_b[{op_subset(node.transB, kc_range, nc_range)}]'))
+        state.add_edge(pack_b, '__bpack', bpack, None, dace.Memlet(f'_bpack[0:{NC * KC}]'))
+
+        # Pack a block of op(A)
+        apack = state.add_access('_apack')
+        state.add_memlet_path(state.add_read('_a'),
+                              panel_entry,
+                              block_entry,
+                              pack_a,
+                              dst_conn='__a',
+                              memlet=dace.Memlet(f'_a[{op_subset(node.transA, mc_range, kc_range)}]'))
+        state.add_edge(pack_a, '__apack', apack, None, dace.Memlet(f'_apack[0:{MC * KC}]'))
+
+        # Compute tiles of C
+        state.add_memlet_path(apack,
+                              tile_entry,
+                              kernel,
+                              dst_conn='__ap',
+                              memlet=dace.Memlet(f'_apack[__ir * {KC}:__ir * {KC} + {MR * KC}]'))
+        state.add_memlet_path(bpack,
+                              block_entry,
+                              tile_entry,
+                              kernel,
+                              dst_conn='__bp',
+                              memlet=dace.Memlet(f'_bpack[__jr * {KC}:__jr * {KC} + {NR * KC}]'))
+        state.add_memlet_path(
+            kernel,
+            tile_exit,
+            block_exit,
+            panel_exit,
+            state.add_write('_c'),
+            src_conn='__c',
+            # The micro-kernel accumulates into C across blocks of the inner dimension
+            memlet=dace.Memlet(f'_c[{tile_subset}]', wcr='lambda a, b: a + b'))
+
+        return sdfg
+
+    @staticmethod
+    def expansion(node, state, sdfg, mc=None, nc=None, kc=None, mr=None, nr=None):
+        node.validate(sdfg, state)
+        return ExpandGemmPureTiled.make_sdfg(node, state, sdfg, mc=mc, nc=nc, kc=kc, mr=mr, nr=nr)
+
+
 @dace.library.expansion
 class ExpandGemmOpenBLAS(ExpandTransformation):
 
@@ -960,6 +1153,7 @@ class Gemm(dace.sdfg.nodes.LibraryNode):
     # Global properties
     implementations = {
         "pure": ExpandGemmPure,
+        "pure_tiled": ExpandGemmPureTiled,
         "MKL": ExpandGemmMKL,
         "OpenBLAS": ExpandGemmOpenBLAS,
         "cuBLAS": ExpandGemmCuBLAS,
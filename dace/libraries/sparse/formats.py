@@ -0,0 +1,81 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Host-side helpers for the sparse matrix formats of the sparse library, which compute the sizes of the arrays needed by
+the format conversion library nodes and provide NumPy reference conversions.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def _sell_order(indptr: np.ndarray, sigma: int) -> Tuple[np.ndarray, np.ndarray]:
+    """ Returns the row lengths and the order of rows, sorted by decreasing length within windows of sigma rows. """
+    lengths = np.diff(indptr)
+    order = np.arange(len(lengths))
+    for w in range(0, len(lengths), sigma):
+        window = order[w:w + sigma]
+        order[w:w + sigma] = window[np.argsort(-lengths[window], kind='stable')]
+    return lengths, order
+
+
+def sell_size(indptr: np.ndarray, chunk_size: int = 8, sigma: int = 256) -> Tuple[int, int]:
+    """
+    Returns the number of slices and the number of stored (padded) entries of a CSR matrix in SELL-C-sigma format.
+
+    :param indptr: Row pointers of the CSR matrix.
+    :param chunk_size: Number of rows per slice (C).
+    :param sigma: Number of rows within which rows are sorted by length.
+    :return: A tuple of the number of slices and stored entries.
+    """
+    lengths, order = _sell_order(np.asarray(indptr), sigma)
+    nslices = (len(lengths) + chunk_size - 1) // chunk_size
+    sorted_lengths = np.zeros(nslices * chunk_size, dtype=lengths.dtype)
+    sorted_lengths[:len(lengths)] = lengths[order]
+    widths = sorted_lengths.reshape(nslices, chunk_size).max(axis=1, initial=0)
+    return nslices, int(widths.sum()) * chunk_size
+
+
+def csr_to_sell(indptr: np.ndarray,
+                indices: np.ndarray,
+                data: np.ndarray,
+                chunk_size: int = 8,
+                sigma: int = 256) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts a CSR matrix to SELL-C-sigma format, as the ``CSRToSELL`` library node.
+
+    :return: A tuple of the slice offsets, row permutation, column indices and values.
+    """
+    indptr = np.asarray(indptr)
+    lengths, order = _sell_order(indptr, sigma)
+    nslices, size = sell_size(indptr, chunk_size, sigma)
+    slices = np.zeros(nslices + 1, dtype=indptr.dtype)
+    perm = np.full(nslices * chunk_size, -1, dtype=indptr.dtype)
+    perm[:len(order)] = order
+    cols = np.zeros(size, dtype=indices.dtype)
+    vals = np.zeros(size, dtype=data.dtype)
+    for s in range(nslices):
+        rows = perm[s * chunk_size:(s + 1) * chunk_size]
+        width = max((lengths[r] for r in rows if r >= 0), default=0)
+        slices[s + 1] = slices[s] + width * chunk_size
+        for l, r in enumerate(rows):
+            if r < 0:
+                continue
+            stored = slices[s] + np.arange(lengths[r]) * chunk_size + l
+            cols[stored] = indices[indptr[r]:indptr[r + 1]]
+            vals[stored] = data[indptr[r]:indptr[r + 1]]
+    return slices, perm, cols, vals
+
+
+def bsr_size(indptr: np.ndarray, indices: np.ndarray, blocksize: Tuple[int, int]) -> int:
+    """
+    Returns the number of nonzero blocks of a CSR matrix in BSR format.
+
+    :param indptr: Row pointers of the CSR matrix.
+    :param indices: Column indices of the CSR matrix.
+    :param blocksize: Number of rows and columns of a block.
+    """
+    indptr = np.asarray(indptr)
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    blocks = np.unique(np.stack([rows // blocksize[0], np.asarray(indices)[indptr[0]:indptr[-1]] // blocksize[1]]),
+                       axis=1)
+    return blocks.shape[1]
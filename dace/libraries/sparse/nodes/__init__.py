@@ -1,3 +1,7 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 from .csrmm import CSRMM
 from .csrmv import CSRMV
+from .sell import SELLMM, SELLMV
+from .bsr import BSRMM, BSRMV
+from .coo import COOMM, COOMV
+from .convert import CSRToBSR, CSRToCOO, CSRToSELL
@@ -0,0 +1,101 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace.library
+from dace.libraries.sparse import sparse_helpers as sh
+from dace.libraries.sparse.nodes.sparse_product import SparseMatrixProduct
+from dace.transformation.transformation import ExpandTransformation
+
+
+def _expand_bsr(node: 'BSRMV', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    dtype = sh.value_type(operands)
+    nblockrows = sym2cpp(operands['_a_rows'][2][0] - 1)
+    R, BC = (sym2cpp(s) for s in operands['_a_vals'][2][1:])
+    K, b, c = sh.dense_operand_code(operands)
+
+    def a(name, *index):
+        return '%s[%s]' % (name, sh.index_to_cpp(operands[name][3], *index))
+
+    code = sh.init_output_code(operands, node.beta, dtype)
+    code += sh.partition_code('_a_rows', nblockrows, node.partitions)
+    code += f'''
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __p = 0; __p < __nparts; ++__p) {{
+        const long long __rend = __partition_begin(__p + 1);
+        for (long long __br = __partition_begin(__p); __br < __rend; ++__br) {{
+            const long long __end = {a('_a_rows', '__br + 1')};
+            for (long long __e = {a('_a_rows', '__br')}; __e < __end; ++__e) {{
+                const long long __bc = {a('_a_cols', '__e')};
+                for (long long __r = 0; __r < {R}; ++__r) {{
+                    for (long long __j = 0; __j < {BC}; ++__j) {{
+                        const auto __val = {sh.scalar_to_cpp(node.alpha, dtype)} * {a('_a_vals', '__e', '__r', '__j')};
+                        #pragma omp simd
+                        for (long long __k = 0; __k < {K}; ++__k) {{
+                            {c(f'__br * {R} + __r', '__k')} += __val * {b(f'__bc * {BC} + __j', '__k')};
+                        }}
+                    }}
+                }}
+            }}
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+@dace.library.expansion
+class ExpandBSRMVOpenMP(ExpandTransformation):
+    """
+    Computes the product block row by block row. Partitions of consecutive block rows with about the same number of
+    nonzero blocks are processed in parallel. The loops over a block have constant bounds if the block size is known,
+    such that they can be unrolled and vectorized by the compiler.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_bsr(node, state, sdfg)
+
+
+@dace.library.expansion
+class ExpandBSRMMOpenMP(ExpandTransformation):
+    """
+    Computes the product as in ``ExpandBSRMVOpenMP``. The innermost loop runs over the columns of B and C, and is
+    vectorized.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_bsr(node, state, sdfg)
+
+
+@dace.library.node
+class BSRMV(SparseMatrixProduct):
+    """
+    Executes alpha * (A @ b) + beta * c, where A is a sparse matrix in block compressed sparse row (BSR) format, while b
+    and c are dense vectors.
+
+    A consists of R x C blocks. ``_a_rows`` contains the offsets of the block rows into ``_a_cols``, which contains the
+    block column of every nonzero block, and ``_a_vals`` is a three-dimensional array of the row-major nonzero blocks.
+    The block size is taken from the shape of ``_a_vals``, and the number of rows of A must be a multiple of R.
+    """
+
+    implementations = {"OpenMP": ExpandBSRMVOpenMP}
+    default_implementation = "OpenMP"
+
+    sparse_inputs = {"_a_rows": 1, "_a_cols": 1, "_a_vals": 3}
+
+
+@dace.library.node
+class BSRMM(BSRMV):
+    """
+    Executes alpha * (A @ B) + beta * C, where A is a sparse matrix in BSR format (see ``BSRMV``), while B and C are
+    dense matrices.
+    """
+
+    implementations = {"OpenMP": ExpandBSRMMOpenMP}
+    default_implementation = "OpenMP"
+
+    matrix = True
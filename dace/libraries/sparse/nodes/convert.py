@@ -0,0 +1,293 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+from typing import Dict
+import dace.library
+import dace.sdfg.nodes
+from dace import properties
+from dace.libraries.sparse import sparse_helpers as sh
+from dace.transformation.transformation import ExpandTransformation
+
+
+@properties.make_properties
+class SparseFormatConversion(dace.sdfg.nodes.LibraryNode):
+    """
+    Base class of library nodes that convert a sparse matrix from one storage format to another. Subclasses define
+    the input and output arrays, which are all connected as whole arrays. Since the size of the output generally
+    depends on the sparsity pattern, the output arrays must be allocated beforehand (see
+    ``dace.libraries.sparse.formats``), and the conversion fails at runtime if they are too small.
+    """
+
+    #: Input connectors, mapped to their number of dimensions
+    conversion_inputs: Dict[str, int] = {}
+    #: Output connectors, mapped to their number of dimensions
+    conversion_outputs: Dict[str, int] = {}
+
+    def __init__(self, name, location=None):
+        super().__init__(name,
+                         location=location,
+                         inputs=set(self.conversion_inputs),
+                         outputs=set(self.conversion_outputs))
+
+    def validate(self, sdfg, state):
+        """
+        Validates the operands of the conversion.
+
+        :return: A dictionary of the operands, as returned by ``sparse_helpers.get_operands``.
+        """
+        operands = sh.get_operands(self, state, sdfg)
+        sh.check_dimensions(operands, {**self.conversion_inputs, **self.conversion_outputs}, type(self).__name__)
+        return operands
+
+
+def _accessor(operands):
+    """ Returns a function that returns the C++ expression of an element of an operand. """
+
+    def access(name, *index):
+        return '%s[%s]' % (name, sh.index_to_cpp(operands[name][3], *index))
+
+    return access
+
+
+def _expand_csr_to_coo(node: 'CSRToCOO', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    a = _accessor(operands)
+    nrows = sym2cpp(operands['_csr_rows'][2][0] - 1)
+
+    code = sh.partition_code('_csr_rows', nrows, 0)
+    code += f'''
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __p = 0; __p < __nparts; ++__p) {{
+        const long long __rend = __partition_begin(__p + 1);
+        for (long long __r = __partition_begin(__p); __r < __rend; ++__r) {{
+            for (long long __e = {a('_csr_rows', '__r')}; __e < {a('_csr_rows', '__r + 1')}; ++__e) {{
+                {a('_coo_rows', '__e - ' + a('_csr_rows', '0'))} = __r;
+            }}
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+def _expand_csr_to_sell(node: 'CSRToSELL', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    a = _accessor(operands)
+    C, sigma = node.chunk_size, node.sigma
+    nrows = sym2cpp(operands['_csr_rows'][2][0] - 1)
+    nslices = sym2cpp(operands['_sell_slices'][2][0] - 1)
+    capacity = sym2cpp(operands['_sell_vals'][2][0])
+    zero = sh.scalar_to_cpp(0, sh.value_type(operands, '_sell_vals'))
+
+    code = f'''
+    const long long __n = {nrows}, __nslices = ({nrows} + {C} - 1) / {C};
+    if (__nslices != {nslices} || {sym2cpp(operands['_sell_perm'][2][0])} < __nslices * {C}) {{
+        throw std::runtime_error("CSRToSELL: output arrays do not match the number of slices");
+    }}
+    auto __length = [&](long long __r) -> long long {{
+        return {a('_csr_rows', '__r + 1')} - {a('_csr_rows', '__r')};
+    }};
+
+    // Sort rows by decreasing length within every window of sigma rows
+    std::vector<long long> __order(__n);
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __w = 0; __w < __n; __w += {sigma}) {{
+        const long long __wend = std::min(__n, __w + {sigma});
+        for (long long __r = __w; __r < __wend; ++__r) __order[__r] = __r;
+        std::stable_sort(__order.begin() + __w, __order.begin() + __wend,
+                         [&](long long __x, long long __y) {{ return __length(__x) > __length(__y); }});
+    }}
+
+    // Slice offsets
+    {a('_sell_slices', '0')} = 0;
+    for (long long __s = 0; __s < __nslices; ++__s) {{
+        long long __width = 0;
+        for (long long __i = __s * {C}; __i < std::min(__n, (__s + 1) * {C}); ++__i) {{
+            __width = std::max(__width, __length(__order[__i]));
+        }}
+        {a('_sell_slices', '__s + 1')} = {a('_sell_slices', '__s')} + __width * {C};
+    }}
+    if ({a('_sell_slices', '__nslices')} > {capacity}) {{
+        throw std::runtime_error("CSRToSELL: output arrays are too small for the padded matrix");
+    }}
+
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __s = 0; __s < __nslices; ++__s) {{
+        const long long __begin = {a('_sell_slices', '__s')};
+        const long long __width = ({a('_sell_slices', '__s + 1')} - __begin) / {C};
+        for (long long __l = 0; __l < {C}; ++__l) {{
+            const long long __i = __s * {C} + __l;
+            const long long __row = __i < __n ? __order[__i] : -1;
+            const long long __len = __row >= 0 ? __length(__row) : 0;
+            const long long __rbegin = __row >= 0 ? (long long){a('_csr_rows', '__row')} : 0;
+            {a('_sell_perm', '__i')} = __row;
+            for (long long __j = 0; __j < __width; ++__j) {{
+                const long long __e = __begin + __j * {C} + __l;
+                if (__j < __len) {{
+                    {a('_sell_cols', '__e')} = {a('_csr_cols', '__rbegin + __j')};
+                    {a('_sell_vals', '__e')} = {a('_csr_vals', '__rbegin + __j')};
+                }} else {{
+                    {a('_sell_cols', '__e')} = 0;
+                    {a('_sell_vals', '__e')} = {zero};
+                }}
+            }}
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+def _expand_csr_to_bsr(node: 'CSRToBSR', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    a = _accessor(operands)
+    nrows = sym2cpp(operands['_csr_rows'][2][0] - 1)
+    nblockrows = sym2cpp(operands['_bsr_rows'][2][0] - 1)
+    capacity, R, BC = (sym2cpp(s) for s in operands['_bsr_vals'][2])
+    zero = sh.scalar_to_cpp(0, sh.value_type(operands, '_bsr_vals'))
+
+    code = f'''
+    const long long __n = {nrows}, __nb = {nblockrows};
+    if (__nb != (__n + {R} - 1) / {R}) {{
+        throw std::runtime_error("CSRToBSR: output arrays do not match the number of block rows");
+    }}
+
+    // Sorted block columns of every block row
+    std::vector<std::vector<long long>> __bcols(__nb);
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __br = 0; __br < __nb; ++__br) {{
+        std::vector<long long> &__cols = __bcols[__br];
+        for (long long __r = __br * {R}; __r < std::min(__n, (__br + 1) * {R}); ++__r) {{
+            for (long long __e = {a('_csr_rows', '__r')}; __e < {a('_csr_rows', '__r + 1')}; ++__e) {{
+                __cols.push_back({a('_csr_cols', '__e')} / {BC});
+            }}
+        }}
+        std::sort(__cols.begin(), __cols.end());
+        __cols.erase(std::unique(__cols.begin(), __cols.end()), __cols.end());
+    }}
+
+    {a('_bsr_rows', '0')} = 0;
+    for (long long __br = 0; __br < __nb; ++__br) {{
+        {a('_bsr_rows', '__br + 1')} = {a('_bsr_rows', '__br')} + (long long)__bcols[__br].size();
+    }}
+    if ({a('_bsr_rows', '__nb')} > {capacity}) {{
+        throw std::runtime_error("CSRToBSR: output arrays are too small for the number of nonzero blocks");
+    }}
+
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __br = 0; __br < __nb; ++__br) {{
+        const std::vector<long long> &__cols = __bcols[__br];
+        const long long __begin = {a('_bsr_rows', '__br')};
+        for (long long __i = 0; __i < (long long)__cols.size(); ++__i) {{
+            {a('_bsr_cols', '__begin + __i')} = __cols[__i];
+            for (long long __r = 0; __r < {R}; ++__r) {{
+                for (long long __j = 0; __j < {BC}; ++__j) {{
+                    {a('_bsr_vals', '__begin + __i', '__r', '__j')} = {zero};
+                }}
+            }}
+        }}
+        for (long long __r = __br * {R}; __r < std::min(__n, (__br + 1) * {R}); ++__r) {{
+            for (long long __e = {a('_csr_rows', '__r')}; __e < {a('_csr_rows', '__r + 1')}; ++__e) {{
+                const long long __col = {a('_csr_cols', '__e')};
+                const long long __i = std::lower_bound(__cols.begin(), __cols.end(), __col / {BC}) - __cols.begin();
+                {a('_bsr_vals', '__begin + __i', f'__r - __br * {R}', f'__col % {BC}')} += {a('_csr_vals', '__e')};
+            }}
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+@dace.library.expansion
+class ExpandCSRToCOOOpenMP(ExpandTransformation):
+    """ Expands the row pointers in parallel, over partitions of rows with about the same number of nonzeros. """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_csr_to_coo(node, state, sdfg)
+
+
+@dace.library.expansion
+class ExpandCSRToSELLOpenMP(ExpandTransformation):
+    """
+    Sorts the windows of rows and fills the slices in parallel. The slice offsets are computed sequentially.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_csr_to_sell(node, state, sdfg)
+
+
+@dace.library.expansion
+class ExpandCSRToBSROpenMP(ExpandTransformation):
+    """
+    Collects the nonzero blocks and fills them in parallel over block rows. The block row offsets are computed
+    sequentially.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_csr_to_bsr(node, state, sdfg)
+
+
+@dace.library.node
+class CSRToCOO(SparseFormatConversion):
+    """
+    Computes the row indices of the nonzeros of a sparse matrix in CSR format. Together with the column indices and
+    values of the CSR matrix, they form the matrix in COO format, sorted by row (see ``COOMV``).
+    """
+
+    implementations = {"OpenMP": ExpandCSRToCOOOpenMP}
+    default_implementation = "OpenMP"
+
+    conversion_inputs = {"_csr_rows": 1}
+    conversion_outputs = {"_coo_rows": 1}
+
+
+@dace.library.node
+class CSRToSELL(SparseFormatConversion):
+    """
+    Converts a sparse matrix from CSR to SELL-C-sigma format (see ``SELLMV``). ``_sell_slices`` must have
+    ``ceil(N / C) + 1`` elements and ``_sell_perm`` at least ``ceil(N / C) * C`` elements, while ``_sell_cols`` and
+    ``_sell_vals`` must be large enough for the padded matrix, see ``dace.libraries.sparse.formats.sell_size``.
+    """
+
+    implementations = {"OpenMP": ExpandCSRToSELLOpenMP}
+    default_implementation = "OpenMP"
+
+    conversion_inputs = {"_csr_rows": 1, "_csr_cols": 1, "_csr_vals": 1}
+    conversion_outputs = {"_sell_slices": 1, "_sell_perm": 1, "_sell_cols": 1, "_sell_vals": 1}
+
+    chunk_size = properties.Property(dtype=int, default=8, desc="Number of rows per slice (C)")
+    sigma = properties.Property(dtype=int,
+                                default=256,
+                                desc="Number of rows within which rows are sorted by length. Should be a multiple "
+                                "of the chunk size")
+
+    def __init__(self, name, location=None, chunk_size=8, sigma=256):
+        super().__init__(name, location=location)
+        self.chunk_size = chunk_size
+        self.sigma = sigma
+
+
+@dace.library.node
+class CSRToBSR(SparseFormatConversion):
+    """
+    Converts a sparse matrix from CSR to BSR format (see ``BSRMV``). The block size is taken from the shape of
+    ``_bsr_vals``, and ``_bsr_rows`` must have ``ceil(N / R) + 1`` elements. The first dimension of ``_bsr_cols`` and
+    ``_bsr_vals`` must be at least the number of nonzero blocks, see ``dace.libraries.sparse.formats.bsr_size``.
+    """
+
+    implementations = {"OpenMP": ExpandCSRToBSROpenMP}
+    default_implementation = "OpenMP"
+
+    conversion_inputs = {"_csr_rows": 1, "_csr_cols": 1, "_csr_vals": 1}
+    conversion_outputs = {"_bsr_rows": 1, "_bsr_cols": 1, "_bsr_vals": 3}
@@ -0,0 +1,117 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace.library
+from dace.libraries.sparse import sparse_helpers as sh
+from dace.libraries.sparse.nodes.sparse_product import SparseMatrixProduct
+from dace.transformation.transformation import ExpandTransformation
+
+
+def _expand_coo(node: 'COOMV', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    dtype = sh.value_type(operands)
+    ctype = dtype.ctype
+    nnz = sym2cpp(operands['_a_vals'][2][0])
+    K, b, c = sh.dense_operand_code(operands)
+
+    def a(name, index):
+        return '%s[%s]' % (name, sh.index_to_cpp(operands[name][3], index))
+
+    code = sh.init_output_code(operands, node.beta, dtype)
+    code += f'''
+    const long long __nnz = {nnz};
+    const long long __nparts = std::max(1LL, std::min(__nnz, {node.partitions} > 0 ? {node.partitions}LL :
+                                                                (long long)omp_get_max_threads() * 8));
+    // Partial results of the first and last row of every partition, which may be shared with other partitions
+    std::vector<long long> __carry_rows(2 * __nparts, -1);
+    std::vector<{ctype}> __carry(2 * __nparts * {K}, {sh.scalar_to_cpp(0, dtype)});
+
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __p = 0; __p < __nparts; ++__p) {{
+        const long long __pbegin = __nnz * __p / __nparts, __pend = __nnz * (__p + 1) / __nparts;
+        if (__pbegin >= __pend) continue;
+        const long long __first = {a('_a_rows', '__pbegin')}, __last = {a('_a_rows', '__pend - 1')};
+        __carry_rows[2 * __p] = __first;
+        if (__last != __first) __carry_rows[2 * __p + 1] = __last;
+        for (long long __begin = __pbegin, __end; __begin < __pend; __begin = __end) {{
+            const long long __row = {a('_a_rows', '__begin')};
+            for (__end = __begin + 1; __end < __pend && {a('_a_rows', '__end')} == __row; ++__end);
+            for (long long __k = 0; __k < {K}; ++__k) {{
+                {ctype} __acc = {sh.scalar_to_cpp(0, dtype)};
+                for (long long __e = __begin; __e < __end; ++__e) {{
+                    __acc += {a('_a_vals', '__e')} * {b(a('_a_cols', '__e'), '__k')};
+                }}
+                __acc *= {sh.scalar_to_cpp(node.alpha, dtype)};
+                if (__row == __first) {{
+                    __carry[2 * __p * {K} + __k] = __acc;
+                }} else if (__row == __last) {{
+                    __carry[(2 * __p + 1) * {K} + __k] = __acc;
+                }} else {{
+                    {c('__row', '__k')} += __acc;
+                }}
+            }}
+        }}
+    }}
+
+    for (long long __s = 0; __s < 2 * __nparts; ++__s) {{
+        const long long __row = __carry_rows[__s];
+        if (__row < 0) continue;
+        for (long long __k = 0; __k < {K}; ++__k) {{
+            {c('__row', '__k')} += __carry[__s * {K} + __k];
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+@dace.library.expansion
+class ExpandCOOMVOpenMP(ExpandTransformation):
+    """
+    Computes the product as a segmented reduction. The nonzeros are split into partitions of equal size, regardless
+    of the number of nonzeros per row, which are processed in parallel. Rows that are contained in a single partition
+    are written directly, while the partial results of the first and last row of every partition are combined
+    sequentially at the end.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_coo(node, state, sdfg)
+
+
+@dace.library.expansion
+class ExpandCOOMMOpenMP(ExpandTransformation):
+    """ Computes the product as in ``ExpandCOOMVOpenMP``, for every column of B. """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_coo(node, state, sdfg)
+
+
+@dace.library.node
+class COOMV(SparseMatrixProduct):
+    """
+    Executes alpha * (A @ b) + beta * c, where A is a sparse matrix in coordinate (COO) format, while b and c are dense
+    vectors. The nonzeros must be sorted by row (e.g., ``scipy.sparse.csr_matrix.tocoo()``), and rows may contain
+    arbitrarily many nonzeros. See ``CSRToCOO`` for the conversion from CSR.
+    """
+
+    implementations = {"OpenMP": ExpandCOOMVOpenMP}
+    default_implementation = "OpenMP"
+
+    sparse_inputs = {"_a_rows": 1, "_a_cols": 1, "_a_vals": 1}
+
+
+@dace.library.node
+class COOMM(COOMV):
+    """
+    Executes alpha * (A @ B) + beta * C, where A is a sparse matrix in COO format (see ``COOMV``), while B and C are
+    dense matrices.
+    """
+
+    implementations = {"OpenMP": ExpandCOOMMOpenMP}
+    default_implementation = "OpenMP"
+
+    matrix = True
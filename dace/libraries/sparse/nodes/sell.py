@@ -0,0 +1,116 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import dace.library
+from dace import properties
+from dace.libraries.sparse import sparse_helpers as sh
+from dace.libraries.sparse.nodes.sparse_product import SparseMatrixProduct
+from dace.transformation.transformation import ExpandTransformation
+
+
+def _expand_sell(node: 'SELLMV', state, sdfg):
+    from dace.codegen.targets.cpp import sym2cpp
+
+    operands = node.validate(sdfg, state)
+    sh.check_host_access(operands)
+    dtype = sh.value_type(operands)
+    ctype = dtype.ctype
+    C = node.chunk_size
+    nslices = sym2cpp(operands['_a_slices'][2][0] - 1)
+    K, b, c = sh.dense_operand_code(operands)
+
+    def a(name, index):
+        return '%s[%s]' % (name, sh.index_to_cpp(operands[name][3], index))
+
+    code = sh.init_output_code(operands, node.beta, dtype)
+    code += sh.partition_code('_a_slices', nslices, node.partitions)
+    code += f'''
+    #pragma omp parallel for schedule(dynamic)
+    for (long long __p = 0; __p < __nparts; ++__p) {{
+        const long long __send = __partition_begin(__p + 1);
+        for (long long __s = __partition_begin(__p); __s < __send; ++__s) {{
+            const long long __begin = {a('_a_slices', '__s')};
+            const long long __width = ({a('_a_slices', '__s + 1')} - __begin) / {C};
+            for (long long __k = 0; __k < {K}; ++__k) {{
+                {ctype} __acc[{C}];
+                for (int __l = 0; __l < {C}; ++__l) {{
+                    __acc[__l] = {sh.scalar_to_cpp(0, dtype)};
+                }}
+                for (long long __j = 0; __j < __width; ++__j) {{
+                    const long long __e = __begin + __j * {C};
+                    #pragma omp simd
+                    for (int __l = 0; __l < {C}; ++__l) {{
+                        __acc[__l] += {a('_a_vals', '__e + __l')} * {b(a('_a_cols', '__e + __l'), '__k')};
+                    }}
+                }}
+                for (int __l = 0; __l < {C}; ++__l) {{
+                    const long long __row = {a('_a_perm', '__s * %d + __l' % C)};
+                    if (__row >= 0) {{
+                        {c('__row', '__k')} += {sh.scalar_to_cpp(node.alpha, dtype)} * __acc[__l];
+                    }}
+                }}
+            }}
+        }}
+    }}
+    '''
+    return sh.make_tasklet(node, code)
+
+
+@dace.library.expansion
+class ExpandSELLMVOpenMP(ExpandTransformation):
+    """
+    Computes the product slice by slice. Partitions of consecutive slices with about the same number of stored
+    entries are processed in parallel, and the rows of a slice are processed with SIMD instructions.
+    """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_sell(node, state, sdfg)
+
+
+@dace.library.expansion
+class ExpandSELLMMOpenMP(ExpandTransformation):
+    """ Computes the product as in ``ExpandSELLMVOpenMP``, for every column of B. """
+    environments = []
+
+    @staticmethod
+    def expansion(node, state, sdfg):
+        return _expand_sell(node, state, sdfg)
+
+
+@dace.library.node
+class SELLMV(SparseMatrixProduct):
+    """
+    Executes alpha * (A @ b) + beta * c, where A is a sparse matrix in SELL-C-sigma format, while b and c are dense
+    vectors.
+
+    The rows of A are sorted by decreasing number of nonzeros within windows of sigma rows, and the sorted rows are
+    grouped into slices of C (``chunk_size``) rows. Every slice is padded to its longest row and stored column-major,
+    i.e., entry ``j`` of row ``l`` of slice ``s`` is stored at index ``_a_slices[s] + j * C + l`` of ``_a_cols`` and
+    ``_a_vals``. ``_a_perm[s * C + l]`` contains the original index of row ``l`` of slice ``s``, or -1 for padding
+    rows. Padding entries must have a valid column index (e.g., zero) and a zero value. See
+    ``dace.libraries.sparse.formats`` and ``CSRToSELL`` for the conversion from CSR.
+    """
+
+    implementations = {"OpenMP": ExpandSELLMVOpenMP}
+    default_implementation = "OpenMP"
+
+    sparse_inputs = {"_a_slices": 1, "_a_perm": 1, "_a_cols": 1, "_a_vals": 1}
+
+    chunk_size = properties.Property(dtype=int, default=8, desc="Number of rows per slice (C)")
+
+    def __init__(self, name, location=None, alpha=1, beta=0, chunk_size=8, partitions=0):
+        super().__init__(name, location=location, alpha=alpha, beta=beta, partitions=partitions)
+        self.chunk_size = chunk_size
+
+
+@dace.library.node
+class SELLMM(SELLMV):
+    """
+    Executes alpha * (A @ B) + beta * C, where A is a sparse matrix in SELL-C-sigma format (see ``SELLMV``), while B and
+    C are dense matrices.
+    """
+
+    implementations = {"OpenMP": ExpandSELLMMOpenMP}
+    default_implementation = "OpenMP"
+
+    matrix = True
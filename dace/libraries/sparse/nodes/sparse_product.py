@@ -0,0 +1,47 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+from typing import Dict
+import dace.sdfg.nodes
+from dace import properties
+from dace.libraries.sparse import sparse_helpers
+
+
+@properties.make_properties
+class SparseMatrixProduct(dace.sdfg.nodes.LibraryNode):
+    """
+    Base class of library nodes that execute alpha * (A @ B) + beta * C, where A is a sparse matrix and B and C are
+    dense. Subclasses define the storage format of A through their input connectors, and whether B and C are vectors
+    or matrices.
+    """
+
+    #: Input connectors of the sparse matrix, mapped to their number of dimensions
+    sparse_inputs: Dict[str, int] = {}
+    #: Whether B and C are matrices (True) or vectors (False)
+    matrix = False
+
+    alpha = properties.Property(allow_none=False,
+                                default=1,
+                                desc="A scalar which will be multiplied with A @ B before adding C")
+    beta = properties.Property(allow_none=False,
+                               default=0,
+                               desc="A scalar which will be multiplied with C before adding it")
+    partitions = properties.Property(dtype=int,
+                                     default=0,
+                                     desc="Number of row partitions processed in parallel. Partitions contain "
+                                     "about the same number of nonzeros. If zero, eight partitions per thread are used")
+
+    def __init__(self, name, location=None, alpha=1, beta=0, partitions=0):
+        super().__init__(name,
+                         location=location,
+                         inputs=set(self.sparse_inputs) | ({"_b", "_cin"} if beta != 0 else {"_b"}),
+                         outputs={"_c"})
+        self.alpha = alpha
+        self.beta = beta
+        self.partitions = partitions
+
+    def validate(self, sdfg, state):
+        """
+        Validates the operands of the product.
+
+        :return: A dictionary of the operands, as returned by ``sparse_helpers.get_operands``.
+        """
+        return sparse_helpers.sparse_product_operands(self, state, sdfg, self.sparse_inputs)
@@ -0,0 +1,165 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Helper functions for the CPU (OpenMP) expansions of the sparse library nodes. """
+from copy import deepcopy as dc
+from typing import Dict, List, Tuple
+
+import dace
+from dace import data, dtypes
+from dace.sdfg import SDFG, SDFGState
+from dace.sdfg.graph import MultiConnectorEdge
+
+#: A tuple of (edge, outer data descriptor, squeezed size, strides of the squeezed dimensions)
+Operand = Tuple[MultiConnectorEdge, data.Data, List[dace.symbolic.SymbolicType], List[dace.symbolic.SymbolicType]]
+
+
+def get_operands(node: dace.nodes.LibraryNode, state: SDFGState, sdfg: SDFG) -> Dict[str, Operand]:
+    """
+    Returns the edge, outer data descriptor, squeezed size and strides of every connected input and output connector
+    of a library node.
+    """
+    result = {}
+    for edge in state.in_edges(node):
+        result[edge.dst_conn] = _get_operand(edge, sdfg)
+    for edge in state.out_edges(node):
+        result[edge.src_conn] = _get_operand(edge, sdfg)
+    return result
+
+
+def _get_operand(edge: MultiConnectorEdge, sdfg: SDFG) -> Operand:
+    subset = dc(edge.data.subset)
+    squeezed = subset.squeeze()
+    desc = sdfg.arrays[edge.data.data]
+    strides = [s for i, s in enumerate(desc.strides) if i in squeezed]
+    return edge, desc, subset.size(), strides
+
+
+def scalar_to_cpp(value, dtype: dtypes.typeclass) -> str:
+    """ Returns a C++ expression for a (possibly complex) scalar constant of the given type. """
+    if isinstance(value, complex):
+        return f'{dtype.ctype}({value.real}, {value.imag})'
+    return f'{dtype.ctype}({value})'
+
+
+def index_to_cpp(strides: List[dace.symbolic.SymbolicType], *indices: str) -> str:
+    """ Returns a C++ expression of the offset of the given (C++) indices into an array with the given strides. """
+    from dace.codegen.targets.cpp import sym2cpp
+    return ' + '.join(f'({index}) * {sym2cpp(stride)}' for index, stride in zip(indices, strides))
+
+
+def init_output_code(operands: Dict[str, Operand], beta, dtype: dtypes.typeclass) -> str:
+    """
+    Returns C++ code that initializes the output ``_c`` of a sparse matrix product to ``beta * _cin`` (or zero), in
+    parallel. The product is then accumulated into the output.
+    """
+    from dace.codegen.targets.cpp import sym2cpp
+    _, _, csize, cstrides = operands['_c']
+    indices = ['__i%d' % i for i in range(len(csize))]
+    value = scalar_to_cpp(0, dtype)
+    if beta != 0:
+        value = '%s * _cin[%s]' % (scalar_to_cpp(beta, dtype), index_to_cpp(operands['_cin'][3], *indices))
+    code = '#pragma omp parallel for collapse(%d)\n' % len(csize)
+    code += ''.join('for (long long {i} = 0; {i} < {sz}; ++{i})\n'.format(i=i, sz=sym2cpp(sz))
+                    for i, sz in zip(indices, csize))
+    code += '    _c[%s] = %s;\n' % (index_to_cpp(cstrides, *indices), value)
+    return code
+
+
+def partition_code(ptr: str, nrows: str, partitions: int) -> str:
+    """
+    Returns C++ code that defines the number of row partitions ``__nparts`` and a function ``__partition_begin(p)``
+    that returns the first row of partition ``p``, given a row pointer array ``ptr`` of ``nrows + 1`` elements.
+    Partitions contain contiguous rows and about the same number of nonzeros (or, in general, of entries between row
+    pointers), regardless of how the nonzeros are distributed over the rows.
+
+    :param ptr: Name of the row pointer array.
+    :param nrows: C++ expression of the number of rows.
+    :param partitions: Number of partitions, or zero to use eight partitions per OpenMP thread.
+    """
+    return f'''
+    const long long __nparts = {partitions} > 0 ? {partitions} : (long long)omp_get_max_threads() * 8;
+    auto __partition_begin = [&](long long __p) -> long long {{
+        if (__p >= __nparts) return {nrows};
+        const long long __target = {ptr}[0] + ((long long){ptr}[{nrows}] - {ptr}[0]) * __p / __nparts;
+        return std::lower_bound({ptr}, {ptr} + {nrows} + 1, __target) - {ptr};
+    }};
+    '''
+
+
+#: Global code needed by the OpenMP expansions
+GLOBAL_CODE = '#include <omp.h>\n#include <algorithm>\n#include <stdexcept>\n#include <vector>'
+
+
+def make_tasklet(node: dace.nodes.LibraryNode, code: str) -> dace.nodes.Tasklet:
+    """ Returns a C++ tasklet that replaces the given library node. """
+    return dace.nodes.Tasklet(node.name,
+                              node.in_connectors,
+                              node.out_connectors,
+                              code,
+                              language=dtypes.Language.CPP,
+                              code_global=GLOBAL_CODE)
+
+
+def check_dimensions(operands: Dict[str, Operand], expected: Dict[str, int], kind: str):
+    """
+    Checks that the operands of a library node are connected and have the expected number of dimensions.
+
+    :param operands: The operands, as returned by :func:`get_operands`.
+    :param expected: A mapping from connector names to the number of dimensions.
+    :param kind: Name of the operation, used in error messages.
+    """
+    for name, dims in expected.items():
+        if name not in operands:
+            raise ValueError(f'Connector "{name}" of {kind} is not connected')
+        if len(operands[name][2]) != dims:
+            raise ValueError(f'Expected {dims}-dimensional input "{name}" in {kind}, got '
+                             f'{len(operands[name][2])} dimensions')
+
+
+def sparse_product_operands(node: dace.nodes.LibraryNode, state: SDFGState, sdfg: SDFG,
+                            sparse: Dict[str, int]) -> Dict[str, Operand]:
+    """
+    Validates the dense operands of a sparse matrix-vector (``node.matrix`` is False) or matrix-matrix product, and the
+    number of dimensions of the given sparse matrix operands.
+
+    :return: The operands, as returned by :func:`get_operands`.
+    """
+    kind = type(node).__name__
+    operands = get_operands(node, state, sdfg)
+    dims = 2 if node.matrix else 1
+    expected = dict(sparse)
+    expected.update({'_b': dims, '_c': dims})
+    if node.beta != 0:
+        expected['_cin'] = dims
+    check_dimensions(operands, expected, kind)
+    if '_cin' in operands and operands['_cin'][2] != operands['_c'][2]:
+        raise ValueError(f'Input C of {kind} must match the output C')
+    if node.matrix and operands['_b'][2][1] != operands['_c'][2][1]:
+        raise ValueError(f'Inputs B and C of {kind} must agree in the number of columns')
+    return operands
+
+
+def dense_operand_code(operands: Dict[str, Operand]) -> Tuple[str, callable, callable]:
+    """
+    Returns the C++ expression of the number of columns of the dense operands (``K``, one for vectors), and functions
+    that return the C++ expressions of the element ``(row, k)`` of ``_b`` and ``_c``.
+    """
+    from dace.codegen.targets.cpp import sym2cpp
+    _, _, bsize, bstrides = operands['_b']
+    _, _, _, cstrides = operands['_c']
+    if len(bsize) == 1:
+        return '1', (lambda row, k: '_b[%s]' % index_to_cpp(bstrides, row)), (
+            lambda row, k: '_c[%s]' % index_to_cpp(cstrides, row))
+    return sym2cpp(bsize[1]), (lambda row, k: '_b[%s]' % index_to_cpp(bstrides, row, k)), (
+        lambda row, k: '_c[%s]' % index_to_cpp(cstrides, row, k))
+
+
+def check_host_access(operands: Dict[str, Operand]):
+    """ Raises an error if any operand cannot be accessed from the host. """
+    from dace.libraries.blas.blas_helpers import check_access
+    check_access(dtypes.ScheduleType.CPU_Multicore, *(op[1] for op in operands.values()))
+
+
+def value_type(operands: Dict[str, Operand], name: str = '_a_vals') -> dtypes.typeclass:
+    """ Returns the base type of the values of the sparse matrix. """
+    return operands[name][1].dtype.base_type
+
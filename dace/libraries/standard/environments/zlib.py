@@ -0,0 +1,21 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+from dace import library
+
+
+@library.environment
+class ZLib:
+
+    cmake_minimum_version = None
+    cmake_packages = []
+    cmake_variables = {}
+    cmake_includes = []
+    cmake_libraries = ['z']
+    cmake_compile_flags = ['-DDACE_SERIALIZATION_ZLIB']
+    cmake_link_flags = []
+    cmake_files = []
+
+    headers = []
+    state_fields = []
+    init_code = ""
+    finalize_code = ""
+    dependencies = []
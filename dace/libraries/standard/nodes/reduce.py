@@ -391,6 +391,222 @@ class ExpandReduceOpenMP(pm.ExpandTransformation):
         return tnode
 
 
+@dace.library.expansion
+class ExpandReduceOpenMPTree(pm.ExpandTransformation):
+    """
+        OpenMP-based implementation of the reduce node that does not serialize
+        on the output, and supports custom reduction functions and
+        partial-axis reductions.
+
+        Depending on the input layout and sizes (chosen at runtime), threads
+        either reduce disjoint sets of output elements, or accumulate
+        privatized partial results over disjoint parts of the reduced range,
+        which are then combined in a binary tree. Partial results are combined
+        in thread order, so the reduction function only needs to be
+        associative. Loops are ordered such that the innermost loop traverses
+        the input contiguously and can be vectorized.
+    """
+    environments = []
+
+    # OpenMP reduction identifiers that can be used in SIMD reduction clauses
+    _SIMD_REDUCTIONS = {'+', '*', 'max', 'min', '&', '|', '^', '&&', '||'}
+
+    # Number of contiguous output elements reduced together by a thread
+    _OUTPUT_BLOCK = 64
+
+    @staticmethod
+    def expansion(node: 'Reduce', state: SDFGState, sdfg: SDFG):
+        from dace.codegen.targets.cpp import sym2cpp, unparse_cr
+
+        node.validate(sdfg, state)
+        inedge: graph.MultiConnectorEdge = state.in_edges(node)[0]
+        outedge: graph.MultiConnectorEdge = state.out_edges(node)[0]
+        input_dims = len(inedge.data.subset)
+        input_data = sdfg.arrays[inedge.data.data]
+        output_data = sdfg.arrays[outedge.data.data]
+        insize = inedge.data.subset.size()
+        outsize = outedge.data.subset.size()
+
+        # Visual C++ compiler not always supported
+        if platform.system() == 'Windows':
+            warnings.warn('OpenMP reduction expansion not supported on Visual C++')
+            return ExpandReducePure.expansion(node, state, sdfg)
+
+        # Reduced and kept input dimensions, and the corresponding output dimensions (skipping unit dimensions)
+        axes = node.axes if node.axes is not None else [i for i in range(input_dims)]
+        rdims = [i for i in range(input_dims) if i in axes and insize[i] != 1]
+        kdims = [i for i in range(input_dims) if i not in axes and insize[i] != 1]
+        odims = [i for i in range(len(outsize)) if outsize[i] != 1]
+        if not rdims:  # Degenerate reduction
+            return ExpandReducePure.expansion(node, state, sdfg)
+        if len(odims) != len(kdims):
+            warnings.warn('Cannot match the output dimensions of the reduction, falling back to pure expansion')
+            return ExpandReducePure.expansion(node, state, sdfg)
+
+        # Reduction operation
+        dtype = output_data.dtype
+        redtype = detect_reduction_type(node.wcr, openmp=True)
+        if redtype in ExpandReduceOpenMP._REDUCTION_TYPE_TO_OPENMP:
+            omptype, expr = ExpandReduceOpenMP._REDUCTION_TYPE_TO_OPENMP[redtype]
+            code = ''
+        else:
+            omptype, expr = None, '{o} = __reduce({o}, {i});'
+            code = 'auto __reduce = %s;\n' % unparse_cr(sdfg, node.wcr, dtype)
+        simd_reduction = omptype in ExpandReduceOpenMPTree._SIMD_REDUCTIONS
+
+        ovars = ['_o%d' % i for i in range(len(kdims))]
+        rvars = ['_r%d' % i for i in range(len(rdims))]
+        ovar = dict(zip(kdims, ovars))
+        ovar.update(zip(rdims, rvars))
+        osizes = [sym2cpp(insize[i]) for i in kdims]
+        rsizes = [sym2cpp(insize[i]) for i in rdims]
+        num_outputs = ' * '.join(osizes) or '1'
+        num_reduced = ' * '.join(rsizes)
+
+        def offset(dims, strides):
+            return ' + '.join('%s * %s' % (ovar[d], sym2cpp(s)) for d, s in zip(dims, strides)) or '0'
+
+        inexpr = '_in[%s]' % offset(kdims + rdims, [input_data.strides[i] for i in kdims + rdims])
+        outexpr = '_out[%s]' % offset(kdims, [output_data.strides[i] for i in odims])
+        initexpr = outexpr if node.identity is None else sym2cpp(node.identity)
+        # Row-major index into the (flattened) partial results of one thread
+        pidx = '0'
+        for var, size in zip(ovars, osizes):
+            pidx = var if pidx == '0' else '(%s) * %s + %s' % (pidx, size, var)
+
+        def loops(variables, sizes):
+            return ''.join('for (int {v} = 0; {v} < {sz}; ++{v}) {{\n'.format(v=v, sz=sz)
+                           for v, sz in zip(variables, sizes))
+
+        # Privatized partial results, combined in a binary tree
+        privatized = f'''{{
+            const int __max_threads = omp_get_max_threads();
+            {dtype.ctype} *__partial = new {dtype.ctype}[__max_threads * ({num_outputs})];
+            char *__has_partial = new char[__max_threads];
+            int __nthreads = 1;
+            #pragma omp parallel
+            {{
+                const int __tid = omp_get_thread_num();
+                #pragma omp single
+                __nthreads = omp_get_num_threads();
+                {dtype.ctype} *__acc = __partial + __tid * ({num_outputs});
+                bool __has = false;
+                #pragma omp for collapse({len(rdims)}) schedule(static) nowait
+                {loops(rvars, rsizes)}
+                    if (__has) {{
+                        {'#pragma omp simd collapse(%d)' % len(kdims) if kdims else ''}
+                        {loops(ovars, osizes)}
+                        {expr.format(o='__acc[%s]' % pidx, i=inexpr)}
+                        {'}' * len(kdims)}
+                    }} else {{
+                        {loops(ovars, osizes)}
+                        __acc[{pidx}] = {inexpr};
+                        {'}' * len(kdims)}
+                        __has = true;
+                    }}
+                {'}' * len(rdims)}
+                __has_partial[__tid] = __has;
+                for (int __s = 1; __s < __nthreads; __s *= 2) {{
+                    #pragma omp barrier
+                    if (__tid % (2 * __s) == 0 && __tid + __s < __nthreads && __has_partial[__tid + __s]) {{
+                        {dtype.ctype} *__other = __partial + (__tid + __s) * ({num_outputs});
+                        if (__has_partial[__tid]) {{
+                            for (int __p = 0; __p < {num_outputs}; ++__p) {{
+                                {expr.format(o='__acc[__p]', i='__other[__p]')}
+                            }}
+                        }} else {{
+                            for (int __p = 0; __p < {num_outputs}; ++__p) {{
+                                __acc[__p] = __other[__p];
+                            }}
+                            __has_partial[__tid] = 1;
+                        }}
+                    }}
+                }}
+            }}
+            {loops(ovars, osizes)}
+                {dtype.ctype} __v = {initexpr};
+                if (__has_partial[0]) {{
+                    {expr.format(o='__v', i='__partial[%s]' % pidx)}
+                }}
+                {outexpr} = __v;
+            {'}' * len(kdims)}
+            delete[] __partial;
+            delete[] __has_partial;
+        }}
+        '''
+
+        if not kdims:
+            code += privatized
+        else:
+            # Find the dimension that is contiguous in the input (or the last one)
+            inner = next((i for i in kdims + rdims if input_data.strides[i] == 1), max(kdims + rdims))
+            if inner in rdims:
+                # Rows are reduced: each thread reduces whole output elements, vectorizing over the row
+                simd = f'#pragma omp simd collapse({len(rdims)}) reduction({omptype}: __v)' if simd_reduction else ''
+                by_output = f'''
+                #pragma omp parallel for collapse({len(kdims)}) schedule(static)
+                {loops(ovars, osizes)}
+                    {dtype.ctype} __v = {initexpr};
+                    {simd}
+                    {loops(rvars, rsizes)}
+                        {expr.format(o='__v', i=inexpr)}
+                    {'}' * len(rdims)}
+                    {outexpr} = __v;
+                {'}' * len(kdims)}
+                '''
+                condition = f'({num_outputs}) >= omp_get_max_threads()'
+            else:
+                # Columns are reduced: each thread reduces blocks of contiguous output elements, vectorizing over the
+                # block
+                block = ExpandReduceOpenMPTree._OUTPUT_BLOCK
+                kin = kdims.index(inner)
+                bvar, bsize = ovars[kin], osizes[kin]
+                outer_vars = [v for v in ovars if v != bvar] + ['__b']
+                outer_sizes = [s for v, s in zip(ovars, osizes) if v != bvar] + [f'({bsize} + {block - 1}) / {block}']
+                by_output = f'''
+                #pragma omp parallel for collapse({len(outer_vars)}) schedule(static)
+                {loops(outer_vars, outer_sizes)}
+                    {dtype.ctype} __v[{block}];
+                    const int __len = min({block}, {bsize} - __b * {block});
+                    for (int __i = 0; __i < __len; ++__i) {{
+                        const int {bvar} = __b * {block} + __i;
+                        __v[__i] = {initexpr};
+                    }}
+                    {loops(rvars, rsizes)}
+                        #pragma omp simd
+                        for (int __i = 0; __i < __len; ++__i) {{
+                            const int {bvar} = __b * {block} + __i;
+                            {expr.format(o='__v[__i]', i=inexpr)}
+                        }}
+                    {'}' * len(rdims)}
+                    for (int __i = 0; __i < __len; ++__i) {{
+                        const int {bvar} = __b * {block} + __i;
+                        {outexpr} = __v[__i];
+                    }}
+                {'}' * len(outer_vars)}
+                '''
+                # Privatize only if the output is too small to give every thread a block and there is enough
+                # reduced work to split
+                condition = (f'({num_outputs}) >= omp_get_max_threads() * {block} || '
+                             f'({num_reduced}) < omp_get_max_threads()')
+            code += f'if ({condition}) {{\n{by_output}\n}} else {privatized}'
+
+        # Make tasklet
+        tnode = dace.nodes.Tasklet('reduce', {'_in': dace.pointer(input_data.dtype)},
+                                   {'_out': dace.pointer(output_data.dtype)},
+                                   code,
+                                   language=dace.Language.CPP,
+                                   code_global='#include <omp.h>')
+
+        # Rename outer connectors and add to node
+        inedge._dst_conn = '_in'
+        outedge._src_conn = '_out'
+        node.add_in_connector('_in')
+        node.add_out_connector('_out')
+
+        return tnode
+
+
 @dace.library.expansion
 class ExpandReduceCUDADevice(pm.ExpandTransformation):
     """
@@ -1545,6 +1761,7 @@ class Reduce(dace.sdfg.nodes.LibraryNode):
         'pure': ExpandReducePure,
         'pure-seq': ExpandReducePureSequentialDim,
         'OpenMP': ExpandReduceOpenMP,
+        'OpenMP (tree)': ExpandReduceOpenMPTree,
         'CUDA (device)': ExpandReduceCUDADevice,
         'CUDA (block)': ExpandReduceCUDABlock,
         'CUDA (block allreduce)': ExpandReduceCUDABlockAll,
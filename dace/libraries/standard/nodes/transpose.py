@@ -7,6 +7,7 @@ import dace.sdfg.nodes
 from dace.libraries.blas import blas_helpers
 from dace.libraries.blas import environments as blas_environments
 from dace.transformation.transformation import ExpandTransformation
+from .ttranspose import add_blocked_permutation, can_expand_blocked
 import warnings
 
 
@@ -34,6 +35,28 @@ def _get_transpose_output(node, state, sdfg):
     raise ValueError("Transpose output connector \"_out\" not found.")
 
 
+def _make_transpose_sdfg(node, parent_state, parent_sdfg):
+    """Returns a new SDFG with the transpose input and output arrays, its state, and the two arrays."""
+    in_edge, in_outer_array, in_shape = _get_transpose_input(node, parent_state, parent_sdfg)
+    out_edge, out_outer_array, out_shape = _get_transpose_output(node, parent_state, parent_sdfg)
+    dtype = node.dtype
+
+    sdfg = dace.SDFG(node.label + "_sdfg")
+    state = sdfg.add_state(node.label + "_state")
+
+    _, in_array = sdfg.add_array("_inp",
+                                 in_shape,
+                                 dtype,
+                                 strides=in_outer_array.strides,
+                                 storage=in_outer_array.storage)
+    _, out_array = sdfg.add_array("_out",
+                                  out_shape,
+                                  dtype,
+                                  strides=out_outer_array.strides,
+                                  storage=out_outer_array.storage)
+    return sdfg, state, in_array, out_array
+
+
 @dace.library.expansion
 class ExpandTransposePure(ExpandTransformation):
 
@@ -42,23 +65,7 @@ class ExpandTransposePure(ExpandTransformation):
     @staticmethod
     def make_sdfg(node, parent_state, parent_sdfg):
 
-        in_edge, in_outer_array, in_shape = _get_transpose_input(node, parent_state, parent_sdfg)
-        out_edge, out_outer_array, out_shape = _get_transpose_output(node, parent_state, parent_sdfg)
-        dtype = node.dtype
-
-        sdfg = dace.SDFG(node.label + "_sdfg")
-        state = sdfg.add_state(node.label + "_state")
-
-        _, in_array = sdfg.add_array("_inp",
-                                     in_shape,
-                                     dtype,
-                                     strides=in_outer_array.strides,
-                                     storage=in_outer_array.storage)
-        _, out_array = sdfg.add_array("_out",
-                                      out_shape,
-                                      dtype,
-                                      strides=out_outer_array.strides,
-                                      storage=out_outer_array.storage)
+        sdfg, state, in_array, out_array = _make_transpose_sdfg(node, parent_state, parent_sdfg)
 
         num_elements = functools.reduce(lambda x, y: x * y, in_array.shape)
         if num_elements == 1:
@@ -92,6 +99,33 @@ class ExpandTransposePure(ExpandTransformation):
         return ExpandTransposePure.make_sdfg(node, state, sdfg)
 
 
+@dace.library.expansion
+class ExpandTransposePureBlocked(ExpandTransformation):
+    """
+    Transposes the matrix tile by tile, such that both the source and the destination tile stay in cache, and
+    processes the tiles in parallel. The tile size is taken from the ``library.standard.transpose_tile_size``
+    configuration entry unless given to the expansion. Falls back to the pure expansion for single elements, in
+    device-level code, and for arrays that are not accessible from the host.
+    """
+
+    environments = []
+
+    @staticmethod
+    def make_sdfg(node, parent_state, parent_sdfg, tile_size=None):
+        sdfg, state, in_array, out_array = _make_transpose_sdfg(node, parent_state, parent_sdfg)
+        num_elements = functools.reduce(lambda x, y: x * y, in_array.shape)
+        if num_elements == 1 or not can_expand_blocked(node, parent_state, parent_sdfg, in_array, out_array):
+            return ExpandTransposePure.make_sdfg(node, parent_state, parent_sdfg)
+
+        add_blocked_permutation(state, "_inp", "_out", [1, 0], "__out = __inp", tile_size=tile_size)
+        return sdfg
+
+    @staticmethod
+    def expansion(node, state, sdfg, tile_size=None):
+        node.validate(sdfg, state)
+        return ExpandTransposePureBlocked.make_sdfg(node, state, sdfg, tile_size=tile_size)
+
+
 @dace.library.expansion
 class ExpandTransposeMKL(ExpandTransformation):
 
@@ -211,6 +245,7 @@ class Transpose(dace.sdfg.nodes.LibraryNode):
     # Global properties
     implementations = {
         "pure": ExpandTransposePure,
+        "pure_blocked": ExpandTransposePureBlocked,
         "MKL": ExpandTransposeMKL,
         "OpenBLAS": ExpandTransposeOpenBLAS,
         "cuBLAS": ExpandTransposeCuBLAS
@@ -1,14 +1,124 @@
 # Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
+import functools
 import multiprocessing
-from dace import library, nodes, properties
+import operator
+from dace import dtypes, library, nodes, properties
 from dace.libraries.blas import blas_helpers
+from dace.sdfg import scope
 from dace.symbolic import symstr
 from dace.transformation.transformation import ExpandTransformation
 from numbers import Number
+from typing import List, Optional, Sequence
 from .. import environments
 
 
+def permutation_groups(axes: Sequence[int]) -> List[List[int]]:
+    """
+    Groups the modes of a tensor permutation into runs of consecutive input modes that remain adjacent and in order in
+    the output. Each group can be traversed as a single, merged mode of both tensors.
+
+    :param axes: The permutation of the input modes.
+    :return: The groups of input modes, in output order.
+    """
+    groups = [[axes[0]]]
+    for axis in axes[1:]:
+        if axis == groups[-1][-1] + 1:
+            groups[-1].append(axis)
+        else:
+            groups.append([axis])
+    return groups
+
+
+def can_expand_blocked(node: nodes.LibraryNode, state: dace.SDFGState, sdfg: dace.SDFG, *arrays) -> bool:
+    """
+    Returns True if a blocked permutation of the given arrays can be generated for the library node, i.e., if the
+    node is not in device-level code and the arrays are accessible from the host.
+    """
+    if scope.is_devicelevel_gpu(sdfg, state, node) or scope.is_devicelevel_fpga(sdfg, state, node):
+        return False
+    return all(dtypes.can_access(dtypes.ScheduleType.CPU_Multicore, desc.storage) for desc in arrays)
+
+
+def add_blocked_permutation(state: dace.SDFGState,
+                            inp: str,
+                            out: str,
+                            axes: Sequence[int],
+                            code: str,
+                            inout: bool = False,
+                            tile_size: Optional[int] = None,
+                            name: str = 'transpose'):
+    """
+    Adds a blocked out-of-place permutation of the modes of ``inp`` into ``out`` to the given state.
+
+    Modes that remain adjacent in the output are merged (see :func:`permutation_groups`). If the innermost group of
+    the input and the output is the same, both tensors are traversed contiguously by a single map. Otherwise, the
+    innermost input group and the innermost output group are tiled with ``tile_size`` x ``tile_size`` tiles, such that
+    both the tile of the source and of the destination stay in cache while the tile is transposed. The (collapsed) map
+    over the tiles and the remaining groups is parallel.
+
+    :param state: The state to add the permutation to.
+    :param inp: Name of the input tensor.
+    :param out: Name of the output tensor.
+    :param axes: The permutation of the input modes, as in ``numpy.transpose``.
+    :param code: Tasklet code, reading connector ``__inp`` (and ``__inout`` if set) and writing connector ``__out``.
+    :param inout: If True, the tasklet also reads the output element through connector ``__inout``.
+    :param tile_size: Size of the tiles. If None, taken from the ``library.standard.transpose_tile_size``
+                      configuration entry.
+    :param name: Name of the tasklet and prefix of the maps.
+    """
+    tile_size = tile_size or dace.config.Config.get('library', 'standard', 'transpose_tile_size')
+    shape = state.parent.arrays[inp].shape
+    groups = permutation_groups(axes)
+    sizes = [symstr(functools.reduce(operator.mul, (shape[a] for a in group), 1)) for group in groups]
+    params = [f'__g{i}' for i in range(len(groups))]
+
+    # Index of every input mode in terms of the group indices
+    index = [None] * len(shape)
+    for group, param in zip(groups, params):
+        stride = 1
+        for i, axis in enumerate(reversed(group)):
+            expr = param if stride == 1 else f'({param} // ({symstr(stride)}))'
+            if i < len(group) - 1:
+                expr = f'({expr} % ({symstr(shape[axis])}))'
+            index[axis] = expr
+            stride *= shape[axis]
+    inp_mem = dace.Memlet(f'{inp}[{", ".join(index)}]')
+    out_mem = dace.Memlet(f'{out}[{", ".join(index[a] for a in axes)}]')
+    inputs = {'__inp': inp_mem}
+    if inout:
+        inputs['__inout'] = dace.Memlet.from_memlet(out_mem)
+
+    # Groups in input order. The group of the innermost input mode is always last
+    input_order = sorted(range(len(groups)), key=lambda i: groups[i][0])
+    inner_inp, inner_out = input_order[-1], len(groups) - 1
+    if inner_inp == inner_out:
+        state.add_mapped_tasklet(name, {params[i]: f'0:{sizes[i]}'
+                                        for i in input_order},
+                                 inputs,
+                                 code, {'__out': out_mem},
+                                 external_edges=True)
+        return
+
+    tiled = [i for i in input_order if i in (inner_inp, inner_out)]
+    outer_ranges = {params[i]: f'0:{sizes[i]}' for i in input_order if i not in tiled}
+    outer_ranges.update({f'__t{i}': f'0:{sizes[i]}:{tile_size}' for i in tiled})
+    inner_ranges = {params[i]: f'__t{i}:min({sizes[i]}, __t{i} + {tile_size})' for i in tiled}
+
+    outer_entry, outer_exit = state.add_map(f'{name}_tiles', outer_ranges)
+    outer_entry.map.collapse = len(outer_ranges)
+    inner_entry, inner_exit = state.add_map(f'{name}_tile', inner_ranges, schedule=dtypes.ScheduleType.Sequential)
+    tasklet = state.add_tasklet(name, set(inputs.keys()), {'__out'}, code)
+    for conn, memlet in inputs.items():
+        state.add_memlet_path(state.add_read(memlet.data),
+                              outer_entry,
+                              inner_entry,
+                              tasklet,
+                              memlet=memlet,
+                              dst_conn=conn)
+    state.add_memlet_path(tasklet, inner_exit, outer_exit, state.add_write(out), memlet=out_mem, src_conn='__out')
+
+
 @library.expansion
 class ExpandPure(ExpandTransformation):
     """ Implements the pure expansion of TensorTranspose library node. """
@@ -47,6 +157,49 @@ class ExpandPure(ExpandTransformation):
         return sdfg
 
 
+@library.expansion
+class ExpandPureBlocked(ExpandTransformation):
+    """
+    Implements the TensorTranspose library node with a blocked permutation (see :func:`add_blocked_permutation`).
+    Falls back to the pure expansion in device-level code and for tensors that are not accessible from the host.
+    """
+
+    environments = []
+
+    @staticmethod
+    def expansion(node, parent_state, parent_sdfg, tile_size=None):
+        inp_tensor, out_tensor = node.validate(parent_sdfg, parent_state)
+        if not can_expand_blocked(node, parent_state, parent_sdfg, inp_tensor, out_tensor):
+            return ExpandPure.expansion(node, parent_state, parent_sdfg)
+
+        sdfg = dace.SDFG(f"{node.label}_sdfg")
+        sdfg.add_array("_inp_tensor",
+                       inp_tensor.shape,
+                       inp_tensor.dtype,
+                       inp_tensor.storage,
+                       strides=inp_tensor.strides)
+        sdfg.add_array("_out_tensor",
+                       out_tensor.shape,
+                       out_tensor.dtype,
+                       out_tensor.storage,
+                       strides=out_tensor.strides)
+
+        state = sdfg.add_state(f"{node.label}_state")
+        code = f"__out = {node.alpha} * __inp"
+        if node.beta != 0:
+            code = f"__out = {node.alpha} * __inp + {node.beta} * __inout"
+        add_blocked_permutation(state,
+                                "_inp_tensor",
+                                "_out_tensor",
+                                node.axes,
+                                code,
+                                inout=node.beta != 0,
+                                tile_size=tile_size,
+                                name=f"{node.label}_tasklet")
+
+        return sdfg
+
+
 @library.expansion
 class ExpandHPTT(ExpandTransformation):
     """
@@ -85,7 +238,7 @@ class ExpandHPTT(ExpandTransformation):
 class TensorTranspose(nodes.LibraryNode):
     """ Implements out-of-place tensor transpositions. """
 
-    implementations = {"pure": ExpandPure, "HPTT": ExpandHPTT}
+    implementations = {"pure": ExpandPure, "pure_blocked": ExpandPureBlocked, "HPTT": ExpandHPTT}
     default_implementation = 'pure'
 
     axes = properties.ListProperty(element_type=int, default=[], desc="Permutation of input tensor's modes")
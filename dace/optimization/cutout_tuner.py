@@ -5,9 +5,12 @@ import math
 import dace
 import json
 
-from typing import Dict, Generator, Any, List, Tuple
+from concurrent.futures import Future, as_completed
+from typing import Callable, Dict, Generator, Any, List, Optional, Set, Tuple
 from dace.optimization import auto_tuner
 from dace.optimization import utils as optim_utils
+from dace.optimization.measurement_farm import MeasurementFarm
+from dace.optimization.search_strategies import ExhaustiveSearch, SearchStrategy
 from dace.sdfg.sdfg import SDFG
 from dace.sdfg.state import SDFGState
 
@@ -44,6 +47,7 @@ class CutoutTuner(auto_tuner.AutoTuner):
         """
         super().__init__(sdfg=sdfg)
         self._task = task
+        self._farm: Optional[MeasurementFarm] = None
 
     @property
     def task(self) -> str:
@@ -52,6 +56,11 @@ class CutoutTuner(auto_tuner.AutoTuner):
     def file_name(self, label: str) -> str:
         return f"{self._task}.{label}.tuning"
 
+    @staticmethod
+    def eliminated_file_name(file_name: str) -> str:
+        """ Returns the file that lists the eliminated configurations of the given tuning file. """
+        return f"{file_name}.eliminated"
+
     def try_load(self, file_name) -> Dict:
         results = None
         if os.path.exists(file_name):
@@ -68,9 +77,6 @@ class CutoutTuner(auto_tuner.AutoTuner):
     def space(self, **kwargs) -> Generator[Any, None, None]:
         raise NotImplementedError
 
-    def search(self, cutout: SDFG, measurements: int, **kwargs) -> Dict:
-        raise NotImplementedError
-
     def pre_evaluate(self, **kwargs) -> Dict:
         raise NotImplementedError
 
@@ -85,55 +91,158 @@ class CutoutTuner(auto_tuner.AutoTuner):
 
     def measure(self, cutout, dreport, repetitions: int = 30, timeout: float = 300.0) -> float:
         dreport_ = {}
-        for cstate in cutout.nodes():
-            for dnode in cstate.data_nodes():
-                array = cutout.arrays[dnode.data]
-                if array.transient:
-                    continue
-            try:
-                data = dreport.get_first_version(dnode.data)
-                dreport_[dnode.data] = data
-            except:
-                continue
-        
+        # Cutouts are measured on random data if no data was instrumented
+        if dreport is not None:
+            for cstate in cutout.nodes():
+                for dnode in cstate.data_nodes():
+                    array = cutout.arrays[dnode.data]
+                    if array.transient:
+                        continue
+                    try:
+                        data = dreport.get_first_version(dnode.data)
+                        dreport_[dnode.data] = data
+                    except (KeyError, OSError):
+                        continue
+
+        if self._farm is not None:
+            return self._farm.submit(cutout, dreport_, repetitions)
+
         runtime = optim_utils.subprocess_measure(cutout=cutout, dreport=dreport_, repetitions=repetitions, timeout=timeout)
         return runtime
 
-    def optimize(self, measurements: int = 30, apply: bool = False, **kwargs) -> Dict[Any, Any]:
-        tuning_report = {}
-        for cutout, label in tqdm(list(self.cutouts())):
-            fn = self.file_name(label)
-            results = self.try_load(fn)
+    @staticmethod
+    def checkpoint(file_name: str, results: Dict[str, float], eliminated: Optional[Set[str]] = None) -> None:
+        """
+        Atomically writes (partial) tuning results of a cutout into its tuning file.
 
-            if results is None:
-                results = self.search(cutout, measurements, **kwargs)
-                if results is None:
+        :param file_name: The tuning file of the cutout.
+        :param results: A dictionary mapping configuration keys to runtimes.
+        :param eliminated: Keys of configurations that were eliminated by the search strategy without a full
+                           measurement, which are written to a separate file (see ``eliminated_file_name``).
+        """
+        files = [(file_name, results)]
+        if eliminated:
+            files.append((CutoutTuner.eliminated_file_name(file_name), sorted(eliminated)))
+        for name, contents in files:
+            tmp_name = f'{name}.tmp'
+            with open(tmp_name, 'w') as fp:
+                json.dump(contents, fp)
+            os.replace(tmp_name, name)
+
+    def optimize(self,
+                 measurements: int = 30,
+                 apply: bool = False,
+                 farm: Optional[MeasurementFarm] = None,
+                 strategy: Optional[SearchStrategy] = None,
+                 **kwargs) -> Dict[Any, Any]:
+        """
+        Tunes all cutouts of the SDFG. Results are checkpointed into the tuning file of each cutout after every
+        measured configuration, and configurations that already appear in a tuning file (or were eliminated by the
+        search strategy) are not measured again, such that an interrupted run resumes where it stopped.
+
+        :param measurements: Number of measurements of each configuration.
+        :param apply: If True, applies the best configuration of each cutout to the SDFG.
+        :param farm: An optional measurement farm that compiles configurations concurrently.
+        :param strategy: The search strategy that selects the configurations to measure (if None, measures every
+                         configuration).
+        :return: A dictionary mapping cutout labels to the tuning results of the cutout.
+        """
+        tuning_report = {}
+        self._farm = farm
+        try:
+            for cutout, label in tqdm(list(self.cutouts())):
+                fn = self.file_name(label)
+                results = self.search(cutout,
+                                      measurements,
+                                      results=self.try_load(fn),
+                                      checkpoint=lambda res, elim: self.checkpoint(fn, res, elim),
+                                      strategy=strategy,
+                                      eliminated=set(self.try_load(self.eliminated_file_name(fn)) or []),
+                                      **kwargs)
+                if not results:
                     tuning_report[label] = None
                     continue
 
-                with open(fn, 'w') as fp:
-                    json.dump(results, fp)
-
-            best_config = min(results, key=results.get)
-            if apply:
-                config = self.config_from_key(best_config, cutout=cutout)
-                self.apply(config, label=label)
+                best_config = min(results, key=results.get)
+                if apply:
+                    config = self.config_from_key(best_config, cutout=cutout)
+                    self.apply(config, label=label)
 
-            tuning_report[label] = results
+                tuning_report[label] = results
+        finally:
+            self._farm = None
 
         return tuning_report
 
-    def search(self, cutout: SDFG, measurements: int,
+    def search(self,
+               cutout: SDFG,
+               measurements: int,
+               results: Optional[Dict[str, float]] = None,
+               checkpoint: Optional[Callable[[Dict[str, float], Set[str]], None]] = None,
+               strategy: Optional[SearchStrategy] = None,
+               eliminated: Optional[Set[str]] = None,
                **kwargs) -> Dict[str, float]:
+        """
+        Measures configurations in the search space of a cutout.
+
+        :param cutout: The cutout to tune.
+        :param measurements: Number of measurements of each configuration.
+        :param results: Previous (partial) results of the cutout, whose configurations are not measured again.
+        :param checkpoint: A function that is called with the results and the eliminated configurations after every
+                           fully measured configuration, and whenever the search strategy eliminated configurations.
+        :param strategy: The search strategy that selects the configurations to measure (if None, measures every
+                         configuration).
+        :param eliminated: Keys of configurations that were eliminated in a previous (interrupted) search, which are
+                           not measured again. Configurations eliminated by the strategy are added to this set.
+        :return: A dictionary mapping configuration keys to runtimes of configurations that were measured with the
+                 full number of repetitions.
+        """
         kwargs = self.pre_evaluate(cutout=cutout, measurements=measurements, **kwargs)
 
-        results = {}
+        results = dict(results or {})
+        eliminated = set() if eliminated is None else eliminated
         key = kwargs["key"]
-        for config in tqdm(list(self.space(**(kwargs["space_kwargs"])))):
-            kwargs["config"] = config
-            runtime = self.evaluate(**kwargs)
-            results[key(config)] = runtime
+        configs = {}
+        for config in self.space(**(kwargs["space_kwargs"])):
+            configs.setdefault(key(config), config)
+
+        checkpointed = set(eliminated)
+
+        def measure(keys: List[str], repetitions: int) -> Dict[str, float]:
+            runtimes: Dict[str, float] = {}
+            if checkpoint is not None and eliminated != checkpointed:
+                # Configurations were eliminated since the last measurement
+                checkpoint(results, eliminated)
+                checkpointed.update(eliminated)
+
+            def record(config_key: str, runtime: float) -> None:
+                runtimes[config_key] = runtime
+                # Measurements with fewer repetitions (e.g., eliminated in successive halving) are only returned to
+                # the strategy, as they are not comparable to full measurements
+                if repetitions >= measurements:
+                    results[config_key] = runtime
+                    if checkpoint is not None:
+                        checkpoint(results, eliminated)
+
+            pending: Dict[Future, str] = {}
+            for config_key in tqdm(keys):
+                kwargs["config"] = configs[config_key]
+                kwargs["measurements"] = repetitions
+                runtime = self.evaluate(**kwargs)
+                if isinstance(runtime, Future):
+                    # Configuration is measured in a measurement farm
+                    pending[runtime] = config_key
+                    continue
+                record(config_key, runtime)
+
+            for future in as_completed(pending):
+                record(pending[future], future.result())
+
+            return runtimes
 
+        strategy = strategy or ExhaustiveSearch()
+        strategy.search([k for k in configs.keys() if k not in eliminated], measure, measurements, dict(results),
+                        eliminated)
         return results
 
     @staticmethod
@@ -0,0 +1,604 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Per-machine selection of library node implementations from measured runtimes.
+
+``LibraryImplementationTuner`` measures the implementations of library nodes over a grid of sizes and data types and
+stores the runtimes in an ``ImplementationDatabase``. If the ``library.autoselect`` configuration entry is enabled,
+library nodes are then expanded with the implementation that was fastest for the nearest measured sizes (see
+``select_implementation``), instead of following a static priority list.
+"""
+from copy import deepcopy as dc
+import itertools
+import json
+import math
+import os
+import re
+import timeit
+import uuid
+import warnings
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+import dace
+from dace import config, dtypes, symbolic
+from dace.file_lock import file_lock
+from dace.sdfg import SDFG, SDFGState, nodes
+
+#: A problem description: data type, variant (e.g., transposition of the inputs) and sizes
+Problem = Tuple[str, str, Tuple[int, ...]]
+
+# Databases loaded in this process, mapped to the modification time of their file
+_loaded: Dict[str, Tuple[float, 'ImplementationDatabase']] = {}
+
+
+def default_database_path() -> str:
+    """
+    Returns the path of the implementation database from the configuration, or ``~/.dace/implementations.json`` if
+    none is configured.
+    """
+    path = config.Config.get('library', 'implementation_database')
+    return os.path.abspath(os.path.expanduser(path or os.path.join('~', '.dace', 'implementations.json')))
+
+
+class ImplementationDatabase:
+    """
+    A JSON file of measured library node runtimes. Every record describes a problem (library node type, target device,
+    data type, variant and sizes) and maps the measured implementations to their runtime in seconds.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Opens an implementation database, or creates an empty one if the file does not exist.
+
+        :param path: Path of the database file. If not given, uses ``default_database_path()``.
+        """
+        self.path = os.path.abspath(path) if path else default_database_path()
+        self.records: Dict[str, List[Dict[str, Any]]] = {}
+        if os.path.isfile(self.path):
+            with open(self.path, 'r') as fp:
+                self.records = json.load(fp)['records']
+
+    @staticmethod
+    def load(path: Optional[str] = None) -> 'ImplementationDatabase':
+        """
+        Returns the implementation database at the given path, reusing the database loaded in this process unless the
+        file was modified since.
+        """
+        path = os.path.abspath(path) if path else default_database_path()
+        mtime = os.path.getmtime(path) if os.path.isfile(path) else -1
+        if path not in _loaded or _loaded[path][0] != mtime:
+            _loaded[path] = (mtime, ImplementationDatabase(path))
+        return _loaded[path][1]
+
+    def _find(self, node_type: str, device: str, dtype: str, variant: str, sizes: Sequence[int]) -> Dict[str, Any]:
+        for record in self.records.get(node_type, []):
+            if (record['device'], record['dtype'], record['variant'], record['sizes']) == (device, dtype, variant,
+                                                                                         list(sizes)):
+                return record
+        return None
+
+    def record(self,
+               node_type: str,
+               problem: Problem,
+               implementation: str,
+               runtime: float,
+               device: dtypes.DeviceType = dtypes.DeviceType.CPU) -> None:
+        """
+        Adds (or replaces) the runtime of an implementation for the given problem.
+
+        :param node_type: Name of the library node class.
+        :param problem: A tuple of data type, variant and sizes.
+        :param implementation: Name of the implementation.
+        :param runtime: The runtime in seconds.
+        :param device: The device the implementation was measured on.
+        """
+        dtype, variant, sizes = problem
+        record = self._find(node_type, device.name, dtype, variant, sizes)
+        if record is None:
+            record = dict(device=device.name, dtype=dtype, variant=variant, sizes=list(sizes), runtimes={})
+            self.records.setdefault(node_type, []).append(record)
+        record['runtimes'][implementation] = runtime
+
+    def save(self) -> None:
+        """
+        Writes the database to its file. Records written by other processes in the meantime are kept, and runtimes
+        measured by both are overwritten with the ones in this database.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with file_lock(self.path + '.lock'):
+            merged = ImplementationDatabase(self.path)
+            for node_type, records in self.records.items():
+                for record in records:
+                    problem = (record['dtype'], record['variant'], record['sizes'])
+                    for implementation, runtime in record['runtimes'].items():
+                        merged.record(node_type, problem, implementation, runtime, dtypes.DeviceType[record['device']])
+            self.records = merged.records
+            tmp_path = '%s.%s.tmp' % (self.path, uuid.uuid4().hex)
+            with open(tmp_path, 'w') as fp:
+                json.dump({'records': self.records}, fp, indent=1)
+            os.replace(tmp_path, self.path)
+
+    def fastest(self,
+                node_type: str,
+                problem: Problem,
+                candidates: Optional[Sequence[str]] = None,
+                device: dtypes.DeviceType = dtypes.DeviceType.CPU) -> Optional[str]:
+        """
+        Returns the fastest implementation for the measured problem nearest to the given one, i.e., with the same data
+        type and variant, and the smallest distance between the logarithms of the sizes.
+
+        :param node_type: Name of the library node class.
+        :param problem: A tuple of data type, variant and sizes.
+        :param candidates: If given, only considers these implementations.
+        :param device: The target device.
+        :return: The name of the fastest implementation, or None if no matching problem was measured.
+        """
+        dtype, variant, sizes = problem
+        best, best_distance = None, math.inf
+        for record in self.records.get(node_type, []):
+            if ((record['device'], record['dtype'], record['variant']) != (device.name, dtype, variant)
+                    or len(record['sizes']) != len(sizes)):
+                continue
+            runtimes = {k: v for k, v in record['runtimes'].items() if candidates is None or k in candidates}
+            if not runtimes:
+                continue
+            distance = sum(abs(math.log2(max(a, 1)) - math.log2(max(b, 1))) for a, b in zip(record['sizes'], sizes))
+            if distance < best_distance:
+                best, best_distance = min(runtimes, key=runtimes.get), distance
+        return best
+
+
+##################################################################################################################
+# Problems
+
+
+def _evaluate(expr, symbols: Dict[str, Any]) -> Optional[int]:
+    try:
+        return int(symbolic.evaluate(expr, symbols))
+    except (TypeError, ValueError, KeyError):
+        return None
+
+
+def _operand(node: nodes.LibraryNode,
+             state: SDFGState,
+             sdfg: SDFG,
+             connector: Optional[str],
+             symbols: Dict[str, Any],
+             squeeze: bool = True) -> Optional[Tuple[dtypes.typeclass, List[int]]]:
+    """
+    Returns the data type and concrete size of the data connected to the given connector (or the first input if
+    ``connector`` is None), or None if the size cannot be evaluated.
+    """
+    for edge in state.all_edges(node):
+        conn = edge.dst_conn if edge.dst is node else edge.src_conn
+        if (connector is None and edge.dst is node) or (connector is not None and conn == connector):
+            subset = edge.data.subset
+            if squeeze:
+                subset = dc(subset)
+                subset.squeeze()
+            symbols = {**sdfg.constants, **(symbols or {})}
+            sizes = [_evaluate(s, symbols) for s in subset.size()]
+            if any(s is None for s in sizes):
+                return None
+            return sdfg.arrays[edge.data.data].dtype, sizes
+    return None
+
+
+def _add_arrays(sdfg: SDFG, state: SDFGState, node: nodes.LibraryNode, inputs: Dict[str, Tuple[Sequence, Any]],
+                outputs: Dict[str, Tuple[Sequence, Any]]) -> None:
+    """ Adds arrays of the given shapes and types to a single-node SDFG and connects them to the node. """
+    state.add_node(node)
+    for connectors, is_input in ((inputs, True), (outputs, False)):
+        for conn, (shape, dtype) in connectors.items():
+            name = 'arr' + (conn or ('_in' if is_input else '_out'))
+            sdfg.add_array(name, shape, dtype)
+            if is_input:
+                state.add_edge(state.add_read(name), None, node, conn, dace.Memlet(name))
+            else:
+                state.add_edge(node, conn, state.add_write(name), None, dace.Memlet(name))
+
+
+def _random(shape: Sequence[int], dtype: dtypes.typeclass) -> np.ndarray:
+    return np.random.rand(*shape).astype(dtype.as_numpy_dtype())
+
+
+class LibraryBenchmark:
+    """
+    Describes how the implementations of a library node type are measured: how a library node is mapped to a problem
+    (variant and sizes), how a single-node SDFG with symbolic sizes is built for a variant, and how its arguments are
+    created for concrete sizes.
+    """
+
+    #: The library node class
+    node_type: Type[nodes.LibraryNode] = None
+    #: Connector of the data that determines the data type of the problem (None for the first input)
+    dtype_connector: Optional[str] = None
+    #: Default grid of (variant, sizes) to measure
+    grid: List[Tuple[str, Tuple[int, ...]]] = []
+
+    def problem(self,
+                node: nodes.LibraryNode,
+                state: SDFGState,
+                sdfg: SDFG,
+                symbols: Optional[Dict[str, Any]] = None) -> Optional[Problem]:
+        """
+        Returns the problem computed by a library node, or None if it has no concrete sizes or is not supported.
+
+        :param symbols: Values of symbols that are not constants of the SDFG.
+        """
+        operand = _operand(node, state, sdfg, self.dtype_connector, symbols)
+        variant_sizes = self.variant_and_sizes(node, state, sdfg, symbols)
+        if operand is None or variant_sizes is None:
+            return None
+        return (operand[0].to_string(), *variant_sizes)
+
+    def variant_and_sizes(self, node: nodes.LibraryNode, state: SDFGState, sdfg: SDFG,
+                          symbols: Dict[str, Any]) -> Optional[Tuple[str, Tuple[int, ...]]]:
+        raise NotImplementedError
+
+    def build(self, sdfg: SDFG, state: SDFGState, dtype: dtypes.typeclass, variant: str) -> nodes.LibraryNode:
+        """ Adds the library node and its (symbolically sized) arrays to an empty SDFG and returns the node. """
+        raise NotImplementedError
+
+    def arguments(self, dtype: dtypes.typeclass, variant: str, sizes: Tuple[int, ...]) -> Dict[str, Any]:
+        """ Returns the arguments of the SDFG built by ``build`` for the given sizes. """
+        raise NotImplementedError
+
+
+_M, _N, _K, _NNZ = (dace.symbol(s) for s in ('M', 'N', 'K', 'NNZ'))
+_SIZES = (16, 128, 1024)
+
+
+class GemmBenchmark(LibraryBenchmark):
+    """ Measures ``Gemm`` (C = A @ B) for transposed and non-transposed inputs. Sizes are (M, N, K). """
+
+    dtype_connector = '_a'
+    grid = ([('NN', s) for s in itertools.product(_SIZES, repeat=3)] +
+            [('TN', s) for s in itertools.product(_SIZES[:2], repeat=3)])
+
+    @property
+    def node_type(self):
+        from dace.libraries.blas import Gemm
+        return Gemm
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        a = _operand(node, state, sdfg, '_a', symbols)
+        b = _operand(node, state, sdfg, '_b', symbols)
+        if a is None or b is None or len(a[1]) != 2 or len(b[1]) != 2:
+            return None
+        (m, k), n = (a[1][::-1] if node.transA else a[1]), (b[1][0] if node.transB else b[1][1])
+        return ('T' if node.transA else 'N') + ('T' if node.transB else 'N'), (m, n, k)
+
+    def build(self, sdfg, state, dtype, variant):
+        node = self.node_type('gemm', transA=variant[0] == 'T', transB=variant[1] == 'T')
+        _add_arrays(sdfg, state, node, {
+            '_a': ([_K, _M] if variant[0] == 'T' else [_M, _K], dtype),
+            '_b': ([_N, _K] if variant[1] == 'T' else [_K, _N], dtype)
+        }, {'_c': ([_M, _N], dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        m, n, k = sizes
+        return dict(arr_a=_random([k, m] if variant[0] == 'T' else [m, k], dtype),
+                    arr_b=_random([n, k] if variant[1] == 'T' else [k, n], dtype),
+                    arr_c=_random([m, n], dtype),
+                    M=m,
+                    N=n,
+                    K=k)
+
+
+class GemvBenchmark(LibraryBenchmark):
+    """ Measures ``Gemv`` (y = A @ x) for transposed and non-transposed matrices. Sizes are the shape of A. """
+
+    dtype_connector = '_A'
+    grid = [(v, s) for v in ('N', 'T') for s in itertools.product((16, 256, 4096), repeat=2)]
+
+    @property
+    def node_type(self):
+        from dace.libraries.blas import Gemv
+        return Gemv
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        a = _operand(node, state, sdfg, '_A', symbols)
+        if a is None or len(a[1]) != 2:
+            return None
+        return ('T' if node.transA else 'N'), tuple(a[1])
+
+    def build(self, sdfg, state, dtype, variant):
+        node = self.node_type('gemv', transA=variant == 'T')
+        xsize, ysize = (_M, _N) if variant == 'T' else (_N, _M)
+        _add_arrays(sdfg, state, node, {'_A': ([_M, _N], dtype), '_x': ([xsize], dtype)}, {'_y': ([ysize], dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        m, n = sizes
+        xsize, ysize = (m, n) if variant == 'T' else (n, m)
+        return dict(arr_A=_random([m, n], dtype),
+                    arr_x=_random([xsize], dtype),
+                    arr_y=_random([ysize], dtype),
+                    M=m,
+                    N=n)
+
+
+class DotBenchmark(LibraryBenchmark):
+    """ Measures ``Dot``. Sizes are the length of the vectors. """
+
+    dtype_connector = '_x'
+    grid = [('', (n, )) for n in (64, 4096, 262144, 4194304)]
+
+    @property
+    def node_type(self):
+        from dace.libraries.blas import Dot
+        return Dot
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        x = _operand(node, state, sdfg, '_x', symbols)
+        if x is None or len(x[1]) != 1:
+            return None
+        return '', tuple(x[1])
+
+    def build(self, sdfg, state, dtype, variant):
+        node = self.node_type('dot')
+        _add_arrays(sdfg, state, node, {'_x': ([_N], dtype), '_y': ([_N], dtype)}, {'_result': ([1], dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        return dict(arr_x=_random(sizes, dtype),
+                    arr_y=_random(sizes, dtype),
+                    arr_result=_random([1], dtype),
+                    N=sizes[0])
+
+
+class TransposeBenchmark(LibraryBenchmark):
+    """ Measures ``Transpose``. Sizes are the shape of the input matrix. """
+
+    dtype_connector = '_inp'
+    grid = [('', s) for s in itertools.product((16, 256, 4096), repeat=2)]
+
+    @property
+    def node_type(self):
+        from dace.libraries.standard import Transpose
+        return Transpose
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        inp = _operand(node, state, sdfg, '_inp', symbols)
+        if inp is None or len(inp[1]) != 2:
+            return None
+        return '', tuple(inp[1])
+
+    def build(self, sdfg, state, dtype, variant):
+        node = self.node_type('transpose', dtype=dtype)
+        _add_arrays(sdfg, state, node, {'_inp': ([_M, _N], dtype)}, {'_out': ([_N, _M], dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        m, n = sizes
+        return dict(arr_inp=_random([m, n], dtype), arr_out=_random([n, m], dtype), M=m, N=n)
+
+
+class ReduceBenchmark(LibraryBenchmark):
+    """
+    Measures sum reductions (``Reduce``) of matrices. The variant contains the reduced axes, and sizes are the shape
+    of the input.
+    """
+
+    grid = [(v, s) for v in ('0', '1', 'all') for s in itertools.product((16, 256, 4096), repeat=2)]
+
+    @property
+    def node_type(self):
+        from dace.libraries.standard import Reduce
+        return Reduce
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        inp = _operand(node, state, sdfg, None, symbols, squeeze=False)
+        if inp is None:
+            return None
+        axes = node.axes
+        if axes is None or len(set(axes)) == len(inp[1]):
+            return 'all', tuple(inp[1])
+        return ','.join(str(a) for a in sorted(axes)), tuple(inp[1])
+
+    def build(self, sdfg, state, dtype, variant):
+        axes = None if variant == 'all' else [int(a) for a in variant.split(',')]
+        node = self.node_type('lambda a, b: a + b', axes, 0)
+        outsize = {'all': [1], '0': [_N], '1': [_M]}[variant]
+        _add_arrays(sdfg, state, node, {None: ([_M, _N], dtype)}, {None: (outsize, dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        m, n = sizes
+        outsize = {'all': [1], '0': [n], '1': [m]}[variant]
+        return dict(arr_in=_random([m, n], dtype), arr_out=_random(outsize, dtype), M=m, N=n)
+
+
+class CSRMVBenchmark(LibraryBenchmark):
+    """ Measures ``CSRMV`` on random sparse matrices. Sizes are (rows, columns, nonzeros). """
+
+    dtype_connector = '_a_vals'
+    grid = [('', (n, n, n * d)) for n in (256, 4096, 65536) for d in (4, 32)]
+
+    @property
+    def node_type(self):
+        from dace.libraries.sparse import CSRMV
+        return CSRMV
+
+    def variant_and_sizes(self, node, state, sdfg, symbols):
+        rows = _operand(node, state, sdfg, '_a_rows', symbols)
+        vals = _operand(node, state, sdfg, '_a_vals', symbols)
+        b = _operand(node, state, sdfg, '_b', symbols)
+        if rows is None or vals is None or b is None:
+            return None
+        return '', (rows[1][0] - 1, b[1][0], vals[1][0])
+
+    def build(self, sdfg, state, dtype, variant):
+        node = self.node_type('csrmv')
+        _add_arrays(sdfg, state, node, {
+            '_a_rows': ([_M + 1], dace.int32),
+            '_a_cols': ([_NNZ], dace.int32),
+            '_a_vals': ([_NNZ], dtype),
+            '_b': ([_N], dtype)
+        }, {'_c': ([_M], dtype)})
+        return node
+
+    def arguments(self, dtype, variant, sizes):
+        m, n, nnz = sizes
+        rows = np.sort(np.random.randint(0, m, nnz))
+        return dict(arr_a_rows=np.searchsorted(rows, np.arange(m + 1)).astype(np.int32),
+                    arr_a_cols=np.random.randint(0, n, nnz).astype(np.int32),
+                    arr_a_vals=_random([nnz], dtype),
+                    arr_b=_random([n], dtype),
+                    arr_c=_random([m], dtype),
+                    M=m,
+                    N=n,
+                    NNZ=nnz)
+
+
+#: Benchmarks of the supported library node types, by class name. ``MatMul`` nodes are not measured themselves, since
+#: they are specialized into ``Gemm``, ``Gemv`` and ``Dot`` nodes, whose implementations are then selected.
+BENCHMARKS: Dict[str, LibraryBenchmark] = {
+    'Gemm': GemmBenchmark(),
+    'Gemv': GemvBenchmark(),
+    'Dot': DotBenchmark(),
+    'Transpose': TransposeBenchmark(),
+    'Reduce': ReduceBenchmark(),
+    'CSRMV': CSRMVBenchmark(),
+}
+
+
+##################################################################################################################
+# Measurement and selection
+
+
+def host_implementations(node_type: Type[nodes.LibraryNode]) -> List[str]:
+    """
+    Returns the implementations of a library node type that run on the host, excluding GPU, FPGA and distributed
+    implementations, and implementations whose library environments report that they are not installed.
+    """
+    result = []
+    for name, expansion in node_type.implementations.items():
+        if re.search('FPGA|GPU|CUDA|PBLAS', name, re.IGNORECASE):
+            continue
+        environments = getattr(expansion, 'environments', [])
+        if any({'CUDA', 'HIP'} & set(getattr(env, 'cmake_packages', [])) for env in environments):
+            continue
+        if any(hasattr(env, 'is_installed') and not env.is_installed() for env in environments):
+            continue
+        result.append(name)
+    return result
+
+
+class LibraryImplementationTuner:
+    """
+    Measures the host implementations of library node types over a grid of problems and records their runtimes in
+    an implementation database. For every node type, implementation, data type and variant, one SDFG with symbolic
+    sizes is compiled and then run for all sizes of the grid.
+    """
+
+    def __init__(self,
+                 database: Optional[ImplementationDatabase] = None,
+                 data_types: Sequence[dtypes.typeclass] = (dace.float32, dace.float64),
+                 repetitions: int = 5) -> None:
+        """
+        :param database: The database to record runtimes in. If not given, uses the default database.
+        :param data_types: The data types to measure.
+        :param repetitions: Number of runs per problem, of which the median runtime is recorded.
+        """
+        self.database = database or ImplementationDatabase()
+        self.data_types = data_types
+        self.repetitions = repetitions
+
+    def tune(self,
+             node_types: Optional[Sequence[str]] = None,
+             grids: Optional[Dict[str, List[Tuple[str, Tuple[int, ...]]]]] = None,
+             implementations: Optional[Sequence[str]] = None,
+             save: bool = True) -> ImplementationDatabase:
+        """
+        Measures the implementations of the given library node types.
+
+        :param node_types: Names of the node types to measure (keys of ``BENCHMARKS``). If not given, measures all.
+        :param grids: Grids of (variant, sizes) per node type, replacing the default grid of the benchmark.
+        :param implementations: If given, only measures these implementations.
+        :param save: Whether to save the database after measuring.
+        :return: The implementation database.
+        """
+        for type_name in (node_types or BENCHMARKS.keys()):
+            benchmark = BENCHMARKS[type_name]
+            grid = (grids or {}).get(type_name, benchmark.grid)
+            variants = sorted(set(variant for variant, _ in grid))
+            candidates = [
+                impl for impl in host_implementations(benchmark.node_type)
+                if implementations is None or impl in implementations
+            ]
+            for dtype, variant, impl in itertools.product(self.data_types, variants, candidates):
+                name = re.sub('[^a-zA-Z0-9_]', '_', f'tune_{type_name}_{impl}_{dtype.to_string()}_{variant}')
+                sdfg = SDFG(name)
+                node = benchmark.build(sdfg, sdfg.add_state(), dtype, variant)
+                node.implementation = impl
+                try:
+                    csdfg = sdfg.compile()
+                except Exception as ex:
+                    warnings.warn(f'Could not compile implementation "{impl}" of {type_name}: {ex}')
+                    continue
+                for _, sizes in filter(lambda p: p[0] == variant, grid):
+                    arguments = benchmark.arguments(dtype, variant, sizes)
+                    call = lambda: csdfg.fast_call(**arguments)
+                    try:
+                        call()  # Warm-up
+                        runtime = np.median(timeit.repeat(call, number=1, repeat=self.repetitions))
+                    except Exception as ex:
+                        warnings.warn(f'Could not run implementation "{impl}" of {type_name} for {sizes}: {ex}')
+                        continue
+                    self.database.record(type_name, (dtype.to_string(), variant, tuple(sizes)), impl, float(runtime))
+        if save:
+            self.database.save()
+        return self.database
+
+
+def select_implementation(node: nodes.LibraryNode,
+                          state: SDFGState,
+                          sdfg: SDFG,
+                          candidates: Optional[Sequence[str]] = None,
+                          symbols: Optional[Dict[str, Any]] = None,
+                          device: dtypes.DeviceType = dtypes.DeviceType.CPU,
+                          database: Optional[ImplementationDatabase] = None) -> Optional[str]:
+    """
+    Returns the implementation of a library node that was measured fastest for the nearest problem in the
+    implementation database.
+
+    :param node: The library node.
+    :param state: The state containing the node.
+    :param sdfg: The SDFG containing the state.
+    :param candidates: If given, only considers these implementations.
+    :param symbols: Values of symbols that are not constants of the SDFG, used to evaluate the sizes of the node.
+    :param device: The target device.
+    :param database: The database to use. If not given, loads the default database.
+    :return: The name of the implementation, or None if the node type is not supported, the sizes of the node are not
+             known, or no matching problem was measured.
+    """
+    benchmark = BENCHMARKS.get(type(node).__name__, None)
+    if benchmark is None or not isinstance(node, benchmark.node_type):
+        return None
+    problem = benchmark.problem(node, state, sdfg, symbols)
+    if problem is None:
+        return None
+    database = database or ImplementationDatabase.load()
+    candidates = [c for c in (candidates or node.implementations) if c in node.implementations]
+    return database.fastest(type(node).__name__, problem, candidates, device)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Measures library node implementations on this machine.')
+    parser.add_argument('node_types',
+                        nargs='*',
+                        default=list(BENCHMARKS.keys()),
+                        help=f'Library node types to measure, out of {", ".join(BENCHMARKS.keys())}')
+    parser.add_argument('-d', '--database', default=None, help='Path of the implementation database')
+    parser.add_argument('-t', '--types', nargs='+', default=['float32', 'float64'], help='Data types to measure')
+    parser.add_argument('-r', '--repetitions', type=int, default=5)
+    args = parser.parse_args()
+
+    tuner = LibraryImplementationTuner(ImplementationDatabase(args.database), [getattr(dace, t) for t in args.types],
+                                       args.repetitions)
+    print('Wrote', tuner.tune(args.node_types).path)
@@ -81,4 +81,4 @@ class MapPermutationTuner(cutout_tuner.CutoutTuner):
         ]
         map_.map.params = config
 
-        return self.measure(cutout_, measurements)
+        return self.measure(cutout_, self._sdfg.get_instrumented_data(), measurements)
@@ -84,4 +84,4 @@ class MapTilingTuner(cutout_tuner.CutoutTuner):
         if config == "None":
             df.MapTiling.apply_to(cutout_, map_entry=map_, options={"tile_sizes": config})
 
-        return self.measure(cutout_, measurements)
+        return self.measure(cutout_, self._sdfg.get_instrumented_data(), measurements)
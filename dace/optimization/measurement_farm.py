@@ -0,0 +1,236 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+A parallel, crash-isolated executor for measuring cutout configurations during auto-tuning.
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import hashlib
+import math
+import multiprocessing as mp
+import os
+import queue
+import threading
+import traceback
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import dace
+from dace import config
+from dace.optimization import utils as optim_utils
+
+
+def _pin(cores: Optional[Sequence[int]]) -> None:
+    """ Pins the current process to the given cores, if supported by the operating system. """
+    if cores and hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, set(cores))
+
+
+def _compile_cutout(cutout_json: Dict, build_folder: str) -> str:
+    """ Compiles a cutout in a compilation worker. Returns the build folder of the compiled cutout. """
+    cutout = dace.SDFG.from_json(cutout_json)
+    # Compile with the same arguments as the measured cutout (see ``optim_utils._cutout_arguments``)
+    optim_utils._remove_unused_arrays(cutout)
+    cutout.build_folder = build_folder
+    with dace.config.set_temporary('debugprint', value=False):
+        with dace.config.set_temporary('instrumentation', 'report_each_invocation', value=False):
+            with dace.config.set_temporary('compiler', 'allow_view_arguments', value=True):
+                cutout.compile()
+    return build_folder
+
+
+def _measure_worker(conn, cores: Optional[Sequence[int]]) -> None:
+    """
+    Main loop of the measurement worker: receives compiled cutouts and returns their median runtime, until it receives
+    None.
+    """
+    _pin(cores)
+    while True:
+        request = conn.recv()
+        if request is None:
+            return
+        build_folder, dreport, repetitions = request
+        try:
+            csdfg = dace.sdfg.utils.load_precompiled_sdfg(build_folder)
+            cutout = csdfg.sdfg
+            cutout.build_folder = build_folder
+            arguments = optim_utils._cutout_arguments(cutout, dreport)
+            with dace.config.set_temporary('compiler', 'allow_view_arguments', value=True):
+                for _ in range(repetitions):
+                    csdfg(**arguments)
+                csdfg.finalize()
+            del csdfg
+            conn.send((optim_utils._median_runtime(cutout), None))
+        except Exception:
+            conn.send((math.inf, traceback.format_exc()))
+
+
+class MeasurementFarm:
+    """
+    Measures cutout configurations for auto-tuning (see ``CutoutTuner``). Cutouts are compiled concurrently on a pool
+    of warm worker processes, and measured one at a time in a separate, persistent measurement process that is pinned
+    to cores that are not used for compilation. A crash or timeout of a worker process only affects the configuration
+    that caused it: the process is restarted and the configuration is assigned an infinite runtime. Identical
+    cutout configurations (by SDFG hash) are compiled and measured once.
+
+    For example::
+
+        with MeasurementFarm(compile_workers=8) as farm:
+            results = MapTilingTuner(sdfg).optimize(farm=farm)
+    """
+
+    def __init__(self,
+                 folder: Optional[str] = None,
+                 compile_workers: Optional[int] = None,
+                 measure_cores: Optional[Sequence[int]] = None,
+                 timeout: float = 600.0) -> None:
+        """
+        Creates a measurement farm.
+
+        :param folder: The folder in which the cutouts are compiled (if not given, uses a ``tuning`` subfolder of the
+                       default build folder).
+        :param compile_workers: Number of concurrent compilation processes (if not given, uses the cores that are not
+                                used for measurement).
+        :param measure_cores: The cores to pin the measurement process to (if not given, uses the last available
+                              core). Compilation processes are pinned to the remaining cores.
+        :param timeout: Timeout (in seconds) for measuring a single configuration.
+        """
+        self.folder = os.path.abspath(folder or os.path.join(config.Config.get('default_build_folder'), 'tuning'))
+        self.timeout = timeout
+
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else list(range(os.cpu_count()))
+        if measure_cores is None:
+            measure_cores = cores[-1:]
+        self.measure_cores = list(measure_cores)
+        self.compile_cores = [c for c in cores if c not in self.measure_cores] or cores
+        self.compile_workers = compile_workers or len(self.compile_cores)
+
+        self._context = mp.get_context('spawn')
+        self._lock = threading.Lock()
+        self._futures: Dict[Tuple[Any, ...], Future] = {}
+        self._compile_pool: Optional[ProcessPoolExecutor] = None
+        self._measure_queue: queue.Queue = queue.Queue()
+        self._measure_process = None
+        self._measure_conn = None
+        self._measure_thread = threading.Thread(target=self._measure_loop, daemon=True)
+        self._measure_thread.start()
+
+    def __enter__(self) -> 'MeasurementFarm':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def submit(self, cutout: dace.SDFG, dreport: Dict[str, Any], repetitions: int = 30) -> 'Future[float]':
+        """
+        Schedules a cutout for compilation and measurement.
+
+        :param cutout: The cutout to measure.
+        :param dreport: A dictionary mapping non-transient data of the cutout to their contents.
+        :param repetitions: Number of times to run the cutout.
+        :return: A future that resolves to the median runtime of the cutout, or infinity if compilation or
+                 measurement failed.
+        """
+        cutout_json = cutout.to_json()
+        digest = cutout.hash_sdfg(cutout_json)
+        key = (digest, repetitions, tuple(sorted(dreport.keys())),
+               tuple(state.instrument.name for state in cutout.nodes()))
+        with self._lock:
+            if key in self._futures:
+                return self._futures[key]
+            result = Future()
+            self._futures[key] = result
+
+        build_folder = os.path.join(self.folder, hashlib.sha256(repr(key).encode('utf-8')).hexdigest()[:32])
+        self._compile(cutout_json, build_folder, dreport, repetitions, result, retry=True)
+        return result
+
+    def _compile(self, cutout_json: Dict, build_folder: str, dreport: Dict[str, Any], repetitions: int, result: Future,
+                 retry: bool) -> None:
+        with self._lock:
+            if self._compile_pool is None:
+                self._compile_pool = ProcessPoolExecutor(max_workers=self.compile_workers,
+                                                         mp_context=self._context,
+                                                         initializer=_pin,
+                                                         initargs=(self.compile_cores, ))
+            pool = self._compile_pool
+
+        def compiled(future: Future):
+            try:
+                self._measure_queue.put((future.result(), dreport, repetitions, result))
+            except BrokenProcessPool:
+                # A worker crashed, which breaks every pending compilation: restart the pool and retry once
+                with self._lock:
+                    if self._compile_pool is pool:
+                        self._compile_pool = None
+                        pool.shutdown(wait=False)
+                if retry:
+                    self._compile(cutout_json, build_folder, dreport, repetitions, result, retry=False)
+                else:
+                    result.set_result(math.inf)
+            except Exception as ex:
+                print('Error occured during compilation:', ex)
+                result.set_result(math.inf)
+
+        try:
+            pool.submit(_compile_cutout, cutout_json, build_folder).add_done_callback(compiled)
+        except (BrokenProcessPool, RuntimeError):
+            if not retry:
+                result.set_result(math.inf)
+                return
+            with self._lock:
+                if self._compile_pool is pool:
+                    self._compile_pool = None
+            self._compile(cutout_json, build_folder, dreport, repetitions, result, retry=False)
+
+    def _start_measure_process(self) -> None:
+        self._measure_conn, child_conn = self._context.Pipe()
+        self._measure_process = self._context.Process(target=_measure_worker,
+                                                      args=(child_conn, self.measure_cores),
+                                                      daemon=True)
+        self._measure_process.start()
+
+    def _stop_measure_process(self) -> None:
+        if self._measure_process is not None:
+            self._measure_process.kill()
+            self._measure_process.join()
+            self._measure_process = None
+
+    def _measure_loop(self) -> None:
+        """ Measures compiled cutouts serially, restarting the measurement process if it crashes or times out. """
+        while True:
+            request = self._measure_queue.get()
+            if request is None:
+                break
+            build_folder, dreport, repetitions, result = request
+            if self._measure_process is None or not self._measure_process.is_alive():
+                self._start_measure_process()
+            try:
+                self._measure_conn.send((build_folder, dreport, repetitions))
+                if not self._measure_conn.poll(self.timeout):
+                    raise TimeoutError(f'Measurement timed out after {self.timeout} seconds')
+                runtime, error = self._measure_conn.recv()
+                if error is not None:
+                    print('Error occured during measuring:', error)
+            except (EOFError, OSError, TimeoutError) as ex:
+                print('Error occured during measuring:', ex)
+                self._stop_measure_process()
+                runtime = math.inf
+            result.set_result(runtime)
+
+        if self._measure_process is not None:
+            try:
+                self._measure_conn.send(None)
+                self._measure_process.join(self.timeout)
+            except OSError:
+                pass
+            self._stop_measure_process()
+
+    def shutdown(self) -> None:
+        """ Waits for all scheduled configurations to be measured and stops the worker processes. """
+        for future in list(self._futures.values()):
+            future.result()
+        with self._lock:
+            if self._compile_pool is not None:
+                self._compile_pool.shutdown()
+                self._compile_pool = None
+        self._measure_queue.put(None)
+        self._measure_thread.join()
@@ -0,0 +1,277 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Search strategies for cutout tuning, which decide which configurations of a search space are measured, and with how
+many repetitions.
+"""
+import math
+import random
+import re
+from typing import Callable, Dict, List, Optional, Set
+
+import numpy as np
+
+#: Measures a batch of configurations (given by their keys) with the given number of repetitions, and returns their
+#: runtimes. Configurations in a batch may be compiled and measured concurrently. Only measurements with the full
+#: number of repetitions are recorded as tuning results.
+MeasureFunction = Callable[[List[str], int], Dict[str, float]]
+
+
+class SearchStrategy:
+    """
+    General API for search strategies of ``CutoutTuner.search``. A strategy selects configurations to measure from
+    the search space of a cutout, given the measurements that are already known (e.g., from an interrupted run).
+    """
+
+    def search(self,
+               keys: List[str],
+               measure: MeasureFunction,
+               measurements: int,
+               known: Dict[str, float],
+               eliminated: Optional[Set[str]] = None) -> None:
+        """
+        Searches the space of configurations of a cutout.
+
+        :param keys: The keys of all configurations in the search space.
+        :param measure: A function that measures a batch of configurations and records their runtimes.
+        :param measurements: The number of repetitions of a full measurement.
+        :param known: Runtimes of configurations that were measured before the search.
+        :param eliminated: If given, the keys of configurations that the strategy eliminates without a full
+                           measurement are added to this set.
+        """
+        raise NotImplementedError
+
+
+class ExhaustiveSearch(SearchStrategy):
+    """ Measures every configuration in the search space. """
+
+    def search(self,
+               keys: List[str],
+               measure: MeasureFunction,
+               measurements: int,
+               known: Dict[str, float],
+               eliminated: Optional[Set[str]] = None) -> None:
+        measure([k for k in keys if k not in known], measurements)
+
+
+class RandomSearch(SearchStrategy):
+    """
+    Measures configurations in a random order, until a budget of measured configurations is exhausted or the best
+    runtime has not improved for a number of consecutive configurations (early stopping).
+    """
+
+    def __init__(self,
+                 budget: Optional[int] = None,
+                 patience: Optional[int] = None,
+                 batch_size: int = 1,
+                 seed: Optional[int] = None) -> None:
+        """
+        Creates a random search strategy.
+
+        :param budget: The maximal number of configurations to measure (if None, measures every configuration).
+        :param patience: Stops after this number of consecutive configurations did not improve the best runtime (if
+                         None, never stops early).
+        :param batch_size: Number of configurations that are measured together (e.g., concurrently in a measurement
+                           farm).
+        :param seed: Random seed.
+        """
+        self.budget = budget
+        self.patience = patience
+        self.batch_size = batch_size
+        self.seed = seed
+
+    def search(self,
+               keys: List[str],
+               measure: MeasureFunction,
+               measurements: int,
+               known: Dict[str, float],
+               eliminated: Optional[Set[str]] = None) -> None:
+        order = [k for k in keys if k not in known]
+        random.Random(self.seed).shuffle(order)
+        if self.budget is not None:
+            order = order[:self.budget]
+
+        best = min(known.values(), default=math.inf)
+        without_improvement = 0
+        for i in range(0, len(order), self.batch_size):
+            batch = order[i:i + self.batch_size]
+            runtimes = measure(batch, measurements)
+            for k in batch:
+                if runtimes[k] < best:
+                    best = runtimes[k]
+                    without_improvement = 0
+                else:
+                    without_improvement += 1
+            if self.patience is not None and without_improvement >= self.patience:
+                break
+
+
+class SuccessiveHalving(SearchStrategy):
+    """
+    Successive halving on the number of repetitions: all configurations are first measured with few repetitions,
+    then only the best fraction of them is measured again with more repetitions, until the remaining configurations
+    are measured with the full number of repetitions. Only the configurations of the last round are part of the
+    tuning results, as the shorter measurements of eliminated configurations are not comparable to full ones.
+    Eliminated configurations are reported through the ``eliminated`` set instead.
+    """
+
+    def __init__(self,
+                 min_measurements: int = 1,
+                 eta: int = 2,
+                 budget: Optional[int] = None,
+                 seed: Optional[int] = None) -> None:
+        """
+        Creates a successive halving strategy.
+
+        :param min_measurements: The minimal number of repetitions of a measurement.
+        :param eta: The factor by which the number of configurations is reduced (and the number of repetitions is
+                    increased) in every round.
+        :param budget: The maximal number of configurations to measure in the first round, which are sampled randomly
+                       (if None, measures every configuration).
+        :param seed: Random seed for sampling configurations.
+        """
+        if eta < 2:
+            raise ValueError('Successive halving requires a reduction factor of at least 2')
+        self.min_measurements = min_measurements
+        self.eta = eta
+        self.budget = budget
+        self.seed = seed
+
+    def search(self,
+               keys: List[str],
+               measure: MeasureFunction,
+               measurements: int,
+               known: Dict[str, float],
+               eliminated: Optional[Set[str]] = None) -> None:
+        candidates = [k for k in keys if k not in known]
+        if self.budget is not None and len(candidates) > self.budget:
+            candidates = random.Random(self.seed).sample(candidates, self.budget)
+        if not candidates:
+            return
+
+        rounds = int(math.log(len(candidates), self.eta)) if len(candidates) > 1 else 0
+        repetitions = max(self.min_measurements, measurements // (self.eta**rounds))
+        while True:
+            if len(candidates) == 1:
+                repetitions = measurements
+            repetitions = min(repetitions, measurements)
+            runtimes = measure(candidates, repetitions)
+            if repetitions >= measurements:
+                break
+            ranked = sorted(candidates, key=runtimes.get)
+            candidates = ranked[:max(1, math.ceil(len(candidates) / self.eta))]
+            if eliminated is not None:
+                eliminated.update(ranked[len(candidates):])
+            repetitions *= self.eta
+
+
+def key_features(keys: List[str]) -> np.ndarray:
+    """
+    Encodes configuration keys as feature vectors for a surrogate cost model. Keys are split into tokens, which are
+    aligned by position: numeric tokens are encoded by their logarithm, and other tokens (e.g., map parameters) are
+    one-hot encoded.
+
+    :param keys: The configuration keys.
+    :return: A (standardized) feature matrix with one row per key.
+    """
+    tokenized = [re.findall(r'[A-Za-z_]\w*|\d+', key) for key in keys]
+    length = max((len(t) for t in tokenized), default=0)
+    columns = []
+    for i in range(length):
+        tokens = [t[i] if i < len(t) else None for t in tokenized]
+        columns.append([0.0 if t is None else 1.0 for t in tokens])
+        numeric = [t for t in tokens if t is not None and t.isdigit()]
+        if numeric:
+            columns.append([math.log2(int(t) + 1) if t is not None and t.isdigit() else 0.0 for t in tokens])
+        for value in sorted(set(t for t in tokens if t is not None and not t.isdigit())):
+            columns.append([1.0 if t == value else 0.0 for t in tokens])
+
+    features = np.array(columns, dtype=np.float64).T.reshape(len(keys), len(columns))
+    std = features.std(axis=0)
+    std[std == 0] = 1
+    return (features - features.mean(axis=0)) / std
+
+
+class ModelGuidedSearch(SearchStrategy):
+    """
+    Searches configurations guided by a surrogate cost model, which is trained on the measurements collected so far.
+    After an initial random sample, the configurations with the lowest predicted runtime are measured next, until a
+    budget of measured configurations is exhausted. The surrogate model is a distance-weighted k-nearest-neighbor
+    regression of the logarithmic runtime over configuration features (see ``key_features``).
+    """
+
+    def __init__(self,
+                 budget: int = 32,
+                 initial_samples: int = 8,
+                 batch_size: int = 1,
+                 neighbors: int = 3,
+                 exploration: float = 0.1,
+                 seed: Optional[int] = None) -> None:
+        """
+        Creates a model-guided search strategy.
+
+        :param budget: The maximal number of configurations to measure.
+        :param initial_samples: Number of randomly sampled configurations before the model is used.
+        :param batch_size: Number of configurations that are measured together (e.g., concurrently in a measurement
+                           farm).
+        :param neighbors: Number of nearest measured configurations used to predict a runtime.
+        :param exploration: Probability of measuring a random configuration instead of the predicted best one.
+        :param seed: Random seed.
+        """
+        self.budget = budget
+        self.initial_samples = initial_samples
+        self.batch_size = batch_size
+        self.neighbors = neighbors
+        self.exploration = exploration
+        self.seed = seed
+
+    def predict(self, features: np.ndarray, observed: List[int], runtimes: np.ndarray,
+                candidates: List[int]) -> np.ndarray:
+        """
+        Predicts the logarithmic runtime of candidate configurations.
+
+        :param features: The feature matrix of all configurations.
+        :param observed: Indices of the measured configurations.
+        :param runtimes: Logarithmic runtimes of the measured configurations.
+        :param candidates: Indices of the configurations to predict.
+        :return: The predicted logarithmic runtimes of the candidates.
+        """
+        distances = np.linalg.norm(features[candidates][:, None, :] - features[observed][None, :, :], axis=2)
+        k = min(self.neighbors, len(observed))
+        nearest = np.argsort(distances, axis=1)[:, :k]
+        weights = 1 / (np.take_along_axis(distances, nearest, axis=1) + 1e-6)
+        return (weights * runtimes[nearest]).sum(axis=1) / weights.sum(axis=1)
+
+    def search(self,
+               keys: List[str],
+               measure: MeasureFunction,
+               measurements: int,
+               known: Dict[str, float],
+               eliminated: Optional[Set[str]] = None) -> None:
+        rng = random.Random(self.seed)
+        features = key_features(keys)
+        index = {k: i for i, k in enumerate(keys)}
+        observed: Dict[int, float] = {index[k]: v for k, v in known.items() if k in index}
+        unmeasured = [i for i in range(len(keys)) if i not in observed]
+
+        remaining = self.budget
+        while remaining > 0 and unmeasured:
+            size = min(self.batch_size, remaining, len(unmeasured))
+            if len(observed) < self.initial_samples:
+                batch = rng.sample(unmeasured, min(size, self.initial_samples - len(observed)))
+            else:
+                finite = [v for v in observed.values() if math.isfinite(v) and v > 0]
+                # Failed configurations are penalized with a runtime worse than every successful one
+                penalty = 10 * max(finite) if finite else 1.0
+                runtimes = np.log(np.array([v if math.isfinite(v) and v > 0 else penalty for v in observed.values()]))
+                predicted = self.predict(features, list(observed.keys()), runtimes, unmeasured)
+                ranked = [unmeasured[i] for i in np.argsort(predicted, kind='stable')]
+                batch = []
+                for _ in range(size):
+                    choices = [i for i in ranked if i not in batch]
+                    batch.append(rng.choice(choices) if rng.random() < self.exploration else choices[0])
+
+            result = measure([keys[i] for i in batch], measurements)
+            for i in batch:
+                observed[i] = result[keys[i]]
+                unmeasured.remove(i)
+            remaining -= len(batch)
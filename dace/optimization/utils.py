@@ -113,7 +113,26 @@ def subprocess_measure(cutout: dace.SDFG, dreport, repetitions: int = 30, timeou
 
 def _subprocess_measure(cutout_json: Dict, dreport, repetitions: int, q: mp.Queue) -> float:
     cutout = dace.SDFG.from_json(cutout_json)
-    
+    arguments = _cutout_arguments(cutout, dreport)
+
+    with dace.config.set_temporary('debugprint', value=False):
+        with dace.config.set_temporary('instrumentation', 'report_each_invocation', value=False):
+            with dace.config.set_temporary('compiler', 'allow_view_arguments', value=True):
+                cutout.build_folder = "/dev/shm"
+                csdfg = cutout.compile()
+                for _ in range(repetitions):
+                    csdfg(**arguments)
+
+                csdfg.finalize()
+
+    q.put(_median_runtime(cutout))
+
+
+def _cutout_arguments(cutout: dace.SDFG, dreport) -> Dict:
+    """
+    Creates the arguments of a cutout from the given data and removes non-transient arrays without data from the
+    cutout.
+    """
     arguments = {}
     # TODO: Store symbolic arguments in file
     for symbol in cutout.free_symbols:
@@ -131,28 +150,24 @@ def _subprocess_measure(cutout_json: Dict, dreport, repetitions: int, q: mp.Queu
             except KeyError:
                 arguments[dnode.data] = dace.data.make_array_from_descriptor(array)
 
+    _remove_unused_arrays(cutout)
+    return arguments
 
-    for name, array in list(cutout.arrays.items()):
-        if array.transient:
-            continue
 
-        if not name in arguments:
+def _remove_unused_arrays(cutout: dace.SDFG) -> None:
+    """ Removes the non-transient arrays that are not accessed in a cutout, which are not arguments of the cutout. """
+    used = set(dnode.data for state in cutout.nodes() for dnode in state.data_nodes())
+    for name, array in list(cutout.arrays.items()):
+        if not array.transient and name not in used:
             del cutout.arrays[name]
 
 
-    with dace.config.set_temporary('debugprint', value=False):
-        with dace.config.set_temporary('instrumentation', 'report_each_invocation', value=False):
-            with dace.config.set_temporary('compiler', 'allow_view_arguments', value=True):
-                cutout.build_folder = "/dev/shm"
-                csdfg = cutout.compile()
-                for _ in range(repetitions):
-                    csdfg(**arguments)
-
-                csdfg.finalize()
-
+def _median_runtime(cutout: dace.SDFG) -> float:
+    """ Returns the median runtime in the latest instrumentation report of a cutout. """
     report = cutout.get_latest_report()
     durations = next(iter(next(iter(next(iter(report.durations.values())).values())).values()))
-    q.put(np.median(np.array(durations)))
+    return np.median(np.array(durations))
+
 
 class MeasureProcess(mp.Process):
     def __init__(self, *args, **kwargs):
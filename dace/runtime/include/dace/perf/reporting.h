@@ -2,12 +2,17 @@
 #ifndef __DACE_PERF_REPORTING_H
 #define __DACE_PERF_REPORTING_H
 
+#include <algorithm>
+#include <atomic>
 #include <chrono>
+#include <climits>
 #include <cstring>
 #include <fstream>
 #include <map>
+#include <memory>
 #include <mutex>
 #include <sstream>
+#include <string>
 #include <thread>
 #include <vector>
 
@@ -22,6 +27,8 @@
 #define DACE_REPORT_BUFFER_SIZE     2048
 #define DACE_REPORT_EVENT_NAME_LEN  64
 #define DACE_REPORT_EVENT_CAT_LEN   10
+#define DACE_REPORT_MAX_SAMPLED_THREADS 256
+#define DACE_REPORT_HISTOGRAM_BUCKETS   64
 
 namespace dace {
 namespace perf {
@@ -44,6 +51,283 @@ namespace perf {
         } counter;
     };
 
+    class Report;
+
+    /**
+     * Returns a process-wide index of the calling thread, assigned in order
+     * of first use.
+     */
+    inline int sampled_thread_index() {
+        static std::atomic<int> next_index(0);
+        // Constant-initialized to avoid a thread-local initialization guard on every access
+        static thread_local int index = -1;
+        if (index < 0)
+            index = next_index.fetch_add(1, std::memory_order_relaxed);
+        return index;
+    }
+
+    /**
+     * Histogram of durations (in nanoseconds) with logarithmic buckets.
+     * Bucket 0 counts zero durations, and bucket i > 0 counts durations in
+     * [2^(i-1), 2^i).
+     */
+    struct DurationHistogram {
+        unsigned long long count;
+        unsigned long long sum;
+        unsigned long long min;
+        unsigned long long max;
+        unsigned long long buckets[DACE_REPORT_HISTOGRAM_BUCKETS];
+
+        DurationHistogram() {
+            reset();
+        }
+
+        void reset() {
+            count = 0;
+            sum = 0;
+            min = ULLONG_MAX;
+            max = 0;
+            std::fill(buckets, buckets + DACE_REPORT_HISTOGRAM_BUCKETS, 0ULL);
+        }
+
+        inline void add(unsigned long long duration) {
+#if defined(__GNUC__) || defined(__clang__)
+            int bucket = (duration == 0) ? 0 : (64 - __builtin_clzll(duration));
+#else
+            int bucket = 0;
+            for (unsigned long long d = duration; d != 0; d >>= 1)
+                ++bucket;
+#endif
+            if (bucket >= DACE_REPORT_HISTOGRAM_BUCKETS)
+                bucket = DACE_REPORT_HISTOGRAM_BUCKETS - 1;
+            ++buckets[bucket];
+            ++count;
+            sum += duration;
+            min = std::min(min, duration);
+            max = std::max(max, duration);
+        }
+
+        void merge(const DurationHistogram& other) {
+            count += other.count;
+            sum += other.sum;
+            min = std::min(min, other.min);
+            max = std::max(max, other.max);
+            for (int i = 0; i < DACE_REPORT_HISTOGRAM_BUCKETS; ++i)
+                buckets[i] += other.buckets[i];
+        }
+    };
+
+    /**
+     * Per-thread state of a sampled timer. Written only by its thread.
+     */
+    struct SampledTimerSlot {
+        size_t tid;
+        unsigned long long invocations;
+        unsigned long long countdown;
+        unsigned long long next_sample;
+        std::atomic<unsigned long long> written;
+        DurationHistogram histogram;
+        // Ring buffer of the most recent samples (start time and duration,
+        // in nanoseconds)
+        std::unique_ptr<unsigned long long[]> buffer;
+
+        SampledTimerSlot(size_t capacity) : tid(std::hash<std::thread::id>{}(std::this_thread::get_id())),
+                                            written(0), buffer(new unsigned long long[2 * capacity]) {
+            reset();
+        }
+
+        void reset() {
+            invocations = 0;
+            countdown = 1;
+            next_sample = 0;
+            written.store(0, std::memory_order_relaxed);
+            histogram.reset();
+        }
+    };
+
+    /**
+     * Low-overhead timer of one instrumented element, which measures only
+     * every N-th invocation (or at most one invocation per time period) of
+     * every thread. Samples are stored in a fixed-size ring buffer per
+     * thread, and aggregated into a duration histogram on the fly. Threads
+     * do not synchronize with each other when timing. Threads beyond the
+     * first DACE_REPORT_MAX_SAMPLED_THREADS of the process are not timed.
+     */
+    class SampledTimer {
+    protected:
+        std::string _name;
+        int _sdfg_id, _state_id, _el_id;
+        unsigned long long _interval;
+        unsigned long long _period;
+        size_t _capacity;
+        std::atomic<SampledTimerSlot *> _slots[DACE_REPORT_MAX_SAMPLED_THREADS];
+
+        inline SampledTimerSlot *slot() {
+            int index = sampled_thread_index();
+            if (index >= DACE_REPORT_MAX_SAMPLED_THREADS)
+                return nullptr;
+            SampledTimerSlot *result = _slots[index].load(std::memory_order_acquire);
+            if (result == nullptr) {
+                result = new SampledTimerSlot(_capacity);
+                _slots[index].store(result, std::memory_order_release);
+            }
+            return result;
+        }
+
+        static inline unsigned long long now() {
+            return std::chrono::duration_cast<std::chrono::nanoseconds>(
+                std::chrono::high_resolution_clock::now().time_since_epoch()
+            ).count();
+        }
+
+    public:
+        /**
+         * Creates a sampled timer and registers it with a report.
+         * @param report:    The report to save the samples to.
+         * @param name:      Name of the timed element.
+         * @param sdfg_id:   SDFG ID of the timed element.
+         * @param state_id:  State ID of the timed element.
+         * @param el_id:     ID of the timed element.
+         * @param interval:  Time every N-th invocation of each thread.
+         * @param period_us: If nonzero, time the first invocation after
+         *                   every period (in microseconds) instead.
+         * @param capacity:  Number of samples kept per thread.
+         */
+        SampledTimer(Report& report, const char *name, int sdfg_id, int state_id, int el_id,
+                     unsigned long long interval, unsigned long long period_us, size_t capacity);
+
+        SampledTimer(const SampledTimer&) = delete;
+        SampledTimer& operator=(const SampledTimer&) = delete;
+
+        ~SampledTimer() {
+            for (int i = 0; i < DACE_REPORT_MAX_SAMPLED_THREADS; ++i)
+                delete _slots[i].load(std::memory_order_acquire);
+        }
+
+        /**
+         * Begins a timed region.
+         * @return The start timestamp if this invocation is sampled, or 0.
+         */
+        inline unsigned long long begin() {
+            SampledTimerSlot *s = slot();
+            if (s == nullptr)
+                return 0;
+            ++s->invocations;
+            if (_period == 0) {
+                if (--s->countdown != 0)
+                    return 0;
+                s->countdown = _interval;
+                return now();
+            }
+            unsigned long long tstart = now();
+            if (tstart < s->next_sample)
+                return 0;
+            s->next_sample = tstart + _period;
+            return tstart;
+        }
+
+        /**
+         * Ends a timed region.
+         * @param tstart: The value returned from the corresponding begin().
+         */
+        inline void end(unsigned long long tstart) {
+            if (tstart == 0)
+                return;
+            unsigned long long duration = now() - tstart;
+            SampledTimerSlot *s = slot();
+            s->histogram.add(duration);
+            unsigned long long n = s->written.load(std::memory_order_relaxed);
+            size_t pos = 2 * (n % _capacity);
+            s->buffer[pos] = tstart;
+            s->buffer[pos + 1] = duration;
+            s->written.store(n + 1, std::memory_order_release);
+        }
+
+        /**
+         * Clears all samples. Must not be called while the element runs.
+         */
+        void reset() {
+            for (int i = 0; i < DACE_REPORT_MAX_SAMPLED_THREADS; ++i) {
+                SampledTimerSlot *s = _slots[i].load(std::memory_order_acquire);
+                if (s != nullptr)
+                    s->reset();
+            }
+        }
+
+        void save_args(std::ostream& ofs) const {
+            ofs << "\"args\": {";
+            ofs << "\"sdfg_id\": " << _sdfg_id;
+            if (_state_id > -1)
+                ofs << ", \"state_id\": " << _state_id;
+            if (_el_id > -1)
+                ofs << ", \"id\": " << _el_id;
+            ofs << "}";
+        }
+
+        /**
+         * Writes the samples in the ring buffers as completion events.
+         */
+        void save_events(std::ostream& ofs, int pid, bool& first) const {
+            for (int i = 0; i < DACE_REPORT_MAX_SAMPLED_THREADS; ++i) {
+                const SampledTimerSlot *s = _slots[i].load(std::memory_order_acquire);
+                if (s == nullptr)
+                    continue;
+                unsigned long long written = s->written.load(std::memory_order_acquire);
+                unsigned long long begin = (written > _capacity) ? (written - _capacity) : 0;
+                for (unsigned long long n = begin; n < written; ++n) {
+                    size_t pos = 2 * (n % _capacity);
+                    if (first)
+                        first = false;
+                    else
+                        ofs << "," << std::endl;
+                    ofs << "    {";
+                    ofs << "\"name\": \"" << _name << "\", ";
+                    ofs << "\"cat\": \"Timer\", ";
+                    ofs << "\"ph\": \"X\", ";
+                    ofs << "\"ts\": " << s->buffer[pos] / 1000 << ", ";
+                    ofs << "\"dur\": " << s->buffer[pos + 1] / 1000.0 << ", ";
+                    ofs << "\"pid\": " << pid << ", ";
+                    ofs << "\"tid\": " << s->tid << ", ";
+                    save_args(ofs);
+                    ofs << "}";
+                }
+            }
+        }
+
+        /**
+         * Writes the histogram of all samples (over all threads).
+         */
+        void save_histogram(std::ostream& ofs) const {
+            DurationHistogram histogram;
+            unsigned long long invocations = 0;
+            for (int i = 0; i < DACE_REPORT_MAX_SAMPLED_THREADS; ++i) {
+                const SampledTimerSlot *s = _slots[i].load(std::memory_order_acquire);
+                if (s == nullptr)
+                    continue;
+                invocations += s->invocations;
+                histogram.merge(s->histogram);
+            }
+            int nbuckets = DACE_REPORT_HISTOGRAM_BUCKETS;
+            while (nbuckets > 0 && histogram.buckets[nbuckets - 1] == 0)
+                --nbuckets;
+
+            ofs << "    {";
+            ofs << "\"name\": \"" << _name << "\", ";
+            ofs << "\"cat\": \"Timer\", ";
+            ofs << "\"invocations\": " << invocations << ", ";
+            ofs << "\"count\": " << histogram.count << ", ";
+            ofs << "\"sum\": " << histogram.sum << ", ";
+            ofs << "\"min\": " << (histogram.count > 0 ? histogram.min : 0) << ", ";
+            ofs << "\"max\": " << histogram.max << ", ";
+            ofs << "\"buckets\": [";
+            for (int i = 0; i < nbuckets; ++i)
+                ofs << (i > 0 ? ", " : "") << histogram.buckets[i];
+            ofs << "], ";
+            save_args(ofs);
+            ofs << "}";
+        }
+    };
+
     /**
      * Simple instrumentation report class that can save to JSON.
      */
@@ -51,6 +335,7 @@ namespace perf {
     protected:
         std::mutex _mutex;
         std::vector<TraceEvent> _events;
+        std::vector<SampledTimer *> _sampled_timers;
     public:
         ~Report() {}
 
@@ -61,6 +346,17 @@ namespace perf {
             std::lock_guard<std::mutex> guard (this->_mutex);
             this->_events.clear();
             this->_events.reserve(DACE_REPORT_BUFFER_SIZE);
+            for (SampledTimer *timer : this->_sampled_timers)
+                timer->reset();
+        }
+
+        /**
+         * Registers a sampled timer, whose samples and histogram are saved
+         * with the report.
+         */
+        void add_sampled_timer(SampledTimer *timer) {
+            std::lock_guard<std::mutex> guard (this->_mutex);
+            this->_sampled_timers.push_back(timer);
         }
 
         void add_counter(
@@ -223,8 +519,21 @@ namespace perf {
                     ofs << "}}";
                 }
 
+                for (const SampledTimer *timer : this->_sampled_timers)
+                    timer->save_events(ofs, pid, first);
+
                 ofs << std::endl << "  ]," << std::endl;
 
+                if (!this->_sampled_timers.empty()) {
+                    ofs << "  \"histograms\": [" << std::endl;
+                    for (size_t i = 0; i < this->_sampled_timers.size(); ++i) {
+                        if (i > 0)
+                            ofs << "," << std::endl;
+                        this->_sampled_timers[i]->save_histogram(ofs);
+                    }
+                    ofs << std::endl << "  ]," << std::endl;
+                }
+
                 ofs << "  \"sdfgHash\": \"";
                 ofs << hash;
                 ofs << "\"" << std::endl;
@@ -234,6 +543,16 @@ namespace perf {
         }
     };
 
+    inline SampledTimer::SampledTimer(Report& report, const char *name, int sdfg_id, int state_id, int el_id,
+                                      unsigned long long interval, unsigned long long period_us, size_t capacity)
+        : _name(name), _sdfg_id(sdfg_id), _state_id(state_id), _el_id(el_id),
+          _interval(interval > 0 ? interval : 1), _period(period_us * 1000),
+          _capacity(capacity > 0 ? capacity : 1) {
+        for (int i = 0; i < DACE_REPORT_MAX_SAMPLED_THREADS; ++i)
+            _slots[i].store(nullptr, std::memory_order_relaxed);
+        report.add_sampled_timer(this);
+    }
+
     extern Report report;
 
 }  // namespace perf
@@ -242,5 +561,7 @@ namespace perf {
 #undef DACE_REPORT_BUFFER_SIZE
 #undef DACE_REPORT_EVENT_NAME_LEN
 #undef DACE_REPORT_EVENT_CAT_LEN
+#undef DACE_REPORT_MAX_SAMPLED_THREADS
+#undef DACE_REPORT_HISTOGRAM_BUCKETS
 
 #endif  // __DACE_PERF_REPORTING_H
@@ -2,12 +2,21 @@
 #ifndef __DACE_SERIALIZATION_H
 #define __DACE_SERIALIZATION_H
 
+#include <algorithm>
 #include <chrono>
+#include <cstdio>
 #include <cstdlib>
+#include <cstring>
 #include <fstream>
 #include <map>
 #include <mutex>
 #include <sstream>
+#include <string>
+#include <vector>
+
+#ifdef DACE_SERIALIZATION_ZLIB
+#include <zlib.h>
+#endif
 
 #if defined(_WIN32) || defined(_WIN64)
 #include <windows.h>
@@ -51,6 +60,26 @@ static inline void write_parameter_pack(std::ofstream& ofs, T value, Args... val
     write_parameter_pack(ofs, values...);
 }
 
+/**
+ * An entry in the index of a chunked data report.
+ */
+struct DataChunk {
+    uint64_t offset;
+    uint64_t size;
+    uint64_t stored_size;
+    bool compressed;
+};
+
+/**
+ * Saves and restores data containers and symbols of an SDFG.
+ *
+ * Two formats are supported: one file per version of every data container
+ * (see InstrumentedDataReport), and a chunked format, in which all versions
+ * are appended to a single data file ("data.bin"), and an index of the
+ * chunks is appended to "index.jsonl", one JSON object per line. Chunks can
+ * optionally be compressed with zlib (if DACE_SERIALIZATION_ZLIB is
+ * defined). When restoring, the format is detected from the report folder.
+ */
 class DataSerializer {
 protected:
     std::mutex _mutex;
@@ -58,8 +87,180 @@ protected:
     std::map<std::string, int> version;
     bool enable;
 
+    // Chunked format
+    bool chunked;
+    int compression;
+    std::FILE *data_file;
+    std::FILE *index_file;
+    uint64_t offset;
+    bool index_loaded;
+    std::map<std::string, DataChunk> index;
+
+    static std::string chunk_key(const std::string& name, const std::string& uuid, int version) {
+        std::stringstream ss;
+        ss << name << "/" << uuid << "_" << version;
+        return ss.str();
+    }
+
+    int next_version(const std::string& key) {
+        int version;
+        if (this->version.find(key) == this->version.end())
+            version = 0;
+        else
+            version = this->version[key] + 1;
+        this->version[key] = version;
+        return version;
+    }
+
+    bool open_chunk_store() {
+        if (this->data_file != nullptr)
+            return true;
+        std::string data_path = this->folder + "/data.bin", index_path = this->folder + "/index.jsonl";
+        this->data_file = std::fopen(data_path.c_str(), "ab");
+        this->index_file = std::fopen(index_path.c_str(), "a");
+        if (this->data_file == nullptr || this->index_file == nullptr) {
+            printf("WARNING: Could not open '%s' for data instrumentation. Skipping saves.\n", data_path.c_str());
+            this->enable = false;
+            return false;
+        }
+        std::fseek(this->data_file, 0, SEEK_END);
+        this->offset = (uint64_t)std::ftell(this->data_file);
+        return true;
+    }
+
+    void close_chunk_store() {
+        if (this->data_file != nullptr)
+            std::fclose(this->data_file);
+        if (this->index_file != nullptr)
+            std::fclose(this->index_file);
+        this->data_file = nullptr;
+        this->index_file = nullptr;
+    }
+
+    /**
+     * Appends a chunk to the data file, and its entry to the index. The
+     * index entry is written after the data, so that every indexed chunk
+     * is complete.
+     */
+    void append_chunk(const std::string& name, const std::string& uuid, int version, const char *kind,
+                      const char *bytes, size_t size, const uint32_t *shape_strides, uint32_t ndims) {
+        if (!open_chunk_store())
+            return;
+
+        // Align chunks to 64 bytes
+        static const char padding[64] = {0};
+        uint64_t padsize = (64 - (this->offset % 64)) % 64;
+        if (padsize > 0) {
+            std::fwrite(padding, 1, padsize, this->data_file);
+            this->offset += padsize;
+        }
+
+        const char *stored = bytes;
+        size_t stored_size = size;
+#ifdef DACE_SERIALIZATION_ZLIB
+        std::vector<Bytef> compressed;
+        if (this->compression > 0 && size > 0) {
+            uLongf compressed_size = compressBound(size);
+            compressed.resize(compressed_size);
+            if (compress2(compressed.data(), &compressed_size, (const Bytef *)bytes, size,
+                          this->compression) == Z_OK) {
+                stored = (const char *)compressed.data();
+                stored_size = compressed_size;
+            }
+        }
+#endif
+        std::fwrite(stored, 1, stored_size, this->data_file);
+        std::fflush(this->data_file);
+
+        std::fprintf(this->index_file,
+                     "{\"name\": \"%s\", \"uuid\": \"%s\", \"version\": %d, \"kind\": \"%s\", \"offset\": %llu, "
+                     "\"size\": %llu, \"stored_size\": %llu, \"compression\": \"%s\", \"shape\": [",
+                     name.c_str(), uuid.c_str(), version, kind, (unsigned long long)this->offset,
+                     (unsigned long long)size, (unsigned long long)stored_size,
+                     (stored == bytes) ? "none" : "zlib");
+        for (uint32_t i = 0; i < ndims; ++i)
+            std::fprintf(this->index_file, i > 0 ? ", %u" : "%u", shape_strides[i]);
+        std::fprintf(this->index_file, "], \"strides\": [");
+        for (uint32_t i = 0; i < ndims; ++i)
+            std::fprintf(this->index_file, i > 0 ? ", %u" : "%u", shape_strides[ndims + i]);
+        std::fprintf(this->index_file, "]}\n");
+        std::fflush(this->index_file);
+
+        this->offset += stored_size;
+    }
+
+    static std::string json_string(const std::string& line, const char *key) {
+        std::string pattern = std::string("\"") + key + "\": \"";
+        size_t pos = line.find(pattern);
+        if (pos == std::string::npos)
+            return "";
+        pos += pattern.length();
+        return line.substr(pos, line.find('"', pos) - pos);
+    }
+
+    static uint64_t json_uint(const std::string& line, const char *key) {
+        std::string pattern = std::string("\"") + key + "\": ";
+        size_t pos = line.find(pattern);
+        if (pos == std::string::npos)
+            return 0;
+        return std::strtoull(line.c_str() + pos + pattern.length(), nullptr, 10);
+    }
+
+    /**
+     * Loads the index of a chunked report, if the report folder contains
+     * one. Later entries of the same chunk replace earlier ones.
+     */
+    void load_index() {
+        if (this->index_loaded)
+            return;
+        this->index_loaded = true;
+        this->index.clear();
+        std::ifstream ifs(this->folder + "/index.jsonl");
+        std::string line;
+        while (std::getline(ifs, line)) {
+            if (line.empty())
+                continue;
+            DataChunk chunk;
+            chunk.offset = json_uint(line, "offset");
+            chunk.size = json_uint(line, "size");
+            chunk.stored_size = json_uint(line, "stored_size");
+            chunk.compressed = (json_string(line, "compression") != "none");
+            this->index[chunk_key(json_string(line, "name"), json_string(line, "uuid"),
+                                  (int)json_uint(line, "version"))] = chunk;
+        }
+        this->chunked = !this->index.empty();
+    }
+
+    /**
+     * Reads (and decompresses) a chunk into a buffer of the given size.
+     */
+    bool read_chunk(const DataChunk& chunk, char *buffer, size_t size) {
+        std::ifstream ifs(this->folder + "/data.bin", std::ios::binary);
+        ifs.seekg(chunk.offset);
+        if (!chunk.compressed) {
+            ifs.read(buffer, std::min<uint64_t>(size, chunk.size));
+            return true;
+        }
+#ifdef DACE_SERIALIZATION_ZLIB
+        std::vector<Bytef> compressed(chunk.stored_size);
+        ifs.read((char *)compressed.data(), chunk.stored_size);
+        std::vector<Bytef> uncompressed(chunk.size);
+        uLongf uncompressed_size = chunk.size;
+        if (uncompress(uncompressed.data(), &uncompressed_size, compressed.data(), chunk.stored_size) != Z_OK)
+            return false;
+        std::memcpy(buffer, uncompressed.data(), std::min<uint64_t>(size, uncompressed_size));
+        return true;
+#else
+        printf("WARNING: Data instrumentation report is compressed, but zlib support is not enabled. Set "
+               "instrumentation.data_compression to a positive value to enable it.\n");
+        return false;
+#endif
+    }
+
 public:
-    DataSerializer(const std::string& build_folder) : enable(true) {
+    DataSerializer(const std::string& build_folder, bool chunked = false, int compression = 0)
+        : enable(true), chunked(chunked), compression(compression), data_file(nullptr), index_file(nullptr),
+          offset(0), index_loaded(false) {
         long unsigned int tstart = std::chrono::duration_cast<std::chrono::milliseconds>(
             std::chrono::high_resolution_clock::now().time_since_epoch()).count();
 
@@ -83,10 +284,15 @@ public:
         }
     }
 
-    ~DataSerializer() {}
+    ~DataSerializer() {
+        close_chunk_store();
+    }
 
     void set_folder(const std::string& folder) {
+        std::lock_guard<std::mutex> guard(this->_mutex);
+        close_chunk_store();
         this->folder = folder;
+        this->index_loaded = false;
     }
 
     template <typename T>
@@ -95,12 +301,15 @@ public:
         std::lock_guard<std::mutex> guard(this->_mutex);
 
         // Update version
-        int version;
-        if (this->version.find(symbol_name) == this->version.end())
-            version = 0;
-        else
-            version = this->version[symbol_name] + 1;
-        this->version[symbol_name] = version;
+        int version = next_version(symbol_name);
+
+        if (this->chunked) {
+            std::stringstream value;
+            value << symbol_value;
+            std::string contents = value.str();
+            append_chunk(symbol_name, filename, version, "symbol", contents.c_str(), contents.length(), nullptr, 0);
+            return;
+        }
 
         std::stringstream ss;
         ss << this->folder << "/" << symbol_name;
@@ -123,12 +332,20 @@ public:
         std::lock_guard<std::mutex> guard(this->_mutex);
 
         // Update version
-        int version;
-        if (this->version.find(symbol_name) == this->version.end())
-            version = 0;
-        else
-            version = this->version[symbol_name] + 1;
-        this->version[symbol_name] = version;
+        int version = next_version(symbol_name);
+
+        T val;
+        load_index();
+        if (this->chunked) {
+            auto it = this->index.find(chunk_key(symbol_name, filename, version));
+            if (it == this->index.end())
+                return val;
+            std::string contents(it->second.size, '\0');
+            read_chunk(it->second, &contents[0], contents.length());
+            std::istringstream iss(contents);
+            iss >> val;
+            return val;
+        }
 
         // Read contents from file
         std::stringstream ss;
@@ -136,7 +353,6 @@ public:
         std::ifstream ifs(ss.str(), std::ios::in);
 
         // Read the symbol back
-        T val;
         ifs >> val;
         return val;
     }
@@ -148,12 +364,14 @@ public:
         std::lock_guard<std::mutex> guard(this->_mutex);
 
         // Update version
-        int version;
-        if (this->version.find(filename) == this->version.end())
-            version = 0;
-        else
-            version = this->version[filename] + 1;
-        this->version[filename] = version;
+        int version = next_version(filename);
+
+        if (this->chunked) {
+            uint32_t shape_strides[sizeof...(shape_stride) + 1] = { uint32_t(shape_stride)... };
+            append_chunk(arrayname, filename, version, "array", (const char *)buffer, sizeof(T) * size,
+                         shape_strides, sizeof...(shape_stride) / 2);
+            return;
+        }
 
         std::stringstream ss;
         ss << this->folder << "/" << arrayname;
@@ -179,12 +397,15 @@ public:
         std::lock_guard<std::mutex> guard(this->_mutex);
 
         // Update version
-        int version;
-        if (this->version.find(filename) == this->version.end())
-            version = 0;
-        else
-            version = this->version[filename] + 1;
-        this->version[filename] = version;
+        int version = next_version(filename);
+
+        load_index();
+        if (this->chunked) {
+            auto it = this->index.find(chunk_key(arrayname, filename, version));
+            if (it != this->index.end())
+                read_chunk(it->second, (char *)buffer, sizeof(T) * size);
+            return;
+        }
 
         // Read contents from file
         std::stringstream ss;
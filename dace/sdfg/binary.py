@@ -0,0 +1,314 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Compact binary container format for SDFGs.
+
+The format stores the JSON representation of an SDFG (see ``SDFG.to_json``) as tagged binary records. All strings
+(labels, symbols, type names, dictionary keys) are stored once in a string table and referenced by index. Every SDFG
+(including nested SDFGs) and the contents of every state are stored as separately addressable chunks, which allows
+materializing states on demand when loading.
+
+File layout::
+
+    header:       magic (8 bytes), version (uint32), string table offset (uint64), chunk index offset (uint64)
+    chunks:       encoded values, chunk 0 is the top-level SDFG
+    string table: number of strings, followed by (length, UTF-8 data) for each string
+    chunk index:  number of chunks, followed by one uint64 offset per chunk
+"""
+import struct
+from typing import Any, Dict, List, Tuple
+
+from dace import serialize
+
+MAGIC = b'DACESDFG'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sIQQ')
+_DOUBLE = struct.Struct('<d')
+_OFFSET = struct.Struct('<Q')
+
+# Record tags
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_NEGINT = 4
+_FLOAT = 5
+_STR = 6
+_LIST = 7
+_DICT = 8
+_SDFG = 9  # Reference to a chunk containing an SDFG
+_STATE_CONTENTS = 10  # Reference to a chunk containing the nodes and edges of a state
+
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Encoder:
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.chunks: List[bytearray] = []
+
+    def string(self, value: str) -> int:
+        try:
+            return self.strings[value]
+        except KeyError:
+            index = len(self.strings)
+            self.strings[value] = index
+            return index
+
+    def new_chunk(self) -> Tuple[int, bytearray]:
+        self.chunks.append(bytearray())
+        return len(self.chunks) - 1, self.chunks[-1]
+
+    def encode_sdfg(self, sdfg_json: Dict[str, Any]) -> int:
+        """ Encodes an SDFG into a new chunk, storing the contents of each state in separate chunks. """
+        index, out = self.new_chunk()
+        out.append(_DICT)
+        _write_varint(out, len(sdfg_json))
+        for k, v in sdfg_json.items():
+            _write_varint(out, self.string(k))
+            if k != 'nodes':
+                self.encode(v, out)
+                continue
+
+            # States
+            out.append(_LIST)
+            _write_varint(out, len(v))
+            for state in v:
+                out.append(_DICT)
+                _write_varint(out, len(state) - 1)  # Nodes and edges are replaced by one entry
+                for sk, sv in state.items():
+                    if sk in ('nodes', 'edges'):
+                        continue
+                    _write_varint(out, self.string(sk))
+                    self.encode(sv, out)
+                contents_index, contents = self.new_chunk()
+                self.encode([state['nodes'], state['edges']], contents)
+                _write_varint(out, self.string('contents'))
+                out.append(_STATE_CONTENTS)
+                _write_varint(out, contents_index)
+        return index
+
+    def encode(self, value: Any, out: bytearray):
+        if isinstance(value, str):
+            out.append(_STR)
+            _write_varint(out, self.string(value))
+        elif isinstance(value, dict):
+            if value.get('type') == 'SDFG' and 'nodes' in value:
+                out.append(_SDFG)
+                _write_varint(out, self.encode_sdfg(value))
+                return
+            out.append(_DICT)
+            _write_varint(out, len(value))
+            for k, v in value.items():
+                _write_varint(out, self.string(str(k)))
+                self.encode(v, out)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _write_varint(out, len(value))
+            for v in value:
+                self.encode(v, out)
+        elif value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            if value >= 0:
+                out.append(_INT)
+                _write_varint(out, value)
+            else:
+                out.append(_NEGINT)
+                _write_varint(out, -value)
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        else:
+            # Same fallback as JSON serialization
+            self.encode(serialize.to_json(value), out)
+
+
+def dumps(sdfg_json: Dict[str, Any]) -> bytes:
+    """
+    Encodes a JSON-serialized SDFG into the binary container format.
+
+    :param sdfg_json: The SDFG in JSON format, as returned by ``SDFG.to_json``.
+    :return: The encoded file contents.
+    """
+    encoder = _Encoder()
+    encoder.encode_sdfg(sdfg_json)  # Top-level SDFG is chunk 0
+
+    # Assemble file
+    result = bytearray(_HEADER.size)
+    offsets = []
+    for chunk in encoder.chunks:
+        offsets.append(len(result))
+        result += chunk
+
+    string_table_offset = len(result)
+    _write_varint(result, len(encoder.strings))
+    for string in encoder.strings:
+        encoded = string.encode('utf-8')
+        _write_varint(result, len(encoded))
+        result += encoded
+
+    chunk_index_offset = len(result)
+    _write_varint(result, len(offsets))
+    for offset in offsets:
+        result += _OFFSET.pack(offset)
+
+    result[:_HEADER.size] = _HEADER.pack(MAGIC, VERSION, string_table_offset, chunk_index_offset)
+    return bytes(result)
+
+
+def is_binary(data: bytes) -> bool:
+    """ Returns True if the given data (or file prefix) is in the binary SDFG format. """
+    return data[:len(MAGIC)] == MAGIC
+
+
+class BinaryReader:
+    """
+    Decodes chunks from a binary SDFG file on demand.
+    """
+
+    def __init__(self, data: bytes):
+        if len(data) < _HEADER.size:
+            raise ValueError('Data is not a binary SDFG')
+        magic, version, string_table_offset, chunk_index_offset = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError('Data is not a binary SDFG')
+        if version != VERSION:
+            raise ValueError(f'Unsupported binary SDFG format version {version}')
+        self.data = data
+
+        # Read string table
+        count, pos = self._read_varint(string_table_offset)
+        strings = []
+        for _ in range(count):
+            length, pos = self._read_varint(pos)
+            strings.append(str(data[pos:pos + length], 'utf-8'))
+            pos += length
+        self.strings = strings
+
+        # Read chunk index
+        count, pos = self._read_varint(chunk_index_offset)
+        self.offsets = list(struct.unpack_from(f'<{count}Q', data, pos))
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self.offsets)
+
+    def _read_varint(self, pos: int) -> Tuple[int, int]:
+        data = self.data
+        byte = data[pos]
+        if byte < 0x80:
+            return byte, pos + 1
+        result = byte & 0x7f
+        shift = 7
+        pos += 1
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+
+    def sdfg(self, index: int = 0, lazy: bool = False) -> Dict[str, Any]:
+        """
+        Decodes an SDFG chunk into JSON format.
+
+        :param index: The chunk index (0 is the top-level SDFG).
+        :param lazy: If True, the contents of SDFG states are not decoded. Instead, the ``contents`` entry of each
+                     state contains a function that decodes and returns its nodes and edges
+                     (see ``SDFGState.from_json``).
+        :return: The SDFG in JSON format.
+        """
+        sdfg_json, _ = self._decode(self.offsets[index], lazy)
+        if not lazy:
+            for state in sdfg_json['nodes']:
+                state['nodes'], state['edges'] = state.pop('contents')
+        return sdfg_json
+
+    def state_contents(self, index: int, lazy: bool = False) -> Tuple[List[Any], List[Any]]:
+        """
+        Decodes a chunk containing the contents of a state.
+
+        :param index: The chunk index.
+        :param lazy: If True, states of nested SDFGs are loaded lazily.
+        :return: A 2-tuple of the JSON-serialized nodes and edges of the state.
+        """
+        (nodes, edges), _ = self._decode(self.offsets[index], lazy)
+        return nodes, edges
+
+    def _decode(self, pos: int, lazy: bool) -> Tuple[Any, int]:
+        data = self.data
+        tag = data[pos]
+        pos += 1
+        if tag == _STR:
+            index, pos = self._read_varint(pos)
+            return self.strings[index], pos
+        elif tag == _DICT:
+            length, pos = self._read_varint(pos)
+            strings = self.strings
+            result = {}
+            for _ in range(length):
+                key, pos = self._read_varint(pos)
+                result[strings[key]], pos = self._decode(pos, lazy)
+            return result, pos
+        elif tag == _LIST:
+            length, pos = self._read_varint(pos)
+            result = [None] * length
+            for i in range(length):
+                result[i], pos = self._decode(pos, lazy)
+            return result, pos
+        elif tag == _INT:
+            return self._read_varint(pos)
+        elif tag == _NONE:
+            return None, pos
+        elif tag == _TRUE:
+            return True, pos
+        elif tag == _FALSE:
+            return False, pos
+        elif tag == _NEGINT:
+            value, pos = self._read_varint(pos)
+            return -value, pos
+        elif tag == _FLOAT:
+            return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+        elif tag == _SDFG:
+            index, pos = self._read_varint(pos)
+            return self.sdfg(index, lazy), pos
+        elif tag == _STATE_CONTENTS:
+            index, pos = self._read_varint(pos)
+            if lazy:
+                return _LazyStateContents(self, index), pos
+            return self.state_contents(index), pos
+        raise ValueError(f'Invalid record tag {tag} at offset {pos - 1}')
+
+
+class _LazyStateContents:
+    """ Decodes the contents of a state upon call. """
+
+    def __init__(self, reader: BinaryReader, index: int):
+        self.reader = reader
+        self.index = index
+
+    def __call__(self) -> Tuple[List[Any], List[Any]]:
+        return self.reader.state_contents(self.index, lazy=True)
+
+
+def loads(data: bytes, lazy: bool = False) -> Dict[str, Any]:
+    """
+    Decodes a binary SDFG into JSON format. The result can be passed to ``SDFG.from_json``.
+
+    :param data: The file contents.
+    :param lazy: If True, the contents of states are decoded upon first access (see ``BinaryReader.sdfg``).
+    :return: The SDFG in JSON format.
+    """
+    return BinaryReader(data).sdfg(0, lazy)
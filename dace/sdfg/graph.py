@@ -8,6 +8,9 @@ from dace.dtypes import deduplicate
 import dace.serialize
 from typing import Any, Callable, Generic, Iterable, List, Sequence, TypeVar, Union
 
+# Source of graph version numbers (see ``OrderedDiGraph.version``)
+_graph_versions = itertools.count()
+
 
 class NodeNotFoundError(Exception):
     pass
@@ -624,11 +627,17 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes = OrderedDict()
         # {(src, dst): edge}
         self._edges = OrderedDict()
+        self._version = next(_graph_versions)
 
     @property
     def nx(self):
         return self._nx
 
+    @property
+    def version(self) -> int:
+        """ A number that changes whenever nodes or edges are added to or removed from the graph. """
+        return self._version
+
     def node(self, id: int) -> NodeT:
         try:
             return next(n for i, n in enumerate(self._nodes.keys()) if i == id)
@@ -658,6 +667,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
             raise RuntimeError("Duplicate node added")
         self._nodes[node] = (OrderedDict(), OrderedDict())
         self._nx.add_node(node)
+        self._version = next(_graph_versions)
 
     def add_edge(self, src: NodeT, dst: NodeT, data: EdgeT = None):
         t = (src, dst)
@@ -672,6 +682,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes[src][1][t] = edge
         self._nodes[dst][0][t] = edge
         self._nx.add_edge(src, dst, data=data)
+        self._version = next(_graph_versions)
         return edge
 
     def remove_node(self, node: NodeT):
@@ -680,6 +691,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
                 self.remove_edge(edge)
             del self._nodes[node]
             self._nx.remove_node(node)
+            self._version = next(_graph_versions)
         except KeyError:
             pass
 
@@ -691,6 +703,7 @@ class OrderedDiGraph(Graph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[src][1][t]
         del self._nodes[dst][0][t]
         del self._edges[t]
+        self._version = next(_graph_versions)
 
     def in_degree(self, node):
         return self._nx.in_degree(node)
@@ -740,6 +753,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes = OrderedDict()
         # {edge: edge}
         self._edges = OrderedDict()
+        self._version = next(_graph_versions)
 
     def add_edge(self, src: NodeT, dst: NodeT, data: EdgeT) -> MultiEdge[EdgeT]:
         key = self._nx.add_edge(src, dst, data=data)
@@ -751,6 +765,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._version = next(_graph_versions)
         return edge
 
     def remove_edge(self, edge: MultiEdge[EdgeT]):
@@ -758,6 +773,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
         self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._version = next(_graph_versions)
 
     def in_edges(self, node) -> List[MultiEdge[EdgeT]]:
         return super().in_edges(node)
@@ -774,6 +790,7 @@ class OrderedMultiDiGraph(OrderedDiGraph[NodeT, EdgeT], Generic[NodeT, EdgeT]):
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
             self._nodes[n] = (out_edges, in_edges)
+        self._version = next(_graph_versions)
 
     def is_multigraph(self) -> bool:
         return True
@@ -795,6 +812,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         self._nodes[src][1][edge] = edge
         self._nodes[dst][0][edge] = edge
         self._edges[edge] = edge
+        self._version = next(_graph_versions)
         return edge
 
     def add_nedge(self, src: NodeT, dst: NodeT, data: EdgeT) -> MultiConnectorEdge[EdgeT]:
@@ -806,6 +824,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
         del self._nodes[edge.src][1][edge]
         del self._nodes[edge.dst][0][edge]
         self._nx.remove_edge(edge.src, edge.dst, edge.key)
+        self._version = next(_graph_versions)
 
     def reverse(self) -> None:
         self._nx.reverse(False)
@@ -813,6 +832,7 @@ class OrderedMultiDiConnectorGraph(OrderedMultiDiGraph[NodeT, EdgeT], Generic[No
             e.reverse()
         for n, (in_edges, out_edges) in self._nodes.items():
             self._nodes[n] = (out_edges, in_edges)
+        self._version = next(_graph_versions)
 
     def in_edges(self, node) -> List[MultiConnectorEdge[EdgeT]]:
         return super().in_edges(node)
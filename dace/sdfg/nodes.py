@@ -1341,6 +1341,10 @@ class LibraryNode(CodeNode):
                     implementation = config_implementation
             except KeyError:
                 config_override = False
+        # If not explicitly set, try the implementation measured fastest on this machine
+        if implementation is None and Config.get_bool('library', 'autoselect'):
+            from dace.optimization.library_tuner import select_implementation  # Avoid import loop
+            implementation = select_implementation(self, state, sdfg)
         # If not explicitly set, try the node default
         if implementation is None:
             implementation = type(self).default_implementation
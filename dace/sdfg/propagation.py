@@ -4,21 +4,36 @@ Functionality relating to Memlet propagation (deducing external memlets
 from internal memory accesses and scope ranges).
 """
 
-from collections import deque
+from collections import OrderedDict, deque
 import copy
 from dace.symbolic import issymbolic, pystr_to_symbolic, simplify
 import itertools
 import functools
 import sympy
+import threading
 from sympy import ceiling, Symbol
 from sympy.concrete.summations import Sum
 import warnings
 import networkx as nx
 
 from dace import registry, subsets, symbolic, dtypes, data
+from dace.config import Config
 from dace.memlet import Memlet
 from dace.sdfg import nodes, graph as gr
-from typing import List, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+# Memoized results of ``propagate_subset``, keyed on the propagated subsets, array shape, and range
+_propagation_cache: 'OrderedDict[Tuple[Any, ...], Tuple[subsets.Subset, Any, bool]]' = OrderedDict()
+_propagation_cache_stats: Dict[str, int] = {'hits': 0, 'misses': 0}
+_propagation_cache_lock = threading.Lock()
+
+
+def _subs_expand(expr, sym, value):
+    """ Substitutes a symbol in an expression and expands the result, without SymPy if both are affine. """
+    aexpr, avalue = symbolic.affine(expr), symbolic.affine(value)
+    if aexpr is not None and avalue is not None:
+        return aexpr.subs(sym, avalue).to_sympy()
+    return expr.subs(sym, value).expand()
 
 
 @registry.make_registry
@@ -155,8 +170,17 @@ class AffineSMemlet(SeparableMemletPattern):
                 # Try to match an affine expression with a parameter
                 param = None
                 pind = -1
+                aff = symbolic.affine(subexpr)
+                if aff is not None:
+                    # Fast path: read the multiplier and addition off the affine expression
+                    matching = [(indp, p) for indp, p in enumerate(params) if aff.coefficient(p) != 0]
+                    if len(matching) != 1:
+                        return False  # A (single) parameter must match
+                    pind, param = matching[0]
+                    multiplier = sympy.Integer(aff.coefficient(param))
+                    addition = aff.subs(param, symbolic.AffineExpr({})).to_sympy()
                 for indp, p in enumerate(params):
-                    if p not in subexpr.free_symbols:
+                    if aff is not None or p not in subexpr.free_symbols:
                         continue
                     matches = subexpr.match(a * p + b)
                     if param is None and matches is None:
@@ -196,7 +220,7 @@ class AffineSMemlet(SeparableMemletPattern):
                     return False  # Step must be independent of parameter
 
             node_rb, node_re, node_rs = node_range[self.paramind]
-            result_begin = subexprs[0].subs(self.param, node_rb).expand()
+            result_begin = _subs_expand(subexprs[0], self.param, node_rb)
             if node_rs != 1:
                 # Special case: i:i+stride for a begin:end:stride range
                 if node_rb == result_begin and bre + 1 == node_rs and step == 1:
@@ -243,8 +267,8 @@ class AffineSMemlet(SeparableMemletPattern):
             rs = 1
             rt = 1
 
-        result_begin = rb.subs(self.param, node_rb).expand()
-        result_end = re.subs(self.param, node_re).expand()
+        result_begin = _subs_expand(rb, self.param, node_rb)
+        result_end = _subs_expand(re, self.param, node_re)
 
         # Special case: multiplier < 0
         if (self.multiplier < 0) == True:
@@ -371,6 +395,11 @@ class ConstantSMemlet(SeparableMemletPattern):
             for rngelem in dexpr:
                 if dtypes.isconstant(rngelem):
                     continue
+                aff = symbolic.affine(rngelem)
+                if aff is not None:
+                    if not aff.is_constant:
+                        return False
+                    continue
 
                 matches = rngelem.match(cst)
                 if matches is None or len(matches) != 1:
@@ -380,6 +409,9 @@ class ConstantSMemlet(SeparableMemletPattern):
 
         else:  # Single element case
             # Try to match a constant expression
+            aff = symbolic.affine(dexpr)
+            if aff is not None:
+                return aff.is_constant
             if not dtypes.isconstant(dexpr):
                 matches = dexpr.match(cst)
                 if matches is None or len(matches) != 1:
@@ -1132,6 +1164,9 @@ def propagate_memlets_nested_sdfg(parent_sdfg, parent_state, nsdfg_node):
                 oedge.data.volume = 0
                 oedge.data.dynamic = True
 
+    # Memlets around the nested SDFG node were modified in place
+    parent_sdfg.journal.mark_modified(parent_state, [nsdfg_node])
+
 
 def reset_state_annotations(sdfg):
     """ Resets the state (loop-related) annotations of an SDFG.
@@ -1205,6 +1240,37 @@ def propagate_memlets_state(sdfg, state):
     propagate_memlets_scope(sdfg, state, state.scope_leaves())
 
 
+def propagate_memlets_from_nodes(sdfg, state, dirty_nodes: Iterable[nodes.Node], propagate_parents: bool = True):
+    """
+    Propagates memlets from a set of modified ("dirty") nodes upwards, only re-propagating the scopes that contain
+    them. If a dirty node is a nested SDFG, memlets are first propagated out of it. If ``propagate_parents`` is True
+    and the state is in a nested SDFG, propagation continues through the nested SDFG nodes of the parent SDFGs.
+
+    :param sdfg: The SDFG in which the state is situated.
+    :param state: The state that contains the dirty nodes.
+    :param dirty_nodes: The nodes whose memlets or contents changed.
+    :param propagate_parents: If True, propagates out of nested SDFGs into their parent states.
+    :note: This is an in-place operation on the SDFG. Unlike ``propagate_memlets_sdfg``, this does not recompute
+           state (loop-related) annotations.
+    """
+    scope_tree = state.scope_tree()
+    scope_dict = state.scope_dict()
+    scopes = []
+    for node in dirty_nodes:
+        if isinstance(node, nodes.NestedSDFG):
+            propagate_memlets_nested_sdfg(sdfg, state, node)
+        if isinstance(node, nodes.EntryNode):
+            scopes.append(scope_tree[node])
+        elif isinstance(node, nodes.ExitNode):
+            scopes.append(scope_tree[state.entry_node(node)])
+        else:
+            scopes.append(scope_tree[scope_dict[node]])
+    propagate_memlets_scope(sdfg, state, list(dict.fromkeys(scopes)))
+
+    if propagate_parents and sdfg.parent_nsdfg_node is not None:
+        propagate_memlets_from_nodes(sdfg.parent_sdfg, sdfg.parent, [sdfg.parent_nsdfg_node], True)
+
+
 def propagate_memlets_scope(sdfg, state, scopes, propagate_entry=True, propagate_exit=True):
     """ 
     Propagate memlets from the given scopes outwards. 
@@ -1414,24 +1480,91 @@ def propagate_subset(memlets: List[Memlet],
         defined_variables -= set(params)
         defined_variables = set(symbolic.pystr_to_symbolic(p) for p in defined_variables)
 
+    propagated = [(md, _propagated_subset(md, use_dst)) for md in memlets if not md.is_empty()]
+
+    # Look up memoized result
+    cache_size = Config.get('optimizer', 'memlet_propagation_cache_size')
+    key = None
+    if cache_size > 0:
+        try:
+            key = (tuple((_subset_key(subset), md.volume, md.dynamic) for md, subset in propagated),
+                   tuple(m.volume for m in memlets), any(m.dynamic for m in memlets), tuple(arr.shape),
+                   tuple(params), _subset_key(rng), frozenset(defined_variables))
+            hash(key)
+        except TypeError:  # Unhashable subset or symbol
+            key = None
+    entry = None
+    if key is not None:
+        with _propagation_cache_lock:
+            entry = _propagation_cache.get(key)
+            if entry is not None:
+                _propagation_cache.move_to_end(key)
+                _propagation_cache_stats['hits'] += 1
+    if entry is not None:
+        new_subset, volume, dynamic = entry
+        new_memlet = copy.copy(memlets[0])
+        new_memlet.subset = copy.deepcopy(new_subset)
+        new_memlet.other_subset = None
+        new_memlet.volume = volume
+        new_memlet.dynamic = dynamic
+        return new_memlet
+
+    new_memlet = _propagate_subset(memlets, propagated, arr, params, rng, defined_variables)
+    if key is not None:
+        entry = (copy.deepcopy(new_memlet.subset), new_memlet.volume, new_memlet.dynamic)
+        with _propagation_cache_lock:
+            _propagation_cache_stats['misses'] += 1
+            _propagation_cache[key] = entry
+            while len(_propagation_cache) > cache_size:
+                _propagation_cache.popitem(last=False)
+    return new_memlet
+
+
+def clear_propagation_cache():
+    """ Clears the memoized results of memlet propagation. """
+    with _propagation_cache_lock:
+        _propagation_cache.clear()
+        _propagation_cache_stats['hits'] = 0
+        _propagation_cache_stats['misses'] = 0
+
+
+def propagation_cache_info() -> Dict[str, int]:
+    """
+    Returns statistics of the memlet propagation cache.
+
+    :return: A dictionary with the number of cache hits, misses, and current entries.
+    """
+    return dict(_propagation_cache_stats, entries=len(_propagation_cache))
+
+
+def _propagated_subset(md: Memlet, use_dst: bool) -> subsets.Subset:
+    """ Returns the subset of a memlet that is propagated, depending on the propagation direction. """
+    if use_dst and md.dst_subset is not None:
+        return md.dst_subset
+    elif not use_dst and md.src_subset is not None:
+        return md.src_subset
+    return md.subset
+
+
+def _subset_key(subset: subsets.Subset) -> Any:
+    """ Returns an immutable, hashable representation of a subset. """
+    if isinstance(subset, subsets.Range):
+        return ('Range', tuple(tuple(r) for r in subset.ranges), tuple(subset.tile_sizes))
+    elif isinstance(subset, subsets.Indices):
+        return ('Indices', tuple(subset.indices))
+    return (type(subset).__name__, str(subset))
+
+
+def _propagate_subset(memlets: List[Memlet], propagated: List[Tuple[Memlet, subsets.Subset]], arr: data.Data,
+                      params: List[str], rng: subsets.Subset, defined_variables: Set[symbolic.SymbolicType]) -> Memlet:
+    """ Propagates memlets through a range without memoization. See ``propagate_subset``. """
     # Propagate subset
     variable_context = [defined_variables, [symbolic.pystr_to_symbolic(p) for p in params]]
 
     new_subset = None
-    for md in memlets:
-        if md.is_empty():
-            continue
-
+    for md, subset in propagated:
         tmp_subset = None
 
-        subset = None
-        if use_dst and md.dst_subset is not None:
-            subset = md.dst_subset
-        elif not use_dst and md.src_subset is not None:
-            subset = md.src_subset
-        else:
-            subset = md.subset
-
         for pclass in MemletPattern.extensions():
             pattern = pclass()
             if pattern.can_be_applied([subset], variable_context, rng, [md]):
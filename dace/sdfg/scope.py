@@ -1,6 +1,8 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import collections
-from typing import Any, Dict, List, Tuple
+import threading
+import types
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 import dace
 from dace import dtypes, symbolic
@@ -127,6 +129,289 @@ def _scope_dict_to_ids(state: 'dace.sdfg.SDFGState', scope_dict: ScopeDictType):
     return {node_id_or_none(k): [node_id_or_none(vi) for vi in v] for k, v in scope_dict.items()}
 
 
+def _raise_malformed_scopes(graph, leftover_queue, unprocessed_nodes):
+    """ Raises the error of a state whose scopes cannot be computed. """
+    cycles = list(graph.find_cycles())
+    if cycles:
+        raise ValueError('Found cycles in state %s: %s' % (graph.label, cycles))
+    if len(leftover_queue) != 0:
+        raise RuntimeError("Leftover nodes in queue: {}".format(leftover_queue))
+    raise RuntimeError("Some nodes were not processed: {}".format(unprocessed_nodes))
+
+
+#: Marks a node whose predecessors disagree on its scope.
+_INCONSISTENT = object()
+
+
+class ScopeIndex(object):
+    """
+    Scope dictionaries of a state (see ``scope_dict``, ``scope_children``, ``scope_tree``, and ``scope_leaves`` in
+    ``SDFGState``), computed once and then maintained incrementally upon graph mutation.
+
+    The scope of a node follows from any of its predecessors: successors of an entry node are in its scope,
+    successors of an exit node are in the parent scope of the corresponding entry node, and successors of other nodes
+    share their scope. As long as the state is acyclic and the predecessors of every node agree, a mutation only
+    re-evaluates the nodes downstream of it. Otherwise, the index is discarded and recomputed on the next query,
+    which also reports malformed states.
+
+    Queries return read-only views of the index. A view is never modified after it was returned: the next mutation
+    copies the underlying dictionary instead. Queries may be made concurrently (e.g., by analysis passes running in
+    parallel, see ``Pipeline.num_workers``), but not concurrently with mutations.
+    """
+
+    def __init__(self, graph):
+        self._graph = graph
+        # Guards the lazy computation of the index in queries
+        self._lock = threading.RLock()
+        self.clear()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def clear(self):
+        """ Discards the index, which is then recomputed on the next query. """
+        # Node -> scope entry node (or None)
+        self._parent: Optional[Dict[NodeType, Optional[EntryNodeType]]] = None
+        # Scope entry node (or None) -> ordered set of nodes in the scope (only if incrementally maintained)
+        self._members: Optional[Dict[Optional[EntryNodeType], Dict[NodeType, None]]] = None
+        # True if the index is maintained upon mutation, False if it is recomputed
+        self._live = False
+        # True if the current parent dictionary was returned by a query (i.e., has to be copied before modification)
+        self._parent_shared = False
+        # The scope children dictionary returned by queries and the scopes that changed since it was computed
+        self._children: Optional[Dict[Optional[EntryNodeType], List[NodeType]]] = None
+        self._dirty_scopes = set()
+        self._tree: Optional[Dict[Optional[EntryNodeType], ScopeTree]] = None
+        self._leaves: Optional[List[ScopeTree]] = None
+
+    ###################################################################
+    # Queries
+
+    def parents(self, validate: bool = True) -> Mapping[NodeType, Optional[EntryNodeType]]:
+        """
+        Returns a read-only mapping from each node to its parent scope entry node, or to None for top-level nodes.
+
+        :param validate: Raise an error if the state is malformed (e.g., contains cycles).
+        """
+        with self._lock:
+            if self._parent is None or (validate and not self._live):
+                graph = self._graph
+                result = {}
+                leftover = _scope_dict_inner(graph, collections.deque(graph.source_nodes()), None, False, result)
+                well_formed = (len(leftover) == 0 and len(result) == graph.number_of_nodes())
+                if validate and not well_formed:
+                    _raise_malformed_scopes(graph, leftover, set(graph.nodes()) - result.keys())
+                self.clear()
+                self._parent = result
+                # Only maintain the index incrementally if the scope of every node follows from its predecessors
+                self._live = well_formed and all(self._derive(node) is scope for node, scope in result.items())
+                if self._live:
+                    self._members = {None: {}}
+                    for node, scope in result.items():
+                        self._members.setdefault(scope, {})[node] = None
+                        if isinstance(node, nd.EntryNode):
+                            self._members.setdefault(node, {})
+
+            self._parent_shared = True
+            return types.MappingProxyType(self._parent)
+
+    def children(self, validate: bool = True) -> Mapping[Optional[EntryNodeType], List[NodeType]]:
+        """
+        Returns a read-only mapping from each scope entry node (or None for the top-level scope) to a list of the
+        nodes in its scope, not including the nodes in nested scopes.
+
+        :param validate: Raise an error if the state is malformed (e.g., contains cycles).
+        """
+        with self._lock:
+            self.parents(validate)
+            if not self._live:
+                # Malformed states are not maintained incrementally
+                if self._children is None:
+                    graph = self._graph
+                    result = {}
+                    _scope_dict_inner(graph, collections.deque(graph.source_nodes()), None, True, result)
+                    self._children = result
+            elif self._children is None:
+                self._children = {scope: list(nodes) for scope, nodes in self._members.items()}
+            elif self._dirty_scopes:
+                result = dict(self._children)
+                for scope in self._dirty_scopes:
+                    if scope in self._members:
+                        result[scope] = list(self._members[scope])
+                    else:
+                        del result[scope]
+                self._children = result
+            self._dirty_scopes.clear()
+            return types.MappingProxyType(self._children)
+
+    def tree(self) -> Mapping[Optional[EntryNodeType], ScopeTree]:
+        """ Returns a read-only mapping from each scope entry node (or None) to its scope tree node. """
+        with self._lock:
+            if self._tree is None:
+                sdp = self.parents()
+                sdc = self.children()
+                result = {}
+
+                # Get scopes
+                for node, scopenodes in sdc.items():
+                    if node is None:
+                        exit_node = None
+                    else:
+                        exit_node = next(v for v in scopenodes if isinstance(v, nd.ExitNode))
+                    scope = ScopeTree(node, exit_node)
+                    result[node] = scope
+
+                # Scope parents and children
+                for node, scope in result.items():
+                    if node is not None:
+                        scope.parent = result[sdp[node]]
+                    scope.children = [result[n] for n in sdc[node] if isinstance(n, nd.EntryNode)]
+
+                self._tree = result
+            return types.MappingProxyType(self._tree)
+
+    def leaves(self) -> List[ScopeTree]:
+        """ Returns a new list of the scope tree nodes that contain no other scopes. """
+        with self._lock:
+            if self._leaves is None:
+                self._leaves = [scope for scope in self.tree().values() if len(scope.children) == 0]
+            return list(self._leaves)
+
+    ###################################################################
+    # Mutation
+
+    def node_added(self, node: NodeType):
+        """ Updates the index after a (disconnected) node was added to the state. """
+        if not self._live:
+            self.clear()
+            return
+        self._set_scope(node, None)
+        if isinstance(node, nd.EntryNode):
+            self._members[node] = {}
+            self._dirty_scopes.add(node)
+
+    def node_removed(self, node: NodeType):
+        """ Updates the index after a node (and its edges) was removed from the state. """
+        if not self._live:
+            self.clear()
+            return
+        if node not in self._parent or (isinstance(node, nd.EntryNode) and self._members[node]):
+            # Nodes remain in the scope of a removed entry node
+            self.clear()
+            return
+        if self._parent_shared:
+            self._parent = dict(self._parent)
+            self._parent_shared = False
+        scope = self._parent.pop(node)
+        del self._members[scope][node]
+        self._dirty_scopes.add(scope)
+        if isinstance(node, nd.EntryNode):
+            del self._members[node]
+            self._dirty_scopes.add(node)
+        if isinstance(node, (nd.EntryNode, nd.ExitNode)):
+            self._tree = self._leaves = None
+
+    def edge_added(self, edge):
+        """ Updates the index after an edge was added to the state. """
+        if not self._live:
+            self.clear()
+            return
+        if self._reaches(edge.dst, edge.src):
+            # The new edge closes a cycle
+            self.clear()
+            return
+        self._update(edge.dst)
+
+    def edge_removed(self, edge):
+        """ Updates the index after an edge was removed from the state. """
+        if not self._live:
+            self.clear()
+            return
+        self._update(edge.dst)
+
+    def _reaches(self, source: NodeType, target: NodeType) -> bool:
+        """ Returns True if there is a path from ``source`` to ``target`` in the state. """
+        if source is target:
+            return True
+        graph = self._graph
+        if graph.in_degree(target) == 0:
+            return False
+        visited = {source}
+        stack = [source]
+        while stack:
+            for succ in graph.successors(stack.pop()):
+                if succ is target:
+                    return True
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append(succ)
+        return False
+
+    def _derive(self, node: NodeType):
+        """ Returns the scope of a node as given by its predecessors, or ``_INCONSISTENT`` if they disagree. """
+        result = _INCONSISTENT
+        for edge in self._graph.in_edges(node):
+            pred = edge.src
+            if pred not in self._parent:
+                return _INCONSISTENT
+            if isinstance(pred, nd.EntryNode):
+                scope = pred
+            elif isinstance(pred, nd.ExitNode):
+                entry = self._parent[pred]
+                if entry is None:
+                    return _INCONSISTENT
+                scope = self._parent[entry]
+            else:
+                scope = self._parent[pred]
+            if result is _INCONSISTENT:
+                result = scope
+            elif result is not scope:
+                return _INCONSISTENT
+        # Source nodes are at the top level
+        return None if result is _INCONSISTENT else result
+
+    def _update(self, node: NodeType):
+        """ Re-evaluates the scope of a node, and of the nodes downstream of it if it changed. """
+        queue = collections.deque([node])
+        while queue:
+            node = queue.popleft()
+            if node not in self._parent:
+                continue
+            scope = self._derive(node)
+            if scope is _INCONSISTENT:
+                self.clear()
+                return
+            if scope is self._parent[node]:
+                continue
+            self._set_scope(node, scope)
+            queue.extend(self._graph.successors(node))
+            # Nodes after the exit node are in the parent scope of this entry node
+            if isinstance(node, nd.EntryNode):
+                for child in self._members[node]:
+                    if isinstance(child, nd.ExitNode):
+                        queue.extend(self._graph.successors(child))
+
+    def _set_scope(self, node: NodeType, scope: Optional[EntryNodeType]):
+        if self._parent_shared:
+            self._parent = dict(self._parent)
+            self._parent_shared = False
+        if node in self._parent:
+            previous = self._parent[node]
+            del self._members[previous][node]
+            self._dirty_scopes.add(previous)
+        self._parent[node] = scope
+        self._members[scope][node] = None
+        self._dirty_scopes.add(scope)
+        if isinstance(node, (nd.EntryNode, nd.ExitNode)):
+            self._tree = self._leaves = None
+
+
 def scope_contains_scope(sdict: ScopeDictType, node: NodeType, other_node: NodeType) -> bool:
     """ 
     Returns true iff scope of `node` contains the scope of  `other_node`.
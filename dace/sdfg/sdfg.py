@@ -15,7 +15,8 @@ import re
 import shutil
 import sys
 import time
-from typing import Any, AnyStr, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Type, TYPE_CHECKING, Union
+from typing import (Any, AnyStr, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type, TYPE_CHECKING,
+                    Union)
 import warnings
 import numpy as np
 import sympy as sp
@@ -25,7 +26,7 @@ import dace.serialize
 from dace import (data as dt, hooks, memlet as mm, subsets as sbs, dtypes, properties, symbolic)
 from dace.sdfg.scope import ScopeTree
 from dace.sdfg.replace import replace, replace_properties, replace_properties_dict
-from dace.sdfg.validation import (InvalidSDFGError, validate_sdfg)
+from dace.sdfg.validation import (InvalidSDFGError, MutationJournal, validate_sdfg)
 from dace.config import Config
 from dace.frontend.python import astutils, wrappers
 from dace.sdfg import nodes as nd
@@ -42,6 +43,9 @@ from typing import BinaryIO
 ShapeType = Sequence[Union[Integral, str, symbolic.symbol, symbolic.SymExpr, symbolic.sympy.Basic]]
 RankType = Union[Integral, str, symbolic.symbol, symbolic.SymExpr, symbolic.sympy.Basic]
 
+#: Attributes that do not take part in the structural hash of an SDFG (see ``SDFG.structural_hash``)
+STRUCTURAL_HASH_IGNORED_KEYS = ('hash', 'orig_sdfg', 'transformation_hist', 'sdfg_list_id')
+
 if TYPE_CHECKING:
     from dace.codegen.instrumentation.report import InstrumentationReport
     from dace.codegen.instrumentation.data.data_report import InstrumentedDataReport
@@ -502,6 +506,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         self._start_state: Optional[int] = None
         self._cached_start_state: Optional[SDFGState] = None
         self._arrays = NestedDict()  # type: Dict[str, dt.Array]
+        self._descriptor_hashes: Dict[str, Tuple[dt.Data, str]] = {}
+        self._journal = MutationJournal()
         self._labels: Set[str] = set()
         self.global_code = {'frame': CodeBlock("", dtypes.Language.CPP)}
         self.init_code = {'frame': CodeBlock("", dtypes.Language.CPP)}
@@ -532,9 +538,10 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         for k, v in self.__dict__.items():
             # Skip derivative attributes
             if k in ('_cached_start_state', '_edges', '_nodes', '_parent', '_parent_sdfg', '_parent_nsdfg_node',
-                     '_sdfg_list', '_transformation_hist'):
+                     '_sdfg_list', '_transformation_hist', '_journal'):
                 continue
             setattr(result, k, copy.deepcopy(v, memo))
+        result._journal = MutationJournal()
         # Copy edges and nodes
         result._edges = copy.deepcopy(self._edges, memo)
         result._nodes = copy.deepcopy(self._nodes, memo)
@@ -587,7 +594,10 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         tmp['attributes']['name'] = self.name
         if hash:
-            tmp['attributes']['hash'] = self.hash_sdfg(tmp)
+            if Config.get_bool('structural_hash'):
+                tmp['attributes']['hash'] = self.structural_hash()
+            else:
+                tmp['attributes']['hash'] = self.hash_sdfg(tmp)
 
         if int(self.sdfg_id) == 0:
             tmp['dace_version'] = dace.__version__
@@ -676,6 +686,56 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         hsh = sha256(string_representation.encode('utf-8'))
         return hsh.hexdigest()
 
+    def structural_hash(self) -> str:
+        """
+        Returns a hash of the current SDFG that is combined from cached digests of its states, nested SDFGs and
+        data descriptors. Mutating the SDFG through its API (e.g., adding or removing nodes, edges, or data
+        descriptors) only invalidates the affected digests, so that rehashing after a small change does not
+        require serializing the entire SDFG. Unlike ``hash_sdfg``, names and instrumentation are part of the hash.
+
+        :note: Modifying properties of nodes, memlets, or data descriptors directly is not tracked. In that case,
+               call ``invalidate_hash`` on the modified SDFG or state. Transformations and passes applied through
+               the transformation API invalidate the hash automatically.
+        :return: The hash (in SHA-256 format).
+        """
+        attributes = {
+            p.attr_name: p.to_json(v)
+            for p, v in self.properties()
+            if p.attr_name not in ('_arrays', 'orig_sdfg', 'transformation_hist') and not (
+                p.optional and not p.optional_condition(self))
+        }
+        descriptors = [[name, self._descriptor_hash(name)] for name in sorted(self._arrays.keys())]
+        state_ids = {state: i for i, state in enumerate(self.nodes())}
+        states = [state.structural_hash() for state in self.nodes()]
+        edges = [[state_ids[e.src], state_ids[e.dst], e.data.to_json()] for e in self.edges()]
+        return dace.serialize.hash_json([self.name, self._start_state, attributes, descriptors, states, edges],
+                                        STRUCTURAL_HASH_IGNORED_KEYS)
+
+    def _descriptor_hash(self, name: str) -> str:
+        desc = self._arrays[name]
+        cached = self._descriptor_hashes.get(name)
+        if cached is None or cached[0] is not desc:
+            cached = (desc, dace.serialize.hash_json(desc.to_json(), STRUCTURAL_HASH_IGNORED_KEYS))
+            self._descriptor_hashes[name] = cached
+        return cached[1]
+
+    def invalidate_hash(self, recursive: bool = True, states: Optional[Iterable['SDFGState']] = None):
+        """
+        Clears the cached digests used in ``structural_hash``. Should be called after modifying properties of
+        nodes, memlets, or data descriptors directly.
+
+        :param recursive: If True, also invalidates the digests of nested SDFGs.
+        :param states: If given, only invalidates the digests of the given states (and the nested SDFGs within them,
+                       if ``recursive`` is True), along with those of the data descriptors.
+        """
+        self._descriptor_hashes.clear()
+        for state in (self.nodes() if states is None else states):
+            state.invalidate_hash()
+            if recursive:
+                for node in state.nodes():
+                    if isinstance(node, nd.NestedSDFG) and node.sdfg is not None:
+                        node.sdfg.invalidate_hash(recursive)
+
     @property
     def arrays(self):
         """ Returns a dictionary of data descriptors (`Data` objects) used
@@ -683,6 +743,11 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         """
         return self._arrays
 
+    @property
+    def journal(self) -> MutationJournal:
+        """ Returns the journal of mutations to this SDFG since its last incremental validation. """
+        return self._journal
+
     @property
     def process_grids(self):
         """ Returns a dictionary of process-grid descriptors (`ProcessGrid` objects) used in this SDFG. """
@@ -752,6 +817,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         # Replace inside data descriptors
         for array in self.arrays.values():
             replace_properties_dict(array, repldict, symrepl)
+        self._descriptor_hashes.clear()
+        self._journal.reset()
 
         if replace_in_graph:
             # Replace in inter-state edges
@@ -1094,6 +1161,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             return os.path.join(base_folder, 'single_cache')
         elif cache_config == 'hash':
             # Any change to the SDFG will result in a new cache folder
+            if Config.get_bool('structural_hash'):
+                return os.path.join(base_folder, f'{self.name}_{self.structural_hash()}')
             md5_hash = md5(str(self.to_json()).encode('utf-8')).hexdigest()
             return os.path.join(base_folder, f'{self.name}_{md5_hash}')
         elif cache_config == 'unique':
@@ -1135,6 +1204,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
                                          f"{node} in state {state}.")
 
         del self._arrays[name]
+        self._descriptor_hashes.pop(name, None)
+        self._journal.record('descriptor', None, name)
 
     def reset_sdfg_list(self):
         if self.parent_sdfg is not None:
@@ -1566,7 +1637,13 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
 
         return dtypes.deduplicate(shared)
 
-    def save(self, filename: str, use_pickle=False, hash=None, exception=None, compress=False) -> Optional[str]:
+    def save(self,
+             filename: str,
+             use_pickle=False,
+             hash=None,
+             exception=None,
+             compress=False,
+             binary=False) -> Optional[str]:
         """ Save this SDFG to a file.
 
             :param filename: File name to save to.
@@ -1577,6 +1654,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             :param exception: If not None, stores error information along with
                               SDFG.
             :param compress: If True, uses gzip to compress the file upon saving.
+            :param binary: If True, uses the compact binary SDFG format
+                           (see ``dace.sdfg.binary``) instead of JSON.
             :return: The hash of the SDFG, or None if failed/not requested.
         """
         if compress:
@@ -1593,14 +1672,19 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             with fileopen(filename, "wb") as fp:
                 symbolic.SympyAwarePickler(fp).dump(self)
             if hash is True:
-                return self.hash_sdfg()
+                return self.structural_hash() if Config.get_bool('structural_hash') else self.hash_sdfg()
         else:
             hash = True if hash is None else hash
-            with fileopen(filename, "w") as fp:
-                json_output = self.to_json(hash=hash)
-                if exception:
-                    json_output['error'] = exception.to_json()
-                dace.serialize.dump(json_output, fp)
+            json_output = self.to_json(hash=hash)
+            if exception:
+                json_output['error'] = exception.to_json()
+            if binary:
+                from dace.sdfg import binary as binary_format  # Avoid import loop
+                with (gzip.open(filename, "wb") if compress else open(filename, "wb")) as fp:
+                    fp.write(binary_format.dumps(json_output))
+            else:
+                with fileopen(filename, "w") as fp:
+                    dace.serialize.dump(json_output, fp)
             if hash and 'hash' in json_output['attributes']:
                 return json_output['attributes']['hash']
 
@@ -1616,12 +1700,16 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         view(self, filename=filename)
 
     @staticmethod
-    def _from_file(fp: BinaryIO) -> 'SDFG':
-        firstbyte = fp.read(1)
+    def _from_file(fp: BinaryIO, lazy: bool = False) -> 'SDFG':
+        from dace.sdfg import binary  # Avoid import loop
+
+        prefix = fp.read(len(binary.MAGIC))
         fp.seek(0)
-        if firstbyte == b'{':  # JSON file
+        if prefix[:1] == b'{':  # JSON file
             sdfg_json = json.load(fp)
             sdfg = SDFG.from_json(sdfg_json)
+        elif binary.is_binary(prefix):  # Binary SDFG
+            sdfg = SDFG.from_json(binary.loads(fp.read(), lazy=lazy))
         else:  # Pickle
             sdfg = symbolic.SympyAwareUnpickler(fp).load()
 
@@ -1630,20 +1718,23 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
         return sdfg
 
     @staticmethod
-    def from_file(filename: str) -> 'SDFG':
+    def from_file(filename: str, lazy: bool = False) -> 'SDFG':
         """ Constructs an SDFG from a file.
 
             :param filename: File name to load SDFG from.
+            :param lazy: If True and the file is in the binary SDFG format,
+                         the contents of each state are only loaded upon first
+                         access.
             :return: An SDFG.
         """
         # Try compressed first. If fails, try uncompressed
         try:
             with gzip.open(filename, 'rb') as fp:
-                return SDFG._from_file(fp)
+                return SDFG._from_file(fp, lazy)
         except OSError:
             pass
         with open(filename, "rb") as fp:
-            return SDFG._from_file(fp)
+            return SDFG._from_file(fp, lazy)
 
     # Dynamic SDFG creation API
     ##############################
@@ -2034,6 +2125,7 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             else:
                 raise NameError(f'Array or Stream with name "{name}" already exists in SDFG')
         self._arrays[name] = datadesc
+        self._journal.record('descriptor', None, name)
 
         def _add_symbols(desc: dt.Data):
             if isinstance(desc, dt.Structure):
@@ -2436,8 +2528,8 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             before computing the given state. """
         return (e.src for e in self.bfs_edges(state, reverse=True))
 
-    def validate(self, references: Optional[Set[int]] = None, **context: bool) -> None:
-        validate_sdfg(self, references, **context)
+    def validate(self, references: Optional[Set[int]] = None, incremental: bool = False, **context: bool) -> None:
+        validate_sdfg(self, references, incremental, **context)
 
     def is_valid(self) -> bool:
         """ Returns True if the SDFG is verified correctly (using `validate`).
@@ -2466,9 +2558,16 @@ class SDFG(OrderedDiGraph[SDFGState, InterstateEdge]):
             (safely) and removes redundant arrays.
 
             :note: This is an in-place operation on the SDFG.
+            :note: If the ``optimizer.transformation_cache`` configuration entry is enabled, the result is loaded
+                   from the persistent transformation cache if this SDFG was simplified before. Call
+                   ``invalidate_hash`` after modifying properties of the SDFG directly.
         """
         from dace.transformation.passes.simplify import SimplifyPass
-        return SimplifyPass(validate=validate, validate_all=validate_all, verbose=verbose).apply_pass(self, {})
+        pipeline = SimplifyPass(validate=validate, validate_all=validate_all, verbose=verbose)
+        if Config.get_bool('optimizer', 'transformation_cache') and self.parent_sdfg is None:
+            from dace.transformation.transformation_cache import TransformationCache
+            return TransformationCache().apply_pipeline(pipeline, self)
+        return pipeline.apply_pass(self, {})
 
     def _initialize_transformations_from_type(
         self,
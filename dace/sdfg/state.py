@@ -7,7 +7,7 @@ import copy
 import inspect
 import itertools
 import warnings
-from typing import Any, AnyStr, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union, overload
+from typing import Any, AnyStr, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union, overload
 
 import dace
 from dace import data as dt
@@ -276,53 +276,22 @@ class StateGraphView(object):
     def _clear_scopedict_cache(self):
         """
         Clears the cached results for the scope_dict function.
-        For use when the graph mutates (e.g., new edges/nodes, deletions).
+        For use when the graph mutates in a way that is not tracked (mutations through the state API, e.g., new
+        edges/nodes or deletions, update the scope index incrementally).
         """
-        self._scope_dict_toparent_cached = None
-        self._scope_dict_tochildren_cached = None
-        self._scope_tree_cached = None
-        self._scope_leaves_cached = None
+        from dace.sdfg.scope import ScopeIndex
+        self._scope_index = ScopeIndex(self)
 
-    def scope_tree(self) -> 'dace.sdfg.scope.ScopeTree':
-        from dace.sdfg.scope import ScopeTree
-
-        if (hasattr(self, '_scope_tree_cached') and self._scope_tree_cached is not None):
-            return copy.copy(self._scope_tree_cached)
-
-        sdp = self.scope_dict()
-        sdc = self.scope_children()
-
-        result = {}
-
-        sdfg_symbols = self.parent.symbols.keys()
-
-        # Get scopes
-        for node, scopenodes in sdc.items():
-            if node is None:
-                exit_node = None
-            else:
-                exit_node = next(v for v in scopenodes if isinstance(v, nd.ExitNode))
-            scope = ScopeTree(node, exit_node)
-            result[node] = scope
-
-        # Scope parents and children
-        for node, scope in result.items():
-            if node is not None:
-                scope.parent = result[sdp[node]]
-            scope.children = [result[n] for n in sdc[node] if isinstance(n, nd.EntryNode)]
-
-        self._scope_tree_cached = result
-
-        return copy.copy(self._scope_tree_cached)
+    def scope_tree(self) -> Mapping[Optional[nd.EntryNode], 'dace.sdfg.scope.ScopeTree']:
+        """ Returns a read-only mapping from each scope entry node (or None for the top-level scope) to its scope tree
+            node. """
+        return self._scope_index.tree()
 
     def scope_leaves(self) -> List['dace.sdfg.scope.ScopeTree']:
-        if (hasattr(self, '_scope_leaves_cached') and self._scope_leaves_cached is not None):
-            return copy.copy(self._scope_leaves_cached)
-        st = self.scope_tree()
-        self._scope_leaves_cached = [scope for scope in st.values() if len(scope.children) == 0]
-        return copy.copy(self._scope_leaves_cached)
+        """ Returns a list of the scope tree nodes that do not contain other scopes. """
+        return self._scope_index.leaves()
 
-    def scope_dict(self, return_ids: bool = False, validate: bool = True) -> Dict[nd.Node, Optional[nd.Node]]:
+    def scope_dict(self, return_ids: bool = False, validate: bool = True) -> Mapping[nd.Node, Optional[nd.Node]]:
         """ Returns a dictionary that maps each SDFG node to its parent entry
             node, or to None if the node is not in any scope.
 
@@ -330,33 +299,11 @@ class StateGraphView(object):
             :param validate: Ensure that the graph is not malformed when
                              computing dictionary.
             :return: The mapping from a node to its parent scope entry node.
+                     The mapping is a read-only view that does not change
+                     when the state is modified.
         """
-        from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        result = copy.copy(self._scope_dict_toparent_cached)
-
-        if result is None:
-            result = {}
-            node_queue = collections.deque(self.source_nodes())
-            eq = _scope_dict_inner(self, node_queue, None, False, result)
-
-            # Sanity checks
-            if validate and len(eq) != 0:
-                cycles = list(self.find_cycles())
-                if cycles:
-                    raise ValueError('Found cycles in state %s: %s' % (self.label, cycles))
-                raise RuntimeError("Leftover nodes in queue: {}".format(eq))
-
-            if validate and len(result) != self.number_of_nodes():
-                cycles = list(self.find_cycles())
-                if cycles:
-                    raise ValueError('Found cycles in state %s: %s' % (self.label, cycles))
-                leftover_nodes = set(self.nodes()) - result.keys()
-                raise RuntimeError("Some nodes were not processed: {}".format(leftover_nodes))
-
-            # Cache result
-            self._scope_dict_toparent_cached = result
-            result = copy.copy(result)
+        from dace.sdfg.scope import _scope_dict_to_ids
+        result = self._scope_index.parents(validate)
 
         if return_ids:
             return _scope_dict_to_ids(self, result)
@@ -364,7 +311,7 @@ class StateGraphView(object):
 
     def scope_children(self,
                        return_ids: bool = False,
-                       validate: bool = True) -> Dict[Optional[nd.EntryNode], List[nd.Node]]:
+                       validate: bool = True) -> Mapping[Optional[nd.EntryNode], List[nd.Node]]:
         """ Returns a dictionary that maps each SDFG entry node to its children,
             not including the children of children entry nodes. The key `None`
             contains a list of top-level nodes (i.e., not in any scope).
@@ -373,34 +320,11 @@ class StateGraphView(object):
             :param validate: Ensure that the graph is not malformed when
                              computing dictionary.
             :return: The mapping from a node to a list of children nodes.
+                     The mapping is a read-only view that does not change
+                     when the state is modified.
         """
-        from dace.sdfg.scope import _scope_dict_inner, _scope_dict_to_ids
-        result = None
-        if self._scope_dict_tochildren_cached is not None:
-            result = copy.copy(self._scope_dict_tochildren_cached)
-
-        if result is None:
-            result = {}
-            node_queue = collections.deque(self.source_nodes())
-            eq = _scope_dict_inner(self, node_queue, None, True, result)
-
-            # Sanity checks
-            if validate and len(eq) != 0:
-                cycles = self.find_cycles()
-                if cycles:
-                    raise ValueError('Found cycles in state %s: %s' % (self.label, list(cycles)))
-                raise RuntimeError("Leftover nodes in queue: {}".format(eq))
-
-            entry_nodes = set(n for n in self.nodes() if isinstance(n, nd.EntryNode)) | {None}
-            if (validate and len(result) != len(entry_nodes)):
-                cycles = self.find_cycles()
-                if cycles:
-                    raise ValueError('Found cycles in state %s: %s' % (self.label, list(cycles)))
-                raise RuntimeError("Some nodes were not processed: {}".format(entry_nodes - result.keys()))
-
-            # Cache result
-            self._scope_dict_tochildren_cached = result
-            result = copy.copy(result)
+        from dace.sdfg.scope import _scope_dict_to_ids
+        result = self._scope_index.children(validate)
 
         if return_ids:
             return _scope_dict_to_ids(self, result)
@@ -530,12 +454,16 @@ class StateGraphView(object):
                     in_edges = sg.in_edges(n)
                     out_edges = sg.out_edges(n)
                     # Filter out memlets which go out but the same data is written to the AccessNode by another memlet
-                    for out_edge in list(out_edges):
-                        for in_edge in list(in_edges):
-                            if (in_edge.data.data == out_edge.data.data and
-                                    in_edge.data.dst_subset.covers(out_edge.data.src_subset)):
+                    for data in dict.fromkeys(e.data.data for e in in_edges):
+                        writes = [e for e in in_edges if e.data.data == data]
+                        reads = [e for e in out_edges if e.data.data == data]
+                        if not reads:
+                            continue
+                        covered = sbs.SubsetBatch([e.data.dst_subset for e in writes]).covers_any(
+                            sbs.SubsetBatch([e.data.src_subset for e in reads]))
+                        for out_edge, is_covered in zip(reads, covered):
+                            if is_covered:
                                 out_edges.remove(out_edge)
-                                break
 
                     for e in in_edges:
                         # skip empty memlets
@@ -732,6 +660,8 @@ class StateGraphView(object):
         """
         from dace.sdfg.replace import replace
         replace(self, name, new_name)
+        self._graph.invalidate_hash()
+        self._graph._record_mutation('state')
 
     def replace_dict(self,
                      repl: Dict[str, str],
@@ -743,6 +673,8 @@ class StateGraphView(object):
         """
         from dace.sdfg.replace import replace_dict
         replace_dict(self, repl, symrepl)
+        self._graph.invalidate_hash()
+        self._graph._record_mutation('state')
 
 
 @make_properties
@@ -795,6 +727,7 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         self._parent: SDFG = sdfg
         self._graph = self  # Allowing MemletTrackingView mixin to work
         self._clear_scopedict_cache()
+        self.invalidate_hash()
         self._debuginfo = debuginfo
         self.is_collapsed = False
         self.nosync = False
@@ -802,6 +735,8 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         self._default_lineinfo = None
     
     def __deepcopy__(self, memo):
+        if '_lazy_contents' in self.__dict__:
+            self.nodes()  # Materialize state contents
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
@@ -875,12 +810,17 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
             node.sdfg.parent = self
             node.sdfg.parent_sdfg = self.parent
             node.sdfg.parent_nsdfg_node = node
-        self._clear_scopedict_cache()
-        return super(SDFGState, self).add_node(node)
+        self.invalidate_hash()
+        self._record_mutation('node', node)
+        result = super(SDFGState, self).add_node(node)
+        self._scope_index.node_added(node)
+        return result
 
     def remove_node(self, node):
-        self._clear_scopedict_cache()
+        self.invalidate_hash()
+        self._record_mutation('remove_node', node)
         super(SDFGState, self).remove_node(node)
+        self._scope_index.node_removed(node)
 
     def add_edge(self, u, u_connector, v, v_connector, memlet):
         if not isinstance(u, nd.Node):
@@ -899,23 +839,80 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         if v_connector and isinstance(v, nd.AccessNode) and v_connector not in v.in_connectors:
             v.add_in_connector(v_connector, force=True)
 
-        self._clear_scopedict_cache()
+        self.invalidate_hash()
         result = super(SDFGState, self).add_edge(u, u_connector, v, v_connector, memlet)
+        self._scope_index.edge_added(result)
         memlet.try_initialize(self.parent, self, result)
+        self._record_mutation('edge', result)
         return result
 
     def remove_edge(self, edge):
-        self._clear_scopedict_cache()
+        self.invalidate_hash()
+        self._record_mutation('edge', edge)
         super(SDFGState, self).remove_edge(edge)
+        self._scope_index.edge_removed(edge)
 
     def remove_edge_and_connectors(self, edge):
-        self._clear_scopedict_cache()
+        self.invalidate_hash()
+        self._record_mutation('edge', edge)
         super(SDFGState, self).remove_edge(edge)
+        self._scope_index.edge_removed(edge)
         if edge.src_conn in edge.src.out_connectors:
             edge.src.remove_out_connector(edge.src_conn)
         if edge.dst_conn in edge.dst.in_connectors:
             edge.dst.remove_in_connector(edge.dst_conn)
 
+    def _record_mutation(self, kind: str, obj: Any = None):
+        """ Records a mutation of this state in the journal of its parent SDFG (see ``MutationJournal``). """
+        if self._parent is not None:
+            self._parent.journal.record(kind, self, obj)
+
+    def invalidate_hash(self):
+        """
+        Clears the cached structural hash of this state. Called automatically upon graph mutation, and should be
+        called manually if node or memlet properties are modified directly.
+        """
+        self._structural_hash_cached = None
+        self._nested_sdfg_nodes_cached = None
+
+    def structural_hash(self) -> str:
+        """
+        Returns a hash of the contents of this state. The digest of the state itself is cached until the state is
+        mutated, and is combined with the (separately cached) hashes of the nested SDFGs it contains.
+
+        :return: The hash (in SHA-256 format).
+        :see: SDFG.structural_hash
+        """
+        from dace.sdfg.sdfg import STRUCTURAL_HASH_IGNORED_KEYS  # Avoid import loop
+
+        digest = self._structural_hash_cached
+        if digest is None:
+            node_ids = {node: i for i, node in enumerate(self.nodes())}
+            nodes = []
+            for node in self.nodes():
+                if isinstance(node, nd.NestedSDFG):
+                    # Nested SDFG contents are hashed separately
+                    attributes = {p.attr_name: p.to_json(v) for p, v in node.properties() if p.attr_name != 'sdfg'}
+                else:
+                    attributes = serialize.all_properties_to_json(node)
+                nodes.append([type(node).__name__, attributes])
+            edges = sorted(([node_ids[e.src], e.src_conn or '', node_ids[e.dst], e.dst_conn or '',
+                             e.data.to_json()] for e in self.edges()),
+                           key=lambda e: e[:4])
+            digest = serialize.hash_json([self.label, serialize.all_properties_to_json(self), nodes, edges],
+                                         STRUCTURAL_HASH_IGNORED_KEYS)
+            # The nested SDFG nodes are stored before the digest, so that concurrent calls (e.g., from analysis
+            # passes running in parallel) that find the digest also find the nodes
+            self._nested_sdfg_nodes_cached = [
+                node for node in self.nodes() if isinstance(node, nd.NestedSDFG) and node.sdfg is not None
+            ]
+            self._structural_hash_cached = digest
+
+        nested = self._nested_sdfg_nodes_cached
+        if not nested:
+            return digest
+        return serialize.hash_json([digest] + [node.sdfg.structural_hash() for node in nested])
+
     def to_json(self, parent=None):
         # Create scope dictionary with a failsafe
         try:
@@ -954,10 +951,6 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         if _type != cls.__name__:
             raise Exception("Class type mismatch")
 
-        attrs = json_obj['attributes']
-        nodes = json_obj['nodes']
-        edges = json_obj['edges']
-
         ret = SDFGState(label=json_obj['label'], sdfg=context['sdfg'], debuginfo=None)
 
         rec_ci = {
@@ -967,28 +960,52 @@ class SDFGState(OrderedMultiDiConnectorGraph[nd.Node, mm.Memlet], StateGraphView
         }
         serialize.set_properties_from_json(ret, json_obj, rec_ci)
 
+        if 'contents' in json_obj:
+            # Contents are loaded upon first access (see ``dace.sdfg.binary``)
+            del ret._nx, ret._nodes, ret._edges
+            ret._lazy_contents = (json_obj['contents'], rec_ci['callback'])
+            return ret
+
+        ret._add_contents_from_json(json_obj['nodes'], json_obj['edges'], rec_ci)
+        return ret
+
+    def _add_contents_from_json(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], context: Dict[str,
+                                                                                                              Any]):
         for n in nodes:
-            nret = serialize.from_json(n, context=rec_ci)
-            ret.add_node(nret)
+            nret = serialize.from_json(n, context=context)
+            self.add_node(nret)
 
         # Connect using the edges
         for e in edges:
-            eret = serialize.from_json(e, context=rec_ci)
+            eret = serialize.from_json(e, context=context)
 
-            ret.add_edge(eret.src, eret.src_conn, eret.dst, eret.dst_conn, eret.data)
+            self.add_edge(eret.src, eret.src_conn, eret.dst, eret.dst_conn, eret.data)
 
         # Fix potentially broken scopes
         for n in nodes:
             if isinstance(n, nd.MapExit):
-                n.map = ret.entry_node(n).map
+                n.map = self.entry_node(n).map
             elif isinstance(n, nd.ConsumeExit):
-                n.consume = ret.entry_node(n).consume
+                n.consume = self.entry_node(n).consume
 
         # Reinitialize memlets
-        for edge in ret.edges():
-            edge.data.try_initialize(context['sdfg'], ret, edge)
-
-        return ret
+        for edge in self.edges():
+            edge.data.try_initialize(context['sdfg'], self, edge)
+
+    def __getattr__(self, name):
+        # Materializes the graph of lazily-loaded states upon first access
+        if name in ('_nx', '_nodes', '_edges') and '_lazy_contents' in self.__dict__:
+            load_contents, callback = self.__dict__.pop('_lazy_contents')
+            OrderedMultiDiConnectorGraph.__init__(self)
+            nodes, edges = load_contents()
+            self._add_contents_from_json(nodes, edges, {'sdfg': self.parent, 'sdfg_state': self, 'callback': callback})
+            return getattr(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __getstate__(self):
+        if '_lazy_contents' in self.__dict__:
+            self.nodes()  # Materialize state contents
+        return self.__dict__
 
     def _repr_html_(self):
         """ HTML representation of a state, used mainly for Jupyter
@@ -3,7 +3,7 @@
 import copy
 from dace.dtypes import DebugInfo, StorageType
 import os
-from typing import TYPE_CHECKING, Dict, List, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 import warnings
 from dace import dtypes, data as dt, subsets
 from dace import symbolic
@@ -18,6 +18,193 @@ if TYPE_CHECKING:
 # Validation
 
 
+class MutationJournal(object):
+    """
+    Records the mutations of an SDFG since it was last validated incrementally (see ``validate_sdfg``): nodes and
+    edges that were added to or removed from its states, states that were modified in place, and changed data
+    descriptors. Mutations through the graph and data descriptor APIs are recorded automatically. Direct modifications
+    of data descriptors, memlets, and connectors are detected by comparing their fingerprints with those of the last
+    validation. Direct modifications of other node properties are not, and should be registered with
+    ``mark_modified`` (transformations applied through the transformation API do so for the graph they were applied
+    to).
+    """
+
+    #: Maximal number of journal entries, after which the next validation is a full validation
+    max_entries = 100000
+
+    def __init__(self):
+        self.entries: List[Tuple[str, Any, Any]] = []
+        # Validated states and the context they were validated in, or None if not validated incrementally
+        self._states: Optional[Dict['dace.SDFGState', Tuple[Any, ...]]] = None
+        self._descriptors: Dict[str, Tuple[Any, ...]] = {}
+        self._elements: Dict['dace.SDFGState', Dict[Any, Tuple[Any, ...]]] = {}
+
+    @property
+    def validated(self) -> bool:
+        """ Returns True if the SDFG was validated incrementally, i.e., if mutations are being recorded. """
+        return self._states is not None
+
+    def record(self, kind: str, graph: Any, obj: Any = None) -> None:
+        """
+        Records a mutation.
+
+        :param kind: The kind of mutation: ``'node'`` (added or modified node), ``'remove_node'``, ``'edge'`` (added
+                     or removed edge), ``'state'`` (state modified in place), or ``'descriptor'``.
+        :param graph: The modified state.
+        :param obj: The node, edge, or data descriptor name that was modified.
+        """
+        if self._states is None:
+            return
+        if len(self.entries) >= self.max_entries:
+            self.reset()
+            return
+        self.entries.append((kind, graph, obj))
+
+    def mark_modified(self, graph: Union['dace.SDFG', 'dace.SDFGState'], nodes: Optional[List[Any]] = None) -> None:
+        """
+        Marks a graph as modified in place, e.g., after modifying properties of its nodes or memlets.
+
+        :param graph: The modified state. If an SDFG is given, the entire SDFG is validated again.
+        :param nodes: If given, only these nodes of the state (and memlets adjacent to them) were modified.
+        """
+        from dace.sdfg import SDFG  # Avoid import loop
+        if isinstance(graph, SDFG):
+            self.reset()
+        elif nodes is None:
+            self.record('state', graph)
+        else:
+            for node in nodes:
+                self.record('node', graph, node)
+
+    def reset(self) -> None:
+        """ Clears the journal, such that the next validation is a full validation. """
+        self.entries.clear()
+        self._states = None
+        self._descriptors = {}
+        self._elements = {}
+
+    def validated_context(self, state: 'dace.SDFGState') -> Optional[Tuple[Any, ...]]:
+        """ Returns the context in which a state was last validated, or None if it was not validated. """
+        return self._states.get(state) if self._states is not None else None
+
+    def modified_nodes(
+        self, sdfg: 'dace.SDFG', descriptors: Dict[str, Tuple[Any, ...]],
+        elements: Dict['dace.SDFGState', Dict[Any, Tuple[Any, ...]]]
+    ) -> Optional[Dict['dace.SDFGState', Optional[Set[Any]]]]:
+        """
+        Collects the nodes that need to be validated again.
+
+        :param sdfg: The SDFG this journal belongs to.
+        :param descriptors: The current fingerprints of the data descriptors of the SDFG.
+        :param elements: The current fingerprints of the memlets and node connectors of every state (see
+                         ``_element_fingerprints``).
+        :return: A dictionary mapping modified states to their modified nodes (or None if the entire state needs to
+                 be validated), or None if the SDFG was not validated incrementally before.
+        """
+        from dace.sdfg import nodes as nd  # Avoid import loop
+        if self._states is None:
+            return None
+
+        result: Dict['dace.SDFGState', Optional[Set[Any]]] = {}
+
+        def mark(state, nodes=None):
+            if nodes is None:
+                result[state] = None
+            elif result.setdefault(state, set()) is not None:
+                result[state].update(nodes)
+
+        changed = {name for name in descriptors.keys() | self._descriptors.keys()
+                   if descriptors.get(name) != self._descriptors.get(name)}
+        for kind, graph, obj in self.entries:
+            if kind == 'state':
+                mark(graph)
+            elif kind == 'node':
+                if obj in graph.nx:
+                    mark(graph, [obj])
+            elif kind == 'remove_node':
+                # Removing a scope node changes the scopes of other nodes
+                if isinstance(obj, (nd.EntryNode, nd.ExitNode)):
+                    mark(graph)
+            elif kind == 'edge':
+                mark(graph, [n for n in (obj.src, obj.dst) if n in graph.nx])
+            elif kind == 'descriptor':
+                changed.add(obj)
+
+        # Memlets and connectors modified in place
+        for state, fingerprints in elements.items():
+            validated = self._elements.get(state)
+            if validated is None:
+                continue
+            modified = []
+            for element, fingerprint in fingerprints.items():
+                if validated.get(element, fingerprint) != fingerprint:
+                    modified.extend((element, ) if isinstance(element, nd.Node) else (element.src, element.dst))
+            if modified:
+                mark(state, modified)
+
+        # Nodes and memlets that use modified data descriptors
+        if changed:
+            for state in sdfg.nodes():
+                modified = [n for n in state.data_nodes() if n.data in changed]
+                modified.extend(n for e in state.edges() if e.data.data in changed for n in (e.src, e.dst))
+                if modified:
+                    mark(state, modified)
+
+        # Scope entry and exit nodes are validated together
+        for state, nodes in result.items():
+            if not nodes:
+                continue
+            try:
+                for node in list(nodes):
+                    if isinstance(node, nd.EntryNode):
+                        nodes.add(state.exit_node(node))
+                    elif isinstance(node, nd.ExitNode):
+                        nodes.add(state.entry_node(node))
+            except Exception:  # Invalid scopes are reported by a full validation of the state
+                result[state] = None
+
+        return result
+
+    def commit(self, states: Dict['dace.SDFGState', Tuple[Any, ...]], descriptors: Dict[str, Tuple[Any, ...]],
+               elements: Dict['dace.SDFGState', Dict[Any, Tuple[Any, ...]]]) -> None:
+        """ Clears the journal after a successful incremental validation. """
+        self.entries.clear()
+        self._states = states
+        self._descriptors = descriptors
+        self._elements = elements
+
+
+def _descriptor_fingerprint(desc: dt.Data) -> Tuple[Any, ...]:
+    """ Returns the properties of a data descriptor that affect the validity of its uses. """
+    return (type(desc), desc.dtype, tuple(desc.shape), tuple(getattr(desc, 'strides', ())),
+            tuple(getattr(desc, 'offset', ())), getattr(desc, 'veclen', 1), desc.storage, desc.lifetime,
+            desc.transient)
+
+
+def _subset_fingerprint(subset: Optional[subsets.Subset]) -> Any:
+    if isinstance(subset, subsets.Range):
+        return tuple(subset.ranges), tuple(subset.tile_sizes)
+    if isinstance(subset, subsets.Indices):
+        return tuple(subset.indices)
+    return subset
+
+
+def _element_fingerprints(sdfg: 'dace.SDFG') -> Dict['dace.SDFGState', Dict[Any, Tuple[Any, ...]]]:
+    """ Returns the properties of the memlets and node connectors of every state that affect their validity. """
+    result = {}
+    for state in sdfg.nodes():
+        fingerprints = {}
+        for node in state.nodes():
+            fingerprints[node] = (tuple(node.in_connectors.items()), tuple(node.out_connectors.items()))
+        for edge in state.edges():
+            memlet = edge.data
+            fingerprints[edge] = (edge.src_conn, edge.dst_conn, memlet.data, _subset_fingerprint(memlet.subset),
+                                  _subset_fingerprint(memlet.other_subset), memlet.volume, memlet.dynamic, memlet.wcr,
+                                  memlet.allow_oob)
+        result[state] = fingerprints
+    return result
+
+
 def validate(graph: 'dace.sdfg.graph.SubgraphView'):
     from dace.sdfg import SDFG, SDFGState, SubgraphView
     gtype = graph.parent if isinstance(graph, SubgraphView) else graph
@@ -27,12 +214,18 @@ def validate(graph: 'dace.sdfg.graph.SubgraphView'):
         validate_state(graph)
 
 
-def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context: bool):
+def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, incremental: bool = False, **context: bool):
     """ Verifies the correctness of an SDFG by applying multiple tests.
     
         :param sdfg: The SDFG to verify.
         :param references: An optional set keeping seen IDs for object
                            miscopy validation.
+        :param incremental: If True, only validates the nodes and memlets
+                            that were modified since the last incremental
+                            validation, according to the mutation journal
+                            of the SDFG (see ``MutationJournal``). The
+                            first incremental validation of an SDFG is a
+                            full validation.
         :param context: An optional dictionary of boolean attributes
                         used to understand the context of this validation
                         (e.g., is this in a GPU kernel).
@@ -53,6 +246,13 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context
             'rather than using multiple references to the same one', sdfg, None)
     references.add(id(sdfg))
 
+    journal: Optional[MutationJournal] = sdfg.journal if incremental else None
+    if journal is not None:
+        descriptors = {name: _descriptor_fingerprint(desc) for name, desc in sdfg._arrays.items()}
+        elements = _element_fingerprints(sdfg)
+        modified = journal.modified_nodes(sdfg, descriptors, elements)
+        state_contexts = {}
+
     try:
         # SDFG-level checks
         if not dtypes.validate_name(sdfg.name):
@@ -125,6 +325,18 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context
                 symbols[str(sym)] = sym.dtype
         visited = set()
         visited_edges = set()
+
+        def check_state(state: 'dace.sdfg.SDFGState'):
+            nodes = None
+            if journal is not None:
+                # States are validated again if the symbols or context they are validated in change
+                state_context = (frozenset(symbols.keys()), context['in_gpu'], context['in_fpga'])
+                state_contexts[state] = state_context
+                if modified is not None and journal.validated_context(state) == state_context:
+                    nodes = modified.get(state, set())
+            validate_state(state, sdfg.node_id(state), sdfg, symbols, initialized_transients, references, nodes,
+                           **context)
+
         # Run through states via DFS, ensuring that only the defined symbols
         # are available for validation
         for edge in sdfg.dfs_edges(start_state):
@@ -147,8 +359,7 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context
             # Source
             if edge.src not in visited:
                 visited.add(edge.src)
-                validate_state(edge.src, sdfg.node_id(edge.src), sdfg, symbols, initialized_transients, references,
-                               **context)
+                check_state(edge.src)
 
             ##########################################
             # Edge
@@ -192,14 +403,12 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context
             # Destination
             if edge.dst not in visited:
                 visited.add(edge.dst)
-                validate_state(edge.dst, sdfg.node_id(edge.dst), sdfg, symbols, initialized_transients, references,
-                               **context)
+                check_state(edge.dst)
         # End of state DFS
 
         # If there is only one state, the DFS will miss it
         if start_state not in visited:
-            validate_state(start_state, sdfg.node_id(start_state), sdfg, symbols, initialized_transients, references,
-                           **context)
+            check_state(start_state)
 
         # Validate all inter-state edges (including self-loops not found by DFS)
         for eid, edge in enumerate(sdfg.edges()):
@@ -240,7 +449,13 @@ def validate_sdfg(sdfg: 'dace.sdfg.SDFG', references: Set[int] = None, **context
                             f'Trying to read an inaccessible data container "{container}" '
                             f'(Storage: {sdfg.arrays[container].storage}) in host code interstate edge', sdfg, eid)
 
+        if journal is not None:
+            journal.commit(state_contexts, descriptors, elements)
+
     except InvalidSDFGError as ex:
+        if journal is not None:
+            journal.reset()
+
         # If the SDFG is invalid, save it
         fpath = os.path.join('_dacegraphs', 'invalid.sdfg')
         sdfg.save(fpath, exception=ex)
@@ -299,10 +514,15 @@ def validate_state(state: 'dace.sdfg.SDFGState',
                    symbols: Dict[str, dtypes.typeclass] = None,
                    initialized_transients: Set[str] = None,
                    references: Set[int] = None,
+                   nodes: Optional[Set['dace.sdfg.nodes.Node']] = None,
                    **context: bool):
     """ Verifies the correctness of an SDFG state by applying multiple
         tests. Raises an InvalidSDFGError with the erroneous node on
         failure.
+
+        :param nodes: If given, only validates these nodes and the memlet
+                      trees adjacent to them, and validates nested SDFGs
+                      in other nodes incrementally (see ``validate_sdfg``).
     """
     # Avoid import loops
     from dace import data as dt
@@ -349,6 +569,13 @@ def validate_state(state: 'dace.sdfg.SDFGState',
     if state.has_cycles():
         raise InvalidSDFGError('State should be acyclic but contains cycles', sdfg, state_id)
 
+    edges = None
+    if nodes is not None:
+        edges = set()
+        for node in nodes:
+            for e in state.all_edges(node):
+                edges.update(state.memlet_tree(e))
+
     for nid, node in enumerate(state.nodes()):
         # Reference check
         if id(node) in references:
@@ -357,6 +584,21 @@ def validate_state(state: 'dace.sdfg.SDFGState',
                 'rather than using multiple references to the same one', sdfg, state_id, nid)
         references.add(id(node))
 
+        if nodes is not None and node not in nodes:
+            # Unmodified node: register initialized transients and validate nested SDFGs incrementally
+            if isinstance(node, nd.AccessNode):
+                arr = sdfg.arrays.get(node.data)
+                if arr is not None and arr.transient and state.in_degree(node) > 0:
+                    initialized_transients.add(node.data)
+            elif isinstance(node, nd.NestedSDFG):
+                try:
+                    node.validate(sdfg, state, references, incremental=True, **context)
+                except InvalidSDFGError:
+                    raise
+                except Exception as ex:
+                    raise InvalidSDFGNodeError("Node validation failed: " + str(ex), sdfg, state_id, nid) from ex
+            continue
+
         # Node validation
         try:
             if isinstance(node, nd.NestedSDFG):
@@ -566,6 +808,9 @@ def validate_state(state: 'dace.sdfg.SDFGState',
                 'rather than using multiple references to the same one', sdfg, state_id, eid)
         references.add(id(e.data))
 
+        if edges is not None and e not in edges:
+            continue
+
         # Edge validation
         try:
             e.data.validate(sdfg, state)
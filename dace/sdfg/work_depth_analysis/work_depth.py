@@ -4,10 +4,13 @@ from command line as a Python script. """
 
 import argparse
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing as mp
 from dace.sdfg import nodes as nd, propagation, InterstateEdge
 from dace import SDFG, SDFGState, dtypes
 from dace.subsets import Range
-from typing import Tuple, Dict
+from typing import Any, Callable, Tuple, Dict, Optional
 import os
 import sympy as sp
 from copy import deepcopy
@@ -18,7 +21,12 @@ import ast
 import astunparse
 import warnings
 
-from dace.sdfg.work_depth_analysis.helpers import get_uuid, find_loop_guards_tails_exits
+from dace.sdfg.work_depth_analysis.helpers import get_uuid, find_loop_guards_tails_exits, ids_to_string, UUID_SEPARATOR
+
+#: Cache of nested SDFG results. Maps a (structural hash, tasklet analysis function, symbol mapping) key to the
+#: (work, depth) of the SDFG and the work depth map entries of its elements, keyed by IDs relative to the SDFG.
+WorkDepthCache = Dict[Tuple[str, Callable, Tuple[Tuple[str, str], ...]],
+                      Tuple[Tuple[sp.Expr, sp.Expr], Dict[Tuple[int, ...], Tuple[sp.Expr, sp.Expr]]]]
 
 
 def get_array_size_symbols(sdfg):
@@ -74,6 +82,19 @@ def evaluate_symbols(base, new):
     return result
 
 
+def simplify(expr):
+    """
+    Simplifies a sympy expression. Numbers, which are the common case when analyzing with concrete symbol values,
+    are returned as-is without invoking ``sympy.simplify``.
+
+    :param expr: The expression to simplify.
+    """
+    expr = sp.sympify(expr)
+    if expr.is_Number:
+        return expr
+    return sp.simplify(expr)
+
+
 def count_work_matmul(node, symbols, state):
     A_memlet = next(e for e in state.in_edges(node) if e.dst_conn == '_a')
     B_memlet = next(e for e in state.in_edges(node) if e.dst_conn == '_b')
@@ -191,13 +212,21 @@ class ArithmeticCounter(ast.NodeVisitor):
         raise NotImplementedError
 
 
+@functools.lru_cache(maxsize=4096)
+def _count_arithmetic_ops_string(code: str) -> int:
+    ctr = ArithmeticCounter()
+    ctr.visit(ast.parse(code))
+    return ctr.count
+
+
 def count_arithmetic_ops_code(code):
+    if isinstance(code, str):
+        # Identical code (e.g., the same tasklet in multiple nested SDFGs) is only parsed and counted once
+        return _count_arithmetic_ops_string(code)
     ctr = ArithmeticCounter()
     if isinstance(code, (tuple, list)):
         for stmt in code:
             ctr.visit(stmt)
-    elif isinstance(code, str):
-        ctr.visit(ast.parse(code))
     else:
         ctr.visit(code)
     return ctr.count
@@ -241,15 +270,7 @@ class DepthCounter(ast.NodeVisitor):
 
 def count_depth_code(code):
     # so far this is the same as the work counter, since work = depth for each tasklet, as we can't assume any parallelism
-    ctr = ArithmeticCounter()
-    if isinstance(code, (tuple, list)):
-        for stmt in code:
-            ctr.visit(stmt)
-    elif isinstance(code, str):
-        ctr.visit(ast.parse(code))
-    else:
-        ctr.visit(code)
-    return ctr.count
+    return count_arithmetic_ops_code(code)
 
 
 def tasklet_work(tasklet_node, state):
@@ -258,7 +279,7 @@ def tasklet_work(tasklet_node, state):
             return bigo(oedge.data.num_accesses)
 
     elif tasklet_node.code.language == dtypes.Language.Python:
-        return count_arithmetic_ops_code(tasklet_node.code.code)
+        return count_arithmetic_ops_code(tasklet_node.code.as_string)
     else:
         # other languages not implemented, count whole tasklet as work of 1
         warnings.warn('Work of tasklets only properly analyzed for Python or CPP. For all other '
@@ -273,7 +294,7 @@ def tasklet_depth(tasklet_node, state):
         for oedge in state.out_edges(tasklet_node):
             return bigo(oedge.data.num_accesses)
     if tasklet_node.code.language == dtypes.Language.Python:
-        return count_depth_code(tasklet_node.code.code)
+        return count_depth_code(tasklet_node.code.as_string)
     else:
         # other languages not implemented, count whole tasklet as work of 1
         warnings.warn('Depth of tasklets only properly analyzed for Python code. For all other '
@@ -293,8 +314,31 @@ def get_tasklet_avg_par(node, state):
     return tasklet_work(node, state), tasklet_depth(node, state)
 
 
-def sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], analyze_tasklet,
-                    symbols) -> Tuple[sp.Expr, sp.Expr]:
+def _cache_key(sdfg: SDFG, analyze_tasklet, symbols) -> Tuple[str, Callable, Tuple[Tuple[str, str], ...]]:
+    return (sdfg.structural_hash(), analyze_tasklet, tuple(sorted((str(k), str(v)) for k, v in symbols.items())))
+
+
+def _relative_entries(w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]],
+                      sdfg_id: int) -> Dict[Tuple[int, ...], Tuple[sp.Expr, sp.Expr]]:
+    """ Converts work depth map entries of an SDFG and its nested SDFGs to IDs relative to the SDFG. """
+    result = {}
+    for uuid, value in w_d_map.items():
+        ids = tuple(int(i) for i in uuid.split(UUID_SEPARATOR))
+        result[(ids[0] - sdfg_id, ) + ids[1:]] = value
+    return result
+
+
+def _absolute_entries(entries: Dict[Tuple[int, ...], Tuple[sp.Expr, sp.Expr]],
+                      sdfg_id: int) -> Dict[str, Tuple[sp.Expr, sp.Expr]]:
+    """ Inverse of ``_relative_entries``. """
+    return {ids_to_string(ids[0] + sdfg_id, *ids[1:]): value for ids, value in entries.items()}
+
+
+def sdfg_work_depth(sdfg: SDFG,
+                    w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]],
+                    analyze_tasklet,
+                    symbols,
+                    cache: Optional[WorkDepthCache] = None) -> Tuple[sp.Expr, sp.Expr]:
     """
     Analyze the work and depth of a given SDFG.
     First we determine the work and depth of each state. Then we break loops in the state machine, such that we get a DAG.
@@ -304,18 +348,36 @@ def sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], ana
     :param w_d_map: Dictionary which will save the result.
     :param analyze_tasklet: Function used to analyze tasklet nodes.
     :param symbols: A dictionary mapping local nested SDFG symbols to global symbols.
+    :param cache: An optional cache of SDFG results. If given, SDFGs (including nested SDFGs) with the same structure
+                  and symbol mapping as a cached one are not analyzed again.
     :return: A tuple containing the work and depth of the SDFG.
     """
+    if cache is None:
+        return _sdfg_work_depth(sdfg, w_d_map, analyze_tasklet, symbols, cache)
+
+    # The key is computed before the analysis, which modifies the SDFG's state machine
+    key = _cache_key(sdfg, analyze_tasklet, symbols)
+    sdfg_id = sdfg.sdfg_id
+    if key not in cache:
+        sdfg_map = {}
+        result = _sdfg_work_depth(sdfg, sdfg_map, analyze_tasklet, symbols, cache)
+        cache[key] = (result, _relative_entries(sdfg_map, sdfg_id))
+    result, entries = cache[key]
+    w_d_map.update(_absolute_entries(entries, sdfg_id))
+    return result
+
 
+def _sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], analyze_tasklet, symbols,
+                     cache: Optional[WorkDepthCache]) -> Tuple[sp.Expr, sp.Expr]:
     # First determine the work and depth of each state individually.
     # Keep track of the work and depth for each state in a dictionary, where work and depth are multiplied by the number
     # of times the state will be executed.
     state_depths: Dict[SDFGState, sp.Expr] = {}
     state_works: Dict[SDFGState, sp.Expr] = {}
     for state in sdfg.nodes():
-        state_work, state_depth = state_work_depth(state, w_d_map, analyze_tasklet, symbols)
-        state_works[state] = sp.simplify(state_work * state.executions)
-        state_depths[state] = sp.simplify(state_depth * state.executions)
+        state_work, state_depth = state_work_depth(state, w_d_map, analyze_tasklet, symbols, cache)
+        state_works[state] = simplify(state_work * state.executions)
+        state_depths[state] = simplify(state_depth * state.executions)
         w_d_map[get_uuid(state)] = (state_works[state], state_depths[state])
 
     # Prepare the SDFG for a depth analysis by breaking loops. This removes the edge between the last loop state and
@@ -361,8 +423,8 @@ def sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], ana
         if ie is not None:
             visited.add(ie)
 
-        n_depth = sp.simplify(depth + state_depths[state])
-        n_work = sp.simplify(work + state_works[state])
+        n_depth = simplify(depth + state_depths[state])
+        n_work = simplify(work + state_works[state])
 
         # If we are analysing average parallelism, we don't search "heaviest" and "deepest" paths separately, but we want one
         # single path with the least average parallelsim (of all paths with more than 0 work).
@@ -372,8 +434,8 @@ def sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], ana
                 if n_depth != 0:
                     # see if we need to update the work and depth of the current state
                     # we update if avg parallelism of new incoming path is less than current avg parallelism
-                    old_avg_par = sp.simplify(work_map[state] / depth_map[state])
-                    new_avg_par = sp.simplify(n_work / n_depth)
+                    old_avg_par = simplify(work_map[state] / depth_map[state])
+                    new_avg_par = simplify(n_work / n_depth)
 
                     if depth_map[state] == 0 or new_avg_par < old_avg_par:
                         # old value was divided by zero or new path gives actually worse avg par, then we keep new value
@@ -408,7 +470,7 @@ def sdfg_work_depth(sdfg: SDFG, w_d_map: Dict[str, Tuple[sp.Expr, sp.Expr]], ana
         raise Exception(
             'Analysis failed, since not all loops got detected. It may help to use more structured loop constructs.')
 
-    sdfg_result = (sp.simplify(max_work), sp.simplify(max_depth))
+    sdfg_result = (simplify(max_work), simplify(max_depth))
     w_d_map[get_uuid(sdfg)] = sdfg_result
     return sdfg_result
 
@@ -417,7 +479,8 @@ def scope_work_depth(state: SDFGState,
                      w_d_map: Dict[str, sp.Expr],
                      analyze_tasklet,
                      symbols,
-                     entry: nd.EntryNode = None) -> Tuple[sp.Expr, sp.Expr]:
+                     entry: nd.EntryNode = None,
+                     cache: Optional[WorkDepthCache] = None) -> Tuple[sp.Expr, sp.Expr]:
     """
     Analyze the work and depth of a scope.
     This works by traversing through the scope analyzing the work and depth of each encountered node.
@@ -432,6 +495,7 @@ def scope_work_depth(state: SDFGState,
     :param state: The state in which the scope to analyze is contained.
     :param sym_map: A dictionary mapping symbols to their values.
     :param entry: The entry node of the scope to analyze. If None, the entire state is analyzed.
+    :param cache: An optional cache of nested SDFG results (see ``sdfg_work_depth``).
     :return: A tuple containing the work and depth of the scope.
     """
 
@@ -447,7 +511,7 @@ def scope_work_depth(state: SDFGState,
         if isinstance(node, nd.EntryNode):
             # If the scope contains an entry node, we need to recursively analyze the sub-scope of the entry node first.
             # The resulting work/depth are summarized into the entry node
-            s_work, s_depth = scope_work_depth(state, w_d_map, analyze_tasklet, symbols, node)
+            s_work, s_depth = scope_work_depth(state, w_d_map, analyze_tasklet, symbols, node, cache)
             # add up work for whole state, but also save work for this sub-scope scope in w_d_map
             work += s_work
             w_d_map[get_uuid(node, state)] = (s_work, s_depth)
@@ -466,7 +530,7 @@ def scope_work_depth(state: SDFGState,
             nested_syms.update(symbols)
             nested_syms.update(evaluate_symbols(symbols, node.symbol_mapping))
             # Nested SDFGs are recursively analyzed first.
-            nsdfg_work, nsdfg_depth = sdfg_work_depth(node.sdfg, w_d_map, analyze_tasklet, nested_syms)
+            nsdfg_work, nsdfg_depth = sdfg_work_depth(node.sdfg, w_d_map, analyze_tasklet, nested_syms, cache)
 
             # add up work for whole state, but also save work for this nested SDFG in w_d_map
             work += nsdfg_work
@@ -486,7 +550,7 @@ def scope_work_depth(state: SDFGState,
             nmap: nd.Map = entry.map
             range: Range = nmap.range
             n_exec = range.num_elements_exact()
-            work = work * sp.simplify(n_exec)
+            work = work * simplify(n_exec)
         else:
             print('WARNING: Only Map scopes are supported in work analysis for now. Assuming 1 iteration.')
 
@@ -516,7 +580,7 @@ def scope_work_depth(state: SDFGState,
             if in_edge is not None:
                 visited.add(in_edge)
 
-            n_depth = sp.simplify(in_depth + w_d_map[get_uuid(node, state)][1])
+            n_depth = simplify(in_depth + w_d_map[get_uuid(node, state)][1])
 
             if node in depth_map:
                 depth_map[node] = sp.Max(depth_map[node], n_depth)
@@ -540,13 +604,16 @@ def scope_work_depth(state: SDFGState,
                 max_depth = sp.Max(max_depth, depth_map[node])
 
     # summarise work / depth of the whole scope in the dictionary
-    scope_result = (sp.simplify(work), sp.simplify(max_depth))
+    scope_result = (simplify(work), simplify(max_depth))
     w_d_map[get_uuid(state)] = scope_result
     return scope_result
 
 
-def state_work_depth(state: SDFGState, w_d_map: Dict[str, sp.Expr], analyze_tasklet,
-                     symbols) -> Tuple[sp.Expr, sp.Expr]:
+def state_work_depth(state: SDFGState,
+                     w_d_map: Dict[str, sp.Expr],
+                     analyze_tasklet,
+                     symbols,
+                     cache: Optional[WorkDepthCache] = None) -> Tuple[sp.Expr, sp.Expr]:
     """
     Analyze the work and depth of a state.
 
@@ -554,13 +621,75 @@ def state_work_depth(state: SDFGState, w_d_map: Dict[str, sp.Expr], analyze_task
     :param w_d_map: The result will be saved to this map.
     :param analyze_tasklet: Function used to analyze tasklet nodes.
     :param symbols: A dictionary mapping local nested SDFG symbols to global symbols.
+    :param cache: An optional cache of nested SDFG results (see ``sdfg_work_depth``).
     :return: A tuple containing the work and depth of the state.
     """
-    work, depth = scope_work_depth(state, w_d_map, analyze_tasklet, symbols, None)
+    work, depth = scope_work_depth(state, w_d_map, analyze_tasklet, symbols, None, cache)
     return work, depth
 
 
-def analyze_sdfg(sdfg: SDFG, w_d_map: Dict[str, sp.Expr], analyze_tasklet) -> None:
+def _substitute_symbol_values(sdfg: SDFG, values: Dict[str, Any]) -> None:
+    """
+    Replaces symbols with concrete values in an SDFG. Values are forwarded to nested SDFGs through their symbol
+    mappings.
+    """
+    sdfg.replace_dict({k: str(v) for k, v in values.items()}, replace_keys=False)
+    for k in values:
+        if k in sdfg.symbols:
+            sdfg.remove_symbol(k)
+    for state in sdfg.nodes():
+        for node in state.nodes():
+            if isinstance(node, nd.NestedSDFG):
+                nested_values = {}
+                for k, v in node.symbol_mapping.items():
+                    v = pystr_to_symbolic(v)
+                    if v.is_Number:
+                        nested_values[k] = v
+                _substitute_symbol_values(node.sdfg, nested_values)
+
+
+def _analyze_nested_sdfg(sdfg_json: Dict[str, Any], analyze_tasklet,
+                         symbols) -> Tuple[Tuple[sp.Expr, sp.Expr], Dict[Tuple[int, ...], Tuple[sp.Expr, sp.Expr]]]:
+    """ Analyzes a serialized nested SDFG in a worker process and returns an entry for ``WorkDepthCache``. """
+    sdfg = SDFG.from_json(sdfg_json)
+    w_d_map = {}
+    result = sdfg_work_depth(sdfg, w_d_map, analyze_tasklet, symbols, {})
+    return result, _relative_entries(w_d_map, 0)
+
+
+def _analyze_nested_sdfgs_parallel(sdfg: SDFG, analyze_tasklet, cache: WorkDepthCache, processes: int) -> None:
+    """
+    Analyzes the uncached nested SDFGs of an SDFG on a process pool and stores their results in the cache. These
+    nested SDFGs are independent of each other, and the subsequent sequential analysis of the SDFG finds them in the
+    cache.
+    """
+    jobs = {}
+    for state in sdfg.nodes():
+        for node in state.nodes():
+            if isinstance(node, nd.NestedSDFG):
+                # Top-level symbols are global, see ``scope_work_depth``
+                nested_syms = evaluate_symbols({}, node.symbol_mapping)
+                key = _cache_key(node.sdfg, analyze_tasklet, nested_syms)
+                if key not in cache and key not in jobs:
+                    jobs[key] = (node.sdfg.to_json(), nested_syms)
+    if len(jobs) < 2:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(processes, len(jobs)), mp_context=mp.get_context('spawn')) as pool:
+        futures = {
+            key: pool.submit(_analyze_nested_sdfg, sdfg_json, analyze_tasklet, nested_syms)
+            for key, (sdfg_json, nested_syms) in jobs.items()
+        }
+        for key, future in futures.items():
+            cache[key] = future.result()
+
+
+def analyze_sdfg(sdfg: SDFG,
+                 w_d_map: Dict[str, sp.Expr],
+                 analyze_tasklet,
+                 symbol_values: Optional[Dict[str, Any]] = None,
+                 cache: Optional[WorkDepthCache] = None,
+                 processes: int = 1) -> None:
     """
     Analyze a given SDFG. We can either analyze work, work and depth or average parallelism.
 
@@ -569,19 +698,37 @@ def analyze_sdfg(sdfg: SDFG, w_d_map: Dict[str, sp.Expr], analyze_tasklet) -> No
     :param sdfg: The SDFG to analyze.
     :param w_d_map: Dictionary of SDFG elements to (work, depth) tuples. Result will be saved in here.
     :param analyze_tasklet: The function used to analyze tasklet nodes. Analyzes either just work, work and depth or average parallelism.
+    :param symbol_values: An optional dictionary of concrete values for (a subset of) the symbols of the SDFG. The
+                          values are substituted before the analysis, such that the results are numbers rather than
+                          symbolic expressions if all symbols are given.
+    :param cache: An optional dictionary that caches the results of (nested) SDFGs. Passing the same dictionary to
+                  multiple calls avoids reanalyzing unchanged SDFGs, e.g., when work and depth are used as a cost
+                  model while transforming an SDFG. Results of identical nested SDFGs are reused within a call
+                  regardless.
+    :param processes: Number of worker processes that analyze the nested SDFGs of the top-level SDFG in parallel.
     """
 
     # deepcopy such that original sdfg not changed
     sdfg = deepcopy(sdfg)
 
+    if symbol_values:
+        _substitute_symbol_values(sdfg, symbol_values)
+
     # Run state propagation for all SDFGs recursively. This is necessary to determine the number of times each state
     # will be executed, or to determine upper bounds for that number (such as in the case of branching)
     for sd in sdfg.all_sdfgs_recursive():
         propagation.propagate_states(sd, concretize_dynamic_unbounded=True)
+    # State propagation modifies state properties directly, which is not tracked by structural hashing
+    sdfg.invalidate_hash()
+
+    if cache is None:
+        cache = {}
+    if processes > 1:
+        _analyze_nested_sdfgs_parallel(sdfg, analyze_tasklet, cache, processes)
 
     # Analyze the work and depth of the SDFG.
     symbols = {}
-    sdfg_work_depth(sdfg, w_d_map, analyze_tasklet, symbols)
+    sdfg_work_depth(sdfg, w_d_map, analyze_tasklet, symbols, cache)
 
     # Note: This posify could be done more often to improve performance.
     array_symbols = get_array_size_symbols(sdfg)
@@ -628,13 +775,13 @@ def main() -> None:
 
     if args.analyze == 'workDepth':
         for k, v, in work_depth_map.items():
-            work_depth_map[k] = (str(sp.simplify(v[0])), str(sp.simplify(v[1])))
+            work_depth_map[k] = (str(simplify(v[0])), str(simplify(v[1])))
     elif args.analyze == 'work':
         for k, v, in work_depth_map.items():
-            work_depth_map[k] = str(sp.simplify(v[0]))
+            work_depth_map[k] = str(simplify(v[0]))
     elif args.analyze == 'avgPar':
         for k, v, in work_depth_map.items():
-            work_depth_map[k] = str(sp.simplify(v[0] / v[1]) if str(v[1]) != '0' else 0)  # work / depth = avg par
+            work_depth_map[k] = str(simplify(v[0] / v[1]) if str(v[1]) != '0' else 0)  # work / depth = avg par
 
     result_whole_sdfg = work_depth_map[get_uuid(sdfg)]
 
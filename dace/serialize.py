@@ -1,5 +1,6 @@
 # Copyright 2019-2021 ETH Zurich and the DaCe authors. All rights reserved.
 import aenum
+from hashlib import sha256
 import json
 import numpy as np
 import warnings
@@ -184,6 +185,28 @@ def all_properties_to_json(object_with_properties):
     return retdict
 
 
+def hash_json(json_obj, ignore_keys=()) -> str:
+    """ Returns a SHA-256 digest of a JSON-serializable object.
+
+        :param json_obj: The object to hash.
+        :param ignore_keys: Dictionary keys (at any depth) that do not take part in the hash. Keys starting with
+                            ``_meta_`` are always ignored.
+        :return: The hash as a hexadecimal string.
+    """
+
+    def remove_keys(obj):
+        if isinstance(obj, dict):
+            return {
+                k: remove_keys(v)
+                for k, v in obj.items() if not (isinstance(k, str) and (k in ignore_keys or k.startswith('_meta_')))
+            }
+        elif isinstance(obj, (list, tuple)):
+            return [remove_keys(v) for v in obj]
+        return obj
+
+    return sha256(json.dumps(remove_keys(json_obj), default=to_json).encode('utf-8')).hexdigest()
+
+
 def set_properties_from_json(object_with_properties, json_obj, context=None, ignore_properties=None):
     ignore_properties = ignore_properties or set()
     try:
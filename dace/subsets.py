@@ -4,12 +4,38 @@ from dace import data, symbolic, dtypes
 import re
 import sympy as sp
 from functools import reduce
+import numpy as np
 import sympy.core.sympify
-from typing import List, Optional, Sequence, Set, Union
+from typing import Dict, List, Optional, Sequence, Set, Union
 import warnings
 from dace.config import Config
 
 
+def _affine_leq(a, b) -> Optional[bool]:
+    """
+    Tests whether ``a <= b`` on affine expressions, assuming non-negative symbols (identified by name). Returns None if
+    either expression is not affine or the comparison cannot be decided.
+    """
+    aa, ab = symbolic.affine(a), symbolic.affine(b)
+    if aa is None or ab is None:
+        return None
+    return (ab - aa).by_name().nonnegative()
+
+
+def _affine_compare(a, b) -> Optional[int]:
+    """
+    Compares two affine expressions that differ by a constant. Returns the sign of ``b - a``, or None if the difference
+    is not constant.
+    """
+    aa, ab = symbolic.affine(a), symbolic.affine(b)
+    if aa is None or ab is None:
+        return None
+    diff = ab - aa
+    if not diff.is_constant:
+        return None
+    return (diff.const > 0) - (diff.const < 0)
+
+
 class Subset(object):
     """ Defines a subset of a data descriptor. """
     def covers(self, other):
@@ -29,10 +55,19 @@ class Subset(object):
 
         if not symbolic_positive:
             try:
-                return all([(symbolic.simplify_ext(nng(rb)) <= symbolic.simplify_ext(nng(orb))) == True
-                            and (symbolic.simplify_ext(nng(re)) >= symbolic.simplify_ext(nng(ore))) == True
-                            for rb, re, orb, ore in zip(self.min_element_approx(), self.max_element_approx(),
-                                                        other.min_element_approx(), other.max_element_approx())])
+                for rb, re, orb, ore in zip(self.min_element_approx(), self.max_element_approx(),
+                                            other.min_element_approx(), other.max_element_approx()):
+                    lower = _affine_leq(rb, orb)
+                    if lower is None:
+                        lower = (symbolic.simplify_ext(nng(rb)) <= symbolic.simplify_ext(nng(orb))) == True
+                    if not lower:
+                        return False
+                    upper = _affine_leq(ore, re)
+                    if upper is None:
+                        upper = (symbolic.simplify_ext(nng(re)) >= symbolic.simplify_ext(nng(ore))) == True
+                    if not upper:
+                        return False
+                return True
             except TypeError:
                 return False
 
@@ -46,13 +81,13 @@ class Subset(object):
                     # SymPy confirms this but fails to return True when testing less-equal and greater-equal.
 
                     # lower bound: first check whether symbolic positive condition applies
-                    if not (len(rb.free_symbols) == 0 and len(orb.free_symbols) == 1):
+                    if not (len(rb.free_symbols) == 0 and len(orb.free_symbols) == 1) and not _affine_leq(rb, orb):
                         if not (symbolic.simplify_ext(nng(rb)) == symbolic.simplify_ext(nng(orb)) or
                                 symbolic.simplify_ext(nng(rb)) <= symbolic.simplify_ext(nng(orb))):
                             return False
 
                     # upper bound: first check whether symbolic positive condition applies
-                    if not (len(re.free_symbols) == 1 and len(ore.free_symbols) == 0):
+                    if not (len(re.free_symbols) == 1 and len(ore.free_symbols) == 0) and not _affine_leq(ore, re):
                         if not (symbolic.simplify_ext(nng(re)) == symbolic.simplify_ext(nng(ore)) or
                                 symbolic.simplify_ext(nng(re)) >= symbolic.simplify_ext(nng(ore))):
                             return False
@@ -221,12 +256,23 @@ class Range(Subset):
             ]
         else:
             return [
-                ts * sp.ceiling(((iMax.approx if isinstance(iMax, symbolic.SymExpr) else iMax) + off -
-                                 (iMin.approx if isinstance(iMin, symbolic.SymExpr) else iMin)) /
-                                (step.approx if isinstance(step, symbolic.SymExpr) else step))
+                self._dim_size(iMin.approx if isinstance(iMin, symbolic.SymExpr) else iMin,
+                               iMax.approx if isinstance(iMax, symbolic.SymExpr) else iMax,
+                               step.approx if isinstance(step, symbolic.SymExpr) else step, off, ts)
                 for (iMin, iMax, step), off, ts in zip(self.ranges, offset, self.tile_sizes)
             ]
 
+    @staticmethod
+    def _dim_size(iMin, iMax, step, off, ts):
+        """ Returns the number of elements in a range dimension, computed on affine expressions where possible. """
+        length, astep = symbolic.affine(iMax - iMin + off), symbolic.affine(step)
+        if length is not None and astep is not None and astep.is_constant and astep.const != 0:
+            if astep.const in (1, -1):
+                return ts * (length * astep.const).to_sympy()
+            if length.is_constant:
+                return ts * sp.Integer(-(-length.const // astep.const))
+        return ts * sp.ceiling((iMax + off - iMin) / step)
+
     def size_exact(self):
         """ Returns the number of elements in each dimension. """
         return [
@@ -716,6 +762,13 @@ class Range(Subset):
             if rng[0] == orng[0] or rng[1] == orng[1]:
                 continue
 
+            # Fast path: bounds that differ by a constant
+            cmp1, cmp2 = _affine_compare(rng[0], orng[1]), _affine_compare(orng[0], rng[1])
+            if cmp1 is not None and cmp2 is not None:
+                if cmp1 < 0 or cmp2 < 0:
+                    return False
+                continue
+
             # Since conditions can be indeterminate, we check them separately
             # for being False, then make a check that may raise a TypeError
             cond1 = (rng[0] <= orng[1])
@@ -1007,31 +1060,42 @@ def bounding_box_union(subset_a: Subset, subset_b: Subset) -> Range:
             result.append((minrb, maxre, 1))
             continue
 
-        try:
-            minrb = min(arb, brb)
-        except TypeError:
-            if symbolic_positive:
-                if len(arb.free_symbols) == 0:
-                    minrb = arb
-                elif len(brb.free_symbols) == 0:
-                    minrb = brb
+        # Fast path: bounds that differ by a constant
+        minrb, maxre = None, None
+        cmp = _affine_compare(arb, brb)
+        if cmp is not None:
+            minrb = arb if cmp >= 0 else brb
+        cmp = _affine_compare(are, bre)
+        if cmp is not None:
+            maxre = bre if cmp > 0 else are
+
+        if minrb is None:
+            try:
+                minrb = min(arb, brb)
+            except TypeError:
+                if symbolic_positive:
+                    if len(arb.free_symbols) == 0:
+                        minrb = arb
+                    elif len(brb.free_symbols) == 0:
+                        minrb = brb
+                    else:
+                        minrb = sympy.Min(arb, brb)
                 else:
                     minrb = sympy.Min(arb, brb)
-            else:
-                minrb = sympy.Min(arb, brb)
 
-        try:
-            maxre = max(are, bre)
-        except TypeError:
-            if symbolic_positive:
-                if len(are.free_symbols) == 0:
-                    maxre = bre
-                elif len(bre.free_symbols) == 0:
-                    maxre = are
+        if maxre is None:
+            try:
+                maxre = max(are, bre)
+            except TypeError:
+                if symbolic_positive:
+                    if len(are.free_symbols) == 0:
+                        maxre = bre
+                    elif len(bre.free_symbols) == 0:
+                        maxre = are
+                    else:
+                        maxre = sympy.Max(are, bre)
                 else:
                     maxre = sympy.Max(are, bre)
-            else:
-                maxre = sympy.Max(are, bre)
 
         result.append((minrb, maxre, 1))
 
@@ -1094,3 +1158,189 @@ def intersects(subset_a: Subset, subset_b: Subset) -> Union[bool, None]:
         return None
     except TypeError:  # cannot determine truth value of Relational
         return None
+
+
+class SubsetBatch(object):
+    """
+    A batch of subsets (e.g., all the accesses to one data container), packed into integer arrays of their bounds in
+    order to answer all-pairs queries (intersection, coverage) with vectorized operations.
+
+    Subsets whose bounds are not constant, or cannot be evaluated with the given symbol values, are kept symbolic.
+    Queries that involve them fall back to the pairwise ``intersects`` and ``Subset.covers`` functions. For packed
+    subsets, the results are the same as those of the pairwise functions.
+
+    :note: If symbol values are given, the results for subsets with symbolic bounds only hold for these values.
+    """
+
+    def __init__(self, subsets: Sequence[Subset], symbols: Optional[Dict[str, int]] = None):
+        """
+        Packs a batch of subsets.
+
+        :param subsets: The subsets (which may be None).
+        :param symbols: An optional mapping from symbol names to values, used to evaluate symbolic bounds.
+        """
+        self.subsets = list(subsets)
+        self.symbols = symbols
+
+        dims = next((s.dims() for s in self.subsets if isinstance(s, (Range, Indices))), 0)
+        self.begin = np.zeros((len(self.subsets), dims), dtype=np.int64)
+        self.end = np.zeros((len(self.subsets), dims), dtype=np.int64)
+        # Dimensions with a step or tile size other than 1
+        self.strided = np.zeros((len(self.subsets), dims), dtype=bool)
+        self.packed = np.zeros(len(self.subsets), dtype=bool)
+        for i, subset in enumerate(self.subsets):
+            if isinstance(subset, Indices):
+                ranges, tile_sizes = Range.from_indices(subset).ranges, [1] * subset.dims()
+            elif isinstance(subset, Range):
+                ranges, tile_sizes = subset.ranges, subset.tile_sizes
+            else:
+                continue
+            if len(ranges) != dims:
+                continue
+            begin = [self._evaluate(rb) for rb, _, _ in ranges]
+            end = [self._evaluate(re) for _, re, _ in ranges]
+            if any(b is None for b in begin) or any(e is None for e in end):
+                continue
+            self.begin[i] = begin
+            self.end[i] = end
+            self.strided[i] = [(s != 1 or ts != 1) for (_, _, s), ts in zip(ranges, tile_sizes)]
+            self.packed[i] = True
+
+    def __len__(self):
+        return len(self.subsets)
+
+    def _evaluate(self, expr) -> Optional[int]:
+        """ Returns the value of a bound, or None if it is not a constant integer. """
+        if isinstance(expr, (int, np.integer)):
+            return int(expr)
+        if isinstance(expr, symbolic.SymExpr) or not isinstance(expr, sp.Basic):
+            return None
+        if expr.is_Integer:
+            return int(expr)
+        if self.symbols is None or not expr.free_symbols:
+            return None
+        try:
+            value = symbolic.evaluate(expr, self.symbols)
+        except (TypeError, ValueError):
+            return None
+        if isinstance(value, sp.Basic):
+            return int(value) if value.is_Integer else None
+        if isinstance(value, (int, np.integer)):
+            return int(value)
+        return None
+
+    def _pairs(self, other: 'SubsetBatch'):
+        """ Returns a boolean matrix of the pairs of subsets that are both packed (with the same dimensionality). """
+        if self.begin.shape[1] != other.begin.shape[1]:
+            return np.zeros((len(self), len(other)), dtype=bool)
+        return self.packed[:, None] & other.packed[None, :]
+
+    def _intersects_packed(self, other: 'SubsetBatch') -> np.ndarray:
+        """
+        Tests all pairs of subsets for intersection, as in ``Range.intersects``: dimensions are checked in order, and a
+        dimension with a step or tile size other than 1 makes the result indeterminate.
+
+        :return: An integer matrix with 1 (intersect), 0 (disjoint), or -1 (indeterminate) for every pair.
+        """
+        dims = self.begin.shape[1]
+        ab, ae = self.begin[:, None, :], self.end[:, None, :]
+        bb, be = other.begin[None, :, :], other.end[None, :, :]
+        disjoint = ~((ab == bb) | (ae == be) | ((ab <= be) & (bb <= ae)))
+        strided = self.strided[:, None, :] | other.strided[None, :, :]
+        first_disjoint = np.where(disjoint.any(axis=2), disjoint.argmax(axis=2), dims)
+        first_strided = np.where(strided.any(axis=2), strided.argmax(axis=2), dims)
+        result = np.ones((len(self), len(other)), dtype=np.int8)
+        result[first_strided < dims] = -1
+        result[first_disjoint < first_strided] = 0
+        return result
+
+    def intersects(self, other: Optional['SubsetBatch'] = None) -> np.ndarray:
+        """
+        Tests all pairs of subsets for intersection (see ``intersects``).
+
+        :param other: The batch to test against, or None to test this batch against itself.
+        :return: An object array, where entry ``[i, j]`` is True if subset ``i`` of this batch intersects subset ``j``
+                 of ``other``, False if it does not, or None if this cannot be determined.
+        """
+        other = self if other is None else other
+        result = np.full((len(self), len(other)), None, dtype=object)
+        pairs = self._pairs(other)
+        if pairs.any():
+            packed = self._intersects_packed(other)
+            result[pairs & (packed == 1)] = True
+            result[pairs & (packed == 0)] = False
+        for i, j in zip(*np.nonzero(~pairs)):
+            result[i, j] = intersects(self.subsets[i], other.subsets[j])
+        return result
+
+    def may_intersect(self, other: Optional['SubsetBatch'] = None) -> bool:
+        """
+        Returns True if any pair of subsets intersects or cannot be proven disjoint (see ``intersects``). Unlike
+        ``SubsetBatch.intersects``, symbolic subsets are only compared if all packed pairs are disjoint.
+
+        :param other: The batch to test against, or None to test this batch against itself.
+        """
+        other = self if other is None else other
+        pairs = self._pairs(other)
+        if pairs.any() and (self._intersects_packed(other)[pairs] != 0).any():
+            return True
+        for i, j in zip(*np.nonzero(~pairs)):
+            if intersects(self.subsets[i], other.subsets[j]) is not False:
+                return True
+        return False
+
+    def _covers_packed(self, other: 'SubsetBatch') -> np.ndarray:
+        """ Tests all pairs of subsets for coverage of their (packed) bounds. """
+        return ((self.begin[:, None, :] <= other.begin[None, :, :]) &
+                (other.end[None, :, :] <= self.end[:, None, :])).all(axis=2)
+
+    def covers(self, other: Optional['SubsetBatch'] = None) -> np.ndarray:
+        """
+        Tests whether subsets cover other subsets, for all pairs (see ``Subset.covers``).
+
+        :param other: The batch to test against, or None to test this batch against itself.
+        :return: A boolean array, where entry ``[i, j]`` is True if subset ``i`` of this batch covers subset ``j`` of
+                 ``other``.
+        """
+        other = self if other is None else other
+        pairs = self._pairs(other)
+        result = np.zeros((len(self), len(other)), dtype=bool)
+        if pairs.any():
+            result[pairs] = self._covers_packed(other)[pairs]
+        for i, j in zip(*np.nonzero(~pairs)):
+            result[i, j] = self.subsets[i].covers(other.subsets[j])
+        return result
+
+    def covers_any(self, other: 'SubsetBatch') -> np.ndarray:
+        """
+        Tests whether each subset of another batch is covered by any subset of this batch (see ``Subset.covers``).
+        Symbolic subsets are only compared until a covering subset is found.
+
+        :param other: The batch to test.
+        :return: A boolean array, where entry ``j`` is True if subset ``j`` of ``other`` is covered.
+        """
+        pairs = self._pairs(other)
+        result = np.zeros(len(other), dtype=bool)
+        if pairs.any():
+            result = (self._covers_packed(other) & pairs).any(axis=0)
+        for j in np.nonzero(~result)[0]:
+            result[j] = any(self.subsets[i].covers(other.subsets[j]) for i in np.nonzero(~pairs[:, j])[0])
+        return result
+
+    def bounding_box(self) -> Optional[Subset]:
+        """
+        Returns the bounding box of all subsets in the batch (see ``bounding_box_union``), or None if the batch
+        contains no subsets.
+        """
+        subsets = [s for s in self.subsets if s is not None]
+        if len(subsets) <= 1:
+            return subsets[0] if subsets else None
+        result = None
+        packed = self.packed
+        if packed.any():
+            result = Range([(int(b), int(e), 1)
+                            for b, e in zip(self.begin[packed].min(axis=0), self.end[packed].max(axis=0))])
+        for i in np.nonzero(~packed)[0]:
+            if self.subsets[i] is not None:
+                result = self.subsets[i] if result is None else bounding_box_union(result, self.subsets[i])
+        return result
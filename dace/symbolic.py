@@ -847,6 +847,8 @@ def simplify_ext(expr):
     """
     if not isinstance(expr, sympy.Basic):
         return expr
+    if affine(expr) is not None:
+        return expr
     a = sympy.Wild('a')
     b = sympy.Wild('b')
     c = sympy.Wild('c')
@@ -1096,8 +1098,165 @@ def pystr_to_symbolic(expr, symbol_map=None, simplify=None) -> sympy.Basic:
         return sympy_to_dace(sympy.sympify(expr, locals, evaluate=simplify), symbol_map)
 
 
+class AffineExpr(object):
+    """
+    A lightweight representation of an affine integer expression, i.e., a linear combination of symbols with integer
+    coefficients plus an integer constant. Used as a fast path for common operations on subsets (e.g., sizes and
+    comparisons of range bounds), which avoids constructing, substituting, and simplifying SymPy expressions.
+    Expressions that are not affine are handled by SymPy instead (see ``affine``).
+    """
+    __slots__ = ('terms', 'const')
+
+    def __init__(self, terms: Dict[sympy.Symbol, int], const: int = 0):
+        self.terms = {s: c for s, c in terms.items() if c != 0}
+        self.const = const
+
+    @property
+    def is_constant(self) -> bool:
+        return not self.terms
+
+    def coefficient(self, sym: sympy.Symbol) -> int:
+        """ Returns the coefficient of a symbol in the expression. """
+        return self.terms.get(sym, 0)
+
+    def __add__(self, other: Union['AffineExpr', int]) -> 'AffineExpr':
+        if isinstance(other, int):
+            return AffineExpr(self.terms, self.const + other)
+        terms = dict(self.terms)
+        for s, c in other.terms.items():
+            terms[s] = terms.get(s, 0) + c
+        return AffineExpr(terms, self.const + other.const)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> 'AffineExpr':
+        return AffineExpr({s: -c for s, c in self.terms.items()}, -self.const)
+
+    def __sub__(self, other: Union['AffineExpr', int]) -> 'AffineExpr':
+        return self + (-other)
+
+    def __mul__(self, other: int) -> 'AffineExpr':
+        return AffineExpr({s: c * other for s, c in self.terms.items()}, self.const * other)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AffineExpr) and self.terms == other.terms and self.const == other.const
+
+    def __hash__(self) -> int:
+        return hash((frozenset(self.terms.items()), self.const))
+
+    def __repr__(self) -> str:
+        return f'AffineExpr({self.to_sympy()})'
+
+    def subs(self, sym: sympy.Symbol, value: 'AffineExpr') -> 'AffineExpr':
+        """ Substitutes a symbol with an affine expression. """
+        coef = self.terms.get(sym, 0)
+        if coef == 0:
+            return self
+        terms = dict(self.terms)
+        del terms[sym]
+        return AffineExpr(terms, self.const) + value * coef
+
+    def by_name(self) -> 'AffineExpr':
+        """ Returns an expression in which symbols are identified by name (regardless of their assumptions). """
+        terms = {}
+        for s, c in self.terms.items():
+            terms[s.name] = terms.get(s.name, 0) + c
+        return AffineExpr(terms, self.const)
+
+    def nonnegative(self) -> Optional[bool]:
+        """
+        Returns True if the expression is non-negative for all non-negative symbol values, False if it is a negative
+        constant, or None if undetermined.
+        """
+        if all(c > 0 for c in self.terms.values()) and self.const >= 0:
+            return True
+        if not self.terms:
+            return False
+        return None
+
+    def to_sympy(self) -> sympy.Expr:
+        """ Converts the expression to a (canonical) SymPy expression. """
+        return _affine_to_sympy(frozenset(self.terms.items()), self.const)
+
+
+@lru_cache(maxsize=16384)
+def _affine_to_sympy(terms: frozenset, const: int) -> sympy.Expr:
+    return sympy.Add(*(sympy.Integer(c) * s for s, c in terms), sympy.Integer(const))
+
+
+def affine(expr: Union[SymbolicType, int]) -> Optional[AffineExpr]:
+    """
+    Converts an expression to an affine integer expression (see ``AffineExpr``), if possible.
+
+    :param expr: A SymPy expression or integer.
+    :return: An ``AffineExpr`` object, or None if the expression is not affine or the affine fast path is disabled
+             (``optimizer.affine_fast_path`` configuration entry).
+    """
+    from dace.config import Config  # Avoid import loop
+    if not Config.get_bool('optimizer', 'affine_fast_path'):
+        return None
+    if isinstance(expr, (int, numpy.integer)) and not isinstance(expr, bool):
+        return AffineExpr({}, int(expr))
+    if not isinstance(expr, sympy.Basic):
+        return None
+    return _affine(expr)
+
+
+@lru_cache(maxsize=16384)
+def _affine(expr: sympy.Basic) -> Optional[AffineExpr]:
+    if expr.is_Integer:
+        return AffineExpr({}, int(expr))
+    if expr.is_Symbol:
+        return AffineExpr({expr: 1})
+    if expr.is_Add:
+        result = AffineExpr({})
+        for arg in expr.args:
+            term = _affine(arg)
+            if term is None:
+                return None
+            result = result + term
+        return result
+    if expr.is_Mul:
+        factor = 1
+        result = None
+        for arg in expr.args:
+            if arg.is_Integer:
+                factor *= int(arg)
+            elif result is None:
+                result = _affine(arg)
+                if result is None:
+                    return None
+            else:  # Product of two non-constant terms
+                return None
+        return AffineExpr({}, factor) if result is None else result * factor
+    if isinstance(expr, (sympy.Min, sympy.Max)):
+        # Resolve if the differences between the arguments are constant
+        args = [_affine(arg) for arg in expr.args]
+        if any(a is None for a in args):
+            return None
+        best = args[0]
+        for arg in args[1:]:
+            diff = arg - best
+            if not diff.is_constant:
+                return None
+            if (diff.const < 0) == isinstance(expr, sympy.Min):
+                best = arg
+        return best
+    if isinstance(expr, (sympy.floor, sympy.ceiling)):
+        arg = _affine(expr.args[0])
+        if arg is not None and all(s.is_integer for s in arg.terms):
+            return arg
+    return None
+
+
 @lru_cache(maxsize=2048)
 def simplify(expr: SymbolicType) -> SymbolicType:
+    # Affine integer expressions are already simplified
+    aff = affine(expr)
+    if aff is not None:
+        return aff.to_sympy()
     return sympy.simplify(expr)
 
 
@@ -347,7 +347,7 @@ def find_fast_library(device: dtypes.DeviceType) -> List[str]:
         if openblas.OpenBLAS.is_installed():
             result.append('OpenBLAS')
 
-        return result + ['pure']
+        return result + ['pure_blocked', 'pure']
 
     return ['pure']
 
@@ -377,14 +377,22 @@ def move_small_arrays_to_stack(sdfg: SDFG) -> None:
         print(f'Statically allocating {converted} transient arrays')
 
 
-def set_fast_implementations(sdfg: SDFG, device: dtypes.DeviceType, blocklist: List[str] = None):
+def set_fast_implementations(sdfg: SDFG,
+                             device: dtypes.DeviceType,
+                             blocklist: List[str] = None,
+                             symbols: Dict[str, int] = None):
     """
     Set fast library node implementations for the given device
 
     :param sdfg: The SDFG to optimize.
     :param device: the device to optimize for.
     :param blocklist: list of disallowed implementations.
+    :param symbols: Optional dict that maps symbols (str/symbolic) to int/float, used to find measured
+                    implementations for the sizes of library nodes.
     :note: Operates in-place on the given SDFG.
+    :note: If the ``library.autoselect`` configuration entry is enabled, library nodes on the CPU that are not nested
+           in a map use the implementation measured fastest on this machine (see
+           ``dace.optimization.library_tuner``), if measurements exist for their sizes.
     """
     if blocklist is None:
         implementation_prio = find_fast_library(device)
@@ -419,6 +427,24 @@ def set_fast_implementations(sdfg: SDFG, device: dtypes.DeviceType, blocklist: L
                     break
 
     # reduce nodes
+    if device == dtypes.DeviceType.CPU and 'OpenMP (tree)' not in (blocklist or []):
+        for node, state in sdfg.all_nodes_recursive():
+            # Use parallel tree reductions for reductions that are not nested in a parallel scope
+            if (isinstance(node, nodes.LibraryNode) and 'OpenMP (tree)' in node.implementations
+                    and node.schedule != dtypes.ScheduleType.Sequential and xfh.get_parent_map(state, node) is None):
+                node.implementation = 'OpenMP (tree)'
+
+    # measured implementations
+    if device == dtypes.DeviceType.CPU and config.Config.get_bool('library', 'autoselect'):
+        from dace.optimization.library_tuner import select_implementation
+        for node, state in sdfg.all_nodes_recursive():
+            if (isinstance(node, nodes.LibraryNode) and node.schedule != dtypes.ScheduleType.Sequential
+                    and xfh.get_parent_map(state, node) is None):
+                candidates = [impl for impl in node.implementations if impl not in (blocklist or [])]
+                implementation = select_implementation(node, state, state.parent, candidates, symbols)
+                if implementation is not None:
+                    node.implementation = implementation
+
     if device == dtypes.DeviceType.GPU:
         for node, state in sdfg.all_nodes_recursive():
             if isinstance(node, dace.nodes.LibraryNode):
@@ -543,7 +569,32 @@ def auto_optimize(sdfg: SDFG,
     :note: Operates in-place on the given SDFG.
     :note: This function is still experimental and may harm correctness in
            certain cases. Please report an issue if it does.
+    :note: If the ``optimizer.transformation_cache`` configuration entry is
+           enabled, the result is loaded from the persistent transformation
+           cache if this SDFG was optimized before with the same parameters.
+           Call ``SDFG.invalidate_hash`` after modifying properties of the
+           SDFG directly.
     """
+    if config.Config.get_bool('optimizer', 'transformation_cache') and sdfg.parent_sdfg is None:
+        from dace.transformation.transformation_cache import TransformationCache
+        description = {
+            'function': 'auto_optimize',
+            'device': str(device),
+            'validate': validate,
+            'validate_all': validate_all,
+            'symbols': {str(k): str(v)
+                        for k, v in (symbols or {}).items()},
+        }
+        return TransformationCache().apply(sdfg, description, (),
+                                           lambda: _auto_optimize(sdfg, device, validate, validate_all, symbols))
+    return _auto_optimize(sdfg, device, validate, validate_all, symbols)
+
+
+def _auto_optimize(sdfg: SDFG,
+                   device: dtypes.DeviceType,
+                   validate: bool = True,
+                   validate_all: bool = False,
+                   symbols: Dict[str, int] = None) -> SDFG:
     debugprint = config.Config.get_bool('debugprint')
 
     # Simplification and loop parallelization
@@ -604,7 +655,7 @@ def auto_optimize(sdfg: SDFG,
             pass
 
     # Set all library nodes to expand to fast library calls
-    set_fast_implementations(sdfg, device)
+    set_fast_implementations(sdfg, device, symbols=symbols)
 
     # NOTE: We need to `infer_types` in case a LibraryNode expands to other LibraryNodes (e.g., np.linalg.solve)
     infer_types.infer_connector_types(sdfg)
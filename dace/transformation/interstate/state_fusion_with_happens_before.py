@@ -115,13 +115,10 @@ class StateFusionExtended(transformation.MultiStateTransformation):
             edges_b = [e for n in group_b for e in graph_b.in_edges(n)]
             subset_b = dst_subset
 
-        # Simple all-pairs check
-        for ea in edges_a:
-            for eb in edges_b:
-                result = subsets.intersects(subset_a(ea), subset_b(eb))
-                if result is True or result is None:
-                    return True
-        return False
+        # All-pairs check
+        batch_a = subsets.SubsetBatch([subset_a(e) for e in edges_a])
+        batch_b = subsets.SubsetBatch([subset_b(e) for e in edges_b])
+        return batch_a.may_intersect(batch_b)
 
     def has_path(self, first_state: SDFGState, second_state: SDFGState,
                  match_nodes: Dict[nodes.AccessNode, nodes.AccessNode], node_a: nodes.Node, node_b: nodes.Node) -> bool:
@@ -3,10 +3,13 @@
 API for SDFG analysis and manipulation Passes, as well as Pipelines that contain multiple dependent passes.
 """
 from dace import properties, serialize
+from dace.config import Config
 from dace.sdfg import SDFG, SDFGState, graph as gr, nodes, utils as sdutil
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Flag, auto
-from typing import Any, Dict, Iterator, List, Optional, Set, Type, Union
+import time
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union
 from dataclasses import dataclass
 
 
@@ -330,6 +333,16 @@ class Pipeline(Pass):
         results = my_simplify.apply_pass(sdfg, {})
         print('Promoted scalars:', results['ScalarToSymbolPromotion'])
 
+    Pipelines can run independent analysis passes (i.e., passes whose ``modifies`` method returns
+    ``Modifies.Nothing``) concurrently on a thread pool by setting ``num_workers`` (or the
+    ``optimizer.pipeline_workers`` configuration entry) to a value greater than one. The results are merged in the
+    same order as in sequential execution. The wall time spent in each pass is accumulated in ``pass_times``.
+
+    :note: Threads only shorten the pipeline if its analysis passes spend their time outside of the Python
+           interpreter lock (e.g., in native code). The analysis passes of DaCe are pure Python, and run slower on a
+           thread pool than sequentially. Passes are run concurrently as a whole, the work of a ``StatePass`` or
+           ``ScopePass`` is not split across nested SDFGs.
+
     """
 
     CATEGORY: str = 'Helper'
@@ -339,8 +352,15 @@ class Pipeline(Pass):
                                      category='(Debug)',
                                      desc='List of passes that this pipeline contains')
 
-    def __init__(self, passes: List[Pass]):
+    num_workers = properties.Property(dtype=int,
+                                      default=None,
+                                      allow_none=True,
+                                      desc='Number of threads used to run independent analysis passes concurrently '
+                                      '(1 for sequential execution, or None to use configuration file).')
+
+    def __init__(self, passes: List[Pass], num_workers: Optional[int] = None):
         self.passes = []
+        self.num_workers = num_workers
         self._pass_names = set(type(p).__name__ for p in passes)
         self.passes.extend(passes)
 
@@ -352,6 +372,14 @@ class Pipeline(Pass):
         # Keep track of what is modified as the pipeline is executing
         self._modified: Modifies = Modifies.Nothing
 
+        # Accumulated wall time (in seconds) spent in each pass, keyed by pass name
+        self._pass_times: Dict[str, float] = {}
+
+    @property
+    def pass_times(self) -> Dict[str, float]:
+        """ The accumulated wall time (in seconds) spent in each pass of this pipeline, keyed by pass name. """
+        return self._pass_times
+
     def _add_dependencies(self, passes: List[Pass]):
         """
         Verifies pass uniqueness in pipeline and adds missing dependencies from ``depends_on`` of each pass. 
@@ -494,21 +522,93 @@ class Pipeline(Pass):
         """
         return p.apply_pass(sdfg, state)
 
+    def _timed_apply_subpass(self, sdfg: SDFG, p: Pass, state: Dict[str, Any]) -> Tuple[Optional[Any], float]:
+        start = time.perf_counter()
+        r = self.apply_subpass(sdfg, p, state)
+        return r, time.perf_counter() - start
+
+    def _add_result(self, sdfg: SDFG, p: Pass, r: Optional[Any], elapsed: float, state: Dict[str, Any],
+                    retval: Dict[str, Any]):
+        """ Registers the return value and wall time of an applied pass. """
+        name = type(p).__name__
+        self._pass_times[name] = self._pass_times.get(name, 0.0) + elapsed
+        if r is not None:
+            modified = p.modifies()
+            # Passes that only modify the state machine do not change the cached digests of states and descriptors
+            if modified & (Modifies.Descriptors | Modifies.Symbols | Modifies.Nodes | Modifies.Memlets):
+                sdfg.invalidate_hash()
+            if modified != Modifies.Nothing:
+                sdfg.journal.mark_modified(sdfg)
+            state[name] = r
+            retval[name] = r
+            self._modified = p.modifies()
+
     def apply_pass(self, sdfg: SDFG, pipeline_results: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        num_workers = self.num_workers
+        if num_workers is None:
+            num_workers = int(Config.get('optimizer', 'pipeline_workers'))
+
         state = pipeline_results
         retval = {}
         self._modified = Modifies.Nothing
-        for p in self.iterate_over_passes(sdfg):
-            r = self.apply_subpass(sdfg, p, state)
-            if r is not None:
-                state[type(p).__name__] = r
-                retval[type(p).__name__] = r
-                self._modified = p.modifies()
+        if num_workers > 1:
+            self._apply_passes_parallel(sdfg, state, retval, num_workers)
+        else:
+            for p in self.iterate_over_passes(sdfg):
+                r, elapsed = self._timed_apply_subpass(sdfg, p, state)
+                self._add_result(sdfg, p, r, elapsed, state, retval)
 
         if retval:
             return retval
         return None
 
+    def _apply_passes_parallel(self, sdfg: SDFG, state: Dict[str, Any], retval: Dict[str, Any], num_workers: int):
+        """
+        Applies the pipeline, running consecutive analysis passes that do not depend on each other concurrently.
+        Passes that modify the SDFG wait for all running passes to finish and are applied on the calling thread.
+        """
+        # Analysis passes may read the same states concurrently, materialize lazily-loaded states beforehand. Other
+        # per-state caches (scope indices and structural hashes) are safe to query concurrently
+        for sd in sdfg.all_sdfgs_recursive():
+            for st in sd.nodes():
+                st.nodes()
+
+        pending: List[Tuple[Pass, Future]] = []
+
+        def wait_for_pending():
+            # Results are added once no pass is running, in submission order (i.e., the sequential pipeline order)
+            results = [(p, future.result()) for p, future in pending]
+            pending.clear()
+            for p, (r, elapsed) in results:
+                self._add_result(sdfg, p, r, elapsed, state, retval)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            for p in self.iterate_over_passes(sdfg):
+                if p.modifies() != Modifies.Nothing:
+                    wait_for_pending()
+                    r, elapsed = self._timed_apply_subpass(sdfg, p, state)
+                    self._add_result(sdfg, p, r, elapsed, state, retval)
+                    continue
+
+                # Analysis pass: wait only if it depends on the results of a running pass
+                running = set(pp for pp, _ in pending)
+                if any(dep in running for dep in self._depgraph.predecessors(p)):
+                    wait_for_pending()
+
+                # Since analysis passes do not modify the SDFG, the pipeline can proceed immediately
+                pending.append((p, pool.submit(self._timed_apply_subpass, sdfg, p, state)))
+
+            wait_for_pending()
+
+    def timing_report(self) -> str:
+        """
+        Returns a user-readable report of the accumulated wall time spent in each pass, slowest first.
+        """
+        lines = [f'{name}: {elapsed * 1000:.2f} ms' for name, elapsed in sorted(self._pass_times.items(),
+                                                                                key=lambda kv: kv[1],
+                                                                                reverse=True)]
+        return '\n'.join(lines)
+
     def to_json(self, parent=None) -> Dict[str, Any]:
         props = serialize.all_properties_to_json(self)
         return {
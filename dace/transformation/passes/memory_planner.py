@@ -0,0 +1,220 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" SDFG-wide planning of transient memory into arena buffers, based on the liveness of transients. """
+from collections import defaultdict
+from dataclasses import dataclass, field
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+import networkx as nx
+
+from dace import SDFG, SDFGState, data, dtypes, properties, symbolic
+from dace.sdfg import nodes
+from dace.sdfg.scope import is_devicelevel_fpga, is_devicelevel_gpu
+from dace.transformation import pass_pipeline as ppl
+
+# A position in the execution of the SDFG: the index of a state in the (linearized) state machine of the top-level
+# SDFG, followed by the indices of states in nested SDFGs
+Position = Tuple[float, ...]
+
+
+@dataclass
+class MemoryPlan:
+    """
+    The result of transient memory planning: a placement of transients in arena buffers (one per storage type).
+    """
+    #: Maps (SDFG ID, transient name) to the storage type of its arena and its offset in the arena (in bytes)
+    offsets: Dict[Tuple[int, str], Tuple[dtypes.StorageType, int]] = field(default_factory=dict)
+    #: Size of the arena of each storage type (in bytes)
+    arena_sizes: Dict[dtypes.StorageType, int] = field(default_factory=dict)
+    #: Required alignment of the arena of each storage type (in bytes)
+    arena_alignments: Dict[dtypes.StorageType, int] = field(default_factory=dict)
+    #: Total size of the planned transients if allocated separately (in bytes)
+    size_before: int = 0
+    #: Peak size of the transients that are live at the same time (in bytes), a lower bound for the arena sizes
+    peak_live_size: int = 0
+
+    @property
+    def size_after(self) -> int:
+        """ Total size of all arenas (in bytes). """
+        return sum(self.arena_sizes.values())
+
+    def __str__(self) -> str:
+        return (f'Memory plan: {len(self.offsets)} transients in {len(self.arena_sizes)} arena(s), '
+                f'{self.size_before} B before, {self.size_after} B after (peak live: {self.peak_live_size} B)')
+
+
+@dataclass
+class _Buffer:
+    sdfg_id: int
+    name: str
+    storage: dtypes.StorageType
+    size: int
+    alignment: int
+    start: Position
+    end: Position
+
+    def overlaps(self, other: '_Buffer') -> bool:
+        return self.start <= other.end and other.start <= self.end
+
+
+@properties.make_properties
+class MemoryPlanner(ppl.Pass):
+    """
+    Plans the memory of transients in the SDFG and its nested SDFGs into arena buffers. The live range of every
+    transient is computed over the state machine (transients accessed within a loop are live throughout the loop),
+    and transients whose live ranges do not overlap are assigned overlapping memory in an arena, via first-fit
+    interval coloring. Each storage type is assigned a separate arena.
+
+    Only transient arrays of a constant size, whose lifetime is not persistent and whose access nodes are all outside
+    of scopes (e.g., maps), are planned. The pass does not modify the SDFG: the plan is used by the code generator to
+    allocate arenas once, if the ``compiler.memory_arenas`` configuration entry is enabled.
+    """
+
+    CATEGORY: str = 'Memory Footprint Reduction'
+
+    storage_types = properties.SetProperty(element_type=dtypes.StorageType,
+                                           default={dtypes.StorageType.CPU_Heap},
+                                           desc='Storage types of the transients to plan')
+    alignment = properties.Property(dtype=int, default=64, desc='Minimal alignment of transients in an arena (bytes)')
+
+    def __init__(self, storage_types: Optional[Set[dtypes.StorageType]] = None, alignment: int = 64):
+        super().__init__()
+        if storage_types is not None:
+            self.storage_types = set(storage_types)
+        self.alignment = alignment
+
+    def modifies(self) -> ppl.Modifies:
+        return ppl.Modifies.Nothing
+
+    def should_reapply(self, modified: ppl.Modifies) -> bool:
+        return modified & (ppl.Modifies.States | ppl.Modifies.AccessNodes | ppl.Modifies.Descriptors)
+
+    def _state_order(self, sdfg: SDFG) -> Tuple[Dict[SDFGState, int], Dict[SDFGState, Tuple[int, int]]]:
+        """
+        Linearizes the state machine, such that every loop (strongly connected component) is contiguous.
+
+        :return: A 2-tuple of the index of each state, and the index range of the loop that contains each state.
+        """
+        condensed = nx.condensation(sdfg.nx)
+        order: Dict[SDFGState, int] = {}
+        loop_range: Dict[SDFGState, Tuple[int, int]] = {}
+        for component in nx.topological_sort(condensed):
+            members = condensed.nodes[component]['members']
+            start = len(order)
+            for state in sorted(members, key=sdfg.node_id):
+                order[state] = len(order)
+            for state in members:
+                loop_range[state] = (start, len(order) - 1)
+        return order, loop_range
+
+    def _plannable(self, sdfg: SDFG, name: str, desc: data.Data) -> Optional[int]:
+        """ Returns the size (in bytes) of a transient if it can be planned, or None otherwise. """
+        if not desc.transient or type(desc) is not data.Array:
+            return None
+        if desc.storage not in self.storage_types or desc.lifetime not in (dtypes.AllocationLifetime.Scope,
+                                                                           dtypes.AllocationLifetime.State,
+                                                                           dtypes.AllocationLifetime.SDFG):
+            return None
+        if isinstance(desc.dtype, dtypes.opaque):
+            return None
+        size = symbolic.resolve_symbol_to_constant(desc.total_size, sdfg)
+        if size is None:
+            return None
+        return int(size) * desc.dtype.bytes
+
+    def _collect(self, sdfg: SDFG, prefix: Position, buffers: List[_Buffer]):
+        """ Computes the live ranges of the plannable transients of an SDFG and recursively of its nested SDFGs. """
+        if any(isinstance(desc, data.Reference) for desc in sdfg.arrays.values()):
+            return
+
+        order, loop_range = self._state_order(sdfg)
+        excluded: Set[str] = set()
+        accesses: Dict[str, Set[int]] = defaultdict(set)
+        for state in sdfg.nodes():
+            scope_dict = state.scope_dict()
+            nested = [n for n in state.nodes() if isinstance(n, nodes.NestedSDFG)]
+            for node in state.nodes():
+                if isinstance(node, nodes.AccessNode):
+                    accesses[node.data].add(order[state])
+                    if scope_dict[node] is not None:
+                        excluded.add(node.data)
+                elif isinstance(node, nodes.NestedSDFG):
+                    if (scope_dict[node] is not None or node.schedule in dtypes.GPU_SCHEDULES
+                            or node.schedule == dtypes.ScheduleType.FPGA_Device
+                            or is_devicelevel_gpu(sdfg, state, node) or is_devicelevel_fpga(sdfg, state, node)):
+                        continue
+                    # Sibling nested SDFGs may run concurrently and thus occupy the whole state
+                    if len(nested) == 1:
+                        self._collect(node.sdfg, prefix + (order[state], ), buffers)
+                    else:
+                        inner: List[_Buffer] = []
+                        self._collect(node.sdfg, prefix + (order[state], ), inner)
+                        for buf in inner:
+                            buf.start, buf.end = prefix + (order[state], ), prefix + (order[state], math.inf)
+                        buffers.extend(inner)
+
+        # Data used in interstate edges is accessed in the source and destination states
+        for edge in sdfg.edges():
+            for sym in edge.data.read_symbols():
+                if sym in sdfg.arrays:
+                    accesses[sym].add(order[edge.src])
+                    accesses[sym].add(order[edge.dst])
+
+        loops = set(loop_range.values())
+        for name, indices in accesses.items():
+            if name in excluded or name not in sdfg.arrays:
+                continue
+            desc = sdfg.arrays[name]
+            size = self._plannable(sdfg, name, desc)
+            if size is None:
+                continue
+
+            # Extend live range to contain every loop it touches
+            start, end = min(indices), max(indices)
+            changed = True
+            while changed:
+                changed = False
+                for lstart, lend in loops:
+                    if lstart <= end and start <= lend and (lstart < start or lend > end):
+                        start, end = min(start, lstart), max(end, lend)
+                        changed = True
+
+            buffers.append(
+                _Buffer(sdfg.sdfg_id, name, desc.storage, size, max(self.alignment, desc.alignment or 1),
+                        prefix + (start, ), prefix + (end, math.inf)))
+
+    def apply_pass(self, sdfg: SDFG, _) -> Optional[MemoryPlan]:
+        """
+        Plans the transients of the SDFG and its nested SDFGs into arenas.
+
+        :return: A ``MemoryPlan`` object, or None if no transients can be planned.
+        """
+        buffers: List[_Buffer] = []
+        self._collect(sdfg, (), buffers)
+        if not buffers:
+            return None
+
+        plan = MemoryPlan()
+        plan.size_before = sum(buf.size for buf in buffers)
+
+        # Peak of the simultaneously live transients (the maximum is attained at the start of a live range)
+        for buf in buffers:
+            live = sum(other.size for other in buffers if other.start <= buf.start <= other.end)
+            plan.peak_live_size = max(plan.peak_live_size, live)
+
+        # First-fit placement, largest transients first
+        placed: Dict[dtypes.StorageType, List[Tuple[_Buffer, int]]] = defaultdict(list)
+        for buf in sorted(buffers, key=lambda b: (-b.size, b.start, b.sdfg_id, b.name)):
+            conflicts = sorted((offset, offset + other.size) for other, offset in placed[buf.storage]
+                               if buf.overlaps(other))
+            offset = 0
+            for cstart, cend in conflicts:
+                if offset + buf.size <= cstart:
+                    break
+                offset = max(offset, -(-cend // buf.alignment) * buf.alignment)
+            placed[buf.storage].append((buf, offset))
+            plan.offsets[buf.sdfg_id, buf.name] = (buf.storage, offset)
+            plan.arena_sizes[buf.storage] = max(plan.arena_sizes.get(buf.storage, 0), offset + buf.size)
+            plan.arena_alignments[buf.storage] = max(plan.arena_alignments.get(buf.storage, 1), buf.alignment)
+
+        return plan
@@ -3,6 +3,7 @@
 
 import collections
 from dataclasses import dataclass
+import itertools
 import time
 
 from dace import properties
@@ -39,6 +40,12 @@ class PatternMatchAndApply(ppl.Pass):
     validate_all = properties.Property(dtype=bool,
                                        default=False,
                                        desc='If True, validates the SDFG after each transformation applies.')
+    incremental_validation = properties.Property(dtype=bool,
+                                                 default=None,
+                                                 allow_none=True,
+                                                 desc='If True, validation after each transformation only re-checks '
+                                                 'the parts of the SDFG modified since the previous validation (or '
+                                                 'None to use configuration file).')
     states = properties.ListProperty(element_type=SDFGState,
                                      default=None,
                                      allow_none=True,
@@ -60,7 +67,8 @@ class PatternMatchAndApply(ppl.Pass):
                  validate_all: bool = False,
                  states: Optional[List[SDFGState]] = None,
                  print_report: Optional[bool] = None,
-                 progress: Optional[bool] = None) -> None:
+                 progress: Optional[bool] = None,
+                 incremental_validation: Optional[bool] = None) -> None:
         if isinstance(transformations, xf.TransformationBase):
             self.transformations = [transformations]
         else:
@@ -75,6 +83,12 @@ class PatternMatchAndApply(ppl.Pass):
         self.states = states
         self.print_report = print_report
         self.progress = progress
+        self.incremental_validation = incremental_validation
+
+    def _validate_incrementally(self) -> bool:
+        if self.incremental_validation is None:
+            return Config.get_bool('optimizer', 'incremental_validation')
+        return self.incremental_validation
 
     def depends_on(self) -> Set[Type[ppl.Pass]]:
         result = set()
@@ -110,9 +124,10 @@ class PatternMatchAndApply(ppl.Pass):
             match._pipeline_results = pipeline_results
 
             result = match.apply(graph, tsdfg)
+            tsdfg.journal.mark_modified(graph)
             applied_transformations[type(match).__name__].append(result)
             if self.validate_all:
-                sdfg.validate()
+                sdfg.validate(incremental=self._validate_incrementally())
 
         if self.validate:
             sdfg.validate()
@@ -141,6 +156,12 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
                                                   default=True,
                                                   desc='Whether or not to order by transformation.')
 
+    incremental = properties.Property(dtype=bool,
+                                      default=None,
+                                      allow_none=True,
+                                      desc='Whether to first look for matches in the graphs modified by the last '
+                                      'applied transformation (or None to use configuration file).')
+
     def __init__(self,
                  transformations: Union[xf.PatternTransformation, Iterable[xf.PatternTransformation]],
                  permissive: bool = False,
@@ -149,13 +170,39 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
                  states: Optional[List[SDFGState]] = None,
                  print_report: Optional[bool] = None,
                  progress: Optional[bool] = None,
-                 order_by_transformation: bool = True) -> None:
-        super().__init__(transformations, permissive, validate, validate_all, states, print_report, progress)
+                 order_by_transformation: bool = True,
+                 incremental: Optional[bool] = None,
+                 incremental_validation: Optional[bool] = None) -> None:
+        super().__init__(transformations, permissive, validate, validate_all, states, print_report, progress,
+                         incremental_validation)
         self.order_by_transformation = order_by_transformation
+        self.incremental = incremental
+
+    def _match_patterns(self, sdfg: SDFG, patterns: List[xf.PatternTransformation],
+                        cache: 'PatternMatchCache') -> Iterator[xf.PatternTransformation]:
+        """
+        Yields matches of the given patterns. In incremental mode, the graphs modified by the last applied
+        transformation are searched before the entire SDFG.
+        """
+        if cache.modified is not None:
+            yield from match_patterns(sdfg,
+                                      permissive=self.permissive,
+                                      patterns=patterns,
+                                      states=self.states,
+                                      metadata=self._metadata,
+                                      cache=cache,
+                                      graphs=cache.modified)
+        yield from match_patterns(sdfg,
+                                  permissive=self.permissive,
+                                  patterns=patterns,
+                                  states=self.states,
+                                  metadata=self._metadata,
+                                  cache=cache)
 
     # Helper function for applying and validating a transformation
     def _apply_and_validate(self, match: xf.PatternTransformation, sdfg: SDFG, start: float,
-                            pipeline_results: Dict[str, Any], applied_transformations: Dict[str, Any]):
+                            pipeline_results: Dict[str, Any], applied_transformations: Dict[str, Any],
+                            cache: Optional['PatternMatchCache'] = None):
         tsdfg = sdfg.sdfg_list[match.sdfg_id]
         graph = tsdfg.node(match.state_id) if match.state_id >= 0 else tsdfg
 
@@ -166,13 +213,16 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
             match_name = match.print_match(tsdfg)
 
         applied_transformations[type(match).__name__].append(match.apply(graph, tsdfg))
+        tsdfg.journal.mark_modified(graph)
+        if cache is not None:
+            cache.modified = cache.modified_graphs(sdfg, graph)
         if self.progress or (self.progress is None and (time.time() - start) > 5):
             print('Applied {}.\r'.format(', '.join(['%d %s' % (len(v), k)
                                                     for k, v in applied_transformations.items()])),
                   end='')
         if self.validate_all:
             try:
-                sdfg.validate()
+                sdfg.validate(incremental=self._validate_incrementally())
             except InvalidSDFGError as err:
                 raise InvalidSDFGError(
                     f'Validation failed after applying {match_name}. '
@@ -195,20 +245,24 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
         if len(xforms) != len(set(xforms)):
             raise ValueError('Transformation set must be unique')
 
+        # Collapsed graphs and structural matches are kept between iterations
+        cache = PatternMatchCache()
+        incremental = self.incremental
+        if incremental is None:
+            incremental = Config.get_bool('optimizer', 'incremental_matching')
+
         if self.order_by_transformation:
             applied_anything = True
             while applied_anything:
                 applied_anything = False
                 for xform in xforms:
                     applied = True
+                    cache.modified = None
                     while applied:
                         applied = False
-                        for match in match_patterns(sdfg,
-                                                    permissive=self.permissive,
-                                                    patterns=[xform],
-                                                    states=self.states,
-                                                    metadata=self._metadata):
-                            self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations)
+                        for match in self._match_patterns(sdfg, [xform], cache):
+                            self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations,
+                                                     cache if incremental else None)
                             applied = True
                             applied_anything = True
                             break
@@ -219,12 +273,9 @@ class PatternMatchAndApplyRepeated(PatternMatchAndApply):
             while applied:
                 applied = False
                 # Find and apply one of the chosen transformations
-                for match in match_patterns(sdfg,
-                                            permissive=self.permissive,
-                                            patterns=xforms,
-                                            states=self.states,
-                                            metadata=self._metadata):
-                    self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations)
+                for match in self._match_patterns(sdfg, xforms, cache):
+                    self._apply_and_validate(match, sdfg, start, pipeline_results, applied_transformations,
+                                             cache if incremental else None)
                     applied = True
                     break
                 if apply_once:
@@ -268,6 +319,99 @@ class PatternApplyOnceEverywhere(PatternMatchAndApplyRepeated):
         return self._apply_pass(sdfg, pipeline_results, apply_once=True)
 
 
+class _GraphIndex:
+    """ Collapsed graph, node type index, and structural pattern matches of an SDFG or state at a given version. """
+
+    def __init__(self, graph: Union[SDFG, SDFGState]):
+        self.version = graph.version
+        self.digraph = collapse_multigraph_to_nx(graph)
+        self.types: Dict[type, List[int]] = collections.defaultdict(list)
+        for nid, node in enumerate(graph.nodes()):
+            self.types[type(node)].append(nid)
+        self.matches: Dict[nx.DiGraph, _LazyList] = {}
+
+    def nodes_of_type(self, node_type: type) -> List[int]:
+        """ Returns the IDs of the nodes that are instances of the given type, in graph order. """
+        result = []
+        for t, nids in self.types.items():
+            if issubclass(t, node_type):
+                result.extend(nids)
+        if len(result) > len(self.types.get(node_type, ())):
+            result.sort()
+        return result
+
+
+class _LazyList:
+    """ Iterable that caches the values of a generator as they are produced. """
+
+    def __init__(self, generator: Iterator[Any]):
+        self._generator = generator
+        self._items = []
+
+    def __iter__(self):
+        i = 0
+        while True:
+            if i == len(self._items):
+                try:
+                    self._items.append(next(self._generator))
+                except StopIteration:
+                    return
+            yield self._items[i]
+            i += 1
+
+
+class PatternMatchCache:
+    """
+    Caches the collapsed (networkx) graphs, node type indices, and structural pattern matches of SDFGs and states
+    across calls to ``match_patterns``. Entries are recomputed once nodes or edges are added to or removed from the
+    graph (see ``OrderedDiGraph.version``). Only the structural matches are cached, ``can_be_applied`` is
+    always called on the candidates.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Union[SDFG, SDFGState], _GraphIndex] = {}
+
+        #: If not None, the graphs modified since the last applied transformation
+        self.modified: Optional[Set[Union[SDFG, SDFGState]]] = None
+
+    def index(self, graph: Union[SDFG, SDFGState]) -> _GraphIndex:
+        entry = self._entries.get(graph)
+        if entry is None or entry.version != graph.version:
+            entry = _GraphIndex(graph)
+            self._entries[graph] = entry
+        return entry
+
+    def matches(self, graph: Union[SDFG, SDFGState], nxpattern: nx.DiGraph,
+                matcher: Callable) -> Tuple[nx.DiGraph, Iterable[Dict[int, int]]]:
+        """
+        Returns the collapsed graph and the structural matches of a pattern in the given graph.
+
+        :param graph: The SDFG or state to match in.
+        :param nxpattern: The collapsed pattern graph.
+        :param matcher: The matching function (e.g., ``_node_matcher``).
+        :return: A 2-tuple of the collapsed graph and an iterable of matches (mapping graph to pattern node IDs).
+        """
+        entry = self.index(graph)
+        result = entry.matches.get(nxpattern)
+        if result is None:
+            result = _LazyList(matcher(entry.digraph, nxpattern, type_match, None, entry))
+            entry.matches[nxpattern] = result
+        return entry.digraph, result
+
+    def modified_graphs(self, sdfg: SDFG, applied_graph: Union[SDFG, SDFGState]) -> Set[Union[SDFG, SDFGState]]:
+        """
+        Returns the graphs that were modified since they were last indexed, including the graph a transformation
+        was applied to.
+        """
+        result = {applied_graph}
+        for tsdfg in sdfg.all_sdfgs_recursive():
+            for graph in itertools.chain([tsdfg], tsdfg.nodes()):
+                entry = self._entries.get(graph)
+                if entry is None or entry.version != graph.version:
+                    result.add(graph)
+        return result
+
+
 def collapse_multigraph_to_nx(graph: Union[gr.MultiDiGraph, gr.OrderedMultiDiGraph]) -> nx.DiGraph:
     """ Collapses a directed multigraph into a networkx directed graph.
 
@@ -358,10 +502,8 @@ def _try_to_match_transformation(graph: Union[SDFG, SDFGState], collapsed_graph:
     Helper function that tries to instantiate a pattern match into a 
     transformation object. 
     """
-    subgraph = {
-        nxpattern.nodes[j]['node']: graph.node_id(collapsed_graph.nodes[i]['node'])
-        for i, j in subgraph.items()
-    }
+    # Nodes in the collapsed graph are numbered by their ID in the original graph
+    subgraph = {nxpattern.nodes[j]['node']: i for i, j in subgraph.items()}
 
     try:
         if isinstance(xform, xf.PatternTransformation):
@@ -438,28 +580,55 @@ def get_transformation_metadata(patterns: List[Type[xf.PatternTransformation]],
     return interstate_transformations, singlestate_transformations
 
 
-def _subgraph_isomorphism_matcher(digraph, nxpattern, node_pred, edge_pred):
+def _pattern_node_type(pattern_node: Dict[str, Any]) -> type:
+    """ Returns the node type matched by a pattern node using ``type_match``. """
+    if isinstance(pattern_node['node'], xf.PatternNode):
+        return pattern_node['node'].node
+    return type(pattern_node['node'])
+
+
+def _subgraph_isomorphism_matcher(digraph, nxpattern, node_pred, edge_pred, index: Optional[_GraphIndex] = None):
     """ Match based on the VF2 algorithm for general SI. """
+    if index is not None:
+        # Skip graphs that do not contain all node types of the pattern
+        for pnid in nxpattern:
+            if not index.nodes_of_type(_pattern_node_type(nxpattern.nodes[pnid])):
+                return
     graph_matcher = iso.DiGraphMatcher(digraph, nxpattern, node_match=node_pred, edge_match=edge_pred)
     yield from graph_matcher.subgraph_isomorphisms_iter()
 
 
-def _node_matcher(digraph, nxpattern, node_pred, edge_pred):
+def _node_matcher(digraph, nxpattern, node_pred, edge_pred, index: Optional[_GraphIndex] = None):
     """ Match individual nodes. """
     pnid = next(iter(nxpattern))
     pnode = nxpattern.nodes[pnid]
 
+    if index is not None:
+        # Nodes are indexed by type
+        for nid in index.nodes_of_type(_pattern_node_type(pnode)):
+            yield {nid: pnid}
+        return
+
     for nid in digraph:
         if node_pred(digraph.nodes[nid], pnode):
             yield {nid: pnid}
 
 
-def _edge_matcher(digraph, nxpattern, node_pred, edge_pred):
+def _edge_matcher(digraph, nxpattern, node_pred, edge_pred, index: Optional[_GraphIndex] = None):
     """ Match individual edges. """
     pedge = next(iter(nxpattern.edges))
     pu = nxpattern.nodes[pedge[0]]
     pv = nxpattern.nodes[pedge[1]]
 
+    if index is not None and edge_pred is None:
+        # Start from the indexed source nodes
+        dst_type = _pattern_node_type(pv)
+        for u in index.nodes_of_type(_pattern_node_type(pu)):
+            for v in digraph.successors(u):
+                if u != v and isinstance(digraph.nodes[v]['node'], dst_type):
+                    yield {u: pedge[0], v: pedge[1]}
+        return
+
     if edge_pred is None:
         for u, v in digraph.edges:
             if (node_pred(digraph.nodes[u], pu) and node_pred(digraph.nodes[v], pv)):
@@ -482,7 +651,9 @@ def match_patterns(sdfg: SDFG,
                    permissive: bool = False,
                    metadata: Optional[PatternMetadataType] = None,
                    states: Optional[List[SDFGState]] = None,
-                   options: Optional[List[Dict[str, Any]]] = None):
+                   options: Optional[List[Dict[str, Any]]] = None,
+                   cache: Optional[PatternMatchCache] = None,
+                   graphs: Optional[Set[Union[SDFG, SDFGState]]] = None):
     """ Returns a generator of Transformations that match the input SDFG. 
         Ordered by SDFG ID.
 
@@ -496,6 +667,11 @@ def match_patterns(sdfg: SDFG,
                        transformations on this list.
         :param options: An optional iterable of transformation parameter
                         dictionaries.
+        :param cache: An optional cache of collapsed graphs and structural
+                      matches to reuse between calls. Only used with the
+                      default node and edge matching functions.
+        :param graphs: If given, only tries to match in the given SDFGs
+                       (for inter-state transformations) and states.
         :return: A list of PatternTransformation objects that match.
     """
 
@@ -512,6 +688,9 @@ def match_patterns(sdfg: SDFG,
         # Otherwise, precompute all transformation data once
         (interstate_transformations, singlestate_transformations) = get_transformation_metadata(patterns, options)
 
+    if cache is not None and (node_match is not type_match or edge_match is not None):
+        cache = None
+
     # Collect SDFG and nested SDFGs
     sdfgs = sdfg.all_sdfgs_recursive()
 
@@ -519,16 +698,21 @@ def match_patterns(sdfg: SDFG,
     for tsdfg in sdfgs:
         ###################################
         # Match inter-state transformations
-        if len(interstate_transformations) > 0:
-            # Collapse multigraph into directed graph in order to use VF2
-            digraph = collapse_multigraph_to_nx(tsdfg)
-
-        for xform, expr_idx, nxpattern, matcher, opts in interstate_transformations:
-            for subgraph in matcher(digraph, nxpattern, node_match, edge_match):
-                match = _try_to_match_transformation(tsdfg, digraph, subgraph, tsdfg, xform, expr_idx, nxpattern, -1,
-                                                     permissive, opts)
-                if match is not None:
-                    yield match
+        if len(interstate_transformations) > 0 and (graphs is None or tsdfg in graphs):
+            if cache is None:
+                # Collapse multigraph into directed graph in order to use VF2
+                digraph = collapse_multigraph_to_nx(tsdfg)
+
+            for xform, expr_idx, nxpattern, matcher, opts in interstate_transformations:
+                if cache is None:
+                    subgraphs = matcher(digraph, nxpattern, node_match, edge_match)
+                else:
+                    digraph, subgraphs = cache.matches(tsdfg, nxpattern, matcher)
+                for subgraph in subgraphs:
+                    match = _try_to_match_transformation(tsdfg, digraph, subgraph, tsdfg, xform, expr_idx, nxpattern,
+                                                         -1, permissive, opts)
+                    if match is not None:
+                        yield match
 
         ####################################
         # Match single-state transformations
@@ -537,12 +721,19 @@ def match_patterns(sdfg: SDFG,
         for state_id, state in enumerate(tsdfg.nodes()):
             if states is not None and state not in states:
                 continue
+            if graphs is not None and state not in graphs:
+                continue
 
-            # Collapse multigraph into directed graph in order to use VF2
-            digraph = collapse_multigraph_to_nx(state)
+            if cache is None:
+                # Collapse multigraph into directed graph in order to use VF2
+                digraph = collapse_multigraph_to_nx(state)
 
             for xform, expr_idx, nxpattern, matcher, opts in singlestate_transformations:
-                for subgraph in matcher(digraph, nxpattern, node_match, edge_match):
+                if cache is None:
+                    subgraphs = matcher(digraph, nxpattern, node_match, edge_match)
+                else:
+                    digraph, subgraphs = cache.matches(state, nxpattern, matcher)
+                for subgraph in subgraphs:
                     match = _try_to_match_transformation(state, digraph, subgraph, tsdfg, xform, expr_idx, nxpattern,
                                                          state_id, permissive, opts)
                     if match is not None:
@@ -229,6 +229,11 @@ class PatternTransformation(TransformationBase):
         retval = self.apply(tgraph, tsdfg)
         if annotate and not self.annotates_memlets():
             propagation.propagate_memlets_sdfg(tsdfg)
+            tgraph = tsdfg
+        # Only the digests of the modified states are recomputed: the transformed state, or every state of the
+        # transformed SDFG (and its nested SDFGs) if memlets were propagated
+        tsdfg.invalidate_hash(states=[tgraph] if isinstance(tgraph, SDFGState) else None)
+        tsdfg.journal.mark_modified(tgraph)
         return retval
 
     def __lt__(self, other: 'PatternTransformation') -> bool:
@@ -851,7 +856,11 @@ class SubgraphTransformation(TransformationBase):
                                  'given subgraph ("can_be_applied" failed)')
 
         # Apply to SDFG
-        return instance.apply(sdfg)
+        retval = instance.apply(sdfg)
+        graph = subgraph.graph
+        sdfg.invalidate_hash(states=[graph] if isinstance(graph, SDFGState) else None)
+        sdfg.journal.mark_modified(sdfg)
+        return retval
 
     def to_json(self, parent=None):
         props = serialize.all_properties_to_json(self)
@@ -0,0 +1,308 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Persistent, on-disk memoization of SDFG transformation pipelines (e.g., simplification and auto-optimization).
+"""
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import uuid
+
+import dace
+from dace import config, serialize
+from dace.file_lock import file_lock
+from dace.sdfg import SDFG, nodes
+
+# Digest of the DaCe source code, computed once per process
+_dace_source_digest: Optional[str] = None
+
+# Tracks whether a cached transformation is being computed, in order to avoid caching nested transformations
+# (e.g., simplification within auto-optimization)
+_state = threading.local()
+
+
+def _source_digest(classes: Iterable[type]) -> str:
+    """
+    Computes a digest of the DaCe source code and of the source files of the given classes (and their base classes)
+    that are defined outside of DaCe. Used to invalidate cache entries when transformations change.
+    """
+    global _dace_source_digest
+    dace_folder = os.path.dirname(os.path.abspath(dace.__file__))
+    if _dace_source_digest is None:
+        hasher = hashlib.sha256()
+        for root, dirs, files in os.walk(dace_folder):
+            dirs.sort()
+            for file in sorted(files):
+                if file.endswith('.py'):
+                    with open(os.path.join(root, file), 'rb') as fp:
+                        hasher.update(fp.read())
+        _dace_source_digest = hasher.hexdigest()
+
+    hasher = hashlib.sha256(_dace_source_digest.encode('utf-8'))
+    files = set()
+    for cls in classes:
+        for base in inspect.getmro(cls):
+            try:
+                files.add(os.path.abspath(inspect.getfile(base)))
+            except TypeError:  # Built-in class
+                pass
+    for file in sorted(files):
+        if file.startswith(dace_folder) or not os.path.isfile(file):
+            continue
+        with open(file, 'rb') as fp:
+            hasher.update(fp.read())
+    return hasher.hexdigest()
+
+
+def _replace_sdfg(sdfg: SDFG, new_sdfg: SDFG) -> None:
+    """ Replaces the contents of a top-level SDFG in-place with the contents of another top-level SDFG. """
+    sdfg.__dict__.clear()
+    sdfg.__dict__.update(new_sdfg.__dict__)
+    for state in sdfg.nodes():
+        state.parent = sdfg
+        for node in state.nodes():
+            if isinstance(node, nodes.NestedSDFG):
+                node.sdfg.parent_sdfg = sdfg
+    sdfg.reset_sdfg_list()
+
+
+class TransformationCache:
+    """
+    A persistent on-disk cache of the results of transforming SDFGs, shared across processes. Each entry maps
+    the structural hash of an input SDFG (see ``SDFG.structural_hash``), a description of the applied
+    transformations (e.g., a serialized pipeline and its configuration), the optimizer configuration, the DaCe
+    version, and the source code of the transformations, to the transformed SDFG and the transformation return
+    value. The cache is bounded in the number of entries and evicts the least recently used entries first.
+
+    Only top-level SDFGs are cached, since the result of a cache hit replaces the contents of the SDFG in-place.
+
+    :see: dace.frontend.python.cached_program.PersistentProgramCache
+    """
+
+    STATISTICS = ('hits', 'misses', 'stores', 'evictions')
+
+    def __init__(self, folder: Optional[str] = None, size: Optional[int] = None) -> None:
+        """
+        Initializes a persistent transformation cache.
+
+        :param folder: The folder in which the cache is stored (if not given, uses the value from the configuration,
+                       or a ``transformations`` subfolder of the default build folder).
+        :param size: The maximal number of entries in the cache (if not given, uses the value from the
+                     configuration).
+        """
+        folder = folder or config.Config.get('optimizer', 'transformation_cache_folder')
+        if not folder:
+            folder = os.path.join(config.Config.get('default_build_folder'), 'transformations')
+        self.folder = os.path.abspath(folder)
+        self.size = size or config.Config.get('optimizer', 'transformation_cache_size')
+        os.makedirs(os.path.join(self.folder, 'entries'), exist_ok=True)
+        self._lockfile = os.path.join(self.folder, '.lock')
+        self._statsfile = os.path.join(self.folder, 'statistics.json')
+
+    @staticmethod
+    def digest(sdfg: SDFG,
+               description: Dict[str, Any],
+               classes: Iterable[type] = (),
+               rehash: bool = False) -> str:
+        """
+        Computes the address of a transformed SDFG in the cache. The address uses the cached digests of
+        ``SDFG.structural_hash``, which do not track properties that were modified directly.
+
+        :param sdfg: The input SDFG.
+        :param description: A JSON-serializable description of the applied transformations and their parameters.
+        :param classes: The transformation (or pass) classes that are applied.
+        :param rehash: If True, clears the cached digests of the SDFG and recomputes its hash in full.
+        :return: A hexadecimal digest string.
+        """
+        if rehash:
+            sdfg.invalidate_hash()
+        key = {
+            'version': dace.__version__,
+            'sdfg': sdfg.structural_hash(),
+            'description': description,
+            'optimizer': config.Config.get('optimizer'),
+            'source': _source_digest(classes),
+        }
+        return serialize.hash_json(key)
+
+    def _entry_path(self, digest: str) -> str:
+        return os.path.join(self.folder, 'entries', digest + '.pkl')
+
+    def _update_statistics(self, **increments: int) -> None:
+        """ Increments the persistent cache statistics. Must be called while holding the cache lock. """
+        stats = self._read_statistics()
+        for k, v in increments.items():
+            stats[k] += v
+        with open(self._statsfile, 'w') as fp:
+            json.dump(stats, fp)
+
+    def _read_statistics(self) -> Dict[str, int]:
+        stats = {k: 0 for k in self.STATISTICS}
+        try:
+            with open(self._statsfile, 'r') as fp:
+                stats.update(json.load(fp))
+        except (FileNotFoundError, ValueError):
+            pass
+        return stats
+
+    def statistics(self) -> Dict[str, int]:
+        """
+        Returns the statistics of the transformation cache, accumulated over all processes that used it.
+
+        :return: A dictionary with the number of cache hits, misses, stores, evictions, and current entries.
+        """
+        with file_lock(self._lockfile):
+            stats = self._read_statistics()
+        stats['entries'] = len(os.listdir(os.path.join(self.folder, 'entries')))
+        return stats
+
+    def load(self, digest: str) -> Optional[Tuple[SDFG, Any]]:
+        """
+        Loads a transformed SDFG from the cache.
+
+        :param digest: The address of the entry (see ``digest``).
+        :return: A 2-tuple of the transformed SDFG and the transformation return value, or None if the entry is not
+                 in the cache.
+        """
+        path = self._entry_path(digest)
+        with file_lock(self._lockfile):
+            try:
+                with open(path, 'rb') as fp:
+                    data = fp.read()
+                # Mark entry as recently used
+                os.utime(path)
+            except FileNotFoundError:
+                self._update_statistics(misses=1)
+                return None
+            self._update_statistics(hits=1)
+        return pickle.loads(data)
+
+    def store(self, digest: str, sdfg: SDFG, result: Any) -> bool:
+        """
+        Stores a transformed SDFG in the cache, evicting the least recently used entries if the cache exceeds its
+        size.
+
+        :param digest: The address of the entry (see ``digest``).
+        :param sdfg: The transformed SDFG.
+        :param result: The return value of the transformation, which may refer to elements of the SDFG.
+        :return: True if the entry was stored, or False if the SDFG or result cannot be serialized.
+        """
+        try:
+            data = pickle.dumps((sdfg, result))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        # Write entry into a temporary file first, then move it into place atomically
+        tmppath = os.path.join(self.folder, f'.tmp-{uuid.uuid4().hex}')
+        with open(tmppath, 'wb') as fp:
+            fp.write(data)
+        with file_lock(self._lockfile):
+            os.replace(tmppath, self._entry_path(digest))
+            self._update_statistics(stores=1, evictions=self._evict())
+        return True
+
+    def _evict(self) -> int:
+        """
+        Removes the least recently used entries until the cache is within its size. Must be called while holding
+        the cache lock.
+
+        :return: The number of evicted entries.
+        """
+        entries_folder = os.path.join(self.folder, 'entries')
+        entries = [os.path.join(entries_folder, e) for e in os.listdir(entries_folder)]
+        if len(entries) <= self.size:
+            return 0
+        entries.sort(key=os.path.getmtime)
+        evicted = 0
+        for path in entries[:len(entries) - self.size]:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        """ Removes all entries and statistics from the transformation cache. """
+        with file_lock(self._lockfile):
+            entries_folder = os.path.join(self.folder, 'entries')
+            for entry in os.listdir(entries_folder):
+                os.remove(os.path.join(entries_folder, entry))
+            if os.path.exists(self._statsfile):
+                os.remove(self._statsfile)
+
+    def apply(self,
+              sdfg: SDFG,
+              description: Dict[str, Any],
+              classes: Iterable[type],
+              func: Callable[[], Any],
+              rehash: bool = False) -> Any:
+        """
+        Memoizes an in-place transformation of an SDFG. If an entry for the SDFG and transformation exists, the SDFG
+        contents are replaced in-place with the cached result. Otherwise, the transformation is applied and its result
+        is stored in the cache. Transformations that are applied through the cache while ``func`` runs are not
+        cached separately.
+
+        :param sdfg: The top-level SDFG to transform.
+        :param description: A JSON-serializable description of the transformation and its parameters.
+        :param classes: The transformation (or pass) classes that are applied.
+        :param func: A function that applies the transformation to ``sdfg`` and returns a value.
+        :param rehash: If True, recomputes the hash of the SDFG in full (e.g., after its properties were modified
+                       directly without calling ``SDFG.invalidate_hash``).
+        :return: The return value of ``func``, either computed or loaded from the cache.
+        """
+        if sdfg.parent_sdfg is not None:
+            raise ValueError('Only top-level SDFGs can be transformed through the transformation cache')
+
+        if getattr(_state, 'active', False):
+            return func()
+
+        digest = self.digest(sdfg, description, classes, rehash)
+        cached = self.load(digest)
+        if cached is not None:
+            new_sdfg, result = cached
+            _replace_sdfg(sdfg, new_sdfg)
+            if result is new_sdfg:
+                result = sdfg
+            return result
+
+        _state.active = True
+        try:
+            result = func()
+        finally:
+            _state.active = False
+        self.store(digest, sdfg, result)
+        return result
+
+    def apply_pipeline(self,
+                       pipeline: 'dace.transformation.pass_pipeline.Pipeline',
+                       sdfg: SDFG,
+                       rehash: bool = False) -> Optional[Any]:
+        """
+        Applies a pass pipeline to a top-level SDFG through the cache.
+
+        :param pipeline: The pipeline to apply.
+        :param sdfg: The SDFG to apply the pipeline to.
+        :param rehash: If True, recomputes the hash of the SDFG in full.
+        :return: The return value of ``pipeline.apply_pass``.
+        """
+        from dace.transformation import pass_pipeline as ppl  # Avoid import loops
+
+        classes = set()
+
+        def describe(p: ppl.Pass) -> Dict[str, Any]:
+            classes.add(type(p))
+            desc = p.to_json()
+            if isinstance(p, ppl.Pipeline):
+                # Dependencies are added to pipelines in arbitrary order, sort them by name
+                given = [sp for sp in p.passes if type(sp).__name__ in p._pass_names]
+                deps = sorted((sp for sp in p.passes if type(sp).__name__ not in p._pass_names),
+                              key=lambda sp: type(sp).__name__)
+                desc['passes'] = [describe(sp) for sp in given + deps]
+            return desc
+
+        description = describe(pipeline)
+        return self.apply(sdfg, description, classes, lambda: pipeline.apply_pass(sdfg, {}), rehash)
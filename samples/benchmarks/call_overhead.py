@@ -0,0 +1,43 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Microbenchmark measuring the per-call Python overhead of calling a compiled SDFG through the regular call path
+(``CompiledSDFG.__call__``) versus the fast call path with cached argument marshalling (``CompiledSDFG.fast_call``).
+"""
+import argparse
+import timeit
+
+import dace
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def small_kernel(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+    y[:] = a * x + y
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("N", type=int, nargs="?", default=16)
+    parser.add_argument("-r", "--repetitions", type=int, default=100000)
+    args = parser.parse_args()
+
+    csdfg = small_kernel.to_sdfg().compile()
+    x = np.random.rand(args.N)
+    y = np.random.rand(args.N)
+
+    # Warm up (and create the argument marshalling plan)
+    csdfg(2.0, x, y, N=args.N)
+    csdfg.fast_call(2.0, x, y, N=args.N)
+
+    # Measure the cost of the call itself by not executing the generated code
+    for do_not_execute in (True, False):
+        csdfg.do_not_execute = do_not_execute
+        regular = timeit.timeit(lambda: csdfg(2.0, x, y, N=args.N), number=args.repetitions)
+        fast = timeit.timeit(lambda: csdfg.fast_call(2.0, x, y, N=args.N), number=args.repetitions)
+
+        print('Overhead only:' if do_not_execute else 'Including execution:')
+        print('  Regular call: %.3f us/call' % (regular / args.repetitions * 1e6))
+        print('  Fast call:    %.3f us/call' % (fast / args.repetitions * 1e6))
+        print('  Speedup:      %.2fx' % (regular / fast))
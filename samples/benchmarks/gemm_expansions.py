@@ -0,0 +1,64 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark comparing the GFLOP/s of the CPU expansions of the GEMM library node: the naive pure expansion
+("pure"), the cache-blocked pure expansion ("pure_tiled"), and OpenBLAS (if it is installed).
+"""
+import argparse
+import timeit
+import warnings
+
+import dace
+import numpy as np
+from dace.codegen.exceptions import CompilationError, CompilerConfigurationError
+from dace.libraries.blas import Gemm
+
+M, N, K = (dace.symbol(s) for s in 'MNK')
+
+
+def gemm_sdfg(implementation: str, dtype) -> dace.SDFG:
+    sdfg = dace.SDFG(f'gemm_{implementation}')
+    state = sdfg.add_state()
+    for name, shape in (('A', [M, K]), ('B', [K, N]), ('C', [M, N])):
+        sdfg.add_array(name, shape, dtype)
+    node = Gemm('gemm')
+    node.implementation = implementation
+    state.add_node(node)
+    state.add_edge(state.add_read('A'), None, node, '_a', dace.Memlet('A'))
+    state.add_edge(state.add_read('B'), None, node, '_b', dace.Memlet('B'))
+    state.add_edge(node, '_c', state.add_write('C'), None, dace.Memlet('C'))
+    return sdfg
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sizes", type=int, nargs="*", default=[64, 255, 512, 1024])
+    parser.add_argument("-t", "--type", choices=["float32", "float64"], default="float64")
+    parser.add_argument("-r", "--repetitions", type=int, default=5)
+    parser.add_argument("--skip-naive-above", type=int, default=512, help="Largest size to run the naive expansion")
+    args = parser.parse_args()
+
+    dtype = getattr(dace, args.type)
+    compiled = {}
+    for implementation in ('pure', 'pure_tiled', 'OpenBLAS'):
+        try:
+            compiled[implementation] = gemm_sdfg(implementation, dtype).compile()
+        except (CompilerConfigurationError, CompilationError) as ex:
+            warnings.warn(f'Could not compile the {implementation} expansion, skipping: {ex}')
+
+    print('%6s  %12s  %12s  %12s' % ('Size', *('%s GF/s' % impl for impl in ('pure', 'pure_tiled', 'OpenBLAS'))))
+    for size in args.sizes:
+        A = np.random.rand(size, size).astype(dtype.as_numpy_dtype())
+        B = np.random.rand(size, size).astype(dtype.as_numpy_dtype())
+        C = np.zeros((size, size), dtype=dtype.as_numpy_dtype())
+        results = []
+        for implementation in ('pure', 'pure_tiled', 'OpenBLAS'):
+            csdfg = compiled.get(implementation)
+            if csdfg is None or (implementation == 'pure' and size > args.skip_naive_above):
+                results.append('-')
+                continue
+            call = lambda: csdfg(A=A, B=B, C=C, M=size, N=size, K=size)
+            call()
+            assert np.allclose(C, A @ B, rtol=1e-3)
+            runtime = min(timeit.repeat(call, number=1, repeat=args.repetitions))
+            results.append('%.2f' % (2 * size**3 / runtime * 1e-9))
+        print('%6d  %12s  %12s  %12s' % (size, *results))
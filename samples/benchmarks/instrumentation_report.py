@@ -0,0 +1,69 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark comparing load time and peak memory of ``InstrumentationReport`` and the streaming
+``ColumnarInstrumentationReport`` on a synthetic timer report. Each loader runs in a separate process in order to
+measure its peak memory usage.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from dace.codegen.instrumentation.report import ColumnarInstrumentationReport, InstrumentationReport
+
+LOADERS = {
+    'InstrumentationReport': lambda path: InstrumentationReport(path),
+    'ColumnarInstrumentationReport': lambda path: ColumnarInstrumentationReport(path),
+    'ColumnarInstrumentationReport (statistics only)':
+    lambda path: ColumnarInstrumentationReport(path, keep_events=False),
+}
+
+
+def write_report(path: str, num_events: int, num_elements: int = 100):
+    """ Writes a synthetic timer report, in the same format as the DaCe runtime. """
+    rng = np.random.default_rng(0)
+    durations = rng.integers(1, 100000, size=num_events)
+    nodes = rng.integers(0, num_elements, size=num_events)
+    with open(path, 'w') as fp:
+        fp.write('{\n  "traceEvents": [\n')
+        for i in range(num_events):
+            if i > 0:
+                fp.write(',\n')
+            fp.write(f'    {{"name": "Timer", "cat": "Timer", "ph": "X", "ts": {i * 10}, "dur": {durations[i]}, '
+                     f'"pid": 0, "tid": -1, "args": {{"sdfg_id": 0, "state_id": 0, "id": {nodes[i]}}}}}')
+        fp.write('\n  ],\n  "sdfgHash": "' + '0' * 64 + '"\n}\n')
+
+
+def run_loader(name: str, path: str):
+    start = time.perf_counter()
+    LOADERS[name](path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({'time': elapsed, 'peak': peak}))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('sizes', type=int, nargs='*', default=[100000, 1000000])
+    parser.add_argument('--run', nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_loader(*args.run)
+        sys.exit(0)
+
+    with tempfile.TemporaryDirectory() as folder:
+        for size in args.sizes:
+            path = os.path.join(folder, 'report-0.json')
+            write_report(path, size)
+            print(f'{size} events ({os.path.getsize(path) / 2**20:.1f} MiB):')
+            for name in LOADERS:
+                output = subprocess.check_output([sys.executable, __file__, '--run', name, path])
+                result = json.loads(output.decode().strip().split('\n')[-1])
+                print(f'  {name:48} load: {result["time"]:8.2f} s  peak memory: {result["peak"]:9.1f} MiB')
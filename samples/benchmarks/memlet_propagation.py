@@ -0,0 +1,79 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark measuring repeated memlet propagation on large SDFGs with nested SDFGs. Compares three modes:
+
+* Uncached: propagates the entire SDFG without memoization (``optimizer.memlet_propagation_cache_size`` set to 0).
+* Cached: propagates the entire SDFG again, reusing memoized results of unchanged scopes.
+* Dirty: propagates only upwards from a single modified node (``propagate_memlets_from_nodes``).
+
+The benchmarked SDFGs consist of a chain of states, each containing a nested SDFG with two nested maps.
+"""
+import argparse
+import time
+
+import dace
+from dace.sdfg import nodes, propagation
+
+N = dace.symbol('N')
+
+
+def nested(index: int) -> dace.SDFG:
+    """ Creates a nested SDFG with a two-dimensional stencil in nested maps. """
+    sdfg = dace.SDFG(f'nested{index}')
+    sdfg.add_array('A', [N, N], dace.float64)
+    sdfg.add_array('B', [N, N], dace.float64)
+    state = sdfg.add_state()
+    ome, omx = state.add_map('outer', dict(i=f'1:N-1'))
+    ime, imx = state.add_map('inner', dict(j=f'1:N-1'))
+    tasklet = state.add_tasklet('stencil', {'c', 'n', 's', 'w', 'e'}, {'o'}, 'o = 0.2 * (c + n + s + w + e)')
+    r, w = state.add_read('A'), state.add_write('B')
+    for conn, idx in zip('cnswe', ['i, j', 'i-1, j', 'i+1, j', 'i, j-1', 'i, j+1']):
+        state.add_memlet_path(r, ome, ime, tasklet, dst_conn=conn, memlet=dace.Memlet(f'A[{idx}]'))
+    state.add_memlet_path(tasklet, imx, omx, w, src_conn='o', memlet=dace.Memlet('B[i, j]'))
+    return sdfg
+
+
+def chain(num_states: int) -> dace.SDFG:
+    """ Creates an SDFG with the given number of states, each containing a nested SDFG. """
+    sdfg = dace.SDFG('chain')
+    sdfg.add_array('A', [N, N], dace.float64)
+    sdfg.add_array('B', [N, N], dace.float64)
+    state = None
+    for i in range(num_states):
+        state = sdfg.add_state(is_start_state=(i == 0)) if state is None else sdfg.add_state_after(state)
+        nsdfg = state.add_nested_sdfg(nested(i), sdfg, {'A'}, {'B'}, {'N': 'N'})
+        state.add_edge(state.add_read('A'), None, nsdfg, 'A', dace.Memlet('A[0:N, 0:N]'))
+        state.add_edge(nsdfg, 'B', state.add_write('B'), None, dace.Memlet('B[0:N, 0:N]'))
+    return sdfg
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('sizes', type=int, nargs='*', default=[25, 50, 100])
+    args = parser.parse_args()
+
+    print(f'{"States":>8} {"Uncached [s]":>14} {"Cached [s]":>14} {"Dirty [s]":>14}')
+    for size in args.sizes:
+        sdfg = chain(size)
+        propagation.clear_propagation_cache()
+
+        with dace.config.set_temporary('optimizer', 'memlet_propagation_cache_size', value=0):
+            start = time.perf_counter()
+            propagation.propagate_memlets_sdfg(sdfg)
+            uncached = time.perf_counter() - start
+
+        # Fill cache, then measure a full re-propagation
+        propagation.propagate_memlets_sdfg(sdfg)
+        start = time.perf_counter()
+        propagation.propagate_memlets_sdfg(sdfg)
+        cached = time.perf_counter() - start
+
+        # Modify a single tasklet in the middle of the chain and propagate upwards from it
+        nsdfg_node = next(n for n in sdfg.node(size // 2).nodes() if isinstance(n, nodes.NestedSDFG))
+        inner_state = nsdfg_node.sdfg.start_state
+        tasklet = next(n for n in inner_state.nodes() if isinstance(n, nodes.Tasklet))
+        start = time.perf_counter()
+        propagation.propagate_memlets_from_nodes(nsdfg_node.sdfg, inner_state, [tasklet])
+        dirty = time.perf_counter() - start
+
+        print(f'{size:8} {uncached:14.3f} {cached:14.3f} {dirty:14.4f}')
@@ -0,0 +1,95 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark measuring how repeated pattern matching (as in ``SDFG.apply_transformations_repeated``) scales with the
+size of the SDFG. Compares three modes:
+
+* Uncached: collapses every graph and runs subgraph isomorphism from scratch after each application.
+* Cached: reuses collapsed graphs, node type indices, and structural matches of unmodified graphs
+  (``PatternMatchCache``).
+* Incremental: additionally searches the graphs modified by the last applied transformation first
+  (the ``optimizer.incremental_matching`` configuration entry).
+
+The benchmarked SDFGs consist of a chain of states, each containing two consecutive two-dimensional maps.
+"""
+import argparse
+import time
+
+import dace
+from dace.transformation.dataflow import MapExpansion, MapFusion
+from dace.transformation.passes.pattern_matching import (PatternMatchAndApplyRepeated, PatternMatchCache,
+                                                         match_patterns)
+
+
+def chain(num_states: int) -> dace.SDFG:
+    """ Creates an SDFG with the given number of states, each containing two consecutive maps. """
+    sdfg = dace.SDFG('chain')
+    sdfg.add_array('A', [64, 64], dace.float64)
+    sdfg.add_array('B', [64, 64], dace.float64)
+    state = None
+    for i in range(num_states):
+        state = sdfg.add_state(is_start_state=(i == 0)) if state is None else sdfg.add_state_after(state)
+        tmp, _ = sdfg.add_transient(f'tmp{i}', [64, 64], dace.float64, find_new_name=True)
+        tmpnode = state.add_access(tmp)
+        state.add_mapped_tasklet('first',
+                                 dict(i='0:64', j='0:64'),
+                                 dict(a=dace.Memlet('A[i, j]')),
+                                 'b = a * 2',
+                                 dict(b=dace.Memlet(f'{tmp}[i, j]')),
+                                 external_edges=True,
+                                 output_nodes={tmp: tmpnode})
+        state.add_mapped_tasklet('second',
+                                 dict(i='0:64', j='0:64'),
+                                 dict(a=dace.Memlet(f'{tmp}[i, j]')),
+                                 'b = a + 1',
+                                 dict(b=dace.Memlet('B[i, j]')),
+                                 external_edges=True,
+                                 input_nodes={tmp: tmpnode})
+    return sdfg
+
+
+def apply_uncached(sdfg: dace.SDFG, xform) -> int:
+    applied = 0
+    while True:
+        for match in match_patterns(sdfg, [xform]):
+            match.apply_pattern(append=False, annotate=False)
+            applied += 1
+            break
+        else:
+            return applied
+
+
+def apply_cached(sdfg: dace.SDFG, xform) -> int:
+    applied = 0
+    cache = PatternMatchCache()
+    while True:
+        for match in match_patterns(sdfg, [xform], cache=cache):
+            match.apply_pattern(append=False, annotate=False)
+            applied += 1
+            break
+        else:
+            return applied
+
+
+def apply_incremental(sdfg: dace.SDFG, xform) -> int:
+    pazz = PatternMatchAndApplyRepeated([xform], validate=False, progress=False, incremental=True)
+    result = pazz.apply_pass(sdfg, {})
+    return sum(len(v) for v in result.values())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('sizes', type=int, nargs='*', default=[25, 50, 100, 200])
+    args = parser.parse_args()
+
+    modes = {'Uncached': apply_uncached, 'Cached': apply_cached, 'Incremental': apply_incremental}
+    for xform in (MapFusion, MapExpansion):
+        print(f'{xform.__name__}:')
+        print(f'{"States":>8} {"Applied":>8}' + ''.join(f'{mode + " [s]":>16}' for mode in modes))
+        for size in args.sizes:
+            times = []
+            for func in modes.values():
+                sdfg = chain(size)
+                start = time.perf_counter()
+                applied = func(sdfg, xform)
+                times.append(time.perf_counter() - start)
+            print(f'{size:8} {applied:8}' + ''.join(f'{t:16.2f}' for t in times))
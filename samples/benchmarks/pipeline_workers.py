@@ -0,0 +1,47 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark measuring the wall time of a pipeline of independent analysis passes, run sequentially and with
+different numbers of worker threads (see the ``optimizer.pipeline_workers`` configuration entry).
+"""
+import argparse
+import time
+
+import dace
+from dace.transformation import pass_pipeline as ppl
+from dace.transformation.passes import analysis as ap
+
+N = dace.symbol('N')
+
+ANALYSES = (ap.StateReachability, ap.SymbolAccessSets, ap.AccessSets, ap.FindAccessStates, ap.FindAccessNodes,
+            ap.SymbolWriteScopes, ap.ScalarWriteShadowScopes)
+
+
+@dace.program
+def many_states(A: dace.float64[N], B: dace.float64[N]):
+    for t in range(10):
+        A[:] = A + B
+        B[:] = A * 2
+        if t % 2 == 0:
+            A[1:] = B[:-1]
+        for i in dace.map[0:N]:
+            B[i] = A[i] + 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("workers", nargs="*", type=int, default=[1, 2, 4], help="Numbers of worker threads")
+    parser.add_argument("-r", "--repetitions", type=int, default=5)
+    parser.add_argument("-n", "--iterations", type=int, default=20, help="Pipeline applications per measurement")
+    args = parser.parse_args()
+
+    sdfg = many_states.to_sdfg(simplify=False)
+    print(f'{len(ANALYSES)} analysis passes, {sdfg.number_of_nodes()} states')
+    for workers in args.workers:
+        runtimes = []
+        for _ in range(args.repetitions):
+            pipeline = ppl.Pipeline([analysis() for analysis in ANALYSES], num_workers=workers)
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                pipeline.apply_pass(sdfg, {})
+            runtimes.append((time.perf_counter() - start) / args.iterations)
+        print('%2d workers: %8.2f ms' % (workers, min(runtimes) * 1e3))
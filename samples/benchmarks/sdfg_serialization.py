@@ -0,0 +1,97 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark comparing save/load time and file size of the SDFG file formats: JSON, gzip-compressed JSON, and the
+compact binary format (eagerly and lazily loaded).
+
+Given ``.sdfg`` files as arguments, benchmarks those. Otherwise, uses the programs defined in the DaCe samples and
+an SDFG containing a copy of each of them in every state of its nested SDFGs.
+"""
+import argparse
+import glob
+import importlib.util
+import os
+import tempfile
+import time
+import warnings
+
+import dace
+
+
+def sample_sdfgs():
+    """ Yields SDFGs of the ``@dace.program``-decorated functions in the samples folder. """
+    samples_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    for subdir in ('simple', 'explicit', 'optimization'):
+        for path in sorted(glob.glob(os.path.join(samples_dir, subdir, '*.py'))):
+            spec = importlib.util.spec_from_file_location(f'sample_{subdir}_{os.path.basename(path)[:-3]}', path)
+            module = importlib.util.module_from_spec(spec)
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    spec.loader.exec_module(module)
+            except Exception:
+                continue
+            for name, obj in vars(module).items():
+                if isinstance(obj, dace.frontend.python.parser.DaceProgram):
+                    try:
+                        yield f'{subdir}/{name}', obj.to_sdfg()
+                    except Exception:
+                        pass
+
+
+def large_sdfg(sdfgs, copies=20):
+    """ Creates an SDFG with many states, each containing all the given SDFGs as nested SDFGs. """
+    sdfg = dace.SDFG('large_sdfg')
+    state = None
+    for i in range(copies):
+        state = sdfg.add_state(is_start_state=(i == 0)) if state is None else sdfg.add_state_after(state)
+        for nested in sdfgs:
+            nested = dace.SDFG.from_json(nested.to_json())
+            state.add_nested_sdfg(nested, sdfg, {}, {}, symbol_mapping={s: 0 for s in nested.free_symbols})
+    return sdfg
+
+
+def measure(func, repetitions):
+    times = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(name, sdfg, folder, repetitions):
+    formats = {
+        'JSON': dict(compress=False, binary=False),
+        'JSON (gzip)': dict(compress=True, binary=False),
+        'Binary': dict(compress=False, binary=True),
+        'Binary (gzip)': dict(compress=True, binary=True),
+    }
+    print(f'{name} ({sdfg.number_of_nodes()} states, {len(list(sdfg.all_sdfgs_recursive()))} SDFGs):')
+    for fmt, options in formats.items():
+        filename = os.path.join(folder, f'{sdfg.name}_{fmt[0]}{int(options["compress"])}.sdfg')
+        save_time = measure(lambda: sdfg.save(filename, hash=False, **options), repetitions)
+        load_time = measure(lambda: dace.SDFG.from_file(filename), repetitions)
+        size = os.path.getsize(filename)
+        line = f'  {fmt:14} size: {size / 1024:10.1f} KiB'
+        line += f'  save: {save_time * 1e3:9.2f} ms  load: {load_time * 1e3:9.2f} ms'
+        if options['binary']:
+            lazy_time = measure(lambda: dace.SDFG.from_file(filename, lazy=True), repetitions)
+            line += f'  load (lazy): {lazy_time * 1e3:9.2f} ms'
+        print(line)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('files', nargs='*', help='SDFG files to benchmark (default: SDFGs from the samples)')
+    parser.add_argument('-r', '--repetitions', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.files:
+        sdfgs = [(path, dace.SDFG.from_file(path)) for path in args.files]
+    else:
+        sdfgs = list(sample_sdfgs())
+        sdfgs.append(('combined samples', large_sdfg([sdfg for _, sdfg in sdfgs])))
+
+    with tempfile.TemporaryDirectory() as folder:
+        for name, sdfg in sdfgs:
+            benchmark(name, sdfg, folder, args.repetitions)
@@ -0,0 +1,96 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark comparing the performance (GFLOP/s) of the sparse matrix-vector and matrix-matrix products of the sparse
+library in different formats: CSR (pure expansion of CSRMV/CSRMM), SELL-C-sigma, BSR and COO, on synthetic matrices
+with a power-law distribution of nonzeros per row and on banded matrices.
+"""
+import argparse
+import timeit
+
+import dace
+import numpy as np
+import scipy.sparse
+from dace.libraries import sparse
+from dace.libraries.sparse.formats import csr_to_sell
+
+
+def power_law_matrix(n: int, exponent: float = 1.8, seed: int = 0) -> scipy.sparse.csr_matrix:
+    """ Returns a matrix whose numbers of nonzeros per row follow a (Zipf) power-law distribution. """
+    rng = np.random.default_rng(seed)
+    lengths = np.minimum(rng.zipf(exponent, n), n)
+    rows = np.repeat(np.arange(n), lengths)
+    cols = rng.integers(0, n, len(rows))
+    A = scipy.sparse.csr_matrix((rng.random(len(rows)), (rows, cols)), shape=(n, n))
+    A.sort_indices()
+    return A
+
+
+def banded_matrix(n: int, bandwidth: int = 8, seed: int = 0) -> scipy.sparse.csr_matrix:
+    """ Returns a matrix whose nonzeros are within the given distance from the diagonal. """
+    rng = np.random.default_rng(seed)
+    offsets = list(range(-bandwidth, bandwidth + 1))
+    return scipy.sparse.diags([rng.random(n - abs(o)) for o in offsets], offsets, format='csr')
+
+
+MATRICES = {'power_law': power_law_matrix, 'banded': banded_matrix}
+
+
+def formats(A: scipy.sparse.csr_matrix, chunk_size: int, sigma: int, blocksize: int):
+    """ Yields the name, library node classes, keyword arguments and input arrays of every format. """
+    csr = {'_a_rows': A.indptr, '_a_cols': A.indices, '_a_vals': A.data}
+    yield 'CSR', (sparse.CSRMV, sparse.CSRMM), {}, csr
+    slices, perm, cols, vals = csr_to_sell(A.indptr, A.indices, A.data, chunk_size, sigma)
+    sell = {'_a_slices': slices, '_a_perm': perm, '_a_cols': cols, '_a_vals': vals}
+    yield 'SELL', (sparse.SELLMV, sparse.SELLMM), {'chunk_size': chunk_size}, sell
+    blocks = A.tobsr((blocksize, blocksize))
+    bsr = {'_a_rows': blocks.indptr, '_a_cols': blocks.indices, '_a_vals': blocks.data}
+    yield 'BSR', (sparse.BSRMV, sparse.BSRMM), {}, bsr
+    coo = A.tocoo()
+    yield 'COO', (sparse.COOMV, sparse.COOMM), {}, {'_a_rows': coo.row, '_a_cols': coo.col, '_a_vals': coo.data}
+
+
+def product_sdfg(name: str, node: dace.nodes.LibraryNode, arrays, n: int, k: int) -> dace.SDFG:
+    sdfg = dace.SDFG(name)
+    state = sdfg.add_state()
+    for conn, arr in arrays.items():
+        sdfg.add_array('A' + conn, arr.shape, dace.DTYPE_TO_TYPECLASS[arr.dtype.type])
+        state.add_edge(state.add_read('A' + conn), None, node, conn, dace.Memlet('A' + conn))
+    sdfg.add_array('B', [n, k] if k > 1 else [n], dace.float64)
+    sdfg.add_array('C', [n, k] if k > 1 else [n], dace.float64)
+    state.add_edge(state.add_read('B'), None, node, '_b', dace.Memlet('B'))
+    state.add_edge(node, '_c', state.add_write('C'), None, dace.Memlet('C'))
+    return sdfg
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("matrices",
+                        nargs="*",
+                        default=list(MATRICES.keys()),
+                        help=f"Matrices to run, out of {', '.join(MATRICES.keys())}")
+    parser.add_argument("-n", "--size", type=int, default=500000, help="Number of rows and columns")
+    parser.add_argument("-k", "--columns", type=int, default=1, help="Columns of the dense matrix (1 for SpMV)")
+    parser.add_argument("-c", "--chunk-size", type=int, default=8, help="SELL slice height")
+    parser.add_argument("-s", "--sigma", type=int, default=256, help="SELL sorting window")
+    parser.add_argument("-b", "--blocksize", type=int, default=4, help="BSR block size")
+    parser.add_argument("-r", "--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    n, k = args.size, args.columns
+    B = np.random.rand(*([n, k] if k > 1 else [n]))
+    C = np.zeros_like(B)
+    print('%10s  %6s  %12s  %14s' % ('Matrix', 'Format', 'GFLOP/s', 'Stored entries'))
+    for matrix in args.matrices:
+        A = MATRICES[matrix](n)
+        expected = A @ B
+        for fmt, (mv, mm), kwargs, arrays in formats(A, args.chunk_size, args.sigma, args.blocksize):
+            node = (mm if k > 1 else mv)(fmt.lower(), **kwargs)
+            if fmt == 'CSR':
+                node.implementation = 'pure'
+            arrays = {conn: arr.copy() for conn, arr in arrays.items()}
+            csdfg = product_sdfg(f'spmm_{matrix}_{fmt.lower()}', node, arrays, n, k).compile()
+            call = lambda: csdfg(B=B, C=C, **{'A' + conn: arr for conn, arr in arrays.items()})
+            call()
+            assert np.allclose(C, expected)
+            runtime = min(timeit.repeat(call, number=1, repeat=args.repetitions))
+            print('%10s  %6s  %12.2f  %14d' % (matrix, fmt, 2 * A.nnz * k / runtime * 1e-9, arrays['_a_vals'].size))
@@ -0,0 +1,44 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark measuring memlet propagation and validation of large SDFGs with and without the fast path for affine
+symbolic expressions (``optimizer.affine_fast_path``). Memoization of propagation is disabled, so that every memlet
+is propagated in each run. Uses the SDFGs of the ``memlet_propagation`` benchmark.
+"""
+import argparse
+import time
+
+import dace
+from dace import symbolic
+from dace.sdfg import propagation
+
+from memlet_propagation import chain
+
+
+def measure(sdfg: dace.SDFG, fast_path: bool):
+    """ Returns the time to propagate memlets and validate the SDFG. """
+    symbolic.simplify.cache_clear()
+    symbolic._affine.cache_clear()
+    with dace.config.set_temporary('optimizer', 'affine_fast_path', value=fast_path):
+        with dace.config.set_temporary('optimizer', 'memlet_propagation_cache_size', value=0):
+            start = time.perf_counter()
+            propagation.propagate_memlets_sdfg(sdfg)
+            propagate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sdfg.validate()
+        validate = time.perf_counter() - start
+    return propagate, validate
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('sizes', type=int, nargs='*', default=[10, 25, 50])
+    args = parser.parse_args()
+
+    print(f'{"States":>8} {"Propagate [s]":>14} {"(affine) [s]":>14} {"Validate [s]":>14} {"(affine) [s]":>14}')
+    for size in args.sizes:
+        sdfg = chain(size)
+        sympy_propagate, sympy_validate = measure(sdfg, False)
+        affine_propagate, affine_validate = measure(sdfg, True)
+        print(f'{size:8} {sympy_propagate:14.3f} {affine_propagate:14.3f} {sympy_validate:14.3f} '
+              f'{affine_validate:14.3f}')
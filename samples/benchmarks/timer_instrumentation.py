@@ -0,0 +1,68 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark measuring the overhead of timer instrumentation on a small map that is invoked many times in a loop.
+Compares an uninstrumented program with full timer instrumentation (``InstrumentationType.Timer``), which records
+every invocation, and sampled timer instrumentation (``InstrumentationType.Sampled_Timer``), which records every N-th
+invocation in bounded per-thread buffers.
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+import dace
+from dace.sdfg import nodes
+
+N = dace.symbol('N')
+
+
+@dace.program
+def hot_loop(A: dace.float64[N], B: dace.float64[N], iterations: dace.int64):
+    for _ in range(iterations):
+        for i in dace.map[0:N]:
+            B[i] = B[i] + A[i] * 0.5
+
+
+def compile_instrumented(instrumentation: dace.InstrumentationType) -> dace.codegen.compiled_sdfg.CompiledSDFG:
+    sdfg = hot_loop.to_sdfg(simplify=True)
+    sdfg.name = f'hot_loop_{instrumentation.name}'
+    for node, _ in sdfg.all_nodes_recursive():
+        if isinstance(node, nodes.MapEntry):
+            node.map.instrument = instrumentation
+    return sdfg.compile()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', '--size', type=int, default=256)
+    parser.add_argument('-i', '--iterations', type=int, default=100000)
+    parser.add_argument('-r', '--repetitions', type=int, default=5)
+    args = parser.parse_args()
+
+    A = np.random.rand(args.size)
+    B = np.zeros_like(A)
+    modes = {
+        'None': dace.InstrumentationType.No_Instrumentation,
+        'Timer': dace.InstrumentationType.Timer,
+        'Sampled_Timer': dace.InstrumentationType.Sampled_Timer,
+    }
+    baseline = None
+    print(f'{"Mode":>14} {"Time [ms]":>12} {"Overhead":>10} {"Report [KiB]":>14}')
+    for mode, instrumentation in modes.items():
+        csdfg = compile_instrumented(instrumentation)
+        times = []
+        for _ in range(args.repetitions):
+            start = time.perf_counter()
+            csdfg(A=A, B=B, iterations=args.iterations, N=args.size)
+            times.append(time.perf_counter() - start)
+        runtime = min(times)
+        baseline = baseline or runtime
+
+        report_size = 0
+        report_folder = os.path.join(csdfg.sdfg.build_folder, 'perf')
+        if os.path.isdir(report_folder):
+            reports = sorted(os.listdir(report_folder))
+            if reports:
+                report_size = os.path.getsize(os.path.join(report_folder, reports[-1]))
+        print(f'{mode:>14} {runtime * 1e3:12.2f} {(runtime / baseline - 1) * 100:9.1f}% {report_size / 1024:14.1f}')
@@ -0,0 +1,59 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Benchmark comparing the effective bandwidth (GB/s read and written) of the CPU expansions of the TensorTranspose
+library node: the elementwise pure expansion ("pure") and the blocked, parallel expansion ("pure_blocked").
+"""
+import argparse
+import timeit
+
+import dace
+import numpy as np
+from dace.libraries.standard import TensorTranspose
+
+PERMUTATIONS = {
+    'matrix': ((8192, 8192), (1, 0)),
+    'nchw_to_nhwc': ((64, 64, 56, 56), (0, 2, 3, 1)),
+    'nhwc_to_nchw': ((64, 56, 56, 64), (0, 3, 1, 2)),
+    'reverse_4d': ((64, 64, 32, 32), (3, 2, 1, 0)),
+}
+
+
+def transpose_sdfg(implementation: str, shape, axes, dtype) -> dace.SDFG:
+    sdfg = dace.SDFG(f'transpose_{implementation}_{"_".join(map(str, axes))}')
+    state = sdfg.add_state()
+    sdfg.add_array('A', shape, dtype)
+    sdfg.add_array('B', [shape[a] for a in axes], dtype)
+    node = TensorTranspose('transpose', axes)
+    node.implementation = implementation
+    state.add_node(node)
+    state.add_edge(state.add_read('A'), None, node, '_inp_tensor', dace.Memlet('A'))
+    state.add_edge(node, '_out_tensor', state.add_write('B'), None, dace.Memlet('B'))
+    return sdfg
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("permutations",
+                        nargs="*",
+                        default=list(PERMUTATIONS.keys()),
+                        help=f"Permutations to run, out of {', '.join(PERMUTATIONS.keys())}")
+    parser.add_argument("-t", "--type", choices=["float32", "float64"], default="float64")
+    parser.add_argument("-r", "--repetitions", type=int, default=5)
+    args = parser.parse_args()
+
+    dtype = getattr(dace, args.type)
+    implementations = ('pure', 'pure_blocked')
+    print('%14s  %12s  %12s' % ('Permutation', *('%s GB/s' % impl for impl in implementations)))
+    for name in args.permutations:
+        shape, axes = PERMUTATIONS[name]
+        A = np.random.rand(*shape).astype(dtype.as_numpy_dtype())
+        B = np.zeros([shape[a] for a in axes], dtype=dtype.as_numpy_dtype())
+        results = []
+        for implementation in implementations:
+            csdfg = transpose_sdfg(implementation, shape, axes, dtype).compile()
+            call = lambda: csdfg(A=A, B=B)
+            call()
+            assert np.allclose(B, np.transpose(A, axes))
+            runtime = min(timeit.repeat(call, number=1, repeat=args.repetitions))
+            results.append('%.2f' % (2 * A.nbytes / runtime * 1e-9))
+        print('%14s  %12s  %12s' % (name, *results))
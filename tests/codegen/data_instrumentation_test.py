@@ -1,4 +1,5 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
+import os
 from typing import Optional, Tuple
 import dace
 from dace import nodes
@@ -366,6 +367,80 @@ def test_symbol_restore():
     assert np.allclose(A, np.zeros((15, )).tolist() + np.ones((5, )).tolist())
 
 
+@pytest.mark.datainstrument
+@pytest.mark.parametrize('compression', (0, 6))
+def test_chunked_dump_and_restore(compression):
+    @dace.program
+    def dinstr(A: dace.float64[20], B: dace.float64[20]):
+        B[:] = A + 1
+        A[:] = B + 1
+        B[:] = A + 1
+
+    sdfg = dinstr.to_sdfg(simplify=True)
+    sdfg.name = f'dinstr_chunked_{compression}'
+    _instrument(sdfg, dace.DataInstrumentationType.Save)
+
+    A = np.random.rand(20)
+    B = np.random.rand(20)
+    oa = np.copy(A)
+    with dace.config.set_temporary('instrumentation', 'data_format', value='chunked'):
+        with dace.config.set_temporary('instrumentation', 'data_compression', value=compression):
+            sdfg(A, B)
+
+    # All versions are stored in one data file
+    dreport = sdfg.get_instrumented_data()
+    assert sorted(os.listdir(dreport.folder)) == ['data.bin', 'index.jsonl']
+    assert dreport.keys() == {'A', 'B'}
+    assert dreport.num_versions('A') == 2
+    assert all(c.compression == ('zlib' if compression else 'none') for c in dreport.chunks['A'])
+    dreport.get_first_version('A')
+    assert isinstance(dreport.loaded_values['A', 0], np.memmap) == (compression == 0)
+
+    assert np.allclose(dreport.get_version('A', 1), oa + 2)
+    assert np.allclose(dreport['A'][0], oa)
+    assert np.allclose(dreport['B'][0], oa + 1)
+    assert np.allclose(dreport['B'][1], oa + 3)
+
+    # Modify the first version of A
+    dreport.get_first_version('A')[:] = 7
+    dreport.update_report()
+    dreport = sdfg.get_instrumented_data()
+    assert np.allclose(dreport.get_first_version('A'), 7)
+
+    # Restore from the report
+    _instrument(sdfg, dace.DataInstrumentationType.Restore)
+    A[:] = 0
+    B[:] = 0
+    with dace.config.set_temporary('instrumentation', 'data_compression', value=compression):
+        sdfg.call_with_instrumented_data(dreport, A, B)
+    assert np.allclose(B, oa + 3)
+
+
+@pytest.mark.datainstrument
+def test_chunked_symbol_dump_and_restore():
+    j = dace.symbol('j')
+
+    @dace.program
+    def dinstr(A: dace.float64[20]):
+        for i in range(j):
+            A[i] = 0
+
+    sdfg = dinstr.to_sdfg(simplify=True)
+    sdfg.name = 'dinstr_chunked_symbols'
+    sdfg.start_state.symbol_instrument = dace.DataInstrumentationType.Save
+    A = np.ones((20, ))
+    with dace.config.set_temporary('instrumentation', 'data_format', value='chunked'):
+        sdfg(A, j=15)
+    dreport = sdfg.get_instrumented_data()
+    assert dreport['j'] == 15
+
+    sdfg.start_state.symbol_instrument = dace.DataInstrumentationType.Restore
+    A = np.ones((20, ))
+    sdfg.call_with_instrumented_data(dreport, A, j=10)
+
+    assert np.allclose(A, np.zeros((15, )).tolist() + np.ones((5, )).tolist())
+
+
 if __name__ == '__main__':
     test_dump()
     test_symbol_dump()
@@ -381,3 +456,6 @@ if __name__ == '__main__':
     test_dinstr_hooks()
     test_dinstr_in_loop_conditional_cpp()
     test_dinstr_in_loop_conditional_python()
+    test_chunked_dump_and_restore(0)
+    test_chunked_dump_and_restore(6)
+    test_chunked_symbol_dump_and_restore()
@@ -0,0 +1,127 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the direct (CMake-less) build backend and its object file cache. """
+import os
+import shutil
+
+import dace
+from dace.codegen import compiler
+import numpy as np
+
+N = dace.symbol('N')
+
+
+@dace.program
+def scale(A: dace.float64[N], B: dace.float64[N]):
+    B[:] = A * 2 + 1
+
+
+def _cached_objects(folder):
+    return [f for _, _, files in os.walk(folder) for f in files if f.endswith('.o')]
+
+
+def test_direct_build(tmp_path):
+    with dace.config.set_temporary('compiler', 'build_backend', value='direct'):
+        with dace.config.set_temporary('compiler', 'object_cache_folder', value=str(tmp_path)):
+            sdfg = scale.to_sdfg()
+            sdfg.name = 'direct_build_test'
+            csdfg = sdfg.compile()
+
+            # Program and loader stub were built without CMake
+            assert not os.path.isfile(os.path.join(sdfg.build_folder, 'build', 'CMakeCache.txt'))
+            assert len(_cached_objects(str(tmp_path))) == 2
+
+            a = np.random.rand(20)
+            b = np.zeros(20)
+            csdfg(A=a, B=b, N=20)
+            assert np.allclose(b, a * 2 + 1)
+
+
+def test_direct_build_object_reuse(tmp_path):
+    with dace.config.set_temporary('compiler', 'build_backend', value='direct'):
+        with dace.config.set_temporary('compiler', 'object_cache_folder', value=str(tmp_path)):
+            sdfg = scale.to_sdfg()
+            sdfg.name = 'direct_build_reuse_a'
+            sdfg.compile()
+
+            # The loader stub object is shared between programs, the program itself is not
+            sdfg = scale.to_sdfg()
+            sdfg.name = 'direct_build_reuse_b'
+            csdfg = sdfg.compile()
+            assert len(_cached_objects(str(tmp_path))) == 3
+
+            a = np.random.rand(20)
+            b = np.zeros(20)
+            csdfg(A=a, B=b, N=20)
+            assert np.allclose(b, a * 2 + 1)
+
+
+def test_direct_build_manifest(tmp_path, monkeypatch):
+    with dace.config.set_temporary('compiler', 'build_backend', value='direct'):
+        with dace.config.set_temporary('compiler', 'object_cache_folder', value=str(tmp_path)):
+            sdfg = scale.to_sdfg()
+            sdfg.name = 'direct_build_manifest'
+            sdfg.compile()
+
+            # Unchanged sources are not preprocessed again
+            commands = []
+            original = compiler._run_build_command
+
+            def run(command, *args):
+                commands.append(command)
+                return original(command, *args)
+
+            monkeypatch.setattr(compiler, '_run_build_command', run)
+            shutil.rmtree(os.path.join(sdfg.build_folder, 'build'))
+            csdfg = sdfg.compile()
+            assert commands and not any('-E' in command for command in commands)
+
+            a = np.random.rand(20)
+            b = np.zeros(20)
+            csdfg(A=a, B=b, N=20)
+            assert np.allclose(b, a * 2 + 1)
+
+
+def test_direct_build_eviction(tmp_path):
+    with dace.config.set_temporary('compiler', 'build_backend', value='direct'):
+        with dace.config.set_temporary('compiler', 'object_cache_folder', value=str(tmp_path)):
+            sdfg = scale.to_sdfg()
+            sdfg.name = 'direct_build_eviction'
+            sdfg.compile()
+            assert len(_cached_objects(str(tmp_path))) == 2
+
+            # Least recently used files are evicted first
+            files = sorted(os.path.join(root, f) for root, _, fs in os.walk(str(tmp_path)) for f in fs)
+            os.utime(files[0], ns=(0, 0))
+            size = sum(os.path.getsize(f) for f in files)
+            assert compiler._evict_cached_objects(str(tmp_path), size - 1) == 1
+            assert not os.path.exists(files[0])
+            assert compiler._evict_cached_objects(str(tmp_path), 0) == len(files) - 1
+
+            # Evicted objects are compiled again
+            csdfg = sdfg.compile()
+            a = np.random.rand(20)
+            b = np.zeros(20)
+            csdfg(A=a, B=b, N=20)
+            assert np.allclose(b, a * 2 + 1)
+
+
+def test_direct_build_unsupported():
+    from dace.codegen.targets.cpu import CPUCodeGen
+    from dace.codegen.targets.cuda import CUDACodeGen
+
+    assert compiler._direct_build_commands(['cpu/prog.cpp'], {'cpu': CPUCodeGen}, []) is not None
+    assert compiler._direct_build_commands(['cpu/prog.cpp', 'cuda/prog_cuda.cu'], {
+        'cpu': CPUCodeGen,
+        'cuda': CUDACodeGen
+    }, []) is None
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_direct_build(folder)
+    with tempfile.TemporaryDirectory() as folder:
+        test_direct_build_object_reuse(folder)
+    with tempfile.TemporaryDirectory() as folder:
+        test_direct_build_eviction(folder)
+    test_direct_build_unsupported()
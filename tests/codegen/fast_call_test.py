@@ -0,0 +1,75 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+"""
+Tests the fast call path of compiled SDFGs (cached argument marshalling plans).
+"""
+import dace
+import numpy as np
+import pytest
+
+N = dace.symbol('N')
+
+
+@dace.program
+def axpy(a: dace.float64, x: dace.float64[N], y: dace.float64[N]):
+    return a * x + y
+
+
+def test_fast_call_results():
+    csdfg = axpy.to_sdfg().compile()
+
+    for n in (10, 20, 10):
+        x = np.random.rand(n)
+        y = np.random.rand(n)
+        ref = csdfg(a=2.0, x=x, y=y, N=n).copy()
+        csdfg.clear_return_values()
+        res = csdfg.fast_call(a=2.0, x=x, y=y, N=n)
+        assert np.allclose(res, ref)
+        assert np.allclose(res, 2.0 * x + y)
+
+    # One plan per distinct tuple of argument types
+    assert len(csdfg._argument_plans) == 1
+
+
+def test_fast_call_new_signature():
+    csdfg = axpy.to_sdfg().compile()
+    x = np.random.rand(10)
+    y = np.random.rand(10)
+
+    # Integer scalar is cast to a double
+    res = csdfg.fast_call(a=3, x=x, y=y, N=10)
+    assert np.allclose(res, 3 * x + y)
+    res = csdfg.fast_call(a=np.float64(1.5), x=x, y=y, N=10)
+    assert np.allclose(res, 1.5 * x + y)
+    assert len(csdfg._argument_plans) == 2
+
+
+def test_fast_call_type_checking():
+    csdfg = axpy.to_sdfg().compile()
+    x = np.random.rand(20)
+    y = np.random.rand(10)
+
+    # Views are checked once the argument types change
+    csdfg.fast_call(a=1.0, x=x[:10].copy(), y=y, N=10)
+    csdfg.finalize()  # Errors unload the library
+    with pytest.raises(TypeError):
+        csdfg.fast_call(a=1.0, x=x[:10], y=y, N=10)
+    with pytest.raises(KeyError):
+        csdfg.fast_call(a=1.0, x=x, N=10)
+
+
+def test_fast_call_config():
+    with dace.config.set_temporary('compiler', 'fast_call', value=True):
+        csdfg = axpy.to_sdfg().compile()
+    x = np.random.rand(10)
+    y = np.random.rand(10)
+    for _ in range(3):
+        res = csdfg(a=2.0, x=x, y=y, N=10)
+        assert np.allclose(res, 2.0 * x + y)
+    assert len(csdfg._argument_plans) == 1
+
+
+if __name__ == '__main__':
+    test_fast_call_results()
+    test_fast_call_new_signature()
+    test_fast_call_type_checking()
+    test_fast_call_config()
@@ -0,0 +1,174 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests loading instrumentation reports, including the streaming columnar report loader. """
+import json
+import os
+
+import dace
+import numpy as np
+import pytest
+
+from dace.codegen.instrumentation.report import (ColumnarInstrumentationReport, ElementStatistics,
+                                                 InstrumentationReport)
+
+
+def _write_report(path: str, num_events: int = 1000) -> str:
+    rng = np.random.default_rng(42)
+    events = []
+    for i in range(num_events):
+        state, node = int(rng.integers(0, 3)), int(rng.integers(0, 4))
+        events.append(
+            dict(name='Timer',
+                 cat='Timer',
+                 ph='X',
+                 ts=i * 10,
+                 dur=float(rng.integers(1, 100000)),
+                 pid=0,
+                 tid=int(rng.integers(-1, 2)),
+                 args=dict(sdfg_id=0, state_id=state, id=node)))
+        if i % 10 == 0:
+            events.append(
+                dict(name='Counters',
+                     cat='PAPI',
+                     ph='C',
+                     ts=i * 10,
+                     pid=0,
+                     tid=-1,
+                     args=dict(sdfg_id=0, state_id=state, id=node, PAPI_TOT_INS=int(rng.integers(0, 1000)))))
+    events.append(dict(name='SDFG', cat='Timer', ph='X', ts=0, dur=1e6, pid=0, tid=-1, args=dict(sdfg_id=0)))
+
+    filename = os.path.join(path, 'report-1234.json')
+    with open(filename, 'w') as fp:
+        json.dump({'traceEvents': events, 'sdfgHash': 'abcd'}, fp, indent=1)
+    return filename
+
+
+def _parse_csv(csv: str):
+    rows = [line.split(',') for line in csv.strip().split('\n')[1:]]
+    return {tuple(row[:-5]): np.array([float(v) for v in row[-5:]]) for row in rows}
+
+
+@pytest.mark.parametrize('chunk_size', (64, 1 << 20))
+def test_columnar_report(tmp_path, chunk_size):
+    filename = _write_report(str(tmp_path))
+    report = InstrumentationReport(filename)
+    columnar = ColumnarInstrumentationReport(filename, chunk_size=chunk_size)
+    assert columnar.sdfg_hash == report.sdfg_hash
+    assert columnar.name == '1234'
+
+    # Columns contain all events
+    durations = [ev for ev in report.events if ev.category == 'Timer']
+    assert len(columnar.durations['duration']) == len(durations)
+    assert np.array_equal(columnar.durations['timestamp'], [ev.timestamp for ev in durations])
+    assert np.array_equal(columnar.durations['duration'], [ev.duration for ev in durations])
+    assert np.array_equal(columnar.durations['node_id'], [ev.uuid[2] for ev in durations])
+    assert len(columnar.counters['value']) == len(report.events) - len(durations)
+
+    # Same statistics as the original report
+    for csv, expected_csv in zip(columnar.as_csv(), report.as_csv()):
+        result, expected = _parse_csv(csv), _parse_csv(expected_csv)
+        assert result.keys() == expected.keys()
+        for key, values in result.items():
+            assert np.allclose(values, expected[key])
+
+    # Same statistics without storing events, except for the median estimate
+    columnar = ColumnarInstrumentationReport(filename, keep_events=False, chunk_size=chunk_size)
+    assert len(columnar.durations['duration']) == 0
+    for csv, expected_csv in zip(columnar.as_csv(), report.as_csv()):
+        result, expected = _parse_csv(csv), _parse_csv(expected_csv)
+        assert result.keys() == expected.keys()
+        for key, values in result.items():
+            assert np.allclose(values[[0, 1, 2, 4]], expected[key][[0, 1, 2, 4]])
+            assert values[1] <= values[3] <= values[4]
+
+    assert 'Timer (0, 1, 2)' in str(columnar)
+
+
+def test_columnar_report_filtering(tmp_path):
+    filename = _write_report(str(tmp_path))
+    report = ColumnarInstrumentationReport(filename, elements=[(0, 1), (0, 2, 3)], keep_events=False)
+    assert len(report.durations['duration']) == 0
+    assert set(uuid for uuid, _, _ in report.duration_statistics) == {(0, 1, i) for i in range(4)} | {(0, 2, 3)}
+
+    report = ColumnarInstrumentationReport(filename, elements=[(0, )])
+    assert (0, -1, -1) in set(uuid for uuid, _, _ in report.duration_statistics)
+
+
+def test_columnar_report_save(tmp_path):
+    filename = _write_report(str(tmp_path))
+    report = ColumnarInstrumentationReport(filename)
+    report.save_columns(os.path.join(str(tmp_path), 'report.npz'))
+    loaded = np.load(os.path.join(str(tmp_path), 'report.npz'))
+    assert np.array_equal(loaded['durations/duration'], report.durations['duration'])
+    assert list(loaded['counter_names']) == ['PAPI_TOT_INS']
+
+
+def test_columnar_report_from_run():
+    sdfg = dace.SDFG('columnar_report_from_run')
+    sdfg.add_array('A', [64], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('add', dict(i='0:64'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = a + 1',
+                             dict(b=dace.Memlet('A[i]')),
+                             external_edges=True)
+    sdfg.instrument = dace.InstrumentationType.Timer
+    state.instrument = dace.InstrumentationType.Timer
+    A = np.zeros(64)
+    csdfg = sdfg.compile()
+    for _ in range(3):
+        csdfg(A=A)
+    assert np.allclose(A, 3)
+
+    # Thread IDs in reports of compiled programs are 64-bit hashes, and are kept exactly
+    filename = sdfg.get_latest_report_path()
+    report = InstrumentationReport(filename)
+    columnar = ColumnarInstrumentationReport(filename)
+    assert np.array_equal(columnar.durations['tid'], [ev.tid for ev in report.events])
+    assert np.array_equal(columnar.durations['timestamp'], [ev.timestamp for ev in report.events])
+    assert set(tid for _, _, tid in columnar.duration_statistics) == set(ev.tid for ev in report.events)
+    for csv, expected_csv in zip(columnar.as_csv(), report.as_csv()):
+        result, expected = _parse_csv(csv), _parse_csv(expected_csv)
+        assert result.keys() == expected.keys()
+        for key, values in result.items():
+            assert np.allclose(values, expected[key])
+
+
+def test_columnar_report_float_timestamps(tmp_path):
+    # Reports written from Python contain floating-point timestamps
+    filename = os.path.join(str(tmp_path), 'report-5678.json')
+    events = [
+        dict(name='Python', cat='Timer', ph='X', ts=1.5e15 + i / 4, dur=2.5, pid=0, tid=1 << 63, args=dict(sdfg_id=0))
+        for i in range(4)
+    ]
+    with open(filename, 'w') as fp:
+        json.dump({'traceEvents': events, 'sdfgHash': 'abcd'}, fp)
+    columnar = ColumnarInstrumentationReport(filename)
+    assert np.array_equal(columnar.durations['timestamp'], [ev['ts'] for ev in events])
+    assert list(columnar.duration_statistics) == [((0, -1, -1), 'Python', 1 << 63)]
+
+
+def test_median_estimate():
+    values = np.random.default_rng(0).lognormal(size=10000)
+    stats = ElementStatistics()
+    for v in values:
+        stats.add(v)
+    assert stats.count == len(values)
+    assert np.isclose(stats.mean, np.mean(values))
+    assert stats.min == np.min(values) and stats.max == np.max(values)
+    assert abs(stats.median - np.median(values)) / np.median(values) < 0.05
+
+    stats = ElementStatistics()
+    for v in (3, 1, 2):
+        stats.add(v)
+    assert stats.median == 2
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_columnar_report(folder, 64)
+        test_columnar_report_filtering(folder)
+        test_columnar_report_save(folder)
+        test_columnar_report_float_timestamps(folder)
+    test_columnar_report_from_run()
+    test_median_estimate()
@@ -63,6 +63,40 @@ def test_timer():
     onetest(dace.InstrumentationType.Timer)
 
 
+def test_sampled_timer():
+    size = 16
+    A = np.random.rand(size, size)
+    B = np.random.rand(size, size)
+    C = np.zeros([size, size], dtype=np.float64)
+
+    sdfg: dace.SDFG = slowmm.to_sdfg()
+    sdfg.name = "instrumentation_test_sampled_timer"
+    sdfg.simplify()
+    for node, state in sdfg.all_nodes_recursive():
+        if isinstance(node, nodes.MapEntry) and node.map.label == 'mult':
+            node.map.instrument = dace.InstrumentationType.Sampled_Timer
+            state.instrument = dace.InstrumentationType.Sampled_Timer
+
+    with dace.config.set_temporary('instrumentation', 'sampled_timer', 'sampling_interval', value=4):
+        with dace.config.set_temporary('instrumentation', 'sampled_timer', 'buffer_size', value=3):
+            sdfg(A=A, B=B, C=C, N=size)
+    assert np.allclose(C, 20 * A @ B)
+
+    report = sdfg.get_latest_report()
+    print(report)
+
+    # Every 4th of the 20 invocations of the state and the map is sampled, the last 3 samples are kept
+    assert len(report.histograms) == 2
+    for hist in report.histograms:
+        assert hist.invocations == 20
+        assert hist.count == 5
+        assert sum(hist.buckets) == 5
+        assert hist.minimum <= hist.quantile(0.5) <= hist.maximum
+    assert len(report.events) == 6
+    assert all(len(runtimes) == 3 for element in report.durations.values() for times in element.values()
+               for runtimes in times.values())
+
+
 #@pytest.mark.papi
 @pytest.mark.skip
 def test_papi():
@@ -77,6 +111,7 @@ def test_gpu_events():
 
 if __name__ == '__main__':
     test_timer()
+    test_sampled_timer()
     test_papi()
     if len(sys.argv) > 1 and sys.argv[1] == 'gpu':
         test_gpu_events()
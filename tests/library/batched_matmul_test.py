@@ -11,6 +11,8 @@ from dace.library import change_default
 @pytest.mark.parametrize("implementation, dtype", [
     pytest.param("pure", dace.float32),
     pytest.param("pure", dace.float64),
+    pytest.param("pure_tiled", dace.float32),
+    pytest.param("pure_tiled", dace.float64),
     pytest.param("MKL", dace.float32, marks=pytest.mark.mkl),
     pytest.param("MKL", dace.float64, marks=pytest.mark.mkl),
     pytest.param("cuBLAS", dace.float32, marks=pytest.mark.gpu),
@@ -45,6 +47,8 @@ def test_batchmm(implementation: str, dtype):
 if __name__ == "__main__":
     test_batchmm("pure", dace.float32)
     test_batchmm("pure", dace.float64)
+    test_batchmm("pure_tiled", dace.float32)
+    test_batchmm("pure_tiled", dace.float64)
     test_batchmm("MKL", dace.float32)
     test_batchmm("MKL", dace.float64)
     test_batchmm("cuBLAS", dace.float32)
@@ -132,7 +132,8 @@ def run_test(implementation,
     assert diff <= 1e-5
 
 
-@pytest.mark.parametrize(('implementation', ), [('pure', ), ('MKL', ), pytest.param('cuBLAS', marks=pytest.mark.gpu)])
+@pytest.mark.parametrize(('implementation', ), [('pure', ), ('pure_tiled', ), ('MKL', ),
+                                                pytest.param('cuBLAS', marks=pytest.mark.gpu)])
 def test_library_gemm(implementation):
     param_grid_trans = dict(
         transA=[True, False],
@@ -173,6 +174,31 @@ def test_library_gemm(implementation):
                       "misconfigured, skipping test for {}.".format(implementation))
 
 
+def test_gemm_tiled_multiple_blocks():
+    """ Tests the tiled GEMM with symbolic sizes that span multiple, partial blocks and tiles. """
+
+    @dace.program
+    def tiled_gemm(A: dace.float64[M, K], B: dace.float64[N, K], C: dace.float64[M, N]):
+        C[:] = 0.5 * (A @ B.T) + C
+
+    with dace.config.set_temporary('library', 'blas', 'tiled_gemm', 'mc', value=8), \
+         dace.config.set_temporary('library', 'blas', 'tiled_gemm', 'nc', value=16), \
+         dace.config.set_temporary('library', 'blas', 'tiled_gemm', 'kc', value=8):
+        sdfg = tiled_gemm.to_sdfg()
+        sdfg.expand_library_nodes(recursive=False)
+        for node, _ in sdfg.all_nodes_recursive():
+            if isinstance(node, Gemm):
+                node.implementation = 'pure_tiled'
+        sdfg.expand_library_nodes()
+
+    A = np.random.rand(45, 33)
+    B = np.random.rand(29, 33)
+    C = np.random.rand(45, 29)
+    expected = 0.5 * (A @ B.T) + C
+    sdfg(A=A, B=B, C=C, M=45, N=29, K=33)
+    assert np.allclose(C, expected)
+
+
 def test_gemm_symbolic():
     sdfg = dace.SDFG("gemm")
     state = sdfg.add_state()
@@ -223,5 +249,6 @@ if __name__ == "__main__":
         test_library_gemm('cuBLAS')
     # test_library_gemm('pure')
     # test_library_gemm('MKL')
+    test_gemm_tiled_multiple_blocks()
     test_gemm_symbolic()
     test_gemm_symbolic_1()
@@ -0,0 +1,100 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the sparse format conversion library nodes and host-side helpers. """
+import dace
+import numpy as np
+import pytest
+import scipy.sparse
+
+from dace.libraries.sparse import CSRToBSR, CSRToCOO, CSRToSELL
+from dace.libraries.sparse.formats import bsr_size, csr_to_sell, sell_size
+
+
+def _random_matrix(n, m):
+    A = scipy.sparse.random(n, m, density=0.15, format='lil', random_state=7)
+    A[2, :] = np.random.rand(m)
+    A[4, :] = 0
+    A = A.tocsr()
+    A.sort_indices()
+    return A
+
+
+def _convert(name, node, inputs, outputs):
+    sdfg = dace.SDFG(name)
+    state = sdfg.add_state()
+    for conn, arr in inputs.items():
+        sdfg.add_array('in' + conn, arr.shape, dace.DTYPE_TO_TYPECLASS[arr.dtype.type])
+        state.add_edge(state.add_read('in' + conn), None, node, conn, dace.Memlet('in' + conn))
+    for conn, arr in outputs.items():
+        sdfg.add_array('out' + conn, arr.shape, dace.DTYPE_TO_TYPECLASS[arr.dtype.type])
+        state.add_edge(node, conn, state.add_write('out' + conn), None, dace.Memlet('out' + conn))
+    sdfg.expand_library_nodes()
+    sdfg.validate()
+    arguments = {'in' + conn: arr.copy() for conn, arr in inputs.items()}
+    arguments.update({'out' + conn: arr for conn, arr in outputs.items()})
+    sdfg(**arguments)
+
+
+def _csr_inputs(A):
+    return {'_csr_rows': A.indptr, '_csr_cols': A.indices, '_csr_vals': A.data}
+
+
+def test_csr_to_coo():
+    A = _random_matrix(37, 23)
+    rows = np.zeros(A.nnz, dtype=np.int32)
+    _convert('csr_to_coo', CSRToCOO('convert'), {'_csr_rows': A.indptr}, {'_coo_rows': rows})
+    assert np.array_equal(rows, A.tocoo().row)
+
+
+@pytest.mark.parametrize('chunk_size, sigma', [(4, 16), (8, 1), (8, 1000)])
+def test_csr_to_sell(chunk_size, sigma):
+    A = _random_matrix(37, 23)
+    nslices, size = sell_size(A.indptr, chunk_size, sigma)
+    ref = csr_to_sell(A.indptr, A.indices, A.data, chunk_size, sigma)
+
+    # Reference conversion is a valid SELL matrix
+    slices, perm, cols, vals = ref
+    dense = np.zeros(A.shape)
+    for s in range(nslices):
+        width = (slices[s + 1] - slices[s]) // chunk_size
+        for l in range(chunk_size):
+            row = perm[s * chunk_size + l]
+            if row >= 0:
+                stored = slices[s] + np.arange(width) * chunk_size + l
+                np.add.at(dense[row], cols[stored], vals[stored])
+    assert np.allclose(dense, A.toarray())
+
+    outputs = {
+        '_sell_slices': np.zeros(nslices + 1, dtype=np.int32),
+        '_sell_perm': np.zeros(nslices * chunk_size, dtype=np.int32),
+        '_sell_cols': np.zeros(size, dtype=np.int32),
+        '_sell_vals': np.zeros(size),
+    }
+    _convert(f'csr_to_sell_{chunk_size}_{sigma}', CSRToSELL('convert', chunk_size=chunk_size, sigma=sigma),
+             _csr_inputs(A), outputs)
+    for out, expected in zip(outputs.values(), ref):
+        assert np.array_equal(out, expected)
+
+
+@pytest.mark.parametrize('blocksize', [(2, 3), (4, 4), (5, 2)])
+def test_csr_to_bsr(blocksize):
+    A = _random_matrix(40, 24)
+    nblocks = bsr_size(A.indptr, A.indices, blocksize)
+    ref = A.tobsr(blocksize)
+    assert nblocks == ref.indptr[-1]
+
+    outputs = {
+        '_bsr_rows': np.zeros(A.shape[0] // blocksize[0] + 1, dtype=np.int32),
+        '_bsr_cols': np.zeros(nblocks, dtype=np.int32),
+        '_bsr_vals': np.zeros([nblocks, *blocksize]),
+    }
+    _convert(f'csr_to_bsr_{blocksize[0]}_{blocksize[1]}', CSRToBSR('convert'), _csr_inputs(A), outputs)
+    result = scipy.sparse.bsr_matrix((outputs['_bsr_vals'], outputs['_bsr_cols'], outputs['_bsr_rows']),
+                                     shape=A.shape)
+    assert np.array_equal(outputs['_bsr_rows'], ref.indptr)
+    assert np.allclose(result.toarray(), A.toarray())
+
+
+if __name__ == '__main__':
+    test_csr_to_coo()
+    test_csr_to_sell(4, 16)
+    test_csr_to_bsr((2, 3))
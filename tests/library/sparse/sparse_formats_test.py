@@ -0,0 +1,99 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the SELL-C-sigma, BSR and COO sparse matrix products. """
+import dace
+import numpy as np
+import pytest
+import scipy.sparse
+
+from dace.libraries.sparse import BSRMM, BSRMV, COOMM, COOMV, SELLMM, SELLMV
+from dace.libraries.sparse.formats import csr_to_sell
+
+
+def _random_matrix(n, m, dtype):
+    # Rows with very different numbers of nonzeros, including empty rows
+    A = scipy.sparse.random(n, m, density=0.2, format='lil', dtype=dtype, random_state=42)
+    A[3, :] = np.random.rand(m)
+    A[5, :] = 0
+    return A.tocsr()
+
+
+def _make_sdfg(name, node, sparse, n, m, k, dtype, beta):
+    sdfg = dace.SDFG(name)
+    state = sdfg.add_state()
+    for conn, arr in sparse.items():
+        sdfg.add_array('A' + conn, arr.shape, dace.DTYPE_TO_TYPECLASS[arr.dtype.type])
+        state.add_edge(state.add_read('A' + conn), None, node, conn, dace.Memlet('A' + conn))
+    shape = (lambda rows: [rows, k]) if k else (lambda rows: [rows])
+    sdfg.add_array('B', shape(m), dtype)
+    sdfg.add_array('C', shape(n), dtype)
+    state.add_edge(state.add_read('B'), None, node, '_b', dace.Memlet('B'))
+    state.add_edge(node, '_c', state.add_write('C'), None, dace.Memlet('C'))
+    if beta != 0:
+        state.add_edge(state.add_read('C'), None, node, '_cin', dace.Memlet('C'))
+    sdfg.expand_library_nodes()
+    sdfg.validate()
+    return sdfg
+
+
+def _run(name, mv, mm, sparse, A, alpha, beta, k, dtype, **kwargs):
+    n, m = A.shape
+    node = (mm if k else mv)(name, alpha=alpha, beta=beta, **kwargs)
+    sdfg = _make_sdfg(f'{name}_{"mm" if k else "mv"}_{int(beta != 0)}', node, sparse, n, m, k, dtype, beta)
+
+    npdtype = dtype.as_numpy_dtype()
+    B = np.random.rand(*([m, k] if k else [m])).astype(npdtype)
+    C = np.random.rand(*([n, k] if k else [n])).astype(npdtype)
+    expected = alpha * (A @ B) + beta * C
+    sdfg(B=B, C=C, **{'A' + conn: arr.copy() for conn, arr in sparse.items()})
+    assert np.allclose(C, expected, rtol=1e-4)
+
+
+@pytest.mark.parametrize('k', [0, 5])
+@pytest.mark.parametrize('beta', [0.0, 2.0])
+@pytest.mark.parametrize('dtype', [dace.float32, dace.float64])
+def test_sell(k, beta, dtype):
+    A = _random_matrix(37, 23, dtype.as_numpy_dtype())
+    slices, perm, cols, vals = csr_to_sell(A.indptr, A.indices, A.data, chunk_size=4, sigma=16)
+    sparse = {'_a_slices': slices, '_a_perm': perm, '_a_cols': cols, '_a_vals': vals}
+    _run('sell', SELLMV, SELLMM, sparse, A, 1.5, beta, k, dtype, chunk_size=4)
+
+
+@pytest.mark.parametrize('k', [0, 5])
+@pytest.mark.parametrize('beta', [0.0, 2.0])
+@pytest.mark.parametrize('blocksize', [(2, 3), (4, 4)])
+def test_bsr(k, beta, blocksize):
+    A = _random_matrix(36, 24, np.float64).tobsr(blocksize)
+    sparse = {'_a_rows': A.indptr, '_a_cols': A.indices, '_a_vals': A.data}
+    _run('bsr', BSRMV, BSRMM, sparse, A, 1.5, beta, k, dace.float64)
+
+
+@pytest.mark.parametrize('k', [0, 5])
+@pytest.mark.parametrize('beta', [0.0, 2.0])
+@pytest.mark.parametrize('partitions', [0, 3, 100])
+def test_coo(k, beta, partitions):
+    A = _random_matrix(37, 23, np.float64).tocoo()
+    sparse = {'_a_rows': A.row, '_a_cols': A.col, '_a_vals': A.data}
+    _run(f'coo_{partitions}', COOMV, COOMM, sparse, A, 1.5, beta, k, dace.float64, partitions=partitions)
+
+
+def test_sparse_product_validation():
+    sdfg = dace.SDFG('sparse_product_validation')
+    state = sdfg.add_state()
+    node = COOMV('coo')
+    for conn, shape in (('_a_rows', [10]), ('_a_cols', [10]), ('_a_vals', [10]), ('_b', [5, 5]), ('_c', [5])):
+        sdfg.add_array('X' + conn, shape, dace.float64)
+        if conn == '_c':
+            state.add_edge(node, conn, state.add_write('X' + conn), None, dace.Memlet('X' + conn))
+        else:
+            state.add_edge(state.add_read('X' + conn), None, node, conn, dace.Memlet('X' + conn))
+    with pytest.raises(ValueError):
+        node.validate(sdfg, state)
+
+
+if __name__ == '__main__':
+    for k in (0, 5):
+        for beta in (0.0, 2.0):
+            test_sell(k, beta, dace.float64)
+            test_bsr(k, beta, (2, 3))
+            test_coo(k, beta, 0)
+    test_sparse_product_validation()
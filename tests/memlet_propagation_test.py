@@ -1,6 +1,7 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 import dace
 import numpy as np
+from dace.sdfg import propagation
 from dace.sdfg.propagation import propagate_memlets_sdfg
 
 
@@ -104,8 +105,59 @@ def test_nsdfg_memlet_propagation_with_one_sparse_dimension():
             str(outer_out.subset))
 
 
+def _stencil_sdfg():
+    N = dace.symbol('N')
+    sdfg = dace.SDFG('memoized_propagation')
+    sdfg.add_array('A', [N, N], dace.float64)
+    sdfg.add_array('B', [N, N], dace.float64)
+    state = sdfg.add_state()
+    ome, omx = state.add_map('outer', dict(i='1:N-1'))
+    ime, imx = state.add_map('inner', dict(j='1:N-1'))
+    tasklet = state.add_tasklet('stencil', {'a', 'b'}, {'o'}, 'o = a + b')
+    r, w = state.add_read('A'), state.add_write('B')
+    state.add_memlet_path(r, ome, ime, tasklet, dst_conn='a', memlet=dace.Memlet('A[i-1, j]'))
+    state.add_memlet_path(r, ome, ime, tasklet, dst_conn='b', memlet=dace.Memlet('A[i+1, j+1]'))
+    state.add_memlet_path(tasklet, imx, omx, w, src_conn='o', memlet=dace.Memlet('B[i, j]'))
+    return sdfg, state, tasklet
+
+
+def test_memoized_propagation():
+    sdfg, state, _ = _stencil_sdfg()
+    with dace.config.set_temporary('optimizer', 'memlet_propagation_cache_size', value=0):
+        propagate_memlets_sdfg(sdfg)
+    expected = [str(e.data) for e in state.edges()]
+
+    propagation.clear_propagation_cache()
+    propagate_memlets_sdfg(sdfg)
+    misses = propagation.propagation_cache_info()['misses']
+    propagate_memlets_sdfg(sdfg)
+    info = propagation.propagation_cache_info()
+    assert info['misses'] == misses and info['hits'] > 0
+    assert [str(e.data) for e in state.edges()] == expected
+
+    # Cached subsets are not shared with the SDFG
+    outer = next(e for e in state.out_edges(state.source_nodes()[0]))
+    outer.data.subset.offset([1, 1], False)
+    propagate_memlets_sdfg(sdfg)
+    assert [str(e.data) for e in state.edges()] == expected
+
+
+def test_propagate_from_dirty_nodes():
+    sdfg, state, tasklet = _stencil_sdfg()
+    propagate_memlets_sdfg(sdfg)
+
+    # Modify an inner memlet and only propagate from the modified tasklet
+    edge = next(e for e in state.in_edges(tasklet) if e.dst_conn == 'b')
+    edge.data = dace.Memlet('A[i+1, j]')
+    assert str(state.memlet_path(edge)[0].data.subset) == '2:N, 2:N'
+    propagation.propagate_memlets_from_nodes(sdfg, state, [tasklet])
+    assert str(state.memlet_path(edge)[0].data.subset) == '2:N, 1:N - 1'
+
+
 if __name__ == '__main__':
     test_conditional()
     test_conditional_nested()
     test_runtime_conditional()
     test_nsdfg_memlet_propagation_with_one_sparse_dimension()
+    test_memoized_propagation()
+    test_propagate_from_dirty_nodes()
@@ -3,6 +3,9 @@ import numpy as np
 import dace
 import pytest
 from common import compare_numpy_output
+from dace.libraries.standard import TensorTranspose, Transpose
+from dace.libraries.standard.nodes.ttranspose import permutation_groups
+from dace.transformation.auto.auto_optimize import set_fast_implementations
 
 M, N = 24, 24
 
@@ -48,6 +51,56 @@ def test_transpose():
     assert rel_error <= 1e-5
 
 
+def test_permutation_groups():
+    assert permutation_groups([1, 0]) == [[1], [0]]
+    assert permutation_groups([0, 1, 2]) == [[0, 1, 2]]
+    assert permutation_groups([0, 2, 3, 1]) == [[0], [2, 3], [1]]
+    assert permutation_groups([2, 3, 0, 1]) == [[2, 3], [0, 1]]
+
+
+@pytest.mark.parametrize('axes', [[1, 0], [0, 2, 3, 1], [3, 1, 0, 2], [1, 0, 2, 3], [2, 3, 0, 1]])
+def test_transpose_blocked(axes):
+    shape = [11, 6, 5, 3][:len(axes)]
+    sdfg = dace.SDFG(f'transpose_blocked_{"_".join(map(str, axes))}')
+    state = sdfg.add_state()
+    sdfg.add_array('A', shape, dace.float64)
+    sdfg.add_array('B', [shape[a] for a in axes], dace.float64)
+    node = TensorTranspose('transpose', axes, alpha=2, beta=1)
+    node.implementation = 'pure_blocked'
+    state.add_node(node)
+    state.add_edge(state.add_read('A'), None, node, '_inp_tensor', dace.Memlet('A'))
+    state.add_edge(node, '_out_tensor', state.add_write('B'), None, dace.Memlet('B'))
+
+    A = np.random.rand(*shape)
+    B = np.random.rand(*[shape[a] for a in axes])
+    ref = 2 * np.transpose(A, axes) + B
+    # Use tiles that do not divide the tensor sizes
+    with dace.config.set_temporary('library', 'standard', 'transpose_tile_size', value=4):
+        sdfg(A=A, B=B)
+    assert np.allclose(B, ref)
+
+
+def test_transpose_2d_blocked():
+    A = np.random.rand(70, 33).astype(np.float32)
+    B = np.zeros([33, 70], dtype=np.float32)
+
+    @dace.program
+    def transpose_2d_blocked(A: dace.float32[70, 33], B: dace.float32[33, 70]):
+        B[:] = np.transpose(A)
+
+    # The blocked expansion is selected by auto-optimization, not by default
+    sdfg = transpose_2d_blocked.to_sdfg()
+    transposes = [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, Transpose)]
+    assert transposes and all(n.implementation is None for n in transposes)
+    assert Transpose.default_implementation == 'pure'
+    set_fast_implementations(sdfg, dace.DeviceType.CPU, blocklist=['MKL', 'OpenBLAS'])
+    assert all(n.implementation == 'pure_blocked' for n in transposes)
+
+    with dace.config.set_temporary('library', 'standard', 'transpose_tile_size', value=16):
+        sdfg(A=A, B=B)
+    assert np.allclose(B, A.T)
+
+
 # TODO: Enable after fixing HPTT in CI
 # @pytest.mark.hptt
 @pytest.mark.skip
@@ -66,4 +119,8 @@ if __name__ == '__main__':
     test_transpose()
     test_transpose_none()
     test_transpose_no()
+    test_permutation_groups()
+    for axes in ([1, 0], [0, 2, 3, 1], [3, 1, 0, 2], [1, 0, 2, 3], [2, 3, 0, 1]):
+        test_transpose_blocked(axes)
+    test_transpose_2d_blocked()
     test_hptt()
@@ -0,0 +1,125 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import os
+
+import dace
+import numpy as np
+from dace.libraries.blas import Gemm
+from dace.libraries.standard import Transpose
+from dace.optimization.library_tuner import (ImplementationDatabase, LibraryImplementationTuner,
+                                             select_implementation)
+from dace.transformation.auto.auto_optimize import set_fast_implementations
+
+N = dace.symbol('N')
+
+
+def _transpose_sdfg(name, shape):
+    sdfg = dace.SDFG(name)
+    state = sdfg.add_state()
+    sdfg.add_array('A', shape, dace.float64)
+    sdfg.add_array('B', shape[::-1], dace.float64)
+    node = Transpose('transpose', dtype=dace.float64)
+    state.add_node(node)
+    state.add_edge(state.add_read('A'), None, node, '_inp', dace.Memlet('A'))
+    state.add_edge(node, '_out', state.add_write('B'), None, dace.Memlet('B'))
+    return sdfg, state, node
+
+
+def _synthetic_database(path):
+    # The pure expansion is faster for small matrices, the blocked one for large matrices
+    db = ImplementationDatabase(path)
+    for size, pure, blocked in ((16, 1.0, 2.0), (4096, 2.0, 1.0)):
+        db.record('Transpose', ('float64', '', (size, size)), 'pure', pure)
+        db.record('Transpose', ('float64', '', (size, size)), 'pure_blocked', blocked)
+    db.record('Gemm', ('float64', 'NN', (64, 64, 64)), 'pure', 2.0)
+    db.record('Gemm', ('float64', 'NN', (64, 64, 64)), 'pure_tiled', 1.0)
+    db.save()
+    return db
+
+
+def test_database_nearest(tmp_path):
+    path = str(tmp_path / 'db.json')
+    _synthetic_database(path)
+
+    # Records written concurrently are merged on save
+    other = ImplementationDatabase(path)
+    other.record('Transpose', ('float64', '', (16, 16)), 'pure_blocked', 0.5)
+    other.record('Dot', ('float64', '', (64, )), 'pure', 1.0)
+    other.save()
+
+    db = ImplementationDatabase(path)
+    assert db.fastest('Transpose', ('float64', '', (20, 12))) == 'pure_blocked'
+    assert db.fastest('Transpose', ('float64', '', (20, 12)), candidates=['pure']) == 'pure'
+    assert db.fastest('Transpose', ('float64', '', (2000, 8000))) == 'pure_blocked'
+    assert db.fastest('Transpose', ('float32', '', (16, 16))) is None
+    assert db.fastest('Transpose', ('float64', '', (16, 16)), device=dace.DeviceType.GPU) is None
+    assert db.fastest('Dot', ('float64', '', (100, ))) == 'pure'
+
+
+def test_autoselect(tmp_path):
+    path = str(tmp_path / 'db.json')
+    _synthetic_database(path)
+
+    with dace.config.set_temporary('library', 'implementation_database', value=path):
+        with dace.config.set_temporary('library', 'autoselect', value=True):
+            # Expansion of nodes without an explicit implementation (nodes with unknown sizes use the default one)
+            for shape, expected in (([8, 24], 'pure'), ([5000, 3000], 'pure_blocked'), ([N, N], 'pure')):
+                sdfg, state, node = _transpose_sdfg('autoselect_transpose', shape)
+                assert node.expand(sdfg, state) == expected
+
+            # Explicit implementations are kept
+            sdfg, state, node = _transpose_sdfg('autoselect_transpose', [8, 24])
+            node.implementation = 'pure_blocked'
+            assert node.expand(sdfg, state) == 'pure_blocked'
+
+            # Symbolic sizes are evaluated with the given symbols
+            sdfg, state, node = _transpose_sdfg('autoselect_transpose', [N, N])
+            assert select_implementation(node, state, sdfg, symbols={'N': 10}) == 'pure'
+
+            # Implementations chosen by auto-optimization, with blocklists
+            @dace.program
+            def autoselect_gemm(A: dace.float64[50, 70], B: dace.float64[70, 60]):
+                return A @ B
+
+            for blocklist, expected in ((None, 'pure_tiled'), (['pure_tiled'], 'pure')):
+                sdfg = autoselect_gemm.to_sdfg()
+                set_fast_implementations(sdfg, dace.DeviceType.CPU, blocklist)
+                gemms = [n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, Gemm)]
+                assert gemms and all(n.implementation == expected for n in gemms)
+
+
+def test_tune(tmp_path):
+    path = str(tmp_path / 'db.json')
+    tuner = LibraryImplementationTuner(ImplementationDatabase(path), [dace.float64], repetitions=2)
+    tuner.tune(['Transpose', 'Reduce'],
+               grids={
+                   'Transpose': [('', (16, 32)), ('', (64, 64))],
+                   'Reduce': [('1', (32, 16))]
+               },
+               implementations=['pure', 'pure_blocked'])
+    assert os.path.isfile(path)
+
+    db = ImplementationDatabase(path)
+    assert [r['sizes'] for r in db.records['Transpose']] == [[16, 32], [64, 64]]
+    assert all(set(r['runtimes']) == {'pure', 'pure_blocked'} for r in db.records['Transpose'])
+    assert set(db.records['Reduce'][0]['runtimes']) == {'pure'}
+
+    sdfg, state, node = _transpose_sdfg('tuned_transpose', [60, 70])
+    record = db.records['Transpose'][1]['runtimes']
+    assert select_implementation(node, state, sdfg, database=db) == min(record, key=record.get)
+
+    # Selected implementations are correct
+    with dace.config.set_temporary('library', 'implementation_database', value=path):
+        with dace.config.set_temporary('library', 'autoselect', value=True):
+            A = np.random.rand(60, 70)
+            B = np.zeros((70, 60))
+            sdfg(A=A, B=B)
+            assert np.allclose(B, A.T)
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_database_nearest(pathlib.Path(folder) / 'a')
+        test_autoselect(pathlib.Path(folder) / 'b')
+        test_tune(pathlib.Path(folder) / 'c')
@@ -0,0 +1,86 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import json
+import math
+import os
+
+import dace
+from dace.optimization import MapTilingTuner, MeasurementFarm
+
+
+def _cutout(code: str = 'b = a + 1', language: dace.Language = dace.Language.Python) -> dace.SDFG:
+    sdfg = dace.SDFG('farm_cutout')
+    sdfg.add_array('A', [128], dace.float64)
+    sdfg.add_array('B', [128], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(i='0:128'),
+                             dict(a=dace.Memlet('A[i]')),
+                             code,
+                             dict(b=dace.Memlet('B[i]')),
+                             language=language,
+                             external_edges=True)
+    state.instrument = dace.InstrumentationType.Timer
+    return sdfg
+
+
+def test_farm_dedup_and_crash_isolation(tmp_path):
+    with MeasurementFarm(folder=str(tmp_path), compile_workers=2) as farm:
+        first = farm.submit(_cutout(), {}, repetitions=3)
+        duplicate = farm.submit(_cutout(), {}, repetitions=3)
+        crashing = farm.submit(_cutout('abort();', dace.Language.CPP), {}, repetitions=3)
+        other = farm.submit(_cutout('b = a * 2'), {}, repetitions=3)
+
+        assert duplicate is first
+        assert math.isinf(crashing.result())
+        assert math.isfinite(first.result())
+        assert math.isfinite(other.result())
+
+
+def test_tuner_checkpoint_resume(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sdfg = _cutout()
+    tuner = MapTilingTuner(sdfg)
+    (_, label), = list(tuner.cutouts())
+    fn = tuner.file_name(label)
+
+    # A previous, interrupted run measured one configuration
+    with open(fn, 'w') as fp:
+        json.dump({'None': 1.0}, fp)
+
+    with MeasurementFarm(folder=str(tmp_path / 'build'), compile_workers=2) as farm:
+        report = tuner.optimize(measurements=3, farm=farm)
+
+    assert report[label]['None'] == 1.0
+    assert math.isfinite(report[label]['64.8.1'])
+    with open(fn, 'r') as fp:
+        assert json.load(fp) == report[label]
+    assert not os.path.exists(fn + '.tmp')
+
+
+def test_tuner_measure_data():
+    sdfg = _cutout()
+    sdfg.add_transient('tmp', [128], dace.float64)
+    tuner = MapTilingTuner(sdfg)
+
+    class Report:
+
+        def get_first_version(self, name):
+            if name not in sdfg.arrays:
+                raise KeyError(name)
+            return name
+
+    class Farm:
+
+        def submit(self, cutout, dreport, repetitions):
+            return dreport
+
+    # Data of every non-transient container in the cutout is measured
+    tuner._farm = Farm()
+    assert tuner.measure(sdfg, Report()) == {'A': 'A', 'B': 'B'}
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_farm_dedup_and_crash_isolation(pathlib.Path(folder))
@@ -0,0 +1,149 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import itertools
+import json
+import math
+
+import dace
+import pytest
+from dace.optimization import ExhaustiveSearch, MapTilingTuner, ModelGuidedSearch, RandomSearch, SuccessiveHalving
+
+# Tile sizes of a 3-dimensional map, with the optimum at (64, 8, 1)
+KEYS = ['.'.join(map(str, t)) for t in itertools.product([1, 8, 16, 32, 64, 128], [1, 2, 4, 8, 16], [1, 2, 4])]
+
+
+def runtime(key: str) -> float:
+    x, y, z = map(int, key.split('.'))
+    return 1 + (math.log2(x) - 6)**2 + (math.log2(y) - 3)**2 + math.log2(z)**2
+
+
+class Recorder:
+
+    def __init__(self):
+        self.results = {}
+        self.calls = []
+
+    def __call__(self, keys, repetitions):
+        self.calls.append((list(keys), repetitions))
+        for k in keys:
+            self.results[k] = runtime(k)
+        return {k: self.results[k] for k in keys}
+
+
+def test_exhaustive_resume():
+    measure = Recorder()
+    ExhaustiveSearch().search(KEYS, measure, 10, {KEYS[0]: 1.0})
+    assert len(measure.results) == len(KEYS) - 1
+    assert KEYS[0] not in measure.results
+
+
+def test_random_early_stopping():
+    measure = Recorder()
+    RandomSearch(budget=20, seed=0).search(KEYS, measure, 10, {})
+    assert len(measure.results) == 20
+
+    measure = Recorder()
+    RandomSearch(patience=5, seed=0).search(KEYS, measure, 10, {'64.8.1': 1.0})
+    assert len(measure.results) == 5
+
+
+def test_successive_halving():
+    measure = Recorder()
+    SuccessiveHalving(eta=3).search(KEYS, measure, 27, {})
+    repetitions = [reps for _, reps in measure.calls]
+    candidates = [len(keys) for keys, _ in measure.calls]
+    assert repetitions == sorted(repetitions) and repetitions[-1] == 27
+    assert candidates == sorted(candidates, reverse=True) and candidates[0] == len(KEYS)
+    assert '64.8.1' in measure.calls[-1][0]
+
+    # Eliminated configurations are reported separately
+    eliminated = set()
+    SuccessiveHalving(eta=3).search(KEYS, Recorder(), 27, {}, eliminated)
+    assert eliminated == set(KEYS) - set(measure.calls[-1][0])
+
+
+def test_model_guided():
+    measure = Recorder()
+    ModelGuidedSearch(budget=25, initial_samples=8, seed=0).search(KEYS, measure, 10, {})
+    assert len(measure.results) == 25
+    assert '64.8.1' in measure.results
+
+
+class Interrupted(Exception):
+    pass
+
+
+def _tiling_tuner(monkeypatch, measured, interrupt_at=None):
+    """ Returns a map tiling tuner whose configurations are not compiled, but have synthetic runtimes. """
+    sdfg = dace.SDFG('strategy_cutout')
+    sdfg.add_array('A', [128], dace.float64)
+    sdfg.add_array('B', [128], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(i='0:128'),
+                             dict(a=dace.Memlet('A[i]')),
+                             'b = a + 1',
+                             dict(b=dace.Memlet('B[i]')),
+                             external_edges=True)
+    tuner = MapTilingTuner(sdfg)
+
+    def evaluate(config, measurements, **kwargs):
+        if measurements == interrupt_at:
+            raise Interrupted
+        measured.append((config, measurements))
+        return 1.0 if config is None else float(sum(config))
+
+    monkeypatch.setattr(tuner, 'evaluate', evaluate)
+    return tuner
+
+
+def test_tuner_partial_measurements(monkeypatch):
+    measured = []
+    tuner = _tiling_tuner(monkeypatch, measured)
+    (cutout, _), = list(tuner.cutouts())
+    checkpoints = []
+    eliminated = set()
+    results = tuner.search(cutout,
+                           measurements=8,
+                           checkpoint=lambda r, e: checkpoints.append((dict(r), set(e))),
+                           strategy=SuccessiveHalving(eta=2, seed=0),
+                           eliminated=eliminated)
+
+    # Only configurations measured with the full number of repetitions are results
+    assert any(reps < 8 for _, reps in measured)
+    final = [config for config, reps in measured if reps == 8]
+    assert len(results) == len(final) and eliminated
+    assert not (set(results) & eliminated)
+    assert all(len(r) <= len(final) for r, _ in checkpoints)
+    assert checkpoints[-1] == (results, eliminated)
+
+
+def test_tuner_resume_eliminated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    # Interrupted in the last round of successive halving
+    measured = []
+    tuner = _tiling_tuner(monkeypatch, measured, interrupt_at=8)
+    with pytest.raises(Interrupted):
+        tuner.optimize(measurements=8, strategy=SuccessiveHalving(eta=2, seed=0))
+    (_, label), = list(tuner.cutouts())
+    fn = tuner.file_name(label)
+    with open(fn, 'r') as fp:
+        assert json.load(fp) == {}
+    with open(tuner.eliminated_file_name(fn), 'r') as fp:
+        eliminated = set(json.load(fp))
+    assert eliminated
+
+    # Configurations that were eliminated are not measured again
+    measured = []
+    tuner = _tiling_tuner(monkeypatch, measured)
+    report = tuner.optimize(measurements=8, strategy=SuccessiveHalving(eta=2, seed=0))
+    key = lambda config: 'None' if config is None else '.'.join(map(str, config))
+    assert measured and not ({key(config) for config, _ in measured} & eliminated)
+    assert report[label] and not (set(report[label]) & eliminated)
+
+
+if __name__ == '__main__':
+    test_exhaustive_resume()
+    test_random_early_stopping()
+    test_successive_halving()
+    test_model_guided()
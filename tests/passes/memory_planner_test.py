@@ -0,0 +1,106 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the liveness-based transient memory planner. """
+import numpy as np
+
+import dace
+from dace.transformation.passes.memory_planner import MemoryPlanner
+
+
+def _chain_sdfg(loop: bool = False) -> dace.SDFG:
+    """
+    Creates an SDFG with four states: A -> tmp1 -> tmp2 -> tmp3 -> B. If ``loop`` is True, the first two states form
+    a loop.
+    """
+    sdfg = dace.SDFG('memplan_chain' + ('_loop' if loop else ''))
+    sdfg.add_array('A', [64], dace.float64)
+    sdfg.add_array('B', [64], dace.float64)
+    sdfg.add_transient('tmp1', [64], dace.float64, storage=dace.StorageType.CPU_Heap)
+    sdfg.add_transient('tmp2', [64], dace.float64, storage=dace.StorageType.CPU_Heap)
+    sdfg.add_transient('tmp3', [64], dace.float64, storage=dace.StorageType.CPU_Heap)
+
+    def copy(state, src, dst, code):
+        state.add_mapped_tasklet('copy',
+                                 dict(i='0:64'),
+                                 dict(a=dace.Memlet(f'{src}[i]')),
+                                 f'b = {code}',
+                                 dict(b=dace.Memlet(f'{dst}[i]')),
+                                 external_edges=True)
+
+    s1 = sdfg.add_state('s1')
+    copy(s1, 'A', 'tmp1', 'a + 1')
+    s2 = sdfg.add_state_after(s1, 's2')
+    copy(s2, 'tmp1', 'tmp2', 'a * 2')
+    s3 = sdfg.add_state_after(s2, 's3')
+    copy(s3, 'tmp2', 'tmp3', 'a + 3')
+    s4 = sdfg.add_state_after(s3, 's4')
+    copy(s4, 'tmp3', 'B', 'a')
+
+    if loop:
+        # Loop around the first two states
+        sdfg.remove_edge(sdfg.edges_between(s2, s3)[0])
+        sdfg.add_symbol('i', dace.int32)
+        guard = sdfg.add_state('guard')
+        init = sdfg.add_state('init', is_start_state=True)
+        sdfg.add_edge(init, guard, dace.InterstateEdge(assignments=dict(i=0)))
+        sdfg.remove_edge(sdfg.edges_between(s1, s2)[0])
+        sdfg.add_edge(guard, s1, dace.InterstateEdge('i < 3'))
+        sdfg.add_edge(s1, s2, dace.InterstateEdge())
+        sdfg.add_edge(s2, guard, dace.InterstateEdge(assignments=dict(i='i + 1')))
+        sdfg.add_edge(guard, s3, dace.InterstateEdge('i >= 3'))
+
+    return sdfg
+
+
+def test_plan_reuse():
+    sdfg = _chain_sdfg()
+    plan = MemoryPlanner().apply_pass(sdfg, {})
+    assert plan is not None
+    assert len(plan.offsets) == 3
+    assert plan.size_before == 3 * 64 * 8
+    # At most two transients are live at the same time, tmp1 and tmp3 can share memory
+    assert plan.peak_live_size == 2 * 64 * 8
+    assert plan.size_after == 2 * 64 * 8
+    assert plan.offsets[sdfg.sdfg_id, 'tmp1'] == plan.offsets[sdfg.sdfg_id, 'tmp3']
+    assert plan.offsets[sdfg.sdfg_id, 'tmp1'] != plan.offsets[sdfg.sdfg_id, 'tmp2']
+
+
+def test_plan_loop():
+    sdfg = _chain_sdfg(loop=True)
+    sdfg.validate()
+    plan = MemoryPlanner().apply_pass(sdfg, {})
+    assert plan is not None
+    # tmp1 is used in a loop that ends with writing tmp2, which is read after the loop
+    assert plan.offsets[sdfg.sdfg_id, 'tmp1'] != plan.offsets[sdfg.sdfg_id, 'tmp2']
+    assert plan.offsets[sdfg.sdfg_id, 'tmp2'] != plan.offsets[sdfg.sdfg_id, 'tmp3']
+
+
+def test_plan_alignment():
+    sdfg = dace.SDFG('memplan_alignment')
+    sdfg.add_transient('small', [3], dace.float32, storage=dace.StorageType.CPU_Heap)
+    sdfg.add_transient('large', [5], dace.float64, storage=dace.StorageType.CPU_Heap)
+    state = sdfg.add_state()
+    state.add_nedge(state.add_access('small'), state.add_access('large'), dace.Memlet('small[0:3]'))
+    plan = MemoryPlanner(alignment=128).apply_pass(sdfg, {})
+    assert sorted(offset for _, offset in plan.offsets.values()) == [0, 128]
+    assert plan.arena_alignments[dace.StorageType.CPU_Heap] == 128
+
+    # Storage types that are not planned are ignored
+    assert MemoryPlanner({dace.StorageType.GPU_Global}).apply_pass(sdfg, {}) is None
+
+
+def test_memory_arenas_codegen():
+    sdfg = _chain_sdfg(loop=True)
+    A = np.random.rand(64)
+    B = np.zeros(64)
+    with dace.config.set_temporary('compiler', 'memory_arenas', value=True):
+        code = sdfg.generate_code()[0].clean_code
+        assert '__dace_arena_CPU_Heap' in code
+        sdfg(A=A, B=B)
+    assert np.allclose(B, (A + 1) * 2 + 3)
+
+
+if __name__ == '__main__':
+    test_plan_reuse()
+    test_plan_loop()
+    test_plan_alignment()
+    test_memory_arenas_codegen()
@@ -0,0 +1,67 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests caching and incremental matching in repeated pattern matching. """
+import dace
+from dace.transformation.dataflow import MapExpansion
+from dace.transformation.passes.pattern_matching import (PatternMatchAndApplyRepeated, PatternMatchCache,
+                                                         match_patterns)
+import pytest
+
+
+def _make_sdfg(num_states: int) -> dace.SDFG:
+    sdfg = dace.SDFG('pattern_matching_cache_test')
+    sdfg.add_array('A', [20, 20], dace.float64)
+    sdfg.add_array('B', [20, 20], dace.float64)
+    state = None
+    for i in range(num_states):
+        state = sdfg.add_state(is_start_state=(i == 0)) if state is None else sdfg.add_state_after(state)
+        state.add_mapped_tasklet('copy',
+                                 dict(i='0:20', j='0:20'),
+                                 dict(a=dace.Memlet('A[i, j]')),
+                                 'b = a',
+                                 dict(b=dace.Memlet('B[i, j]')),
+                                 external_edges=True)
+    return sdfg
+
+
+def test_graph_version():
+    sdfg = _make_sdfg(1)
+    state = sdfg.node(0)
+    version = state.version
+    node = state.add_access('A')
+    assert state.version != version
+    version = state.version
+    state.remove_node(node)
+    assert state.version != version
+
+
+def test_cached_matches():
+    sdfg = _make_sdfg(3)
+    cache = PatternMatchCache()
+    reference = [(m.state_id, m.subgraph) for m in match_patterns(sdfg, MapExpansion)]
+    cached = [(m.state_id, m.subgraph) for m in match_patterns(sdfg, MapExpansion, cache=cache)]
+    assert cached == reference
+    assert len(cached) == 3
+
+    # Mutating a state invalidates its cached matches
+    match = next(iter(match_patterns(sdfg, MapExpansion, cache=cache)))
+    match.apply_pattern()
+    assert len(list(match_patterns(sdfg, MapExpansion, cache=cache))) == 2
+
+    # Only modified graphs are searched
+    assert len(list(match_patterns(sdfg, MapExpansion, cache=cache, graphs={sdfg.node(0)}))) == 0
+    assert len(list(match_patterns(sdfg, MapExpansion, cache=cache, graphs={sdfg.node(1)}))) == 1
+
+
+@pytest.mark.parametrize('incremental', (False, True))
+def test_incremental_fixed_point(incremental):
+    sdfg = _make_sdfg(5)
+    result = PatternMatchAndApplyRepeated([MapExpansion], incremental=incremental).apply_pass(sdfg, {})
+    assert len(result['MapExpansion']) == 5
+    assert len(list(match_patterns(sdfg, MapExpansion))) == 0
+
+
+if __name__ == '__main__':
+    test_graph_version()
+    test_cached_matches()
+    test_incremental_fixed_point(False)
+    test_incremental_fixed_point(True)
@@ -1,7 +1,10 @@
 # Copyright 2019-2022 ETH Zurich and the DaCe authors. All rights reserved.
 
+import threading
+
 import dace
 from dace.transformation import pass_pipeline as ppl
+from dace.transformation.passes import analysis as ap
 
 
 @dace.program
@@ -96,7 +99,57 @@ def test_pipeline_modification_rerun():
     assert result == {'MyAnalysis': 1, 'PassA': 1, 'PassB': 1, 'PassC': 1}
 
 
+def test_parallel_pipeline():
+    # Both analyses must run at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=10)
+
+    class AnalysisA(MyPass):
+        def modifies(self) -> ppl.Modifies:
+            return ppl.Modifies.Nothing
+
+        def apply_pass(self, sdfg, pipeline_results):
+            barrier.wait()
+            return super().apply_pass(sdfg, pipeline_results)
+
+    class AnalysisB(AnalysisA):
+        pass
+
+    class PassA(MyPass):
+        def depends_on(self):
+            return {AnalysisA, AnalysisB}
+
+        def apply_pass(self, sdfg, pipeline_results):
+            super().apply_pass(sdfg, pipeline_results)
+            return pipeline_results['AnalysisA'] + pipeline_results['AnalysisB']
+
+    pipe = ppl.Pipeline([PassA()], num_workers=2)
+    sdfg = empty.to_sdfg()
+
+    result = pipe.apply_pass(sdfg, {})
+    assert result == {'AnalysisA': 1, 'AnalysisB': 1, 'PassA': 2}
+    assert set(pipe.pass_times.keys()) == {'AnalysisA', 'AnalysisB', 'PassA'}
+
+
+def test_parallel_pipeline_results():
+    @dace.program
+    def prog(A: dace.float64[20], B: dace.float64[20]):
+        for i in range(5):
+            A[:] = B + i
+        if A[0] > 0:
+            B[:] = A * 2
+
+    sdfg = prog.to_sdfg(simplify=False)
+    analyses = [ap.StateReachability, ap.AccessSets, ap.FindAccessStates, ap.SymbolAccessSets, ap.FindAccessNodes]
+
+    expected = ppl.Pipeline([a() for a in analyses], num_workers=1).apply_pass(sdfg, {})
+    result = ppl.Pipeline([a() for a in analyses], num_workers=4).apply_pass(sdfg, {})
+    assert list(result.keys()) == list(expected.keys())
+    assert result == expected
+
+
 if __name__ == '__main__':
     test_simple_pipeline()
     test_pipeline_with_dependencies()
     test_pipeline_modification_rerun()
+    test_parallel_pipeline()
+    test_parallel_pipeline_results()
@@ -0,0 +1,124 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the persistent (on-disk) program cache. """
+import dace
+from dace.frontend.python import cached_program
+import numpy as np
+
+
+def _program(x: dace.float64[20]):
+    return x * x + 1
+
+
+def test_persistent_cache_hit(tmp_path):
+    with dace.config.set_temporary('frontend', 'persistent_cache', value=True):
+        with dace.config.set_temporary('frontend', 'persistent_cache_folder', value=str(tmp_path)):
+            cache = cached_program.PersistentProgramCache()
+            a = np.random.rand(20)
+
+            first = dace.program(_program)
+            assert np.allclose(first(a), a * a + 1)
+            assert cache.statistics()['stores'] == 1
+
+            # A new program object (as in a new process) loads the compiled program from the cache
+            second = dace.program(_program)
+            assert np.allclose(second(a), a * a + 1)
+            stats = cache.statistics()
+            assert stats['hits'] == 1
+            assert stats['stores'] == 1
+            assert stats['entries'] == 1
+            assert len(second._cache.cache) == 1
+
+
+def test_persistent_cache_configuration(tmp_path):
+    with dace.config.set_temporary('frontend', 'persistent_cache', value=True):
+        with dace.config.set_temporary('frontend', 'persistent_cache_folder', value=str(tmp_path)):
+            cache = cached_program.PersistentProgramCache()
+            a = np.random.rand(20)
+            dace.program(_program)(a)
+
+            # Programs compiled with different compiler settings are stored separately
+            with dace.config.set_temporary('compiler', 'build_type', value='Debug'):
+                assert np.allclose(dace.program(_program)(a), a * a + 1)
+            args = dace.config.Config.get('compiler', 'cpu', 'args')
+            with dace.config.set_temporary('compiler', 'cpu', 'args', value=args + ' -DPERSISTENT_CACHE_TEST'):
+                assert np.allclose(dace.program(_program)(a), a * a + 1)
+            stats = cache.statistics()
+            assert stats['hits'] == 0 and stats['stores'] == 3
+
+            dace.program(_program)(a)
+            assert cache.statistics()['hits'] == 1
+
+            # Settings of the cache itself do not invalidate its entries
+            with dace.config.set_temporary('frontend', 'persistent_cache_size', value=100):
+                dace.program(_program)(a)
+            assert cache.statistics()['hits'] == 2
+
+
+def test_persistent_cache_eviction(tmp_path):
+    with dace.config.set_temporary('frontend', 'persistent_cache', value=True):
+        with dace.config.set_temporary('frontend', 'persistent_cache_folder', value=str(tmp_path)):
+            with dace.config.set_temporary('frontend', 'persistent_cache_size', value=1):
+                cache = cached_program.PersistentProgramCache()
+
+                prog = dace.program(_program)
+                prog(np.random.rand(20))
+
+                @dace.program
+                def other(x: dace.float64[20]):
+                    return x + 2
+
+                a = np.random.rand(20)
+                assert np.allclose(other(a), a + 2)
+
+                stats = cache.statistics()
+                assert stats['stores'] == 2
+                assert stats['evictions'] == 1
+                assert stats['entries'] == 1
+
+                cache.clear()
+                assert cache.statistics()['entries'] == 0
+
+
+def test_persistent_cache_unregistered_hooks(tmp_path):
+    with dace.config.set_temporary('frontend', 'persistent_cache', value=True):
+        with dace.config.set_temporary('frontend', 'persistent_cache_folder', value=str(tmp_path)):
+            cache = cached_program.PersistentProgramCache()
+            a = np.random.rand(20)
+            dace.program(_program)(a)
+
+            # Hooks disable the persistent cache only while they are registered
+            for register, unregister in ((dace.hooks.register_sdfg_call_hook, dace.hooks.unregister_sdfg_call_hook),
+                                         (dace.hooks.register_compiled_sdfg_call_hook,
+                                          dace.hooks.unregister_compiled_sdfg_call_hook)):
+                hook_id = register(before_hook=lambda *args: None)
+                try:
+                    dace.program(_program)(a)
+                finally:
+                    unregister(hook_id)
+            assert cache.statistics()['hits'] == 0
+
+            assert np.allclose(dace.program(_program)(a), a * a + 1)
+            assert cache.statistics()['hits'] == 1
+
+
+def test_serialized_key_constants():
+    a = np.zeros([2000])
+    b = np.zeros([2000])
+    b[1000] = 1
+    key_a = cached_program.ProgramCacheKey({}, {}, {'arr': a}, set())
+    key_b = cached_program.ProgramCacheKey({}, {}, {'arr': b}, set())
+    assert key_a.serialize() != key_b.serialize()
+    assert key_a.serialize() == cached_program.ProgramCacheKey({}, {}, {'arr': a.copy()}, set()).serialize()
+
+
+if __name__ == '__main__':
+    import tempfile
+    with tempfile.TemporaryDirectory() as folder:
+        test_persistent_cache_hit(folder)
+    with tempfile.TemporaryDirectory() as folder:
+        test_persistent_cache_configuration(folder)
+    with tempfile.TemporaryDirectory() as folder:
+        test_persistent_cache_eviction(folder)
+    with tempfile.TemporaryDirectory() as folder:
+        test_persistent_cache_unregistered_hooks(folder)
+    test_serialized_key_constants()
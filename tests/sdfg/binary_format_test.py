@@ -0,0 +1,70 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests saving and loading SDFGs in the binary SDFG format. """
+import copy
+import json
+import os
+
+import dace
+from dace.sdfg import binary
+import numpy as np
+import pytest
+
+
+@dace.program
+def inner(A: dace.float64[20]):
+    A[:] = A + 1
+
+
+@dace.program
+def outer(A: dace.float64[20], B: dace.float64[20]):
+    inner(A)
+    for i in dace.map[0:20]:
+        B[i] = A[i] * 2
+
+
+def test_roundtrip():
+    sdfg = outer.to_sdfg(simplify=False)
+    sdfg_json = sdfg.to_json()
+    assert binary.loads(binary.dumps(sdfg_json)) == json.loads(dace.serialize.dumps(sdfg_json))
+
+
+@pytest.mark.parametrize('compress', (False, True))
+def test_save_load(tmp_path, compress):
+    sdfg = outer.to_sdfg(simplify=False)
+    filename = str(tmp_path / 'program.sdfg')
+    sdfg.save(filename, binary=True, compress=compress)
+    assert os.path.getsize(filename) < len(dace.serialize.dumps(sdfg.to_json()))
+
+    loaded = dace.SDFG.from_file(filename)
+    assert loaded.hash_sdfg() == sdfg.hash_sdfg()
+
+
+def test_lazy_load(tmp_path):
+    sdfg = outer.to_sdfg(simplify=False)
+    filename = str(tmp_path / 'program.sdfg')
+    sdfg.save(filename, binary=True)
+
+    loaded = dace.SDFG.from_file(filename, lazy=True)
+    assert all('_lazy_contents' in state.__dict__ for state in loaded.nodes())
+    assert loaded.hash_sdfg() == sdfg.hash_sdfg()
+    assert not any('_lazy_contents' in state.__dict__ for state in loaded.nodes())
+
+    assert len(list(loaded.all_sdfgs_recursive())) == len(list(sdfg.all_sdfgs_recursive()))
+
+    # Copies of lazy SDFGs
+    assert copy.deepcopy(dace.SDFG.from_file(filename, lazy=True)).hash_sdfg() == sdfg.hash_sdfg()
+
+    A = np.random.rand(20)
+    B = np.zeros(20)
+    dace.SDFG.from_file(filename, lazy=True)(A=A, B=B)
+    assert np.allclose(B, A * 2)
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    test_roundtrip()
+    with tempfile.TemporaryDirectory() as folder:
+        test_save_load(pathlib.Path(folder), False)
+        test_save_load(pathlib.Path(folder), True)
+        test_lazy_load(pathlib.Path(folder))
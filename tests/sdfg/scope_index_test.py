@@ -0,0 +1,120 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the incrementally maintained scope index of SDFG states. """
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import dace
+from dace.sdfg import nodes
+from dace.sdfg.scope import ScopeIndex
+from dace.transformation.dataflow import MapExpansion, MapTiling
+
+
+def _state():
+    sdfg = dace.SDFG('scope_index')
+    sdfg.add_array('A', [20, 20], dace.float64)
+    sdfg.add_array('B', [20, 20], dace.float64)
+    state = sdfg.add_state()
+    for _ in range(3):
+        state.add_mapped_tasklet('compute',
+                                 dict(i='0:20', j='0:20'),
+                                 dict(a=dace.Memlet('A[i, j]')),
+                                 'b = a + 1',
+                                 dict(b=dace.Memlet('B[i, j]')),
+                                 external_edges=True)
+    return sdfg, state
+
+
+def _assert_parity(state: dace.SDFGState):
+    """ Compares the scope dictionaries of a state with ones computed from scratch. """
+    expected = ScopeIndex(state)
+    assert dict(state.scope_dict()) == dict(expected.parents())
+    assert ({k: set(v)
+             for k, v in state.scope_children().items()} == {k: set(v)
+                                                              for k, v in expected.children().items()})
+    tree = state.scope_tree()
+    assert tree.keys() == expected.tree().keys()
+    for entry, scope in tree.items():
+        assert scope.exit is expected.tree()[entry].exit
+        assert {c.entry for c in scope.children} == {c.entry for c in expected.tree()[entry].children}
+    assert {s.entry for s in state.scope_leaves()} == {s.entry for s in expected.leaves()}
+
+
+def test_incremental_updates():
+    sdfg, state = _state()
+    _assert_parity(state)
+    me = next(n for n in state.nodes() if isinstance(n, nodes.MapEntry))
+    tasklet = state.out_edges(me)[0].dst
+
+    # Nodes added inside a scope
+    tasklet.add_out_connector('c')
+    access = state.add_access('B')
+    state.add_edge(tasklet, 'c', access, None, dace.Memlet('B[i, j]'))
+    assert state.scope_dict()[access] is me
+    inner = state.add_tasklet('inner', {'x'}, {}, '')
+    state.add_edge(access, None, inner, 'x', dace.Memlet('B[i, j]'))
+    assert state._scope_index._live
+    _assert_parity(state)
+
+    # Nodes moved out of a scope
+    state.remove_node(access)
+    assert state.scope_dict()[inner] is None
+    state.remove_node(inner)
+    tasklet.remove_out_connector('c')
+    assert state._scope_index._live
+    _assert_parity(state)
+
+    # Transformations
+    sdfg.apply_transformations(MapTiling, options=dict(tile_sizes=(4, )))
+    _assert_parity(state)
+    sdfg.apply_transformations_repeated(MapExpansion)
+    _assert_parity(state)
+    sdfg.validate()
+
+
+def test_views():
+    _, state = _state()
+    scope_dict = state.scope_dict()
+    children = state.scope_children()
+    with pytest.raises(TypeError):
+        scope_dict[next(iter(scope_dict))] = None
+
+    # Views do not change upon mutation
+    access = state.add_access('A')
+    assert access not in scope_dict and access not in children[None]
+    assert access in state.scope_dict() and access in state.scope_children()[None]
+
+
+def test_cycles():
+    _, state = _state()
+    state.scope_dict()
+    a, b = state.add_access('A'), state.add_access('B')
+    state.add_nedge(a, b, dace.Memlet())
+    state.scope_dict()
+    state.add_nedge(b, a, dace.Memlet())
+    with pytest.raises(ValueError, match='Found cycles.*'):
+        state.scope_dict()
+
+
+def test_concurrent_queries():
+    for _ in range(10):
+        _, state = _state()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: (dict(state.scope_dict()), len(state.scope_leaves())), range(8)))
+        assert all(r == results[0] for r in results)
+        _assert_parity(state)
+
+    # Copies of the index are independent
+    sdfg, state = _state()
+    state.scope_dict()
+    for copied in (copy.deepcopy(sdfg), pickle.loads(pickle.dumps(sdfg))):
+        _assert_parity(copied.node(0))
+
+
+if __name__ == '__main__':
+    test_incremental_updates()
+    test_views()
+    test_cycles()
+    test_concurrent_queries()
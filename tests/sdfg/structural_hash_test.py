@@ -0,0 +1,103 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests incremental structural hashing of SDFGs. """
+import dace
+from dace.transformation.dataflow import MapTiling, Vectorization
+
+
+@dace.program
+def inner(A: dace.float64[20]):
+    A[:] = A + 1
+
+
+@dace.program
+def outer(A: dace.float64[20], B: dace.float64[20]):
+    inner(A)
+    for i in dace.map[0:20]:
+        B[i] = A[i] * 2
+
+
+def test_structural_hash_stable():
+    sdfg = outer.to_sdfg(simplify=False)
+    first = sdfg.structural_hash()
+    assert sdfg.structural_hash() == first
+    assert outer.to_sdfg(simplify=False).structural_hash() == first
+
+    # Serialization round-trip yields the same hash
+    assert dace.SDFG.from_json(sdfg.to_json()).structural_hash() == first
+
+
+def test_structural_hash_invalidation():
+    sdfg = outer.to_sdfg(simplify=False)
+    first = sdfg.structural_hash()
+
+    # Graph mutation
+    state = sdfg.add_state()
+    second = sdfg.structural_hash()
+    assert second != first
+    state.add_access('A')
+    third = sdfg.structural_hash()
+    assert third != second
+
+    # Data descriptor mutation
+    sdfg.add_transient('tmp', [5], dace.float32)
+    fourth = sdfg.structural_hash()
+    assert fourth != third
+    sdfg.remove_data('tmp')
+    assert sdfg.structural_hash() == third
+
+    # Mutation in a nested SDFG is reflected in the top-level hash
+    nsdfg = next(n for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.NestedSDFG))
+    nsdfg.sdfg.add_state()
+    assert sdfg.structural_hash() != third
+
+    # Direct property changes require explicit invalidation
+    before = sdfg.structural_hash()
+    sdfg.arrays['A'].storage = dace.StorageType.CPU_Pinned
+    assert sdfg.structural_hash() == before
+    sdfg.invalidate_hash()
+    assert sdfg.structural_hash() != before
+
+
+def test_structural_hash_transformation():
+    sdfg = outer.to_sdfg(simplify=False)
+    first = sdfg.structural_hash()
+    map_state = next(s for s in sdfg.nodes() if any(isinstance(n, dace.nodes.MapEntry) for n in s.nodes()))
+    assert sdfg.apply_transformations(MapTiling) == 1
+
+    # Only the digest of the transformed state is invalidated
+    assert all(s._structural_hash_cached is not None for s in sdfg.nodes() if s is not map_state)
+    tiled = sdfg.structural_hash()
+    assert tiled != first
+    sdfg.invalidate_hash()
+    assert sdfg.structural_hash() == tiled
+
+    # Memlet propagation after a transformation in a nested SDFG invalidates the digests of all of its states, but
+    # not those of the outer SDFG
+    nsdfg = next(n.sdfg for n, _ in sdfg.all_nodes_recursive() if isinstance(n, dace.nodes.NestedSDFG))
+    nstate = next(s for s in nsdfg.nodes() if any(isinstance(n, dace.nodes.MapEntry) for n in s.nodes()))
+    Vectorization.apply_to(nsdfg, map_entry=next(n for n in nstate.nodes() if isinstance(n, dace.nodes.MapEntry)))
+    assert all(s._structural_hash_cached is not None for s in sdfg.nodes())
+    assert all(s._structural_hash_cached is None for s in nsdfg.nodes())
+    vectorized = sdfg.structural_hash()
+    assert vectorized != tiled
+    sdfg.invalidate_hash()
+    assert sdfg.structural_hash() == vectorized
+
+
+def test_structural_hash_config(tmp_path):
+    sdfg = outer.to_sdfg(simplify=False)
+    with dace.config.set_temporary('structural_hash', value=True):
+        hsh = sdfg.save(str(tmp_path / 'program.sdfg'))
+        assert hsh == sdfg.structural_hash()
+        with dace.config.set_temporary('cache', value='hash'):
+            assert sdfg.build_folder.endswith(hsh)
+
+
+if __name__ == '__main__':
+    import tempfile
+    import pathlib
+    test_structural_hash_stable()
+    test_structural_hash_invalidation()
+    test_structural_hash_transformation()
+    with tempfile.TemporaryDirectory() as folder:
+        test_structural_hash_config(pathlib.Path(folder))
@@ -0,0 +1,135 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests incremental validation of SDFGs based on their mutation journal. """
+import dace
+from dace.sdfg import nodes
+from dace.sdfg.validation import InvalidSDFGError, validate_sdfg
+from dace.transformation.dataflow import MapExpansion
+
+
+def _sdfg(num_states: int = 4) -> dace.SDFG:
+    sdfg = dace.SDFG('incremental_validation')
+    sdfg.add_array('A', [20, 20], dace.float64)
+    sdfg.add_array('B', [20, 20], dace.float64)
+    state = None
+    for i in range(num_states):
+        state = sdfg.add_state(f's{i}') if state is None else sdfg.add_state_after(state, f's{i}')
+        state.add_mapped_tasklet('compute',
+                                 dict(i='0:20', j='0:20'),
+                                 dict(a=dace.Memlet('A[i, j]')),
+                                 'b = a + 1',
+                                 dict(b=dace.Memlet('B[i, j]')),
+                                 external_edges=True)
+    return sdfg
+
+
+def _outcome(sdfg: dace.SDFG, incremental: bool):
+    try:
+        validate_sdfg(sdfg, incremental=incremental)
+    except InvalidSDFGError as ex:
+        return type(ex), ex.message
+    return None
+
+
+def test_equivalence():
+    sdfg = _sdfg()
+    assert _outcome(sdfg, True) is None
+    assert sdfg.journal.validated
+    state = sdfg.node(2)
+    tasklet = next(n for n in state.nodes() if isinstance(n, nodes.Tasklet))
+    read = next(n for n in state.source_nodes())
+
+    def mutations():
+        # Out-of-bounds memlet on a new edge
+        tasklet.add_in_connector('c')
+        me = state.entry_node(tasklet)
+        state.add_memlet_path(read, me, tasklet, dst_conn='c', memlet=dace.Memlet('A[i + 1, j]'))
+        yield
+        state.remove_memlet_path(next(e for e in state.in_edges(tasklet) if e.dst_conn == 'c'))
+        yield
+        # Dangling connector
+        tasklet.add_in_connector('d')
+        sdfg.journal.mark_modified(state, [tasklet])
+        yield
+        tasklet.remove_in_connector('d')
+        sdfg.journal.mark_modified(state, [tasklet])
+        yield
+        # Connectors and memlets modified in place, without marking them in the journal
+        tasklet.add_in_connector('d')
+        yield
+        tasklet.remove_in_connector('d')
+        yield
+        memlet = next(e for e in state.in_edges(tasklet)).data
+        memlet.subset = dace.subsets.Range.from_string('20, j')
+        yield
+        memlet.subset = dace.subsets.Range.from_string('i, j')
+        yield
+        memlet.subset.ranges[0] = (20, 20, 1)
+        yield
+        memlet.subset = dace.subsets.Range.from_string('i, j')
+        yield
+        # Isolated access node
+        node = state.add_access('B')
+        yield
+        state.remove_node(node)
+        yield
+        # A smaller array makes unmodified memlets in every state out-of-bounds
+        old = sdfg.arrays['A']
+        sdfg.remove_data('A', validate=False)
+        sdfg.add_array('A', [10, 20], dace.float64)
+        yield
+        sdfg.arrays['A'].shape = old.shape
+        sdfg.arrays['A'].total_size = old.total_size
+        yield
+        # Descriptors modified in place
+        sdfg.arrays['B'].shape = (20, 5)
+        yield
+        sdfg.arrays['B'].shape = (20, 20)
+        yield
+
+    for _ in mutations():
+        expected = _outcome(sdfg, False)
+        assert _outcome(sdfg, True) == expected
+
+
+def test_only_modified_memlets(monkeypatch):
+    sdfg = _sdfg(10)
+    sdfg.validate(incremental=True)
+
+    validated = []
+    original = dace.Memlet.validate
+
+    def validate(self, sdfg, state):
+        validated.append(state)
+        return original(self, sdfg, state)
+
+    monkeypatch.setattr(dace.Memlet, 'validate', validate)
+
+    # No changes
+    sdfg.validate(incremental=True)
+    assert not validated
+
+    # Changing one tasklet re-validates its memlet trees only
+    state = sdfg.node(5)
+    tasklet = next(n for n in state.nodes() if isinstance(n, nodes.Tasklet))
+    tasklet.code = dace.properties.CodeBlock('b = a * 2')
+    sdfg.journal.mark_modified(state, [tasklet])
+    sdfg.validate(incremental=True)
+    assert len(validated) == 4 and all(s is state for s in validated)
+
+    # New symbols defined before a state validate it again entirely
+    validated.clear()
+    sdfg.edges_between(sdfg.node(6), sdfg.node(7))[0].data.assignments['k'] = '1'
+    sdfg.validate(incremental=True)
+    assert set(validated) == set(sdfg.nodes()[7:])
+
+
+def test_validate_all_transformations():
+    sdfg = _sdfg()
+    with dace.config.set_temporary('optimizer', 'incremental_validation', value=True):
+        assert sdfg.apply_transformations_repeated(MapExpansion, validate_all=True) == 4
+    sdfg.validate()
+
+
+if __name__ == '__main__':
+    test_equivalence()
+    test_validate_all_transformations()
@@ -197,5 +197,71 @@ def test_work_depth():
         assert correct == res
 
 
+def _repeated_nested_sdfgs():
+    sdfg = dc.SDFG('repeated_nested_sdfgs')
+    sdfg.add_array('x', [N], dc.float64)
+    sdfg.add_array('y', [N], dc.float64)
+    sdfg.add_array('z', [N], dc.float64)
+    state = None
+    # The first and last nested SDFG are identical
+    for i, (program, outputs) in enumerate([(single_for_loop, {'x'}), (single_map, {'z'}), (single_for_loop, {'x'})]):
+        state = sdfg.add_state_after(state) if state is not None else sdfg.add_state()
+        nsdfg = program.to_sdfg()
+        inputs = set(nsdfg.arg_names) - outputs
+        node = state.add_nested_sdfg(nsdfg, sdfg, inputs, outputs, {'N': N})
+        for name in inputs:
+            state.add_edge(state.add_read(name), None, node, name, dc.Memlet(f'{name}[0:N]'))
+        for name in outputs:
+            state.add_edge(node, name, state.add_write(name), None, dc.Memlet(f'{name}[0:N]'))
+    return sdfg
+
+
+def test_work_depth_cache():
+    sdfg = _repeated_nested_sdfgs()
+    expected = {}
+    analyze_sdfg(sdfg, expected, get_tasklet_work_depth)
+    assert expected[get_uuid(sdfg)] == (3 * N, 2 * N + 1)
+    assert len(expected) == len(list(sdfg.all_nodes_recursive())) + len(list(sdfg.all_sdfgs_recursive()))
+
+    cache = {}
+    w_d_map = {}
+    analyze_sdfg(sdfg, w_d_map, get_tasklet_work_depth, cache=cache)
+    assert w_d_map == expected
+    # The identical nested SDFGs share an entry
+    assert len(cache) == 3
+
+    # Analyzing the unchanged SDFG again is served entirely from the cache
+    num_entries = len(cache)
+    w_d_map = {}
+    analyze_sdfg(sdfg, w_d_map, get_tasklet_work_depth, cache=cache)
+    assert w_d_map == expected and len(cache) == num_entries
+
+
+def test_work_depth_symbol_values():
+    values = {'N': 20, 'M': 3, 'K': 7}
+    for test, correct in tests_cases[:10]:
+        sdfg = test.to_sdfg()
+        if 'nested_sdfg' in test.name:
+            sdfg.apply_transformations(NestSDFG)
+        w_d_map = {}
+        analyze_sdfg(sdfg, w_d_map, get_tasklet_work_depth, symbol_values=values)
+        work, depth = w_d_map[get_uuid(sdfg)]
+        assert work.is_Number and depth.is_Number
+        symrepl = {dc.symbol(k): v for k, v in values.items()}
+        assert (work, depth) == tuple(sp.sympify(c).subs(symrepl) for c in correct)
+
+
+def test_work_depth_parallel():
+    sdfg = _repeated_nested_sdfgs()
+    expected = {}
+    analyze_sdfg(sdfg, expected, get_tasklet_work_depth)
+    w_d_map = {}
+    analyze_sdfg(sdfg, w_d_map, get_tasklet_work_depth, processes=2)
+    assert w_d_map == expected
+
+
 if __name__ == '__main__':
     test_work_depth()
+    test_work_depth_cache()
+    test_work_depth_symbol_values()
+    test_work_depth_parallel()
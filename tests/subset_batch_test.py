@@ -0,0 +1,75 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+import random
+
+import numpy as np
+
+import dace
+from dace import subsets
+
+N = dace.symbol('N')
+
+
+def _random_subsets(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    result = []
+    for _ in range(count):
+        dims = []
+        for _ in range(2):
+            begin = rng.randint(0, 20)
+            dims.append((begin, begin + rng.randint(-1, 8), rng.choice([1, 1, 1, 2])))
+        if rng.random() < 0.15:
+            result.append(subsets.Indices([d[0] for d in dims]))
+        else:
+            result.append(subsets.Range(dims))
+    result += [
+        subsets.Range([(0, N - 1, 1), (0, 4, 1)]),
+        subsets.Range([(N, N + 2, 1), (3, 3, 1)]),
+        subsets.Range([(0, 5, 1)]),
+        None,
+    ]
+    return result
+
+
+def test_parity():
+    sbs = _random_subsets(60)
+    batch = subsets.SubsetBatch(sbs)
+    assert batch.packed.sum() == 60
+
+    intersections = batch.intersects()
+    covered = subsets.SubsetBatch(sbs[:-1]).covers()
+    for i, a in enumerate(sbs):
+        for j, b in enumerate(sbs):
+            assert intersections[i, j] is subsets.intersects(a, b)
+            if a is not None and b is not None:
+                assert covered[i, j] == a.covers(b)
+
+    sources = subsets.SubsetBatch(sbs[:30])
+    targets = subsets.SubsetBatch(sbs[30:-1])
+    assert (sources.covers_any(targets) == sources.covers(targets).any(axis=0)).all()
+    assert sources.may_intersect(targets) == any(r is not False for r in sources.intersects(targets).flat)
+
+
+def test_symbol_values():
+    sbs = [subsets.Range([(0, N - 1, 1)]), subsets.Range([(N, N + 2, 1)]), subsets.Range([(2, 2, 1)])]
+    assert not subsets.SubsetBatch(sbs).packed[:2].any()
+    batch = subsets.SubsetBatch(sbs, symbols={'N': 10})
+    assert batch.packed.all()
+    assert batch.may_intersect() is True
+    assert not subsets.SubsetBatch(sbs[:2], symbols={'N': 10}).intersects()[0, 1]
+    assert batch.covers()[0, 2] and not batch.covers()[2, 0]
+    assert batch.bounding_box() == subsets.Range([(0, 12, 1)])
+
+
+def test_bounding_box():
+    sbs = [s for s in _random_subsets(40, seed=1) if s is not None and s.dims() == 2]
+    expected = sbs[0]
+    for s in sbs[1:]:
+        expected = subsets.bounding_box_union(expected, s)
+    assert subsets.SubsetBatch(sbs).bounding_box() == expected
+    assert subsets.SubsetBatch([]).bounding_box() is None
+
+
+if __name__ == '__main__':
+    test_parity()
+    test_symbol_values()
+    test_bounding_box()
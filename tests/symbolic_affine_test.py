@@ -0,0 +1,89 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the fast path for affine symbolic expressions in subsets and memlet propagation. """
+import itertools
+
+import sympy
+
+import dace
+from dace import subsets, symbolic
+from dace.sdfg import propagation
+
+N, M, i = dace.symbol('N'), dace.symbol('M'), dace.symbol('i')
+
+
+def test_affine_conversion():
+    expr = symbolic.affine(2 * N - 3 * M + 1)
+    assert expr.coefficient(N) == 2 and expr.coefficient(M) == -3 and expr.const == 1
+    assert expr.to_sympy() == 2 * N - 3 * M + 1
+    assert symbolic.affine(5).is_constant
+    assert symbolic.affine(sympy.Min(N, N + 2)) == symbolic.affine(N)
+    assert symbolic.affine(N - N + 4) == symbolic.affine(4)
+    assert (symbolic.affine(2 * i + N).subs(i, symbolic.affine(N - 1))).to_sympy() == 3 * N - 2
+
+    # Non-affine expressions
+    assert symbolic.affine(N * M) is None
+    assert symbolic.affine(N / 2) is None
+    assert symbolic.affine(N % 4) is None
+    assert symbolic.affine(sympy.Max(N, M)) is None
+
+    with dace.config.set_temporary('optimizer', 'affine_fast_path', value=False):
+        assert symbolic.affine(N) is None
+
+
+def test_subset_parity():
+    """ Compares subset operations with and without the affine fast path. """
+    ranges = [
+        subsets.Range([(0, N - 1, 1), (1, M, 1)]),
+        subsets.Range([(1, N - 2, 1), (1, M - 1, 2)]),
+        subsets.Range([(N - 1, N - 1, 1), (0, M, 1)]),
+        subsets.Range([(0, 2 * N, 3), (M, M + 4, 1)]),
+        subsets.Range([(N, N + 8, 1), (0, 0, 1)]),
+        subsets.Range([(i, i + 3, 1), (0, N * M, 1)]),
+        subsets.Range([(0, 15, 4), (M, 0, -1)]),
+    ]
+
+    def evaluate():
+        results = []
+        for rng in ranges:
+            results.append(rng.size())
+            results.append(rng.num_elements())
+        for a, b in itertools.product(ranges, repeat=2):
+            results.append(a.covers(b))
+            try:
+                results.append(subsets.intersects(a, b))
+            except TypeError:
+                results.append('TypeError')
+            results.append(subsets.bounding_box_union(a, b))
+        return results
+
+    with dace.config.set_temporary('optimizer', 'affine_fast_path', value=False):
+        expected = evaluate()
+    assert evaluate() == expected
+
+
+def test_propagation_parity():
+    sdfg = dace.SDFG('affine_propagation')
+    sdfg.add_array('A', [N, M], dace.float64)
+    sdfg.add_array('B', [N, M], dace.float64)
+    state = sdfg.add_state()
+    state.add_mapped_tasklet('compute',
+                             dict(j='1:N-1', k='0:M:2'),
+                             dict(a=dace.Memlet('A[j - 1:j + 2, M - k - 1]')),
+                             'b = a[0] + a[2]',
+                             dict(b=dace.Memlet('B[j, k]')),
+                             external_edges=True)
+
+    def propagate():
+        propagation.clear_propagation_cache()
+        propagation.propagate_memlets_sdfg(sdfg)
+        return sorted(str(e.data) for e in state.edges())
+
+    with dace.config.set_temporary('optimizer', 'affine_fast_path', value=False):
+        expected = propagate()
+    assert propagate() == expected
+
+
+if __name__ == '__main__':
+    test_affine_conversion()
+    test_subset_parity()
+    test_propagation_parity()
@@ -0,0 +1,143 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the persistent transformation cache. """
+import dace
+from dace.transformation.auto.auto_optimize import auto_optimize
+from dace.transformation.transformation_cache import TransformationCache
+import numpy as np
+
+
+@dace.program
+def loops(A: dace.float64[20], B: dace.float64[20]):
+    for i in range(5):
+        A[:] = B + i
+    tmp = A * 2
+    B[:] = tmp + 1
+
+
+def _run(sdfg: dace.SDFG):
+    a = np.random.rand(20)
+    b = np.random.rand(20)
+    expected_b = (b + 4) * 2 + 1
+    sdfg(A=a, B=b)
+    assert np.allclose(b, expected_b)
+
+
+def test_simplify_cache(tmp_path):
+    with dace.config.set_temporary('optimizer', 'transformation_cache', value=True):
+        with dace.config.set_temporary('optimizer', 'transformation_cache_folder', value=str(tmp_path)):
+            cache = TransformationCache()
+
+            sdfg = loops.to_sdfg(simplify=False)
+            expected = sdfg.simplify()
+            assert cache.statistics()['stores'] == 1
+
+            sdfg2 = loops.to_sdfg(simplify=False)
+            result = sdfg2.simplify()
+            stats = cache.statistics()
+            assert stats['hits'] == 1 and stats['stores'] == 1
+            assert result == expected
+
+            # The SDFG was replaced in-place
+            assert sdfg2.structural_hash() == sdfg.structural_hash()
+            assert all(state.parent is sdfg2 for state in sdfg2.nodes())
+            assert sdfg2.sdfg_list == [sdfg2]
+            sdfg2.validate()
+            _run(sdfg2)
+
+
+def test_cache_invalidation(tmp_path):
+    with dace.config.set_temporary('optimizer', 'transformation_cache', value=True):
+        with dace.config.set_temporary('optimizer', 'transformation_cache_folder', value=str(tmp_path)):
+            cache = TransformationCache()
+            loops.to_sdfg(simplify=False).simplify()
+
+            # Different pipeline parameters
+            loops.to_sdfg(simplify=False).simplify(validate_all=True)
+            assert cache.statistics()['stores'] == 2
+
+            # Different optimizer configuration
+            with dace.config.set_temporary('optimizer', 'symbolic_positive', value=False):
+                loops.to_sdfg(simplify=False).simplify()
+            assert cache.statistics()['stores'] == 3
+
+            # Different input SDFG
+            sdfg = loops.to_sdfg(simplify=False)
+            sdfg.add_array('unused', [5], dace.float64)
+            sdfg.simplify()
+            stats = cache.statistics()
+            assert stats['stores'] == 4 and stats['hits'] == 0
+
+
+def test_cache_modified_properties(tmp_path):
+    sdfg = dace.SDFG('cache_modified_properties')
+    sdfg.add_array('A', [20], dace.float64)
+    sdfg.add_array('B', [20], dace.float64)
+    state = sdfg.add_state()
+    tasklet, _, _ = state.add_mapped_tasklet('add', dict(i='0:20'),
+                                             dict(a=dace.Memlet('A[i]')),
+                                             'b = a + 1',
+                                             dict(b=dace.Memlet('B[i]')),
+                                             external_edges=True)
+
+    with dace.config.set_temporary('optimizer', 'transformation_cache', value=True):
+        with dace.config.set_temporary('optimizer', 'transformation_cache_folder', value=str(tmp_path)):
+            cache = TransformationCache()
+            sdfg.simplify()
+            sdfg.simplify()
+            assert cache.statistics()['stores'] == 2
+            sdfg.structural_hash()
+
+            # Properties modified outside of the transformation API change the cache entry once the hash is
+            # invalidated, the cached digests are otherwise reused
+            description = {'function': 'test'}
+            digest = cache.digest(sdfg, description)
+            tasklet.code = dace.properties.CodeBlock('b = a + 100')
+            assert cache.digest(sdfg, description) == digest
+            assert state._structural_hash_cached is not None
+            assert cache.digest(sdfg, description, rehash=True) != digest
+            sdfg.invalidate_hash(states=[state])
+            sdfg.simplify()
+            stats = cache.statistics()
+            assert stats['stores'] == 3 and stats['hits'] == 0
+
+    a = np.random.rand(20)
+    b = np.zeros(20)
+    sdfg(A=a, B=b)
+    assert np.allclose(b, a + 100)
+
+
+def test_cache_eviction(tmp_path):
+    with dace.config.set_temporary('optimizer', 'transformation_cache', value=True):
+        with dace.config.set_temporary('optimizer', 'transformation_cache_folder', value=str(tmp_path)):
+            with dace.config.set_temporary('optimizer', 'transformation_cache_size', value=1):
+                cache = TransformationCache()
+                loops.to_sdfg(simplify=False).simplify()
+                loops.to_sdfg(simplify=False).simplify(validate_all=True)
+                stats = cache.statistics()
+                assert stats['evictions'] == 1 and stats['entries'] == 1
+
+
+def test_auto_optimize_cache(tmp_path):
+    with dace.config.set_temporary('optimizer', 'transformation_cache', value=True):
+        with dace.config.set_temporary('optimizer', 'transformation_cache_folder', value=str(tmp_path)):
+            cache = TransformationCache()
+            sdfg = loops.to_sdfg(simplify=False)
+            auto_optimize(sdfg, dace.DeviceType.CPU)
+
+            # Nested simplification passes are not cached separately
+            assert cache.statistics()['stores'] == 1
+
+            sdfg2 = loops.to_sdfg(simplify=False)
+            result = auto_optimize(sdfg2, dace.DeviceType.CPU)
+            assert result is sdfg2
+            assert cache.statistics()['hits'] == 1
+            assert sdfg2.structural_hash() == sdfg.structural_hash()
+            _run(sdfg2)
+
+
+if __name__ == '__main__':
+    import tempfile
+    for test in (test_simplify_cache, test_cache_invalidation, test_cache_modified_properties,
+                 test_cache_eviction, test_auto_optimize_cache):
+        with tempfile.TemporaryDirectory() as folder:
+            test(folder)
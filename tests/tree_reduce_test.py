@@ -0,0 +1,70 @@
+# Copyright 2019-2023 ETH Zurich and the DaCe authors. All rights reserved.
+""" Tests the OpenMP tree reduction expansion of the Reduce library node. """
+import dace
+import numpy as np
+import pytest
+from dace.libraries.standard import Reduce
+from dace.transformation.auto.auto_optimize import set_fast_implementations
+
+
+def _reduce_sdfg(name, shape, axes, wcr, identity):
+    sdfg = dace.SDFG(name)
+    state = sdfg.add_state()
+    sdfg.add_array('A', shape, dace.float64)
+    out_shape = [s for i, s in enumerate(shape) if axes is not None and i not in axes] or [1]
+    sdfg.add_array('B', out_shape, dace.float64)
+    node = Reduce(wcr, axes, identity)
+    node.implementation = 'OpenMP (tree)'
+    state.add_node(node)
+    state.add_edge(state.add_read('A'), None, node, None, dace.Memlet('A'))
+    state.add_edge(node, None, state.add_write('B'), None, dace.Memlet('B'))
+    return sdfg
+
+
+# Shapes exercise both the privatized and the output-parallel code paths
+@pytest.mark.parametrize('shape', [[3, 1000], [1000, 3], [7, 5, 300]])
+def test_tree_reduce(shape):
+    A = np.random.rand(*shape)
+    suffix = '_'.join(map(str, shape))
+
+    # Row sum with identity
+    B = np.random.rand(*shape[:-1])
+    _reduce_sdfg(f'tree_rowsum_{suffix}', shape, [len(shape) - 1], 'lambda a, b: a + b', 0)(A=A, B=B)
+    assert np.allclose(B, A.sum(axis=-1))
+
+    # Column sum without identity, accumulating into the output
+    B = np.random.rand(*shape[1:])
+    expected = B + A.sum(axis=0)
+    _reduce_sdfg(f'tree_colsum_{suffix}', shape, [0], 'lambda a, b: a + b', None)(A=A, B=B)
+    assert np.allclose(B, expected)
+
+    # Custom reduction function over all axes
+    B = np.zeros([1])
+    _reduce_sdfg(f'tree_custom_{suffix}', shape, None, 'lambda a, b: a if abs(a) > abs(b) else b', 0)(A=A, B=B)
+    assert np.allclose(B, A.max())
+
+
+def test_tree_reduce_auto_optimize():
+
+    @dace.program
+    def tree_reduce_autoopt(A: dace.float64[20, 30], B: dace.float64[20, 30]):
+        for i in dace.map[0:20]:
+            B[i] = np.sum(A[i]) * 0 + A[i]
+        return np.sum(A, axis=0)
+
+    sdfg = tree_reduce_autoopt.to_sdfg(simplify=True)
+    set_fast_implementations(sdfg, dace.DeviceType.CPU)
+    reductions = {(node.implementation, state.entry_node(node) is None)
+                  for node, state in sdfg.all_nodes_recursive() if isinstance(node, Reduce)}
+    assert ('OpenMP (tree)', True) in reductions
+    assert all(impl != 'OpenMP (tree)' for impl, toplevel in reductions if not toplevel)
+
+    A = np.random.rand(20, 30)
+    B = np.zeros_like(A)
+    assert np.allclose(sdfg(A=A, B=B), A.sum(axis=0))
+
+
+if __name__ == "__main__":
+    for shape in ([3, 1000], [1000, 3], [7, 5, 300]):
+        test_tree_reduce(shape)
+    test_tree_reduce_auto_optimize()